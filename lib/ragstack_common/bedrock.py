@@ -10,6 +10,7 @@ Provides a simplified client for invoking Amazon Bedrock models with:
 import logging
 import os
 import random
+import threading
 import time
 from typing import Any
 
@@ -64,6 +65,8 @@ class BedrockClient:
         self.max_backoff = max_backoff
         self._client: Any = None
         self.metering_data: dict[str, dict[str, int]] = {}
+        # Guards metering_data when one client is shared across worker threads
+        self._metering_lock = threading.Lock()
 
     @property
     def client(self) -> Any:
@@ -162,16 +165,18 @@ class BedrockClient:
             # Track token usage in metering data
             usage = response.get("usage", {})
             metering_key = f"{context}/bedrock/{model_id}"
-            if metering_key not in self.metering_data:
-                self.metering_data[metering_key] = {
-                    "inputTokens": 0,
-                    "outputTokens": 0,
-                    "totalTokens": 0,
-                }
-
-            self.metering_data[metering_key]["inputTokens"] += usage.get("inputTokens", 0)
-            self.metering_data[metering_key]["outputTokens"] += usage.get("outputTokens", 0)
-            self.metering_data[metering_key]["totalTokens"] += usage.get("totalTokens", 0)
+            with self._metering_lock:
+                if metering_key not in self.metering_data:
+                    self.metering_data[metering_key] = {
+                        "inputTokens": 0,
+                        "outputTokens": 0,
+                        "totalTokens": 0,
+                    }
+
+                totals = self.metering_data[metering_key]
+                totals["inputTokens"] += usage.get("inputTokens", 0)
+                totals["outputTokens"] += usage.get("outputTokens", 0)
+                totals["totalTokens"] += usage.get("totalTokens", 0)
 
             # Return response with metering
             return {"response": response, "metering": {metering_key: usage}}
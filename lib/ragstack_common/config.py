@@ -9,10 +9,16 @@ storage backend. Configuration is structured as three entries:
 The ConfigurationManager merges Custom → Default to provide effective configuration.
 Request-scoped caching ensures DynamoDB is read once per Lambda invocation;
 call clear_cache() at handler entry points to reset between invocations.
+
+Hot handlers can opt in to a warm-container TTL cache by passing
+max_staleness_seconds: the effective config is then reused across invocations
+and clear_cache() only drops it once it is older than the TTL, so edits
+propagate within that bounded window.
 """
 
 import logging
 import os
+import time
 from copy import deepcopy
 from typing import Any
 
@@ -132,17 +138,23 @@ class ConfigurationManager:
     Design Decisions:
         - Request-scoped caching: first call per invocation reads DynamoDB,
           subsequent calls return cached result. Call clear_cache() at handler entry.
+        - Optional TTL mode (max_staleness_seconds): the cache survives across warm
+          invocations until it is older than the TTL.
         - Fails fast: raises exceptions if table access fails (no fallback)
         - Merges Custom → Default: Custom values override Default values
     """
 
-    def __init__(self, table_name: str | None = None):
+    def __init__(self, table_name: str | None = None, max_staleness_seconds: float | None = None):
         """
         Initialize configuration manager.
 
         Args:
             table_name: Configuration table name. If not provided, reads from
                        CONFIGURATION_TABLE_NAME environment variable.
+            max_staleness_seconds: Opt-in TTL for the effective config cache. When set
+                       (> 0), cached config is reused across invocations for up to this
+                       many seconds and clear_cache() keeps a fresh cache. None or 0
+                       keeps the request-scoped behavior.
 
         Raises:
             ValueError: If table_name not provided and env var not set
@@ -158,6 +170,8 @@ class ConfigurationManager:
         self.table = self.dynamodb.Table(table_name)
         self.table_name = table_name
         self._cache: dict[str, Any] | None = None
+        self._cache_loaded_at = 0.0
+        self.max_staleness_seconds = max_staleness_seconds or None
 
         logger.info(f"Initialized ConfigurationManager with table: {table_name}")
 
@@ -189,15 +203,28 @@ class ConfigurationManager:
             logger.exception(f"Error retrieving {config_type} configuration")
             raise
 
-    def clear_cache(self) -> None:
+    def clear_cache(self, force: bool = False) -> None:
         """
         Clear the request-scoped configuration cache.
 
         Call this at the start of each Lambda handler invocation to ensure
         fresh configuration is read from DynamoDB. Within a single invocation,
         subsequent calls to get_effective_config() return the cached result.
+
+        In TTL mode (max_staleness_seconds set) the cache is only dropped once
+        it is older than the TTL, unless force is True.
+
+        Args:
+            force: Drop the cache even if it is within the TTL
         """
-        self._cache = None
+        if force or not self._cache_is_fresh():
+            self._cache = None
+
+    def _cache_is_fresh(self) -> bool:
+        """Check whether the cached config is within the TTL (always False without TTL)."""
+        if self._cache is None or not self.max_staleness_seconds:
+            return False
+        return (time.monotonic() - self._cache_loaded_at) < self.max_staleness_seconds
 
     def get_effective_config(self) -> dict[str, Any]:
         """
@@ -206,7 +233,7 @@ class ConfigurationManager:
         Uses request-scoped caching: the first call reads from DynamoDB and
         caches the result. Subsequent calls within the same Lambda invocation
         return the cached result. Call clear_cache() at handler entry points
-        to reset.
+        to reset. In TTL mode the cache is reloaded once it exceeds the TTL.
 
         Returns:
             Merged configuration dictionary with Custom values overriding Defaults
@@ -214,7 +241,7 @@ class ConfigurationManager:
         Raises:
             ClientError: If DynamoDB access fails
         """
-        if self._cache is not None:
+        if self._cache is not None and (not self.max_staleness_seconds or self._cache_is_fresh()):
             return self._cache
 
         # Get Default configuration
@@ -244,6 +271,7 @@ class ConfigurationManager:
         logger.debug(f"Effective config values: {masked}")
 
         self._cache = effective_config
+        self._cache_loaded_at = time.monotonic()
         return effective_config
 
     def get_parameter(self, param_name: str, default: Any = None) -> Any:
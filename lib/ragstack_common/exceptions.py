@@ -38,6 +38,18 @@ class FileSizeLimitExceededError(Exception):
         )
 
 
+class S3BulkWriteError(Exception):
+    """One or more objects in a bulk S3 write failed after retries."""
+
+    def __init__(self, failures: list[tuple[str, Exception]], total: int) -> None:
+        self.failures = failures  # (s3_uri, error) in input order
+        self.total = total
+        first_uri, first_error = failures[0]
+        super().__init__(
+            f"{len(failures)} of {total} S3 writes failed (first: {first_uri}: {first_error})"
+        )
+
+
 class AudioExtractionError(MediaProcessingError):
     """Error extracting audio from video file."""
 
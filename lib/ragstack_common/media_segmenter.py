@@ -8,7 +8,11 @@ timestamp alignment and speaker label tracking.
 import logging
 import math
 from collections import Counter
-from typing import Any
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ragstack_common.transcribe_client import TranscriptWord
 
 logger = logging.getLogger(__name__)
 
@@ -87,6 +91,64 @@ class MediaSegmenter:
         logger.info(f"Created {len(segments)} segments")
         return segments
 
+    def segment_stream(
+        self, words: "Iterable[TranscriptWord]", fallback_duration: float
+    ) -> tuple[list[dict[str, Any]], float]:
+        """Segment a time-ordered word stream without materializing it.
+
+        Streaming counterpart of segment_transcript for
+        TranscribeClient.iter_transcript_words: each segment is built as soon
+        as the stream passes its end, so only one segment's words are held.
+
+        Args:
+            words: Words in time order.
+            fallback_duration: Media duration to use if no word has an end time.
+
+        Returns:
+            Tuple of (segments, duration). Segments match segment_transcript's
+            output; duration is the last word's end time, or fallback_duration.
+        """
+        segments: list[dict[str, Any]] = []
+        text_parts: list[str] = []
+        speakers: Counter[str] = Counter()
+        duration = 0.0
+
+        def close_segment() -> None:
+            speaker = speakers.most_common(1)[0][0] if speakers else None
+            segments.append(
+                self._make_segment(len(segments), " ".join(text_parts), len(text_parts), speaker)
+            )
+            text_parts.clear()
+            speakers.clear()
+
+        for word in words:
+            if word.start_time is None:
+                # Punctuation without timing
+                continue
+            if word.end_time and word.end_time > duration:
+                duration = word.end_time
+
+            segment_idx = int(word.start_time // self.segment_duration)
+            while len(segments) < segment_idx:
+                close_segment()
+
+            if word.type == "pronunciation":
+                text_parts.append(word.word)
+            if word.speaker:
+                speakers[word.speaker] += 1
+
+        if duration <= 0:
+            duration = fallback_duration
+        num_segments = max(1, math.ceil(duration / self.segment_duration))
+        while len(segments) < num_segments or text_parts:
+            close_segment()
+
+        logger.info(
+            f"Segmented transcript stream: duration={duration}s, "
+            f"segment_duration={self.segment_duration}s, num_segments={len(segments)}"
+        )
+        return segments, duration
+
     def _build_segment(
         self,
         segment_index: int,
@@ -101,9 +163,6 @@ class MediaSegmenter:
         Returns:
             Segment dictionary with metadata.
         """
-        timestamp_start = segment_index * self.segment_duration
-        timestamp_end = (segment_index + 1) * self.segment_duration
-
         # Build text from words
         text = self._build_text(words)
 
@@ -113,6 +172,25 @@ class MediaSegmenter:
         # Determine primary speaker
         speaker = self._get_primary_speaker(words)
 
+        return self._make_segment(segment_index, text, word_count, speaker)
+
+    def _make_segment(
+        self, segment_index: int, text: str, word_count: int, speaker: str | None
+    ) -> dict[str, Any]:
+        """Build a segment dictionary.
+
+        Args:
+            segment_index: Zero-based index of this segment.
+            text: Combined text of the segment's words.
+            word_count: Number of pronunciation words.
+            speaker: Primary speaker, if any.
+
+        Returns:
+            Segment dictionary with metadata.
+        """
+        timestamp_start = segment_index * self.segment_duration
+        timestamp_end = (segment_index + 1) * self.segment_duration
+
         segment: dict[str, Any] = {
             "segment_index": segment_index,
             "timestamp_start": timestamp_start,
@@ -73,6 +73,8 @@ class Document:
         page_end: Ending page for batch processing (1-indexed, inclusive)
         pages_succeeded: Count of successfully processed pages in batch
         pages_failed: Count of failed pages in batch
+        page_offset: Pages of the original document that precede page 1 of
+            input_s3_uri (non-zero when input is a pre-sliced batch PDF)
     """
 
     document_id: str
@@ -94,6 +96,8 @@ class Document:
     # Page success tracking for batch processing
     pages_succeeded: int = 0
     pages_failed: int = 0
+    # Offset of input_s3_uri within the original PDF when it is a pre-sliced batch
+    page_offset: int = 0
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for DynamoDB storage."""
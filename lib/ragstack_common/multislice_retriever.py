@@ -10,10 +10,18 @@ Multi-slice approach:
 
 All slices run in parallel; results are deduplicated by vector ID,
 keeping the highest score for duplicates.
+
+Slices run on a module-level executor reused across warm invocations.
+retrieve() waits at most timeout_seconds, merges the slices that finished,
+and abandons stragglers without joining them. Per-slice latencies are
+recorded in histograms (see get_slice_latency_histograms) for tuning.
 """
 
+import bisect
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from typing import Any
 
@@ -28,6 +36,115 @@ DEFAULT_FILTERED_SCORE_BOOST = 1.25  # default max boost ceiling (configurable v
 ADAPTIVE_BOOST_MARGIN = 1.05  # 5% margin above parity to ensure filtered beats unfiltered
 ADAPTIVE_BOOST_FLOOR = 1.02  # minimum boost even when filtered scores are already higher
 
+# Shared slice executor. Sized above max_slices so a few abandoned stragglers
+# (still blocked on Bedrock) do not starve the next query's slices.
+SLICE_EXECUTOR_WORKERS = 8
+
+# Upper bounds (ms) of the slice latency histogram buckets; the last bucket is open-ended
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+_slice_executor: ThreadPoolExecutor | None = None
+_slice_executor_lock = threading.Lock()
+
+
+def _get_slice_executor() -> ThreadPoolExecutor:
+    """Get or create the shared slice executor (lazy initialization)."""
+    global _slice_executor
+    with _slice_executor_lock:
+        if _slice_executor is None:
+            _slice_executor = ThreadPoolExecutor(
+                max_workers=SLICE_EXECUTOR_WORKERS, thread_name_prefix="multislice"
+            )
+        return _slice_executor
+
+
+class SliceLatencyHistogram:
+    """
+    Thread-safe per-slice latency histograms with outcome counters.
+
+    Each slice name gets counts per LATENCY_BUCKETS_MS bucket plus an
+    overflow bucket, and counters for ok/error/timeout outcomes. Latency is
+    recorded when a slice finishes, so abandoned stragglers that complete
+    later still land in the histogram of the warm container.
+    """
+
+    def __init__(self, buckets_ms: tuple[int, ...] = LATENCY_BUCKETS_MS):
+        self.buckets_ms = buckets_ms
+        self._lock = threading.Lock()
+        self._data: dict[str, dict[str, Any]] = {}
+
+    def _slice(self, name: str) -> dict[str, Any]:
+        if name not in self._data:
+            self._data[name] = {
+                "counts": [0] * (len(self.buckets_ms) + 1),
+                "ok": 0,
+                "error": 0,
+                "timeout": 0,
+                "total_ms": 0.0,
+                "max_ms": 0.0,
+            }
+        return self._data[name]
+
+    def record(self, name: str, latency_ms: float, ok: bool = True) -> None:
+        """Record a finished slice call."""
+        with self._lock:
+            entry = self._slice(name)
+            entry["counts"][bisect.bisect_left(self.buckets_ms, latency_ms)] += 1
+            entry["ok" if ok else "error"] += 1
+            entry["total_ms"] += latency_ms
+            entry["max_ms"] = max(entry["max_ms"], latency_ms)
+
+    def record_timeout(self, name: str) -> None:
+        """Record a slice abandoned at the deadline."""
+        with self._lock:
+            self._slice(name)["timeout"] += 1
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """
+        Get a copy of the histograms.
+
+        Returns:
+            Dict mapping slice name to {"buckets_ms", "counts", "ok", "error",
+            "timeout", "mean_ms", "max_ms"}.
+        """
+        with self._lock:
+            snapshot = {}
+            for name, entry in self._data.items():
+                finished = entry["ok"] + entry["error"]
+                snapshot[name] = {
+                    "buckets_ms": list(self.buckets_ms),
+                    "counts": list(entry["counts"]),
+                    "ok": entry["ok"],
+                    "error": entry["error"],
+                    "timeout": entry["timeout"],
+                    "mean_ms": entry["total_ms"] / finished if finished else 0.0,
+                    "max_ms": entry["max_ms"],
+                }
+            return snapshot
+
+    def reset(self) -> None:
+        """Clear all recorded data."""
+        with self._lock:
+            self._data.clear()
+
+
+_slice_latency = SliceLatencyHistogram()
+
+
+def get_slice_latency_histograms() -> dict[str, dict[str, Any]]:
+    """
+    Get per-slice latency histograms accumulated in this container.
+
+    Returns:
+        Dict mapping slice name to bucket counts and ok/error/timeout totals.
+    """
+    return _slice_latency.snapshot()
+
+
+def reset_slice_latency_histograms() -> None:
+    """Clear the per-slice latency histograms."""
+    _slice_latency.reset()
+
 
 @dataclass
 class SliceConfig:
@@ -282,7 +399,8 @@ class MultiSliceRetriever:
 
         Args:
             bedrock_agent_client: Bedrock Agent Runtime client. Creates one if not provided.
-            timeout_seconds: Timeout per slice in seconds.
+            timeout_seconds: Deadline in seconds for the parallel slices; slices
+                still running at the deadline are abandoned.
             max_slices: Maximum number of slices to execute.
             enabled: Whether multi-slice is enabled. If False, falls back to single query.
             filtered_score_boost: Score multiplier for filtered results (e.g., 1.15 = 15% boost).
@@ -305,6 +423,7 @@ class MultiSliceRetriever:
         data_source_id: str | None,
         metadata_filter: dict[str, Any] | None = None,
         num_results: int = 5,
+        precomputed_slices: dict[str, list[dict[str, Any]]] | None = None,
     ) -> list[dict[str, Any]]:
         """
         Retrieve documents using multi-slice strategy.
@@ -315,6 +434,9 @@ class MultiSliceRetriever:
             data_source_id: Data source ID for filtering (optional).
             metadata_filter: LLM-generated metadata filter (optional).
             num_results: Number of results per slice.
+            precomputed_slices: Results already retrieved for some slices, keyed by
+                slice name (e.g. a speculative "unfiltered" retrieve started while the
+                filter was being generated). Those slices are not re-run.
 
         Returns:
             List of deduplicated retrieval results.
@@ -332,42 +454,46 @@ class MultiSliceRetriever:
         # Build slice configurations
         slices = self._build_slice_configs(metadata_filter, num_results)
 
-        # Execute slices in parallel
-        slice_results: dict[str, list[dict[str, Any]]] = {}
+        # Execute slices in parallel on the shared executor
+        slice_results: dict[str, list[dict[str, Any]]] = dict(precomputed_slices or {})
+        executor = _get_slice_executor()
 
-        try:
-            with ThreadPoolExecutor(max_workers=min(len(slices), self.max_slices)) as executor:
-                # Submit all slice retrievals
-                futures = {}
-                for slice_config in slices[: self.max_slices]:
-                    future = executor.submit(
-                        self._execute_slice,
-                        query=query,
-                        knowledge_base_id=knowledge_base_id,
-                        data_source_id=data_source_id,
-                        slice_config=slice_config,
-                        metadata_filter=metadata_filter if slice_config.use_filter else None,
-                    )
-                    futures[future] = slice_config.name
-
-                # Collect results as they complete
-                for future in as_completed(futures, timeout=self.timeout_seconds):
-                    slice_name = futures[future]
-                    try:
-                        results = future.result(timeout=0.1)
-                        slice_results[slice_name] = results
-                        logger.info(f"Slice '{slice_name}' returned {len(results)} results")
-                    except Exception as e:
-                        logger.warning(f"Slice '{slice_name}' failed: {e}")
-                        # Continue with other slices
-
-        except TimeoutError:
-            logger.warning(f"Multi-slice retrieval timed out after {self.timeout_seconds}s")
-            # Return whatever we collected so far
-
-        except Exception as e:
-            logger.error(f"Multi-slice retrieval error: {e}")
-            # Return whatever we collected
+        futures: dict[Future[list[dict[str, Any]]], str] = {}
+        for slice_config in slices[: self.max_slices]:
+            if slice_config.name in slice_results:
+                continue
+            future = executor.submit(
+                self._timed_slice,
+                query=query,
+                knowledge_base_id=knowledge_base_id,
+                data_source_id=data_source_id,
+                slice_config=slice_config,
+                metadata_filter=metadata_filter if slice_config.use_filter else None,
+            )
+            futures[future] = slice_config.name
+
+        # Wait until the deadline only; never join stragglers
+        done, not_done = wait(futures, timeout=self.timeout_seconds)
+
+        for future in futures:
+            slice_name = futures[future]
+            if future not in done:
+                continue
+            try:
+                results = future.result()
+                slice_results[slice_name] = results
+                logger.info(f"Slice '{slice_name}' returned {len(results)} results")
+            except Exception as e:
+                logger.warning(f"Slice '{slice_name}' failed: {e}")
+                # Continue with other slices
+
+        for future in not_done:
+            slice_name = futures[future]
+            # cancel() only succeeds if the slice never started; running calls
+            # finish in the background and their results are discarded
+            future.cancel()
+            _slice_latency.record_timeout(slice_name)
+            logger.warning(f"Slice '{slice_name}' abandoned after {self.timeout_seconds}s deadline")
 
         # Merge with score boost for filtered results
         total = sum(len(r) for r in slice_results.values())
@@ -421,6 +547,34 @@ class MultiSliceRetriever:
 
         return slices
 
+    def _timed_slice(
+        self,
+        query: str,
+        knowledge_base_id: str,
+        data_source_id: str | None,
+        slice_config: SliceConfig,
+        metadata_filter: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Execute a slice and record its latency in the slice histogram."""
+        start = time.perf_counter()
+        ok = False
+        try:
+            results = self._execute_slice(
+                query=query,
+                knowledge_base_id=knowledge_base_id,
+                data_source_id=data_source_id,
+                slice_config=slice_config,
+                metadata_filter=metadata_filter,
+            )
+            ok = True
+            return results
+        finally:
+            latency_ms = (time.perf_counter() - start) * 1000
+            _slice_latency.record(slice_config.name, latency_ms, ok=ok)
+            logger.info(
+                f"slice_latency name={slice_config.name} latency_ms={latency_ms:.1f} ok={ok}"
+            )
+
     def _execute_slice(
         self,
         query: str,
@@ -8,6 +8,7 @@ Provides OCR capabilities using:
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 
 import boto3
@@ -20,13 +21,58 @@ if TYPE_CHECKING:
 from .bedrock import BedrockClient
 from .image import prepare_bedrock_image_attachment
 from .models import Document, OcrBackend, Page, Status
-from .storage import parse_s3_uri, read_s3_binary, write_s3_text
+from .storage import (
+    delete_s3_object,
+    parse_s3_uri,
+    read_s3_binary,
+    write_s3_binary,
+    write_s3_text,
+)
 
 logger = logging.getLogger(__name__)
 
 # Threshold for determining if a PDF is text-native
 MIN_EXTRACTABLE_CHARS_PER_PAGE = 50
 
+# Prefix for per-batch sub-PDFs sent to Textract (expired by the working/ lifecycle rule)
+TEXTRACT_STAGING_PREFIX = "working/ocr"
+
+
+def copy_pdf_pages(source: "fitz.Document", page_start: int, page_end: int) -> bytes:
+    """
+    Copy a page range of an open PDF into a new, standalone PDF.
+
+    Args:
+        source: Open PyMuPDF document
+        page_start: First page to keep (1-indexed, inclusive)
+        page_end: Last page to keep (1-indexed, inclusive, clamped to the document)
+
+    Returns:
+        Bytes of the sub-PDF
+    """
+    with fitz.open() as subset:
+        subset.insert_pdf(source, from_page=page_start - 1, to_page=min(page_end, len(source)) - 1)
+        result: bytes = subset.tobytes(garbage=3, deflate=True)
+        return result
+
+
+def extract_pdf_page_range(pdf_bytes: bytes, page_start: int, page_end: int) -> bytes | None:
+    """
+    Copy a page range of a PDF into a new, standalone PDF.
+
+    Args:
+        pdf_bytes: Source PDF bytes
+        page_start: First page to keep (1-indexed, inclusive)
+        page_end: Last page to keep (1-indexed, inclusive)
+
+    Returns:
+        Bytes of the sub-PDF, or None if the range already covers the whole document
+    """
+    with fitz.open(stream=pdf_bytes, filetype="pdf") as source:
+        if page_start <= 1 and page_end >= len(source):
+            return None
+        return copy_pdf_pages(source, page_start, page_end)
+
 
 class OcrService:
     """
@@ -38,6 +84,7 @@ class OcrService:
         region: str | None = None,
         backend: str = "textract",
         bedrock_model_id: str | None = None,
+        max_workers: int = 1,
     ):
         """
         Initialize OCR service.
@@ -46,10 +93,12 @@ class OcrService:
             region: AWS region
             backend: OCR backend to use ('textract' or 'bedrock')
             bedrock_model_id: Bedrock model ID for OCR (if backend='bedrock')
+            max_workers: Concurrent Bedrock requests per PDF (1 = sequential)
         """
         self.region = region
         self.backend = backend
         self.bedrock_model_id = bedrock_model_id or "us.anthropic.claude-haiku-4-5-20251001-v1:0"
+        self.max_workers = max(1, max_workers)
 
         # Lazy-load clients
         self._textract_client: TextractClient | None = None
@@ -156,9 +205,12 @@ class OcrService:
             pdf_doc = fitz.open(stream=pdf_bytes, filetype="pdf")
             full_pdf_total = len(pdf_doc)
 
-            # Determine page range (convert 1-indexed to 0-indexed for PyMuPDF)
-            start_idx = (document.page_start - 1) if document.page_start else 0
-            end_idx = document.page_end if document.page_end else full_pdf_total
+            # Determine page range (convert 1-indexed to 0-indexed for PyMuPDF).
+            # Indices are in original-document space; page_offset maps them into
+            # a pre-sliced batch PDF.
+            offset = document.page_offset
+            start_idx = (document.page_start - 1) if document.page_start else offset
+            end_idx = document.page_end if document.page_end else offset + full_pdf_total
 
             # Compute actual batch size for this segment
             page_count = end_idx - start_idx
@@ -169,7 +221,7 @@ class OcrService:
             processed_count = 0
 
             for page_num in range(start_idx, end_idx):
-                page = pdf_doc[page_num]
+                page = pdf_doc[page_num - offset]
 
                 # Extract text
                 text = page.get_text()
@@ -288,54 +340,42 @@ class OcrService:
                 # Use async API for PDFs - requires S3 location
                 # Parse S3 URI from input
                 bucket, key = parse_s3_uri(document.input_s3_uri)
-                logger.info(f"Starting async Textract job for PDF: s3://{bucket}/{key}")
 
-                # Start async text detection
-                start_response = self.textract_client.start_document_text_detection(
-                    DocumentLocation={"S3Object": {"Bucket": bucket, "Name": key}}
-                )
-                job_id = start_response["JobId"]
-                logger.info(f"Textract job started: {job_id}")
-
-                # Poll for completion
-                import time
-
-                max_wait_seconds = 300  # 5 minutes max
-                poll_interval = 2
-                elapsed = 0
-
-                while elapsed < max_wait_seconds:
-                    response = self.textract_client.get_document_text_detection(JobId=job_id)
-                    status = response["JobStatus"]
-
-                    if status == "SUCCEEDED":
-                        logger.info(f"Textract job completed: {job_id}")
-                        break
-                    if status == "FAILED":
-                        error_msg = response.get("StatusMessage", "Unknown error")
-                        raise Exception(f"Textract job failed: {error_msg}")
-                    time.sleep(poll_interval)
-                    elapsed += poll_interval
-
-                if elapsed >= max_wait_seconds:
-                    raise Exception(f"Textract job timed out after {max_wait_seconds}s")
-
-                # Collect all results (may be paginated)
-                all_blocks = response.get("Blocks", [])
-                next_token = response.get("NextToken")
-
-                while next_token:
-                    response = self.textract_client.get_document_text_detection(
-                        JobId=job_id, NextToken=next_token
+                # In batch mode, send Textract only this batch's pages so cost and
+                # latency scale with the batch rather than the whole document
+                page_offset = document.page_offset
+                staged_uri = None
+                if is_batch_mode and not page_offset:
+                    assert document.page_start is not None  # checked by is_batch_mode
+                    assert document.page_end is not None  # checked by is_batch_mode
+                    sub_pdf = extract_pdf_page_range(
+                        document_bytes, document.page_start, document.page_end
                     )
-                    all_blocks.extend(response.get("Blocks", []))
-                    next_token = response.get("NextToken")
+                    if sub_pdf is not None:
+                        key = (
+                            f"{TEXTRACT_STAGING_PREFIX}/{document.document_id}/"
+                            f"pages_{document.page_start:03d}-{document.page_end:03d}.pdf"
+                        )
+                        staged_uri = write_s3_binary(
+                            f"s3://{bucket}/{key}", sub_pdf, content_type="application/pdf"
+                        )
+                        page_offset = document.page_start - 1
+
+                try:
+                    all_blocks = self._run_textract_job(bucket, key)
+                finally:
+                    if staged_uri:
+                        try:
+                            delete_s3_object(staged_uri)
+                        except ClientError as e:
+                            logger.warning(f"Failed to delete staged PDF {staged_uri}: {e}")
 
                 # Group blocks by page
                 pages_dict: dict[int, dict[str, list[Any]]] = {}
                 for block in all_blocks:
                     if block["BlockType"] == "LINE":
-                        page_num = block.get("Page", 1)
+                        # Map sub-PDF page numbers back to the original document
+                        page_num = block.get("Page", 1) + page_offset
                         # In batch mode, filter to only the requested page range
                         if (
                             is_batch_mode
@@ -387,7 +427,7 @@ class OcrService:
                     document.pages_failed = pages_in_batch - len(document.pages)
             else:
                 # Single image - use sync API
-                response = self.textract_client.detect_document_text(  # type: ignore[assignment]
+                response = self.textract_client.detect_document_text(
                     Document={"Bytes": document_bytes}
                 )
 
@@ -467,6 +507,65 @@ class OcrService:
             document.error_message = str(e)
             return document
 
+    def _run_textract_job(self, bucket: str, key: str) -> list[dict[str, Any]]:
+        """
+        Run an async Textract text detection job on an S3 PDF and collect its blocks.
+
+        Args:
+            bucket: S3 bucket holding the PDF
+            key: S3 key of the PDF
+
+        Returns:
+            All result blocks across paginated responses
+
+        Raises:
+            Exception: If the job fails or does not finish within 5 minutes
+        """
+        import time
+
+        logger.info(f"Starting async Textract job for PDF: s3://{bucket}/{key}")
+
+        # Start async text detection
+        start_response = self.textract_client.start_document_text_detection(
+            DocumentLocation={"S3Object": {"Bucket": bucket, "Name": key}}
+        )
+        job_id = start_response["JobId"]
+        logger.info(f"Textract job started: {job_id}")
+
+        # Poll for completion
+        max_wait_seconds = 300  # 5 minutes max
+        poll_interval = 2
+        elapsed = 0
+
+        while elapsed < max_wait_seconds:
+            response = self.textract_client.get_document_text_detection(JobId=job_id)
+            status = response["JobStatus"]
+
+            if status == "SUCCEEDED":
+                logger.info(f"Textract job completed: {job_id}")
+                break
+            if status == "FAILED":
+                error_msg = response.get("StatusMessage", "Unknown error")
+                raise Exception(f"Textract job failed: {error_msg}")
+            time.sleep(poll_interval)
+            elapsed += poll_interval
+
+        if elapsed >= max_wait_seconds:
+            raise Exception(f"Textract job timed out after {max_wait_seconds}s")
+
+        # Collect all results (may be paginated)
+        all_blocks: list[dict[str, Any]] = list(response.get("Blocks", []))  # type: ignore[arg-type]
+        next_token = response.get("NextToken")
+
+        while next_token:
+            response = self.textract_client.get_document_text_detection(
+                JobId=job_id, NextToken=next_token
+            )
+            all_blocks.extend(response.get("Blocks", []))  # type: ignore[arg-type]
+            next_token = response.get("NextToken")
+
+        return all_blocks
+
     def _render_page_to_image(self, pdf_page: Any, max_size_bytes: int = 5 * 1024 * 1024) -> bytes:
         """
         Render PDF page to image, reducing quality if needed to stay under size limit.
@@ -527,22 +626,67 @@ class OcrService:
         logger.error(f"Could not reduce image below {max_size_bytes / 1024 / 1024:.1f} MB")
         return img_bytes
 
+    def _ocr_page_image(self, img_bytes: bytes, page_number: int) -> tuple[str, bool]:
+        """
+        Run Bedrock OCR on a single rendered page.
+
+        Page-level errors are handled here so one failed page never aborts the batch.
+
+        Args:
+            img_bytes: Rendered page image
+            page_number: 1-indexed page number (for logging and placeholders)
+
+        Returns:
+            Tuple of (text or failure placeholder, whether extraction succeeded)
+        """
+        logger.info(f"Processing PDF page {page_number} with Bedrock")
+        image_attachment = prepare_bedrock_image_attachment(img_bytes)
+
+        system_prompt = "You are an OCR system. Extract all text from the image."
+        content = [
+            image_attachment,
+            {"text": "Extract all text from this image. Preserve the layout and structure."},
+        ]
+
+        try:
+            response = self.bedrock_client.invoke_model(
+                model_id=self.bedrock_model_id,
+                system_prompt=system_prompt,
+                content=content,
+                context="OCR",
+            )
+            return self.bedrock_client.extract_text_from_response(response), True
+        except Exception as e:
+            # Handle all page-level errors gracefully - use placeholder and continue
+            error_msg = str(e).lower()
+            if "content filtering" in error_msg or "output blocked" in error_msg:
+                logger.warning(f"Page {page_number} blocked by content filter")
+            else:
+                logger.error(f"Page {page_number} failed: {e}")
+            return f"[Page {page_number} could not be extracted: {type(e).__name__}]", False
+
     def _process_pdf_with_bedrock(
         self,
         pdf_bytes: bytes,
         page_start: int | None = None,
         page_end: int | None = None,
+        page_offset: int = 0,
     ) -> tuple[list[Page], list[str], int, int]:
         """
         Convert PDF pages to images and process each with Bedrock OCR.
 
+        With max_workers > 1 the Bedrock calls run concurrently; pages and text
+        parts are still returned in page order.
+
         Args:
             pdf_bytes: PDF file bytes
             page_start: Starting page (1-indexed, inclusive). None = first page.
             page_end: Ending page (1-indexed, inclusive). None = last page.
+            page_offset: Original-document pages preceding page 1 of pdf_bytes
+                (non-zero for pre-sliced batch PDFs)
 
         Returns:
-            Tuple of (list of Page objects, list of text strings)
+            Tuple of (Page objects, text parts, pages succeeded, pages failed)
         """
         pdf_doc = fitz.open(stream=pdf_bytes, filetype="pdf")
         total_pages = len(pdf_doc)
@@ -550,42 +694,37 @@ class OcrService:
         all_text_parts = []
 
         # Determine page range (convert 1-indexed to 0-indexed for PyMuPDF)
-        start_idx = (page_start - 1) if page_start else 0
-        end_idx = page_end if page_end else total_pages
-
-        pages_failed = 0
-        for page_num in range(start_idx, end_idx):
-            logger.info(f"Processing PDF page {page_num + 1}/{total_pages} with Bedrock")
-            pdf_page = pdf_doc[page_num]
-
-            # Render page to image, auto-reducing quality if needed
-            img_bytes = self._render_page_to_image(pdf_page)
-
-            # Process image with Bedrock
-            image_attachment = prepare_bedrock_image_attachment(img_bytes)
-
-            system_prompt = "You are an OCR system. Extract all text from the image."
-            content = [
-                image_attachment,
-                {"text": "Extract all text from this image. Preserve the layout and structure."},
+        start_idx = (page_start - 1) if page_start else page_offset
+        end_idx = page_end if page_end else page_offset + total_pages
+
+        page_nums = list(range(start_idx, end_idx))
+        workers = min(self.max_workers, len(page_nums))
+        if workers > 1:
+            # Create the boto3 client up front; lazy creation is not thread-safe.
+            # Pages are rendered here (PyMuPDF is not thread-safe) while earlier
+            # pages are already in flight, then reassembled in page order.
+            _ = self.bedrock_client.client
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(
+                        self._ocr_page_image,
+                        self._render_page_to_image(pdf_doc[page_num - page_offset]),
+                        page_num + 1,
+                    )
+                    for page_num in page_nums
+                ]
+                results = [future.result() for future in futures]
+        else:
+            results = [
+                self._ocr_page_image(
+                    self._render_page_to_image(pdf_doc[page_num - page_offset]), page_num + 1
+                )
+                for page_num in page_nums
             ]
 
-            try:
-                response = self.bedrock_client.invoke_model(
-                    model_id=self.bedrock_model_id,
-                    system_prompt=system_prompt,
-                    content=content,
-                    context="OCR",
-                )
-                text = self.bedrock_client.extract_text_from_response(response)
-            except Exception as e:
-                # Handle all page-level errors gracefully - use placeholder and continue
-                error_msg = str(e).lower()
-                if "content filtering" in error_msg or "output blocked" in error_msg:
-                    logger.warning(f"Page {page_num + 1} blocked by content filter")
-                else:
-                    logger.error(f"Page {page_num + 1} failed: {e}")
-                text = f"[Page {page_num + 1} could not be extracted: {type(e).__name__}]"
+        pages_failed = 0
+        for page_num, (text, succeeded) in zip(page_nums, results, strict=True):
+            if not succeeded:
                 pages_failed += 1
 
             all_text_parts.append(f"--- Page {page_num + 1} ---\n{text}")
@@ -631,6 +770,7 @@ class OcrService:
                     document_bytes,
                     page_start=document.page_start,
                     page_end=document.page_end,
+                    page_offset=document.page_offset,
                 )
                 pages, all_text_parts, pages_succeeded, pages_failed = result
                 document.pages = pages
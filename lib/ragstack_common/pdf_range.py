@@ -0,0 +1,591 @@
+"""
+Range-read PDF inspection.
+
+Opens a PDF stored in S3 without downloading the whole file. Only the byte
+ranges PyMuPDF needs to count pages and read the first few pages are
+fetched: the trailer, the cross-reference sections, the document catalog,
+the page-tree nodes leading to those pages, and the objects the pages use
+(content streams, fonts, form XObjects). Image data is skipped.
+
+The fetched ranges are written at their original offsets into a sparse file
+in /tmp, so MuPDF resolves every object through the real xref offsets and
+never reads the regions that were not fetched. If MuPDF has to repair the
+file anyway (it needed an object that was not fetched, or the xref did not
+describe the file), PdfRangeReadError is raised and the caller falls back to
+downloading the whole document.
+
+Usage:
+    try:
+        with open_pdf_head(s3_client, bucket, key, max_pages=3) as pdf_doc:
+            total_pages = len(pdf_doc)
+            text = pdf_doc[0].get_text()
+    except PdfRangeReadError:
+        ...  # download the whole PDF
+"""
+
+import logging
+import re
+import tempfile
+import zlib
+from bisect import bisect_right
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+import fitz  # PyMuPDF
+
+logger = logging.getLogger(__name__)
+
+# Bytes per ranged GET unit; reads are rounded out to whole blocks
+RANGE_BLOCK_SIZE = 64 * 1024
+
+# Give up (and download the whole file) after fetching this much
+MAX_RANGE_READ_BYTES = 32 * 1024 * 1024
+
+# Give up after visiting this many objects
+MAX_RANGE_READ_OBJECTS = 20000
+
+# Bytes read to parse an object's dictionary before deciding to fetch its stream
+OBJECT_HEAD_BYTES = 4096
+
+# Catalog entries PyMuPDF reads when it opens a document: optional content,
+# the outline and the named destinations the outline resolves
+_CATALOG_KEYS = ("OCProperties", "Outlines", "Names", "Dests", "PageLabels")
+
+# Streams whose data is never read for text: images and attached files
+_SKIPPED_STREAM = re.compile(rb"/Subtype\s*/Image\b|/Type\s*/EmbeddedFile\b")
+
+_REF = re.compile(rb"(\d+)\s+(\d+)\s+R\b")
+_OBJ_HEADER = re.compile(rb"\s*(\d+)\s+(\d+)\s+obj\b")
+_STREAM_KEYWORD = re.compile(rb"stream\r?\n")
+_XREF_SUBSECTION = re.compile(rb"(\d+)\s+(\d+)\s*[\r\n]+")
+
+
+class PdfRangeReadError(Exception):
+    """PDF cannot be inspected from byte ranges; download the whole file."""
+
+
+@dataclass
+class PdfHead:
+    """A range-read PDF: its page count and a document holding its first pages."""
+
+    total_pages: int
+    document: "fitz.Document"
+
+
+class _SparseSource:
+    """S3 object mirrored into a sparse local file, filled block by block."""
+
+    def __init__(self, s3_client: Any, bucket: str, key: str, size: int, file: Any):
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.key = key
+        self.size = size
+        self.file = file
+        self.blocks: set[int] = set()
+        self.requests = 0
+        self.bytes_fetched = 0
+
+    def ensure(self, start: int, end: int) -> None:
+        """Fetch bytes [start, end) unless already present (one GET per missing run)."""
+        start = max(start, 0)
+        end = min(end, self.size)
+        if start >= end:
+            return
+        missing = [
+            b
+            for b in range(start // RANGE_BLOCK_SIZE, (end - 1) // RANGE_BLOCK_SIZE + 1)
+            if b not in self.blocks
+        ]
+        runs: list[list[int]] = []
+        for block in missing:
+            if runs and runs[-1][1] == block - 1:
+                runs[-1][1] = block
+            else:
+                runs.append([block, block])
+
+        for first, last in runs:
+            range_start = first * RANGE_BLOCK_SIZE
+            range_end = min((last + 1) * RANGE_BLOCK_SIZE, self.size)
+            if self.bytes_fetched + range_end - range_start > MAX_RANGE_READ_BYTES:
+                raise PdfRangeReadError(f"Range reads exceed {MAX_RANGE_READ_BYTES} bytes")
+            response = self.s3_client.get_object(
+                Bucket=self.bucket, Key=self.key, Range=f"bytes={range_start}-{range_end - 1}"
+            )
+            data = response["Body"].read()
+            if len(data) != range_end - range_start:
+                raise PdfRangeReadError("Short range read (object changed during inspection?)")
+            self.file.seek(range_start)
+            self.file.write(data)
+            self.blocks.update(range(first, last + 1))
+            self.requests += 1
+            self.bytes_fetched += len(data)
+
+    def read(self, start: int, end: int) -> bytes:
+        """Read bytes [start, end), fetching them first if needed."""
+        self.ensure(start, end)
+        self.file.seek(max(start, 0))
+        data: bytes = self.file.read(max(min(end, self.size) - max(start, 0), 0))
+        return data
+
+
+def _dict_end(data: bytes, start: int) -> int:
+    """Return the offset just past the dictionary opening at data[start:]."""
+    depth = 0
+    i = start
+    n = len(data)
+    while i < n:
+        c = data[i : i + 1]
+        if data.startswith(b"<<", i):
+            depth += 1
+            i += 2
+            continue
+        if data.startswith(b">>", i):
+            depth -= 1
+            i += 2
+            if depth == 0:
+                return i
+            continue
+        if c == b"(":
+            # Literal string: skip balanced parentheses and escapes
+            nesting = 0
+            while i < n:
+                ch = data[i : i + 1]
+                if ch == b"\\":
+                    i += 2
+                    continue
+                if ch == b"(":
+                    nesting += 1
+                elif ch == b")":
+                    nesting -= 1
+                    if nesting == 0:
+                        break
+                i += 1
+        i += 1
+    raise PdfRangeReadError("Unterminated dictionary")
+
+
+def _int_entry(dict_bytes: bytes, name: bytes) -> int | None:
+    """Return a direct integer entry of a dictionary."""
+    match = re.search(rb"/" + name + rb"\s+(\d+)(?!\s+\d+\s+R)", dict_bytes)
+    return int(match.group(1)) if match else None
+
+
+def _ref_entry(dict_bytes: bytes, name: bytes) -> int | None:
+    """Return the object number of an indirect-reference entry of a dictionary."""
+    match = re.search(rb"/" + name + rb"\s+(\d+)\s+\d+\s+R\b", dict_bytes)
+    return int(match.group(1)) if match else None
+
+
+def _png_unpredict(data: bytes, columns: int) -> bytes:
+    """Undo PNG row predictors (xref and object streams use one byte per pixel)."""
+    out = bytearray()
+    prev = bytearray(columns)
+    row_size = columns + 1
+    for offset in range(0, len(data) - columns, row_size):
+        kind = data[offset]
+        row = bytearray(data[offset + 1 : offset + row_size])
+        for i in range(columns):
+            left = row[i - 1] if i else 0
+            if kind == 1:
+                row[i] = (row[i] + left) & 0xFF
+            elif kind == 2:
+                row[i] = (row[i] + prev[i]) & 0xFF
+            elif kind == 3:
+                row[i] = (row[i] + ((left + prev[i]) >> 1)) & 0xFF
+            elif kind == 4:
+                up_left = prev[i - 1] if i else 0
+                p = left + prev[i] - up_left
+                pa, pb, pc = abs(p - left), abs(p - prev[i]), abs(p - up_left)
+                predictor = left if pa <= pb and pa <= pc else prev[i] if pb <= pc else up_left
+                row[i] = (row[i] + predictor) & 0xFF
+        out += row
+        prev = row
+    return bytes(out)
+
+
+class _PdfReader:
+    """Minimal cross-reference walker over a _SparseSource."""
+
+    def __init__(self, source: _SparseSource):
+        self.source = source
+        # Object number -> (1, offset, generation) in file, (2, object stream, index)
+        # compressed, or (0, 0, 0) free
+        self.xref: dict[int, tuple[int, int, int]] = {}
+        self.trailer = b""
+        self.startxref = 0
+        self.offsets: list[int] = []
+        self.object_streams: dict[int, dict[int, bytes]] = {}
+
+    # Cross-reference sections
+
+    def load_xref(self) -> None:
+        """Read the trailer and every cross-reference section (/Prev chain)."""
+        size = self.source.size
+        tail = self.source.read(size - RANGE_BLOCK_SIZE, size)
+        position = tail.rfind(b"startxref")
+        if position < 0:
+            raise PdfRangeReadError("No startxref in the last block")
+        match = re.match(rb"startxref\s+(\d+)", tail[position:])
+        if not match:
+            raise PdfRangeReadError("Malformed startxref")
+        self.startxref = int(match.group(1))
+
+        seen: set[int] = set()
+        offset: int | None = self.startxref
+        while offset is not None:
+            if offset in seen or offset >= size:
+                raise PdfRangeReadError(f"Bad cross-reference offset {offset}")
+            seen.add(offset)
+            head = self.source.read(offset, offset + 16)
+            if head.lstrip().startswith(b"xref"):
+                trailer = self._read_xref_table(offset)
+                xref_stream = _int_entry(trailer, b"XRefStm")
+                if xref_stream is not None:
+                    # Hybrid file: table entries win, the stream fills the gaps
+                    self._read_xref_stream(xref_stream)
+            else:
+                trailer = self._read_xref_stream(offset)
+            if not self.trailer:
+                self.trailer = trailer
+            offset = _int_entry(trailer, b"Prev")
+
+        if re.search(rb"/Encrypt\b", self.trailer):
+            raise PdfRangeReadError("Encrypted PDF")
+        if _ref_entry(self.trailer, b"Root") is None:
+            raise PdfRangeReadError("Trailer has no /Root")
+        self.offsets = sorted({off for kind, off, _ in self.xref.values() if kind == 1})
+
+    def _add_entry(self, num: int, entry: tuple[int, int, int]) -> None:
+        """Record an entry unless a newer section already defined the object."""
+        if num not in self.xref:
+            self.xref[num] = entry
+
+    def _read_xref_table(self, offset: int) -> bytes:
+        """Parse a classic xref table; return its trailer dictionary."""
+        position = offset + self.source.read(offset, offset + 16).index(b"xref") + 4
+        while True:
+            chunk = self.source.read(position, position + 64)
+            stripped = chunk.lstrip()
+            position += len(chunk) - len(stripped)
+            if stripped.startswith(b"trailer"):
+                break
+            match = _XREF_SUBSECTION.match(stripped)
+            if not match:
+                raise PdfRangeReadError("Malformed xref subsection")
+            first, count = int(match.group(1)), int(match.group(2))
+            position += match.end()
+            table = self.source.read(position, position + 20 * count)
+            for i in range(count):
+                entry = table[20 * i : 20 * i + 18].split()
+                if len(entry) != 3:
+                    raise PdfRangeReadError("Malformed xref entry")
+                if entry[2] == b"n":
+                    self._add_entry(first + i, (1, int(entry[0]), int(entry[1])))
+                else:
+                    self._add_entry(first + i, (0, 0, 0))
+            position += 20 * count
+
+        data = self.source.read(position, position + RANGE_BLOCK_SIZE)
+        start = data.index(b"<<")
+        return data[start : _dict_end(data, start)]
+
+    def _read_xref_stream(self, offset: int) -> bytes:
+        """Parse a cross-reference stream; return its dictionary."""
+        dict_bytes, data = self._read_stream(offset)
+        if not re.search(rb"/Type\s*/XRef\b", dict_bytes):
+            raise PdfRangeReadError(f"No cross-reference at offset {offset}")
+        widths_match = re.search(rb"/W\s*\[\s*(\d+)\s+(\d+)\s+(\d+)\s*\]", dict_bytes)
+        size = _int_entry(dict_bytes, b"Size")
+        if not widths_match or size is None:
+            raise PdfRangeReadError("Malformed cross-reference stream")
+        widths = [int(w) for w in widths_match.groups()]
+        index_match = re.search(rb"/Index\s*\[([\d\s]*)\]", dict_bytes)
+        index = [int(n) for n in index_match.group(1).split()] if index_match else [0, size]
+
+        row = sum(widths)
+        position = 0
+        for first, count in zip(index[::2], index[1::2], strict=True):
+            for num in range(first, first + count):
+                fields = []
+                for width in widths:
+                    fields.append(int.from_bytes(data[position : position + width], "big"))
+                    position += width
+                kind = fields[0] if widths[0] else 1
+                self._add_entry(num, (kind, fields[1], fields[2]))
+            if position > len(data) or row == 0:
+                raise PdfRangeReadError("Truncated cross-reference stream")
+        return dict_bytes
+
+    # Objects
+
+    def _object_end(self, offset: int) -> int:
+        """End of the object at offset: the next object's offset (or the xref)."""
+        i = bisect_right(self.offsets, offset)
+        candidates = [self.source.size]
+        if i < len(self.offsets):
+            candidates.append(self.offsets[i])
+        if self.startxref > offset:
+            candidates.append(self.startxref)
+        return min(candidates)
+
+    def _read_object_head(self, offset: int) -> tuple[bytes, int]:
+        """
+        Read an object's header and value (the dictionary, for streams).
+
+        Returns:
+            (value bytes, file offset just past the value)
+        """
+        for limit in (OBJECT_HEAD_BYTES, self._object_end(offset) - offset):
+            data = self.source.read(offset, offset + limit)
+            header = _OBJ_HEADER.match(data)
+            if not header:
+                raise PdfRangeReadError(f"No object at offset {offset}")
+            stripped = data[header.end() :].lstrip()
+            body_start = len(data) - len(stripped)
+            try:
+                if stripped.startswith(b"<<"):
+                    body_end = _dict_end(data, body_start)
+                else:
+                    body_end = data.index(b"endobj", body_start)
+            except (PdfRangeReadError, ValueError):
+                continue  # Value runs past the first read; retry up to the next object
+            return data[body_start:body_end], offset + body_end
+        raise PdfRangeReadError(f"Unterminated object at offset {offset}")
+
+    def _read_stream(self, offset: int) -> tuple[bytes, bytes]:
+        """Read a stream object's dictionary and decoded data."""
+        dict_bytes, dict_end = self._read_object_head(offset)
+        length = _int_entry(dict_bytes, b"Length")
+        if length is None:
+            length_ref = _ref_entry(dict_bytes, b"Length")
+            if length_ref is None:
+                raise PdfRangeReadError("Stream without /Length")
+            length = int(self.get_object(length_ref).strip())
+        after = self.source.read(dict_end, dict_end + 32)
+        match = _STREAM_KEYWORD.search(after)
+        if not match:
+            raise PdfRangeReadError(f"No stream keyword at offset {offset}")
+        data_start = dict_end + match.end()
+        data = self.source.read(data_start, data_start + length)
+
+        filters = re.search(rb"/Filter\s*(\[[^\]]*\]|/\w+)", dict_bytes)
+        if filters:
+            names = re.findall(rb"/(\w+)", filters.group(1))
+            if names != [b"FlateDecode"]:
+                raise PdfRangeReadError(f"Unsupported stream filter {filters.group(1)!r}")
+            try:
+                data = zlib.decompress(data)
+            except zlib.error as e:
+                raise PdfRangeReadError(f"Corrupt stream at offset {offset}: {e}") from e
+            predictor = _int_entry(dict_bytes, b"Predictor") or 1
+            if predictor >= 10:
+                data = _png_unpredict(data, _int_entry(dict_bytes, b"Columns") or 1)
+            elif predictor != 1:
+                raise PdfRangeReadError(f"Unsupported predictor {predictor}")
+        return dict_bytes, data
+
+    def get_object(self, num: int) -> bytes:
+        """Return an object's value (dictionary only, for streams)."""
+        kind, field, index = self.xref.get(num, (0, 0, 0))
+        if kind == 1:
+            value, _ = self._read_object_head(field)
+            return value
+        if kind == 2:
+            return self._object_stream(field)[num]
+        raise PdfRangeReadError(f"Object {num} is not in the cross-reference")
+
+    def _object_stream(self, num: int) -> dict[int, bytes]:
+        """Decode an object stream (and mirror its bytes for MuPDF)."""
+        if num not in self.object_streams:
+            kind, offset, _ = self.xref.get(num, (0, 0, 0))
+            if kind != 1:
+                raise PdfRangeReadError(f"Object stream {num} is not in the file")
+            dict_bytes, data = self._read_stream(offset)
+            count = _int_entry(dict_bytes, b"N") or 0
+            first = _int_entry(dict_bytes, b"First") or 0
+            header = [int(n) for n in data[:first].split()]
+            objects: dict[int, bytes] = {}
+            for i in range(count):
+                start = first + header[2 * i + 1]
+                end = first + header[2 * i + 3] if i + 1 < count else len(data)
+                objects[header[2 * i]] = data[start:end].strip()
+            self.object_streams[num] = objects
+        return self.object_streams[num]
+
+    def ref(self, num: int) -> bytes:
+        """Return an indirect reference to an object ("N G R")."""
+        kind, _, generation = self.xref.get(num, (0, 0, 0))
+        return f"{num} {generation if kind == 1 else 0} R".encode()
+
+    def fetch_object(self, num: int) -> bytes:
+        """
+        Mirror an object for MuPDF and return its value.
+
+        Image and attached-file streams keep only their dictionary; other
+        streams are fetched whole.
+        """
+        value = self.get_object(num)
+        kind, offset, _ = self.xref[num]
+        if kind == 1 and not _SKIPPED_STREAM.search(value):
+            self.source.ensure(offset, self._object_end(offset))
+        return value
+
+
+def _collect_pages(reader: _PdfReader, max_pages: int) -> tuple[int, int, bytes, list[int]]:
+    """
+    Fetch the catalog and the page-tree nodes leading to the first pages.
+
+    Returns:
+        (page count, page-tree root object number, page-tree root dictionary,
+        first max_pages leaf page objects)
+    """
+    root = reader.fetch_object(_ref_entry(reader.trailer, b"Root") or 0)
+    info = _ref_entry(reader.trailer, b"Info")
+    if info is not None:
+        reader.fetch_object(info)
+    for key in _CATALOG_KEYS:
+        ref = _ref_entry(root, key.encode())
+        if ref is not None:
+            _fetch_closure(reader, [ref], set())
+
+    pages_root = _ref_entry(root, b"Pages")
+    if pages_root is None:
+        raise PdfRangeReadError("Catalog has no /Pages")
+    root_node = reader.fetch_object(pages_root)
+    total_pages = _int_entry(root_node, b"Count")
+    if total_pages is None:
+        raise PdfRangeReadError("Page tree root has no /Count")
+
+    leaves: list[int] = []
+    # Depth-first in document order, stopping once enough leaves are found
+    stack = [pages_root]
+    visited: set[int] = set()
+    while stack and len(leaves) < min(max_pages, total_pages):
+        num = stack.pop()
+        if num in visited:
+            raise PdfRangeReadError("Cycle in page tree")
+        visited.add(num)
+        node = reader.fetch_object(num)
+        kids = re.search(rb"/Kids\s*\[([^\]]*)\]", node)
+        if kids is None:
+            leaves.append(num)
+            continue
+        refs = [int(m.group(1)) for m in _REF.finditer(kids.group(1))]
+        stack.extend(reversed(refs))
+    return total_pages, pages_root, root_node, leaves
+
+
+def _fetch_closure(reader: _PdfReader, start: list[int], pages: set[int]) -> None:
+    """Fetch every object reachable from start, not crossing into other pages."""
+    seen: set[int] = set()
+    stack = list(start)
+    while stack:
+        num = stack.pop()
+        if num in seen:
+            continue
+        seen.add(num)
+        if len(seen) > MAX_RANGE_READ_OBJECTS:
+            raise PdfRangeReadError(f"More than {MAX_RANGE_READ_OBJECTS} objects")
+        if reader.xref.get(num, (0, 0, 0))[0] == 0:
+            continue  # Free or missing objects resolve to null
+        value = reader.get_object(num)
+        if num not in pages and re.search(rb"/Type\s*/(Pages?|Catalog)\b", value):
+            continue
+        reader.fetch_object(num)
+        stack.extend(int(match.group(1)) for match in _REF.finditer(value))
+
+
+def _append_page_tree(
+    reader: _PdfReader, pages_root: int, root_node: bytes, leaves: list[int]
+) -> None:
+    """
+    Append an incremental update whose page-tree root lists only the leaves.
+
+    MuPDF reads every page object in the tree the first time it loads a
+    page. The update (written to the local file only) replaces the root's
+    /Kids and /Count so it never looks beyond the fetched pages.
+    """
+    source = reader.source
+    kids = b" ".join(reader.ref(num) for num in leaves)
+    node = re.sub(rb"/Kids\s*\[[^\]]*\]", b"/Kids [" + kids + b"]", root_node, count=1)
+    node = re.sub(rb"/Count\s+\d+", b"/Count %d" % len(leaves), node, count=1)
+    generation = reader.ref(pages_root).split()[1]
+
+    trailer = b"/Size %d /Prev %d" % (max(reader.xref) + 1, reader.startxref)
+    for name in (b"Root", b"Info"):
+        entry = re.search(rb"/" + name + rb"\s+\d+\s+\d+\s+R\b", reader.trailer)
+        if entry:
+            trailer += b" " + entry.group(0)
+
+    offset = source.size + 1
+    update = b"\n%d %s obj\n%s\nendobj\n" % (pages_root, generation, node)
+    xref_offset = offset + len(update) - 1
+    update += b"xref\n%d 1\n%010d %05d n \n" % (pages_root, offset, int(generation))
+    update += b"trailer\n<< %s >>\nstartxref\n%d\n%%%%EOF\n" % (trailer, xref_offset)
+    source.file.seek(source.size)
+    source.file.write(update)
+
+
+@contextmanager
+def open_pdf_head(s3_client: Any, bucket: str, key: str, max_pages: int = 3) -> Iterator[PdfHead]:
+    """
+    Open a PDF in S3 reading only its structure and first pages.
+
+    The yielded document contains only the first max_pages pages; the
+    page count of the whole file is PdfHead.total_pages. The check for
+    repairs also runs when the block exits, so callers must discard their
+    results if PdfRangeReadError is raised.
+
+    Args:
+        s3_client: Boto3 S3 client
+        bucket: Bucket name
+        key: Object key
+        max_pages: Number of leading pages to make readable
+
+    Yields:
+        PdfHead with the page count and the open PyMuPDF document
+
+    Raises:
+        PdfRangeReadError: If the file cannot be read from byte ranges
+    """
+    size = int(s3_client.head_object(Bucket=bucket, Key=key)["ContentLength"])
+    if size == 0:
+        raise PdfRangeReadError("Empty file")
+
+    with tempfile.NamedTemporaryFile(suffix=".pdf") as tmp:
+        tmp.truncate(size)  # Sparse: unfetched ranges take no disk space
+        source = _SparseSource(s3_client, bucket, key, size, tmp)
+        reader = _PdfReader(source)
+        try:
+            # The header block holds %PDF- and, in linearized files, the first-page xref
+            source.ensure(0, RANGE_BLOCK_SIZE)
+            reader.load_xref()
+            total_pages, pages_root, root_node, leaves = _collect_pages(reader, max_pages)
+            _fetch_closure(reader, leaves, set(leaves))
+            _append_page_tree(reader, pages_root, root_node, leaves)
+        except PdfRangeReadError:
+            raise
+        except Exception as e:
+            raise PdfRangeReadError(f"Could not parse PDF structure: {e}") from e
+        tmp.flush()
+
+        logger.info(
+            f"Range-read {source.bytes_fetched} of {size} bytes in {source.requests} "
+            f"requests for s3://{bucket}/{key}"
+        )
+
+        try:
+            pdf_doc = fitz.open(tmp.name)
+        except Exception as e:
+            raise PdfRangeReadError(f"PyMuPDF could not open range-read PDF: {e}") from e
+        try:
+            if pdf_doc.is_repaired or len(pdf_doc) != len(leaves):
+                raise PdfRangeReadError("Range-read PDF needed repair on open")
+            yield PdfHead(total_pages=total_pages, document=pdf_doc)
+            # MuPDF repairs the file when it loads an object that was not fetched
+            if pdf_doc.is_repaired:
+                raise PdfRangeReadError("Range-read PDF needed repair while reading pages")
+        finally:
+            pdf_doc.close()
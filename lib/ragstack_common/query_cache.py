@@ -0,0 +1,316 @@
+"""
+Query-result cache for Knowledge Base retrieval.
+
+Caches the generated metadata filter and the raw ``bedrock_agent.retrieve``
+results for repeated queries in a DynamoDB table with a TTL. Keys combine
+the KB ID, the KB content version, the normalized query and (for results)
+the filter and retrieval settings, so a bump of the content version by
+ingest_to_kb or reindex_kb orphans every existing entry; orphaned entries
+expire through the table's TTL.
+
+All cache operations are best-effort: DynamoDB errors are logged and treated
+as misses so a cache outage never fails a query.
+
+Usage:
+    from ragstack_common.query_cache import QueryResultCache, bump_kb_content_version
+
+    cache = QueryResultCache(table_name, ttl_seconds=3600)
+    hit, generated_filter = cache.get_filter(kb_id, query, variant)
+    if not hit:
+        generated_filter = filter_generator.generate_filter(query)
+        cache.put_filter(kb_id, query, variant, generated_filter)
+
+    # After a successful ingestion
+    bump_kb_content_version(table_name)
+"""
+
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+import zlib
+from typing import Any
+
+import boto3
+from botocore.exceptions import ClientError
+
+logger = logging.getLogger(__name__)
+
+# Key of the item holding the global KB content version counter
+CONTENT_VERSION_KEY = "kb_content_version"
+
+# DynamoDB items are limited to 400KB; leave headroom for key and attributes
+MAX_PAYLOAD_BYTES = 350_000
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Lazy-initialized resource
+_dynamodb = None
+
+
+def _get_dynamodb() -> Any:
+    """Get or create DynamoDB resource."""
+    global _dynamodb
+    if _dynamodb is None:
+        _dynamodb = boto3.resource("dynamodb")
+    return _dynamodb
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normalize a query for exact-match cache lookups.
+
+    Lowercases, collapses whitespace and strips trailing punctuation so
+    trivially different phrasings of the same question share an entry.
+
+    Args:
+        query: Retrieval query text.
+
+    Returns:
+        Normalized query string.
+    """
+    return _WHITESPACE_RE.sub(" ", query.lower()).strip().rstrip("?!.").strip()
+
+
+def bump_kb_content_version(table_name: str | None) -> None:
+    """
+    Increment the KB content version, invalidating all cached query results.
+
+    Best-effort: failures are logged and swallowed so ingestion never fails
+    because of the cache.
+
+    Args:
+        table_name: Query cache table name. No-op when empty.
+    """
+    if not table_name:
+        return
+    try:
+        _get_dynamodb().Table(table_name).update_item(
+            Key={"cache_key": CONTENT_VERSION_KEY},
+            UpdateExpression="ADD content_version :one",
+            ExpressionAttributeValues={":one": 1},
+        )
+    except ClientError as e:
+        logger.warning(f"Failed to bump KB content version: {e}")
+
+
+class QueryResultCache:
+    """
+    DynamoDB-backed cache for generated filters and retrieval results.
+
+    Hit/miss counters are kept per instance (one per warm Lambda container)
+    and reported through get_stats() and a structured log line per lookup.
+    """
+
+    def __init__(
+        self,
+        table_name: str,
+        ttl_seconds: int,
+        version_ttl_seconds: float = 5.0,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            table_name: DynamoDB table with hash key ``cache_key`` and TTL on ``ttl``.
+            ttl_seconds: Lifetime of cached entries.
+            version_ttl_seconds: How long the content version is reused before
+                it is re-read, bounding how stale a warm container can be after
+                an ingestion.
+        """
+        self.table_name = table_name
+        self.ttl_seconds = ttl_seconds
+        self.version_ttl_seconds = version_ttl_seconds
+        self._table = _get_dynamodb().Table(table_name)
+        self._version: int | None = None
+        self._version_loaded_at = 0.0
+        self._lock = threading.Lock()
+        self._stats = {"filter_hits": 0, "filter_misses": 0, "result_hits": 0, "result_misses": 0}
+
+    def content_version(self) -> int | None:
+        """
+        Read the KB content version to key one request's lookups and writes.
+
+        Callers that look up and later store entries should read the version
+        once and pass it to both, so results computed while a version bump
+        lands are stored under the version they were looked up with (and are
+        never served after the bump).
+
+        Returns:
+            Content version, or None if it could not be read (skip caching).
+        """
+        try:
+            return self._content_version()
+        except ClientError as e:
+            logger.warning(f"Query cache version read failed: {e}")
+            return None
+
+    def get_filter(
+        self, kb_id: str, query: str, variant: str = "", version: int | None = None
+    ) -> tuple[bool, dict[str, Any] | None]:
+        """
+        Look up a cached generated filter.
+
+        Args:
+            kb_id: Knowledge Base ID.
+            query: Retrieval query.
+            variant: Filter generation settings (e.g. extraction mode and keys).
+            version: Content version from content_version() (read now if None).
+
+        Returns:
+            Tuple of (hit, filter). A hit may carry a None filter, meaning the
+            generator produced no filter for this query.
+        """
+        payload = self._get("filter", self._filter_key(kb_id, query, variant), version)
+        if payload is None:
+            return False, None
+        return True, payload.get("filter")
+
+    def put_filter(
+        self,
+        kb_id: str,
+        query: str,
+        variant: str,
+        generated_filter: dict[str, Any] | None,
+        version: int | None = None,
+    ) -> None:
+        """Store a generated filter (None is cached as "no filter")."""
+        self._put(self._filter_key(kb_id, query, variant), {"filter": generated_filter}, version)
+
+    def get_results(
+        self,
+        kb_id: str,
+        query: str,
+        generated_filter: dict[str, Any] | None,
+        variant: str = "",
+        version: int | None = None,
+    ) -> list[Any] | None:
+        """
+        Look up cached retrieval results.
+
+        Args:
+            kb_id: Knowledge Base ID.
+            query: Retrieval query.
+            generated_filter: Filter the results were retrieved with.
+            variant: Retrieval settings (e.g. multislice flag, boost, result count).
+            version: Content version from content_version() (read now if None).
+
+        Returns:
+            Cached retrieval results, or None on a miss.
+        """
+        payload = self._get(
+            "results", self._results_key(kb_id, query, generated_filter, variant), version
+        )
+        if payload is None:
+            return None
+        results: list[Any] = payload.get("results", [])
+        return results
+
+    def put_results(
+        self,
+        kb_id: str,
+        query: str,
+        generated_filter: dict[str, Any] | None,
+        variant: str,
+        results: list[Any],
+        version: int | None = None,
+    ) -> None:
+        """Store retrieval results. Empty result lists are not cached."""
+        if not results:
+            return
+        self._put(
+            self._results_key(kb_id, query, generated_filter, variant),
+            {"results": results},
+            version,
+        )
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Return hit/miss counters and hit rates for this instance.
+
+        Returns:
+            Dict with filter/result hit and miss counts plus ``filter_hit_rate``
+            and ``result_hit_rate`` (0.0 when no lookups were made).
+        """
+        with self._lock:
+            stats: dict[str, Any] = dict(self._stats)
+        for kind in ("filter", "result"):
+            total = stats[f"{kind}_hits"] + stats[f"{kind}_misses"]
+            stats[f"{kind}_hit_rate"] = stats[f"{kind}_hits"] / total if total else 0.0
+        return stats
+
+    def _content_version(self) -> int:
+        """Return the KB content version, re-reading it every version_ttl_seconds."""
+        now = time.monotonic()
+        if self._version is not None and now - self._version_loaded_at < self.version_ttl_seconds:
+            return self._version
+        response = self._table.get_item(
+            Key={"cache_key": CONTENT_VERSION_KEY}, ProjectionExpression="content_version"
+        )
+        self._version = int(response.get("Item", {}).get("content_version", 0))
+        self._version_loaded_at = now
+        return self._version
+
+    def _filter_key(self, kb_id: str, query: str, variant: str) -> tuple[str, ...]:
+        return ("filter", kb_id, normalize_query(query), variant)
+
+    def _results_key(
+        self, kb_id: str, query: str, generated_filter: dict[str, Any] | None, variant: str
+    ) -> tuple[str, ...]:
+        filter_json = json.dumps(generated_filter, sort_keys=True, default=str)
+        return ("results", kb_id, normalize_query(query), filter_json, variant)
+
+    def _hash_key(self, parts: tuple[str, ...], version: int | None) -> str:
+        if version is None:
+            version = self._content_version()
+        raw = json.dumps([version, *parts])
+        return f"{parts[0]}#{hashlib.sha256(raw.encode('utf-8')).hexdigest()}"
+
+    def _record(self, kind: str, hit: bool) -> None:
+        stat = "filter" if kind == "filter" else "result"
+        with self._lock:
+            self._stats[f"{stat}_{'hits' if hit else 'misses'}"] += 1
+            hits = self._stats[f"{stat}_hits"]
+            total = hits + self._stats[f"{stat}_misses"]
+        logger.info(f"query_cache kind={kind} hit={hit} hit_rate={hits / total:.3f}")
+
+    def _get(self, kind: str, parts: tuple[str, ...], version: int | None) -> dict[str, Any] | None:
+        try:
+            cache_key = self._hash_key(parts, version)
+            item = self._table.get_item(Key={"cache_key": cache_key}).get("Item")
+        except ClientError as e:
+            logger.warning(f"Query cache lookup failed: {e}")
+            self._record(kind, hit=False)
+            return None
+
+        # DynamoDB TTL deletion is lazy; treat expired entries as misses
+        if not item or int(item.get("ttl", 0)) <= int(time.time()):
+            self._record(kind, hit=False)
+            return None
+
+        try:
+            payload: dict[str, Any] = json.loads(zlib.decompress(bytes(item["payload"])))
+        except (KeyError, TypeError, ValueError, zlib.error) as e:
+            logger.warning(f"Discarding unreadable query cache entry: {e}")
+            self._record(kind, hit=False)
+            return None
+        self._record(kind, hit=True)
+        return payload
+
+    def _put(self, parts: tuple[str, ...], payload: dict[str, Any], version: int | None) -> None:
+        blob = zlib.compress(json.dumps(payload, default=str).encode("utf-8"))
+        if len(blob) > MAX_PAYLOAD_BYTES:
+            logger.info(f"Skipping query cache write: payload {len(blob)} bytes too large")
+            return
+        try:
+            self._table.put_item(
+                Item={
+                    "cache_key": self._hash_key(parts, version),
+                    "payload": blob,
+                    "ttl": int(time.time()) + self.ttl_seconds,
+                }
+            )
+        except ClientError as e:
+            logger.warning(f"Query cache write failed: {e}")
@@ -0,0 +1,72 @@
+"""
+Token-bucket rate limiter for sharing a request budget across threads.
+
+Used where a Lambda fans work out to a thread pool but the downstream
+service (typically Bedrock) has a per-second quota that all workers share.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    ``acquire()`` reserves tokens immediately and sleeps outside the lock for
+    any deficit, so concurrent callers are spaced out fairly in arrival order.
+
+    A rate of zero or less disables limiting (acquire never waits).
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second (requests per second)
+            capacity: Maximum burst size (defaults to max(1, rate))
+            clock: Monotonic clock, injectable for tests
+            sleep: Sleep function, injectable for tests
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens from the bucket, blocking until they are available.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            Seconds spent waiting
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        with self._lock:
+            now = self._clock()
+            elapsed = now - self._updated_at
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated_at = now
+            # Reserve now; a negative balance is the queue of callers ahead of us
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            self._sleep(wait)
+        return wait
@@ -5,13 +5,17 @@ This module provides URL discovery, content fetching, HTML-to-Markdown extractio
 and content deduplication for ingesting web documentation into the Bedrock Knowledge Base.
 
 Architecture:
-- Discovery: Recursive URL discovery via SQS with scope enforcement
+- Discovery: Recursive URL discovery via SQS with scope enforcement, or
+  sitemap-driven discovery seeded from robots.txt
 - Fetcher: HTTP-first with Playwright fallback for SPAs
 - Extractor: HTML sanitization and Markdown conversion
 - Dedup: Content-hash based deduplication across scrape jobs
+- Scheduler: Per-host rate and concurrency limits for concurrent discovery
+- Frontier: Per-job Bloom filter of visited URLs for discovery
 """
 
 from ragstack_common.scraper.models import (
+    DiscoveryMode,
     ScrapeConfig,
     ScrapeJob,
     ScrapePage,
@@ -21,6 +25,7 @@ from ragstack_common.scraper.models import (
 )
 
 __all__ = [
+    "DiscoveryMode",
     "ScrapeConfig",
     "ScrapeJob",
     "ScrapePage",
@@ -8,6 +8,7 @@ avoiding duplicate knowledge base entries.
 import hashlib
 import logging
 import re
+from typing import Any
 from urllib.parse import urlparse
 
 import boto3
@@ -131,6 +132,31 @@ class DeduplicationService:
         Returns:
             Content hash string or None if not found
         """
+        item = self._get_previous_record(url)
+        return item.get("content_hash") if item else None
+
+    def get_validators(self, url: str) -> tuple[str | None, str | None]:
+        """
+        Get the HTTP validators stored by a previous scrape of URL.
+
+        Args:
+            url: URL to look up
+
+        Returns:
+            Tuple of (etag, last_modified); either is None if not stored
+        """
+        item = self._get_previous_record(url)
+        if not item:
+            return None, None
+        etag = item.get("etag")
+        last_modified = item.get("last_modified")
+        return (
+            etag if isinstance(etag, str) else None,
+            last_modified if isinstance(last_modified, str) else None,
+        )
+
+    def _get_previous_record(self, url: str) -> dict[str, Any] | None:
+        """Get the most recent ScrapeUrls record for URL from any job."""
         url_hash = compute_content_hash(normalize_url_for_hash(url))
 
         try:
@@ -144,7 +170,7 @@ class DeduplicationService:
 
             items = response.get("Items", [])
             if items:
-                return items[0].get("content_hash")
+                return items[0]
             return None
 
         except ClientError as e:
@@ -153,7 +179,7 @@ class DeduplicationService:
                 # Index doesn't exist yet
                 logger.warning("UrlHashIndex not found, skipping dedup lookup")
                 return None
-            logger.error(f"DynamoDB error in get_existing_hash: {error_code}")
+            logger.error(f"DynamoDB error in dedup lookup: {error_code}")
             return None
 
     def is_content_changed(self, url: str, new_content: str) -> bool:
@@ -176,7 +202,14 @@ class DeduplicationService:
 
         return new_hash != existing_hash
 
-    def store_hash(self, job_id: str, url: str, content: str) -> None:
+    def store_hash(
+        self,
+        job_id: str,
+        url: str,
+        content: str,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
         """
         Store content hash for URL.
 
@@ -184,19 +217,27 @@ class DeduplicationService:
             job_id: Scrape job ID
             url: URL of the page
             content: Markdown content (with frontmatter)
+            etag: ETag response header, for conditional GETs on later jobs
+            last_modified: Last-Modified response header, for conditional GETs
         """
         normalized = normalize_content_for_hash(content)
         content_hash = compute_content_hash(normalized)
         url_hash = compute_content_hash(normalize_url_for_hash(url))
 
+        update_expression = "SET content_hash = :ch, url_hash = :uh"
+        values = {":ch": content_hash, ":uh": url_hash}
+        if etag:
+            update_expression += ", etag = :etag"
+            values[":etag"] = etag
+        if last_modified:
+            update_expression += ", last_modified = :lm"
+            values[":lm"] = last_modified
+
         try:
             self.table.update_item(
                 Key={"job_id": job_id, "url": url},
-                UpdateExpression="SET content_hash = :ch, url_hash = :uh",
-                ExpressionAttributeValues={
-                    ":ch": content_hash,
-                    ":uh": url_hash,
-                },
+                UpdateExpression=update_expression,
+                ExpressionAttributeValues=values,
             )
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code", "")
@@ -3,15 +3,41 @@ URL discovery logic for web scraping.
 
 Handles recursive URL discovery with scope enforcement, link extraction,
 and visited URL tracking to avoid cycles.
+
+Sitemap discovery reads robots.txt (Sitemap directives and Crawl-delay) and
+streams sitemap.xml files and sitemap indexes, plain or gzipped, so a whole
+site can be queued in one pass without fetching pages to find their links.
 """
 
 import fnmatch
-from urllib.parse import urljoin, urlparse
-
+import logging
+import re
+import time
+import xml.etree.ElementTree as ET
+import zlib
+from collections import deque
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from urllib.parse import urljoin, urlparse, urlsplit
+
+import httpx
 from bs4 import BeautifulSoup
 
+from ragstack_common.scraper.fetcher import HttpFetcher, get_connection_pool
 from ragstack_common.scraper.models import ScrapeConfig, ScrapeScope
 
+logger = logging.getLogger(__name__)
+
+# Sitemap limits: the protocol caps a sitemap at 50 MB uncompressed, and a
+# runaway index (or a gzip bomb) must not exhaust the Lambda
+MAX_SITEMAPS = 50
+MAX_SITEMAP_BYTES = 50 * 1024 * 1024
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+# fnmatch wildcard characters
+GLOB_CHARS = re.compile(r"[*?\[]")
+
 
 def normalize_url(url: str) -> str:
     """
@@ -43,18 +69,18 @@ def normalize_url(url: str) -> str:
     return normalized
 
 
-def extract_links(html: str, page_url: str) -> list[str]:
+def extract_links(html: str | BeautifulSoup, page_url: str) -> list[str]:
     """
     Extract all links from HTML content.
 
     Args:
-        html: HTML content to parse
+        html: HTML content to parse, or an already-parsed tree (not modified)
         page_url: URL of the page (for resolving relative links)
 
     Returns:
         List of absolute URLs found in the page
     """
-    soup = BeautifulSoup(html, "lxml")
+    soup = html if isinstance(html, BeautifulSoup) else BeautifulSoup(html, "lxml")
     seen = set()
     links = []
 
@@ -217,6 +243,127 @@ def get_url_depth(url: str, base_url: str) -> int:
     return 0
 
 
+def compile_patterns(patterns: list[str]) -> re.Pattern[str] | None:
+    """
+    Merge glob patterns into one compiled regex for use with search().
+
+    The regex accepts exactly the URLs matches_patterns() accepts (fnmatch
+    syntax, case-sensitive). A leading * becomes search() semantics instead
+    of a .* prefix per pattern, and the common "*/literal/*" form becomes a
+    plain substring alternative, so one scan tests every pattern.
+
+    Args:
+        patterns: List of glob patterns
+
+    Returns:
+        Compiled regex, or None when there are no patterns
+    """
+    if not patterns:
+        return None
+    return re.compile("|".join(_glob_to_search_regex(pattern) for pattern in patterns))
+
+
+def _glob_to_search_regex(pattern: str) -> str:
+    """Translate one glob pattern to a regex whose search() equals fnmatch()."""
+    core = pattern.lstrip("*")
+    if core == pattern:
+        # No leading wildcard: the match is anchored at the start
+        return rf"\A{fnmatch.translate(pattern)}"
+
+    literal = core.rstrip("*")
+    if literal != core and not GLOB_CHARS.search(literal):
+        # *literal* is a substring test
+        return re.escape(literal)
+    return fnmatch.translate(core)
+
+
+class UrlFilter:
+    """
+    Scope and pattern filter compiled once per job.
+
+    Equivalent to should_crawl() for a fixed base URL and config, but the
+    base URL is parsed once, include and exclude patterns are each merged
+    into a single regex, and the scope check compares pre-split host and
+    path prefixes.
+
+    Usage:
+        url_filter = UrlFilter(base_url, config)
+        links = url_filter.filter(extract_links(html, page_url), visited)
+    """
+
+    def __init__(self, base_url: str, config: ScrapeConfig):
+        """
+        Compile the filter.
+
+        Args:
+            base_url: Base URL of the scrape job
+            config: Scrape configuration with scope and patterns
+        """
+        base = urlsplit(base_url)
+        self.scope = config.scope
+        self.base_host = base.netloc.lower()
+        self.base_domain = _get_domain(self.base_host)
+        self.base_path = _strip_params(base.path).rstrip("/")
+        self._base_prefix = f"{self.base_path}/"
+        self._include = compile_patterns(config.include_patterns)
+        self._exclude = compile_patterns(config.exclude_patterns)
+
+    def matches(self, url: str) -> bool:
+        """
+        Check a URL against scope and patterns.
+
+        Args:
+            url: URL to check
+
+        Returns:
+            True if the URL should be crawled
+        """
+        if not self._in_scope(url):
+            return False
+        if self._include is not None and self._include.search(url) is None:
+            return False
+        return self._exclude is None or self._exclude.search(url) is None
+
+    def filter(self, urls: list[str], visited: set[str]) -> list[str]:
+        """
+        Filter URLs by visited set, scope and patterns (order preserved).
+
+        Args:
+            urls: List of discovered URLs to filter
+            visited: Set of already visited URLs
+
+        Returns:
+            Filtered list of URLs to crawl
+        """
+        return [url for url in urls if url not in visited and self.matches(url)]
+
+    def _in_scope(self, url: str) -> bool:
+        """Scope check against the pre-split base URL (see _is_in_scope)."""
+        parts = urlsplit(url)
+        host = parts.netloc.lower()
+
+        if self.scope == ScrapeScope.SUBPAGES:
+            if host != self.base_host:
+                return False
+            if not self.base_path:
+                return True
+            path = _strip_params(parts.path)
+            return path == self.base_path or path.startswith(self._base_prefix)
+
+        if self.scope == ScrapeScope.HOSTNAME:
+            return host == self.base_host
+
+        if self.scope == ScrapeScope.DOMAIN:
+            return _get_domain(host) == self.base_domain
+
+        return False
+
+
+def _strip_params(path: str) -> str:
+    """Drop ;params from a path, as urlparse() does."""
+    return path.split(";", 1)[0] if ";" in path else path
+
+
 def filter_discovered_urls(
     urls: list[str],
     base_url: str,
@@ -226,6 +373,9 @@ def filter_discovered_urls(
     """
     Filter a list of discovered URLs based on scope, patterns, and visited set.
 
+    Compiles a UrlFilter for the call; callers filtering many pages of one
+    job should build the UrlFilter once and call its filter() method.
+
     Args:
         urls: List of discovered URLs to filter
         base_url: Base URL of the scrape job
@@ -235,17 +385,225 @@ def filter_discovered_urls(
     Returns:
         Filtered list of URLs to crawl
     """
-    filtered = []
+    return UrlFilter(base_url, config).filter(urls, visited)
+
+
+@dataclass
+class SitemapDiscovery:
+    """
+    Result of sitemap-driven discovery.
+
+    Attributes:
+        urls: In-scope page URLs (normalized, deduplicated, at most max_pages)
+        crawl_delay_ms: Crawl-delay from robots.txt in milliseconds, if any
+        sitemaps_read: Sitemap URLs that were fetched
+    """
+
+    urls: list[str] = field(default_factory=list)
+    crawl_delay_ms: int | None = None
+    sitemaps_read: list[str] = field(default_factory=list)
+
 
-    for url in urls:
-        # Skip if already visited
-        if url in visited:
+def parse_robots_txt(
+    text: str, user_agent: str = HttpFetcher.USER_AGENT
+) -> tuple[list[str], int | None]:
+    """
+    Read Sitemap directives and the crawl delay from robots.txt content.
+
+    Crawl-delay is taken from the group naming our user agent, else from the
+    * group; fractional delays are kept (urllib.robotparser drops them).
+
+    Args:
+        text: robots.txt content
+        user_agent: User agent whose Crawl-delay applies (falls back to *)
+
+    Returns:
+        Tuple of (sitemap URLs, crawl delay in milliseconds or None)
+    """
+    agent_token = user_agent.split("/", 1)[0].lower()
+    sitemaps: list[str] = []
+    delays: dict[str, float] = {}
+    group: list[str] = []
+    in_rules = False
+
+    for raw_line in text.splitlines():
+        line = raw_line.split("#", 1)[0].strip()
+        if ":" not in line:
             continue
+        key, value = (part.strip() for part in line.split(":", 1))
+        key = key.lower()
+
+        if key == "sitemap":
+            # Global directive, not part of any group
+            if value:
+                sitemaps.append(value)
+        elif key == "user-agent":
+            # Consecutive User-agent lines share one group
+            if in_rules:
+                group, in_rules = [], False
+            group.append(value.lower())
+        else:
+            in_rules = True
+            if key == "crawl-delay":
+                try:
+                    delay = float(value)
+                except ValueError:
+                    continue
+                for agent in group:
+                    delays.setdefault(agent, delay)
+
+    delay_s = next(
+        (d for agent, d in delays.items() if agent not in ("", "*") and agent in agent_token),
+        delays.get("*"),
+    )
+    crawl_delay_ms = int(delay_s * 1000) if delay_s and delay_s > 0 else None
+    return sitemaps, crawl_delay_ms
+
+
+def iter_sitemap_entries(
+    chunks: Iterable[bytes], max_bytes: int = MAX_SITEMAP_BYTES
+) -> Iterator[tuple[str, str]]:
+    """
+    Stream <loc> entries out of a sitemap or sitemap index.
+
+    The body is parsed incrementally as chunks arrive and gzip is detected
+    from the magic bytes (.xml.gz files are served without Content-Encoding).
+    Parsing stops at max_bytes of XML or at the first malformed chunk; entries
+    read up to that point are still yielded.
 
-        # Check if should crawl based on scope and patterns
-        if not should_crawl(url, base_url, config):
+    Args:
+        chunks: Raw response body chunks
+        max_bytes: Maximum uncompressed bytes to parse
+
+    Yields:
+        ("url", loc) for page entries, ("sitemap", loc) for index entries
+    """
+    parser = ET.XMLPullParser(events=("end",))
+    decompressor = None
+    first = True
+    total = 0
+
+    for chunk in chunks:
+        if not chunk:
             continue
+        if first:
+            first = False
+            if chunk[:2] == GZIP_MAGIC:
+                decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        data = decompressor.decompress(chunk, max_bytes - total + 1) if decompressor else chunk
+
+        total += len(data)
+        if total > max_bytes:
+            logger.warning(f"Sitemap exceeds {max_bytes} bytes, truncating")
+            data = data[: max(len(data) - (total - max_bytes), 0)]
+
+        try:
+            parser.feed(data)
+            for _, elem in parser.read_events():
+                tag = elem.tag.rsplit("}", 1)[-1]
+                if tag not in ("url", "sitemap"):
+                    continue
+                loc = next((c.text for c in elem if c.tag.rsplit("}", 1)[-1] == "loc"), None)
+                # Entries are consumed, drop them so memory stays flat
+                elem.clear()
+                if loc and loc.strip():
+                    yield tag, loc.strip()
+        except ET.ParseError as e:
+            logger.warning(f"Malformed sitemap, stopping: {e}")
+            return
+
+        if total >= max_bytes:
+            return
+
+
+def discover_sitemap_urls(
+    base_url: str,
+    config: ScrapeConfig,
+    client: httpx.Client | None = None,
+    max_sitemaps: int = MAX_SITEMAPS,
+    deadline: float | None = None,
+) -> SitemapDiscovery:
+    """
+    Discover a site's pages from robots.txt and its sitemaps.
+
+    Sitemaps come from robots.txt Sitemap directives, or /sitemap.xml when
+    robots.txt lists none. Sitemap indexes are followed breadth-first up to
+    max_sitemaps files; only sitemaps on the base URL's domain are fetched.
+    Page URLs are filtered with a UrlFilter and reading stops once
+    config.max_pages URLs have been collected, or once the deadline passes
+    (URLs read up to then are returned).
+
+    Args:
+        base_url: Base URL of the scrape job
+        config: Scrape configuration (scope, patterns, max_pages, headers)
+        client: HTTP client to use (defaults to the shared connection pool)
+        max_sitemaps: Maximum number of sitemap files to read
+        deadline: time.monotonic() value after which reading stops
 
-        filtered.append(url)
+    Returns:
+        SitemapDiscovery with the URLs found (empty if the site has no sitemap)
+    """
+    parsed = urlparse(base_url)
+    origin = f"{parsed.scheme}://{parsed.netloc}"
+    headers = {"User-Agent": HttpFetcher.USER_AGENT, **config.headers}
+    if client is None:
+        client = get_connection_pool().get_client(origin, 30.0, config.cookies)
+
+    discovery = SitemapDiscovery()
+    sitemaps: list[str] = []
+    try:
+        response = client.get(f"{origin}/robots.txt", headers=headers)
+        if response.status_code == 200:
+            sitemaps, discovery.crawl_delay_ms = parse_robots_txt(response.text)
+    except httpx.HTTPError as e:
+        logger.warning(f"Could not read robots.txt for {origin}: {e}")
+
+    base_domain = _get_domain(parsed.netloc.lower())
+    queue = deque(sitemaps or [f"{origin}/sitemap.xml"])
+    seen_sitemaps: set[str] = set()
+    seen_urls: set[str] = set()
+    url_filter = UrlFilter(base_url, config)
+
+    def out_of_time() -> bool:
+        if deadline is None or time.monotonic() < deadline:
+            return False
+        logger.warning(
+            f"Sitemap time budget exhausted for {origin} after "
+            f"{len(discovery.sitemaps_read)} sitemaps, {len(discovery.urls)} URLs"
+        )
+        return True
+
+    while queue and len(discovery.sitemaps_read) < max_sitemaps:
+        if out_of_time():
+            return discovery
+        sitemap_url = queue.popleft()
+        if sitemap_url in seen_sitemaps:
+            continue
+        seen_sitemaps.add(sitemap_url)
+        if _get_domain(urlparse(sitemap_url).netloc.lower()) != base_domain:
+            logger.info(f"Skipping off-domain sitemap: {sitemap_url}")
+            continue
 
-    return filtered
+        discovery.sitemaps_read.append(sitemap_url)
+        try:
+            with client.stream("GET", sitemap_url, headers=headers) as response:
+                if response.status_code != 200:
+                    logger.info(f"Sitemap not available ({response.status_code}): {sitemap_url}")
+                    continue
+                for kind, loc in iter_sitemap_entries(response.iter_bytes()):
+                    if out_of_time():
+                        return discovery
+                    if kind == "sitemap":
+                        queue.append(urljoin(sitemap_url, loc))
+                        continue
+                    url = normalize_url(urljoin(sitemap_url, loc))
+                    if url in seen_urls or not url_filter.matches(url):
+                        continue
+                    seen_urls.add(url)
+                    discovery.urls.append(url)
+                    if len(discovery.urls) >= config.max_pages:
+                        return discovery
+        except httpx.HTTPError as e:
+            logger.warning(f"Could not read sitemap {sitemap_url}: {e}")
+
+    return discovery
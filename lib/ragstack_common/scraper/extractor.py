@@ -3,13 +3,60 @@ HTML to Markdown content extraction.
 
 Handles HTML sanitization and conversion to clean Markdown
 suitable for knowledge base ingestion.
+
+The pipeline works on a single parse: every step accepts either an HTML
+string or an already-parsed BeautifulSoup tree, and the markdown converter
+walks the sanitized tree directly instead of re-serializing and re-parsing it.
 """
 
 from dataclasses import dataclass
 from datetime import UTC, datetime
 
-from bs4 import BeautifulSoup
-from markdownify import markdownify as md
+from bs4 import BeautifulSoup, Tag
+from markdownify import MarkdownConverter
+
+# Elements to remove completely
+REMOVE_TAGS = frozenset(
+    {
+        "script",
+        "style",
+        "noscript",
+        "iframe",
+        "nav",
+        "footer",
+        "header",
+        "aside",
+        "form",
+        "button",
+        "input",
+        "select",
+        "textarea",
+        "svg",
+    }
+)
+
+# Remove elements by role
+REMOVE_ROLES = frozenset({"navigation", "banner", "contentinfo", "complementary", "search"})
+
+# Remove common non-content classes
+REMOVE_CLASSES = frozenset(
+    {
+        "sidebar",
+        "nav",
+        "navbar",
+        "menu",
+        "footer",
+        "header",
+        "advertisement",
+        "ads",
+        "cookie-banner",
+        "cookie-notice",
+        "newsletter",
+        "social-share",
+        "comments",
+        "related-posts",
+    }
+)
 
 
 @dataclass
@@ -23,19 +70,34 @@ class ExtractedContent:
     word_count: int
 
 
-def extract_title(html: str) -> str | None:
+def parse_html(html: str | BeautifulSoup) -> BeautifulSoup:
+    """
+    Parse HTML with lxml, passing already-parsed trees through unchanged.
+
+    Args:
+        html: HTML content or parsed tree
+
+    Returns:
+        BeautifulSoup tree
+    """
+    if isinstance(html, BeautifulSoup):
+        return html
+    return BeautifulSoup(html, "lxml")
+
+
+def extract_title(html: str | BeautifulSoup) -> str | None:
     """
     Extract page title from HTML.
 
     Priority: og:title > title > h1
 
     Args:
-        html: HTML content
+        html: HTML content or parsed tree (not modified)
 
     Returns:
         Title string or None if not found
     """
-    soup = BeautifulSoup(html, "lxml")
+    soup = parse_html(html)
 
     # Try og:title first (social sharing title)
     og_title = soup.find("meta", property="og:title")
@@ -59,7 +121,7 @@ def extract_title(html: str) -> str | None:
     return None
 
 
-def sanitize_html(html: str) -> BeautifulSoup:
+def sanitize_html(html: str | BeautifulSoup) -> BeautifulSoup:
     """
     Remove non-content elements from HTML.
 
@@ -67,71 +129,28 @@ def sanitize_html(html: str) -> BeautifulSoup:
     Preserves: main, article, section, code, pre
 
     Args:
-        html: Raw HTML content
+        html: Raw HTML content, or a parsed tree to sanitize in place
 
     Returns:
         Sanitized BeautifulSoup object
     """
-    soup = BeautifulSoup(html, "lxml")
-
-    # Elements to remove completely
-    remove_tags = [
-        "script",
-        "style",
-        "noscript",
-        "iframe",
-        "nav",
-        "footer",
-        "header",
-        "aside",
-        "form",
-        "button",
-        "input",
-        "select",
-        "textarea",
-        "svg",
-    ]
+    soup = parse_html(html)
 
-    for tag in remove_tags:
-        for element in soup.find_all(tag):
+    # Single pass over the tree (CSS selectors would walk it once per selector)
+    for element in soup.find_all(_is_non_content):
+        # Skip elements already removed with an ancestor
+        if not element.decomposed:
             element.decompose()
 
-    # Remove elements by role
-    role_selectors = [
-        '[role="navigation"]',
-        '[role="banner"]',
-        '[role="contentinfo"]',
-        '[role="complementary"]',
-        '[role="search"]',
-    ]
-
-    for selector in role_selectors:
-        for element in soup.select(selector):
-            element.decompose()
-
-    # Remove common non-content classes
-    class_selectors = [
-        ".sidebar",
-        ".nav",
-        ".navbar",
-        ".menu",
-        ".footer",
-        ".header",
-        ".advertisement",
-        ".ads",
-        ".cookie-banner",
-        ".cookie-notice",
-        ".newsletter",
-        ".social-share",
-        ".comments",
-        ".related-posts",
-    ]
+    return soup
 
-    for selector in class_selectors:
-        for element in soup.select(selector):
-            element.decompose()
 
-    return soup
+def _is_non_content(tag: Tag) -> bool:
+    """Match tags removed by sanitize_html (by name, role or class)."""
+    if tag.name in REMOVE_TAGS or tag.get("role") in REMOVE_ROLES:
+        return True
+    classes = tag.get("class")
+    return bool(classes) and not REMOVE_CLASSES.isdisjoint(classes)
 
 
 def find_main_content(soup: BeautifulSoup) -> BeautifulSoup:
@@ -175,11 +194,12 @@ def find_main_content(soup: BeautifulSoup) -> BeautifulSoup:
     return soup
 
 
-def html_to_markdown(html: str) -> str:
+def html_to_markdown(html: str | Tag) -> str:
     """
     Convert HTML to Markdown using markdownify.
 
-    Preserves code blocks, headings, lists, and links.
+    Preserves code blocks, headings, lists, and links. Parsed elements are
+    converted directly, without serializing them back to HTML.
 
     Args:
         html: HTML content (string or element)
@@ -187,15 +207,11 @@ def html_to_markdown(html: str) -> str:
     Returns:
         Markdown string
     """
-    markdown = md(
-        str(html),
-        heading_style="ATX",
-        bullets="-",
-        code_language_callback=_get_code_language,
-        escape_asterisks=False,
-        escape_underscores=False,
-        strip=["a"],  # Remove links but keep text
-    )
+    converter = _get_markdown_converter()
+    if isinstance(html, Tag):
+        markdown = converter.convert_soup(html)
+    else:
+        markdown = converter.convert(str(html))
 
     # Clean up excessive whitespace
     lines = markdown.split("\n")
@@ -215,6 +231,25 @@ def html_to_markdown(html: str) -> str:
     return "\n".join(cleaned_lines).strip()
 
 
+# Lazy-initialized converter (caches its per-tag conversion functions)
+_markdown_converter: MarkdownConverter | None = None
+
+
+def _get_markdown_converter() -> MarkdownConverter:
+    """Get or create the shared markdown converter."""
+    global _markdown_converter
+    if _markdown_converter is None:
+        _markdown_converter = MarkdownConverter(
+            heading_style="ATX",
+            bullets="-",
+            code_language_callback=_get_code_language,
+            escape_asterisks=False,
+            escape_underscores=False,
+            strip=["a"],  # Remove links but keep text
+        )
+    return _markdown_converter
+
+
 def _get_code_language(element) -> str:
     """Extract code language from element class."""
     classes = element.get("class", [])
@@ -261,28 +296,33 @@ def add_frontmatter(content: str, source_url: str, title: str | None = None) ->
     return "\n".join(frontmatter_lines) + content
 
 
-def extract_content(html: str, source_url: str) -> ExtractedContent:
+def extract_content(html: str | BeautifulSoup, source_url: str) -> ExtractedContent:
     """
     Full extraction pipeline: sanitize → find main → convert → add frontmatter.
 
+    The HTML is parsed once; a parsed tree (e.g. FetchResult.parsed()) is
+    used as is and sanitized in place.
+
     Args:
-        html: Raw HTML content
+        html: Raw HTML content or parsed tree
         source_url: Original URL (added to frontmatter)
 
     Returns:
         ExtractedContent with title, markdown, and metadata
     """
+    soup = parse_html(html)
+
     # Extract title before sanitizing (title is in head)
-    title = extract_title(html) or "Untitled"
+    title = extract_title(soup) or "Untitled"
 
     # Sanitize HTML
-    soup = sanitize_html(html)
+    sanitize_html(soup)
 
     # Find main content area
     main_content = find_main_content(soup)
 
     # Convert to markdown
-    markdown_body = html_to_markdown(str(main_content))
+    markdown_body = html_to_markdown(main_content)
 
     # Count words for metadata
     word_count = len(markdown_body.split())
@@ -5,15 +5,33 @@ Implements HTTP-first fetching with automatic Playwright fallback
 for SPAs that require JavaScript rendering.
 """
 
+import gzip
+import hashlib
+import importlib.util
+import json
 import logging
+import threading
 import time
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field, fields
+from http.cookiejar import Cookie, CookieJar, DefaultCookiePolicy
+from typing import Any
+from urllib.parse import urlsplit
 
 import httpx
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, CData, NavigableString
+
+from ragstack_common.storage import parse_s3_uri
 
 logger = logging.getLogger(__name__)
 
+# S3 prefix for pages fetched during discovery and handed to processing
+# (under working/, so the bucket lifecycle rule expires them)
+FETCHED_PAGE_PREFIX = "working/scrape"
+
+# HTTP/2 needs the optional h2 package (httpx[http2]); fall back to HTTP/1.1 without it
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 
 class FetchError(Exception):
     """Error during page fetching."""
@@ -34,6 +52,179 @@ class FetchResult:
     content_type: str
     is_html: bool
     error: str | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+    # True when a conditional request got 304 Not Modified (content is empty)
+    not_modified: bool = False
+    # Parsed tree of content, shared by SPA detection and extraction (not serialized)
+    _soup: BeautifulSoup | None = field(default=None, init=False, repr=False, compare=False)
+
+    def parsed(self) -> BeautifulSoup:
+        """
+        Return content parsed with lxml, parsing it on first use.
+
+        The same tree is returned on every call so one fetch is parsed once;
+        extract_content() sanitizes it in place, so extract last.
+        """
+        if self._soup is None:
+            self._soup = BeautifulSoup(self.content, "lxml")
+        return self._soup
+
+
+class _NoStoreCookiePolicy(DefaultCookiePolicy):
+    """Cookie policy that sends preset cookies but never stores response cookies."""
+
+    def set_ok(self, _cookie: Cookie, _request: Any) -> bool:
+        return False
+
+
+def _read_only_cookie_jar(cookies: dict[str, str]) -> CookieJar:
+    """Build a cookie jar holding the given cookies that ignores Set-Cookie."""
+    jar = CookieJar(policy=_NoStoreCookiePolicy())
+    # set_cookie() bypasses the policy, so the configured cookies are kept
+    for cookie in httpx.Cookies(cookies).jar:
+        jar.set_cookie(cookie)
+    return jar
+
+
+class ConnectionPool:
+    """
+    Keep-alive httpx clients shared across fetches and warm invocations.
+
+    One client is kept per (scheme, host, port, timeout, cookies, http2) key so
+    same-host crawls reuse DNS, TCP and TLS setup. The pool holds at most
+    max_clients clients (least recently used evicted first) and closes clients
+    idle for longer than idle_timeout seconds.
+
+    Pooled clients are shared between threads, so their cookie jars are
+    read-only: they send the cookies the client was created with (including
+    across redirects) and ignore Set-Cookie, so one fetch never sees cookies
+    set during another.
+    """
+
+    def __init__(
+        self,
+        max_clients: int = 16,
+        max_connections_per_host: int = 10,
+        idle_timeout: float = 60.0,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            max_clients: Maximum number of pooled clients (one per host key)
+            max_connections_per_host: Connection limit for each client
+            idle_timeout: Seconds before an unused client or connection is closed
+        """
+        self.max_clients = max_clients
+        self.max_connections_per_host = max_connections_per_host
+        self.idle_timeout = idle_timeout
+        self._clients: OrderedDict[tuple[Any, ...], tuple[httpx.Client, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_client(
+        self,
+        url: str,
+        timeout: float,
+        cookies: dict[str, str],
+        http2: bool = False,
+    ) -> httpx.Client:
+        """
+        Return a pooled client for the URL's host, creating it on a miss.
+
+        Args:
+            url: URL about to be fetched
+            timeout: Request timeout in seconds
+            cookies: Cookies the client sends (response cookies are not stored)
+            http2: Enable HTTP/2 (ignored when h2 is not installed)
+
+        Returns:
+            httpx.Client with keep-alive connections to the host
+        """
+        parts = urlsplit(url)
+        http2 = http2 and HTTP2_AVAILABLE
+        key = (
+            parts.scheme,
+            parts.hostname,
+            parts.port,
+            timeout,
+            tuple(sorted(cookies.items())),
+            http2,
+        )
+        now = time.monotonic()
+        stale: list[httpx.Client] = []
+
+        with self._lock:
+            # Evict idle clients (OrderedDict is in least-recently-used order)
+            while self._clients:
+                oldest_key, (client, last_used) = next(iter(self._clients.items()))
+                if now - last_used <= self.idle_timeout:
+                    break
+                del self._clients[oldest_key]
+                stale.append(client)
+                self.evictions += 1
+
+            entry = self._clients.pop(key, None)
+            if entry is not None:
+                self.hits += 1
+                client = entry[0]
+            else:
+                self.misses += 1
+                client = httpx.Client(
+                    timeout=timeout,
+                    follow_redirects=True,
+                    cookies=_read_only_cookie_jar(cookies),
+                    http2=http2,
+                    limits=httpx.Limits(
+                        max_connections=self.max_connections_per_host,
+                        max_keepalive_connections=self.max_connections_per_host,
+                        keepalive_expiry=self.idle_timeout,
+                    ),
+                )
+                while len(self._clients) >= self.max_clients:
+                    _, (evicted, _) = self._clients.popitem(last=False)
+                    stale.append(evicted)
+                    self.evictions += 1
+            self._clients[key] = (client, now)
+
+        for old_client in stale:
+            old_client.close()
+        return client
+
+    def stats(self) -> dict[str, int]:
+        """Return pool hit/miss/eviction counters and current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._clients),
+            }
+
+    def close(self) -> None:
+        """Close all pooled clients."""
+        with self._lock:
+            clients = [client for client, _ in self._clients.values()]
+            self._clients.clear()
+        for client in clients:
+            client.close()
+
+
+# Module-level pool (reused across warm invocations)
+_connection_pool: ConnectionPool | None = None
+_connection_pool_lock = threading.Lock()
+
+
+def get_connection_pool() -> ConnectionPool:
+    """Get or create the shared connection pool (lazy initialization)."""
+    global _connection_pool
+    with _connection_pool_lock:
+        if _connection_pool is None:
+            _connection_pool = ConnectionPool()
+        return _connection_pool
 
 
 class HttpFetcher:
@@ -52,6 +243,8 @@ class HttpFetcher:
         delay_ms: int = 500,
         cookies: dict[str, str] | None = None,
         headers: dict[str, str] | None = None,
+        pooled: bool = False,
+        http2: bool = False,
     ):
         """
         Initialize HTTP fetcher.
@@ -62,19 +255,32 @@ class HttpFetcher:
             delay_ms: Delay between requests in milliseconds
             cookies: Optional cookies for authenticated sites
             headers: Optional custom headers
+            pooled: Reuse keep-alive clients from the module-level ConnectionPool
+                instead of opening a new client per request
+            http2: Negotiate HTTP/2 on pooled clients when h2 is installed
         """
         self.timeout = timeout
         self.max_retries = max_retries
         self.delay_ms = delay_ms
         self.cookies = cookies or {}
         self.headers = headers or {}
+        self.pooled = pooled
+        self.http2 = http2
 
-    def fetch(self, url: str) -> FetchResult:
+    def fetch(
+        self, url: str, etag: str | None = None, last_modified: str | None = None
+    ) -> FetchResult:
         """
         Fetch URL with retries and delay.
 
+        When validators from a previous scrape are given, the request is
+        conditional (If-None-Match / If-Modified-Since) and a 304 response
+        returns a result with not_modified=True and no content.
+
         Args:
             url: URL to fetch
+            etag: ETag from a previous fetch of this URL
+            last_modified: Last-Modified from a previous fetch of this URL
 
         Returns:
             FetchResult with content or error
@@ -88,7 +294,7 @@ class HttpFetcher:
 
         for attempt in range(self.max_retries):
             try:
-                return self._do_fetch(url)
+                return self._do_fetch(url, etag, last_modified)
             except httpx.HTTPStatusError as e:
                 last_status = e.response.status_code
                 last_error = str(e)
@@ -143,7 +349,9 @@ class HttpFetcher:
             error=last_error,
         )
 
-    def _do_fetch(self, url: str) -> FetchResult:
+    def _do_fetch(
+        self, url: str, etag: str | None = None, last_modified: str | None = None
+    ) -> FetchResult:
         """Perform the actual HTTP fetch."""
         request_headers = {
             "User-Agent": self.USER_AGENT,
@@ -151,32 +359,59 @@ class HttpFetcher:
             "Accept-Language": "en-US,en;q=0.5",
             **self.headers,
         }
+        if etag:
+            request_headers["If-None-Match"] = etag
+        if last_modified:
+            request_headers["If-Modified-Since"] = last_modified
+
+        if self.pooled:
+            client = get_connection_pool().get_client(
+                url, self.timeout, self.cookies, http2=self.http2
+            )
+            return self._to_result(client.get(url, headers=request_headers))
 
         with httpx.Client(
             timeout=self.timeout,
             follow_redirects=True,
             cookies=self.cookies,
         ) as client:
-            response = client.get(url, headers=request_headers)
-            response.raise_for_status()
-
-            content_type = response.headers.get("content-type", "")
-            is_html = "text/html" in content_type or "application/xhtml" in content_type
+            return self._to_result(client.get(url, headers=request_headers))
 
+    def _to_result(self, response: httpx.Response) -> FetchResult:
+        """Convert a response to a FetchResult, raising on HTTP errors."""
+        if response.status_code == 304:
             return FetchResult(
-                url=str(response.url),  # May differ from request URL due to redirects
-                status_code=response.status_code,
-                content=response.text,
-                content_type=content_type,
-                is_html=is_html,
+                url=str(response.url),
+                status_code=304,
+                content="",
+                content_type="",
+                is_html=False,
+                etag=response.headers.get("etag"),
+                last_modified=response.headers.get("last-modified"),
+                not_modified=True,
             )
 
+        response.raise_for_status()
+
+        content_type = response.headers.get("content-type", "")
+        is_html = "text/html" in content_type or "application/xhtml" in content_type
+
+        return FetchResult(
+            url=str(response.url),  # May differ from request URL due to redirects
+            status_code=response.status_code,
+            content=response.text,
+            content_type=content_type,
+            is_html=is_html,
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+        )
+
     def _should_retry(self, status_code: int) -> bool:
         """Check if status code is retryable."""
         return status_code in self.RETRYABLE_STATUS_CODES
 
 
-def is_spa(html: str) -> bool:
+def is_spa(html: str, soup: BeautifulSoup | None = None) -> bool:
     """
     Detect if HTML indicates a Single Page Application.
 
@@ -187,43 +422,235 @@ def is_spa(html: str) -> bool:
 
     Args:
         html: HTML content to check
+        soup: Parsed tree of html to reuse (not modified); parsed if omitted
 
     Returns:
         True if SPA detected, False otherwise
     """
-    soup = BeautifulSoup(html, "lxml")
+    if soup is None:
+        soup = BeautifulSoup(html, "lxml")
 
-    # Count scripts before removing them
     script_count = len(soup.find_all("script"))
 
-    # Remove script/style for content measurement
-    for tag in soup(["script", "style", "noscript"]):
-        tag.decompose()
-
-    text_content = soup.get_text(strip=True)
+    # Measure text without script/style/noscript content, without mutating the tree
+    non_content = [
+        tag
+        for tag in soup.find_all(_NON_CONTENT_TAGS)
+        if tag.find_parent(_NON_CONTENT_TAGS) is None
+    ]
+    text_length = _text_length(soup) - sum(_text_length(tag) for tag in non_content)
 
     # Framework indicators in original HTML
     indicators = [
-        len(text_content) < 500,
+        text_length < 500,
         script_count > 5,
         "__NEXT_DATA__" in html,
         "window.__NUXT__" in html,
         "ng-app" in html,
-        "data-reactroot" in html and len(text_content) < 1000,
-        'id="__next"' in html and len(text_content) < 1000,
+        "data-reactroot" in html and text_length < 1000,
+        'id="__next"' in html and text_length < 1000,
     ]
 
     # SPA if at least 2 indicators match
     return sum(indicators) >= 2
 
 
-def fetch_with_playwright(url: str, cookies: dict[str, str] | None = None) -> FetchResult:
+# Tags whose text is not page content for SPA detection
+_NON_CONTENT_TAGS = ["script", "style", "noscript"]
+
+
+def _text_length(node: Any) -> int:
+    """Length of node.get_text(strip=True), counting only plain text nodes."""
+    return sum(
+        len(text.strip())
+        for text in node.find_all(string=True)
+        if type(text) in (NavigableString, CData)
+    )
+
+
+class BrowserPool:
+    """
+    Long-lived headless Chromium reused across fetches in a warm container.
+
+    Launching Chromium dominates per-page time, so one browser is kept and
+    each fetch only opens a page. Browser contexts (cookies, routing) are
+    reused per context key, typically the scrape job ID, and at most
+    max_contexts are kept (least recently used closed first). Images, fonts
+    and media are blocked so networkidle is reached sooner. The browser is
+    relaunched after max_pages_per_browser pages to bound memory growth.
+
+    Playwright's sync API is bound to the thread that started it, so a pool
+    must only be used from one thread.
+    """
+
+    BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+
+    def __init__(
+        self,
+        max_pages_per_browser: int = 100,
+        max_contexts: int = 4,
+        block_resources: bool = True,
+    ):
+        """
+        Initialize the pool (the browser is launched on first use).
+
+        Args:
+            max_pages_per_browser: Pages served before the browser is recycled
+            max_contexts: Maximum number of cached browser contexts
+            block_resources: Abort image, font and media requests
+        """
+        self.max_pages_per_browser = max_pages_per_browser
+        self.max_contexts = max_contexts
+        self.block_resources = block_resources
+        self._playwright: Any = None
+        self._browser: Any = None
+        self._contexts: OrderedDict[tuple[Any, ...], Any] = OrderedDict()
+        self._pages_served = 0
+        self.launches = 0
+        self.pages = 0
+        self.context_hits = 0
+        self.context_misses = 0
+
+    def fetch(
+        self, url: str, cookies: dict[str, str] | None = None, context_key: str | None = None
+    ) -> FetchResult:
+        """
+        Render URL in a pooled browser.
+
+        Args:
+            url: URL to fetch
+            cookies: Optional cookies (part of the context key)
+            context_key: Context reuse key, e.g. the scrape job ID
+
+        Returns:
+            FetchResult with rendered content
+
+        Raises:
+            ImportError: If Playwright is not installed
+        """
+        if self._pages_served >= self.max_pages_per_browser:
+            logger.info(f"Recycling browser after {self._pages_served} pages")
+            self.close()
+
+        context = self._get_context(url, cookies or {}, context_key)
+        page = context.new_page()
+        try:
+            response = page.goto(url, wait_until="networkidle", timeout=60000)
+            content = page.content()
+            status_code = response.status if response else 200
+        finally:
+            page.close()
+            self._pages_served += 1
+            self.pages += 1
+
+        return FetchResult(
+            url=url,
+            status_code=status_code,
+            content=content,
+            content_type="text/html",
+            is_html=True,
+        )
+
+    def _get_browser(self) -> Any:
+        """Return the running browser, launching it if needed."""
+        if self._browser is not None and not self._browser.is_connected():
+            logger.warning("Pooled browser disconnected, relaunching")
+            self.close()
+        if self._browser is None:
+            # Import only when needed (Playwright layer may not be available)
+            from playwright.sync_api import sync_playwright
+
+            self._playwright = sync_playwright().start()
+            self._browser = self._playwright.chromium.launch(headless=True)
+            self._pages_served = 0
+            self.launches += 1
+        return self._browser
+
+    def _get_context(self, url: str, cookies: dict[str, str], context_key: str | None) -> Any:
+        """Return a cached browser context for the key, creating it on a miss."""
+        browser = self._get_browser()
+        key = (context_key, tuple(sorted(cookies.items())))
+
+        context = self._contexts.pop(key, None)
+        if context is not None:
+            self.context_hits += 1
+        else:
+            self.context_misses += 1
+            context = browser.new_context(user_agent=HttpFetcher.USER_AGENT)
+            if cookies:
+                # Convert cookies dict to Playwright format
+                cookie_list = [{"name": k, "value": v, "url": url} for k, v in cookies.items()]
+                context.add_cookies(cookie_list)
+            if self.block_resources:
+                context.route("**/*", self._route)
+            while len(self._contexts) >= self.max_contexts:
+                _, evicted = self._contexts.popitem(last=False)
+                evicted.close()
+        self._contexts[key] = context
+        return context
+
+    def _route(self, route: Any) -> None:
+        """Abort requests for resources that do not affect the rendered HTML."""
+        if route.request.resource_type in self.BLOCKED_RESOURCE_TYPES:
+            route.abort()
+        else:
+            route.continue_()
+
+    def stats(self) -> dict[str, int]:
+        """Return launch, page and context reuse counters."""
+        return {
+            "launches": self.launches,
+            "pages": self.pages,
+            "context_hits": self.context_hits,
+            "context_misses": self.context_misses,
+            "contexts": len(self._contexts),
+        }
+
+    def close(self) -> None:
+        """Close all contexts, the browser and the Playwright driver."""
+        contexts = list(self._contexts.values())
+        self._contexts.clear()
+        browser, self._browser = self._browser, None
+        playwright, self._playwright = self._playwright, None
+        try:
+            for context in contexts:
+                context.close()
+            if browser is not None:
+                browser.close()
+        except Exception as e:
+            logger.warning(f"Error closing pooled browser: {e}")
+        finally:
+            if playwright is not None:
+                playwright.stop()
+
+
+# Module-level browser pool (reused across warm invocations)
+_browser_pool: BrowserPool | None = None
+
+
+def get_browser_pool() -> BrowserPool:
+    """Get or create the shared browser pool (lazy initialization)."""
+    global _browser_pool
+    if _browser_pool is None:
+        _browser_pool = BrowserPool()
+    return _browser_pool
+
+
+def fetch_with_playwright(
+    url: str,
+    cookies: dict[str, str] | None = None,
+    pooled: bool = False,
+    context_key: str | None = None,
+) -> FetchResult:
     """
     Fetch URL using Playwright for JavaScript rendering.
 
     Args:
         url: URL to fetch
         cookies: Optional cookies
+        pooled: Render in the module-level BrowserPool instead of launching
+            and closing a browser for this URL
+        context_key: Browser context reuse key for pooled fetches (e.g. job ID)
 
     Returns:
         FetchResult with rendered content
@@ -241,6 +668,23 @@ def fetch_with_playwright(url: str, cookies: dict[str, str] | None = None) -> Fe
             error="Playwright not available - install playwright package",
         )
 
+    if pooled:
+        pool = get_browser_pool()
+        try:
+            return pool.fetch(url, cookies=cookies, context_key=context_key)
+        except Exception as e:
+            logger.error(f"Playwright fetch failed for {url}: {e}")
+            # Drop the browser so the next fetch starts from a clean launch
+            pool.close()
+            return FetchResult(
+                url=url,
+                status_code=0,
+                content="",
+                content_type="",
+                is_html=False,
+                error=f"Playwright error: {e}",
+            )
+
     try:
         with sync_playwright() as p:
             browser = p.chromium.launch(headless=True)
@@ -281,39 +725,126 @@ def fetch_with_playwright(url: str, cookies: dict[str, str] | None = None) -> Fe
         )
 
 
+def fetched_page_key(job_id: str, url: str) -> str:
+    """
+    Build the S3 key for a page fetched during discovery.
+
+    Args:
+        job_id: Scrape job ID
+        url: Normalized page URL
+
+    Returns:
+        S3 key under FETCHED_PAGE_PREFIX
+    """
+    url_hash = hashlib.sha256(url.encode()).hexdigest()[:16]
+    return f"{FETCHED_PAGE_PREFIX}/{job_id}/{url_hash}.json.gz"
+
+
+def store_fetch_result(s3_client: Any, bucket: str, key: str, result: FetchResult) -> str:
+    """
+    Persist a successful fetch result to S3 as gzipped JSON.
+
+    Args:
+        s3_client: Boto3 S3 client
+        bucket: Destination bucket
+        key: Destination key (see fetched_page_key)
+        result: Fetch result to store
+
+    Returns:
+        S3 URI of the stored result
+    """
+    data = {f.name: getattr(result, f.name) for f in fields(result) if f.init}
+    body = gzip.compress(json.dumps(data).encode("utf-8"))
+    s3_client.put_object(
+        Bucket=bucket,
+        Key=key,
+        Body=body,
+        ContentType="application/json",
+        ContentEncoding="gzip",
+    )
+    return f"s3://{bucket}/{key}"
+
+
+def load_fetch_result(s3_client: Any, s3_uri: str) -> FetchResult | None:
+    """
+    Load a fetch result stored by store_fetch_result.
+
+    Args:
+        s3_client: Boto3 S3 client
+        s3_uri: S3 URI of the stored result
+
+    Returns:
+        FetchResult, or None if the object is missing or unreadable
+    """
+    try:
+        bucket, key = parse_s3_uri(s3_uri)
+        response = s3_client.get_object(Bucket=bucket, Key=key)
+        data = json.loads(gzip.decompress(response["Body"].read()))
+        return FetchResult(**data)
+    except Exception as e:
+        logger.warning(f"Could not load fetched page {s3_uri}, will re-fetch: {e}")
+        return None
+
+
 def fetch_auto(
     url: str,
     cookies: dict[str, str] | None = None,
     headers: dict[str, str] | None = None,
     force_playwright: bool = False,
     delay_ms: int = 500,
+    prefetched: FetchResult | None = None,
+    pooled: bool = False,
+    etag: str | None = None,
+    last_modified: str | None = None,
+    context_key: str | None = None,
 ) -> FetchResult:
     """
     Fetch with auto-detection: try HTTP first, fall back to Playwright if SPA.
 
+    A 304 response, or a prefetched result whose validators match the given
+    ones, returns a result with not_modified=True and skips SPA detection.
+
     Args:
         url: URL to fetch
         cookies: Optional cookies
         headers: Optional headers
         force_playwright: Skip HTTP and use Playwright directly
         delay_ms: Delay between requests in milliseconds
+        prefetched: HTTP result fetched earlier (e.g. during discovery); used
+            in place of a new HTTP request, still subject to SPA detection
+        pooled: Use the shared keep-alive connection pool (with HTTP/2) for HTTP
+            and the shared BrowserPool for Playwright
+        etag: ETag from a previous scrape; makes the HTTP request conditional
+        last_modified: Last-Modified from a previous scrape
+        context_key: Browser context reuse key for pooled Playwright fetches
 
     Returns:
         FetchResult with content or error
     """
     if force_playwright:
-        return fetch_with_playwright(url, cookies)
-
-    # Try HTTP first
-    fetcher = HttpFetcher(cookies=cookies, headers=headers, delay_ms=delay_ms)
-    result = fetcher.fetch(url)
+        return fetch_with_playwright(url, cookies, pooled=pooled, context_key=context_key)
+
+    if prefetched is not None and not prefetched.error:
+        result = prefetched
+        if (etag and prefetched.etag == etag) or (
+            last_modified and prefetched.last_modified == last_modified
+        ):
+            result.not_modified = True
+    else:
+        # Try HTTP first
+        fetcher = HttpFetcher(
+            cookies=cookies, headers=headers, delay_ms=delay_ms, pooled=pooled, http2=pooled
+        )
+        result = fetcher.fetch(url, etag=etag, last_modified=last_modified)
 
-    if result.error:
+    if result.error or result.not_modified:
         return result
 
-    if result.is_html and is_spa(result.content):
+    if result.is_html and is_spa(result.content, result.parsed()):
         logger.info(f"SPA detected for {url}, retrying with Playwright")
-        playwright_result = fetch_with_playwright(url, cookies)
+        playwright_result = fetch_with_playwright(
+            url, cookies, pooled=pooled, context_key=context_key
+        )
 
         # Only use Playwright result if successful
         if not playwright_result.error:
@@ -0,0 +1,284 @@
+"""
+Per-job visited-URL filter for crawl discovery.
+
+Every URL a job claims is added to a Bloom filter stored in S3 next to the
+job's staged pages. Discovery checks the filter before reading ScrapeUrls:
+a negative answer is definitive, so only possible duplicates (URLs seen
+before, or the ~1% false positives) cost a DynamoDB read.
+
+Concurrent discovery invocations update the same filter with S3
+conditional writes (If-Match / If-None-Match). On a conflict the writer
+re-reads the filter and re-adds its URLs, so no claimed URL is lost.
+
+Usage:
+    visited = VisitedFilter(s3, bucket, job_id, capacity=2 * config.max_pages)
+    visited.load(create=is_seed)
+
+    if visited.might_contain(url):
+        ...  # confirm with ScrapeUrls get_item
+    visited.add(url)
+    visited.save()  # before writing the page records
+"""
+
+import hashlib
+import logging
+import math
+import struct
+from collections.abc import Iterable
+from typing import Any
+
+from botocore.exceptions import ClientError
+
+from ragstack_common.scraper.fetcher import FETCHED_PAGE_PREFIX
+
+logger = logging.getLogger(__name__)
+
+# Target false-positive rate at capacity (false positives cost one DynamoDB read)
+VISITED_FILTER_ERROR_RATE = 0.01
+
+# Filters are capped at 1 MB; past capacity the false-positive rate rises
+MAX_FILTER_BITS = 8 * 1024 * 1024
+
+# Serialized header: magic, format version, hash count, size in bits
+_HEADER = struct.Struct(">4sBBI")
+_MAGIC = b"RSBF"
+_FORMAT_VERSION = 1
+
+# S3 error codes for a failed If-Match / If-None-Match write
+_CONDITION_FAILED = {"PreconditionFailed", "ConditionalRequestConflict", "412", "409"}
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter of strings (blake2b double hashing)."""
+
+    def __init__(self, size_bits: int, num_hashes: int, bits: bytearray | None = None):
+        """
+        Initialize filter.
+
+        Args:
+            size_bits: Number of bits in the filter
+            num_hashes: Number of bit positions set per item
+            bits: Existing bit array (size_bits rounded up to whole bytes)
+        """
+        self.size_bits = max(size_bits, 8)
+        self.num_hashes = max(num_hashes, 1)
+        num_bytes = (self.size_bits + 7) // 8
+        if bits is not None and len(bits) != num_bytes:
+            raise ValueError(f"Expected {num_bytes} bytes of filter bits, got {len(bits)}")
+        self.bits = bits if bits is not None else bytearray(num_bytes)
+
+    @classmethod
+    def for_capacity(
+        cls,
+        capacity: int,
+        error_rate: float = VISITED_FILTER_ERROR_RATE,
+        max_bits: int = MAX_FILTER_BITS,
+    ) -> "BloomFilter":
+        """
+        Create an empty filter sized for capacity items at error_rate.
+
+        Args:
+            capacity: Expected number of items
+            error_rate: False-positive rate at capacity
+            max_bits: Upper bound on the filter size
+
+        Returns:
+            Empty BloomFilter
+        """
+        capacity = max(capacity, 1)
+        size_bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        size_bits = min(size_bits, max_bits)
+        num_hashes = round(size_bits / capacity * math.log(2))
+        return cls(size_bits, num_hashes)
+
+    def _positions(self, item: str) -> list[int]:
+        """Bit positions for an item."""
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        return [(h1 + i * h2) % self.size_bits for i in range(self.num_hashes)]
+
+    def add(self, item: str) -> None:
+        """Add an item."""
+        for pos in self._positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: object) -> bool:
+        """Return False if item was never added (True may be a false positive)."""
+        if not isinstance(item, str):
+            return False
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    def to_bytes(self) -> bytes:
+        """Serialize filter (header + bits)."""
+        header = _HEADER.pack(_MAGIC, _FORMAT_VERSION, self.num_hashes, self.size_bits)
+        return header + bytes(self.bits)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "BloomFilter":
+        """
+        Deserialize a filter written by to_bytes.
+
+        Raises:
+            ValueError: If the data is not a serialized filter
+        """
+        if len(data) < _HEADER.size:
+            raise ValueError("Bloom filter data too short")
+        magic, version, num_hashes, size_bits = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _FORMAT_VERSION:
+            raise ValueError("Not a Bloom filter (bad magic or version)")
+        return cls(size_bits, num_hashes, bytearray(data[_HEADER.size :]))
+
+
+def visited_filter_key(job_id: str) -> str:
+    """
+    Build the S3 key for a job's visited filter.
+
+    Args:
+        job_id: Scrape job ID
+
+    Returns:
+        S3 key under FETCHED_PAGE_PREFIX (expires with the working/ lifecycle)
+    """
+    return f"{FETCHED_PAGE_PREFIX}/{job_id}/visited.bloom"
+
+
+class VisitedFilter:
+    """
+    A job's visited-URL Bloom filter, loaded from and saved to S3.
+
+    Only the job's seed invocation creates the filter, so a filter that
+    exists has seen every claimed URL. Jobs without one (started before the
+    filter existed, or whose filter expired or is unreadable) report every
+    URL as possibly visited, which falls back to DynamoDB reads.
+    """
+
+    def __init__(self, s3_client: Any, bucket: str, job_id: str, capacity: int):
+        """
+        Initialize filter handle (call load() before use).
+
+        Args:
+            s3_client: Boto3 S3 client
+            bucket: Bucket holding the filter
+            job_id: Scrape job ID
+            capacity: Expected number of URLs (sizes a newly created filter)
+        """
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.key = visited_filter_key(job_id)
+        self.capacity = capacity
+        self.bloom: BloomFilter | None = None
+        self.etag: str | None = None
+        self.create = False
+        self.loaded = False
+        self.pending: list[str] = []
+        self.negatives = 0
+        self.positives = 0
+
+    def load(self, create: bool = False) -> None:
+        """
+        Read the filter from S3.
+
+        Args:
+            create: Start an empty filter if none exists (job's first batch)
+        """
+        self.create = create
+        try:
+            self._read()
+        except Exception as e:
+            # Unknown state: answer "maybe" for everything; save() re-reads
+            logger.warning(f"Could not load visited filter {self.key}: {e}")
+            self.bloom = None
+            self.loaded = False
+
+    def _read(self) -> None:
+        """Read the filter object, raising on errors other than a missing key."""
+        try:
+            response = self.s3_client.get_object(Bucket=self.bucket, Key=self.key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") not in ("NoSuchKey", "404"):
+                raise
+            self.bloom = BloomFilter.for_capacity(self.capacity) if self.create else None
+            self.etag = None
+            self.loaded = True
+            return
+
+        try:
+            self.bloom = BloomFilter.from_bytes(response["Body"].read())
+            self.etag = response["ETag"]
+        except ValueError as e:
+            # Nobody can trust a corrupt filter, so there is nothing to keep in sync
+            logger.warning(f"Ignoring unreadable visited filter {self.key}: {e}")
+            self.bloom = None
+        self.loaded = True
+
+    def might_contain(self, url: str) -> bool:
+        """
+        Check whether a URL may have been claimed.
+
+        Args:
+            url: Normalized URL
+
+        Returns:
+            False only if the URL was definitely never claimed
+        """
+        if self.bloom is None or url in self.bloom:
+            self.positives += 1
+            return True
+        self.negatives += 1
+        return False
+
+    def add(self, urls: Iterable[str] | str) -> None:
+        """Queue claimed URLs for the next save()."""
+        new_urls = [urls] if isinstance(urls, str) else list(urls)
+        self.pending.extend(new_urls)
+        if self.bloom is not None:
+            for url in new_urls:
+                self.bloom.add(url)
+
+    def save(self, max_attempts: int = 3) -> None:
+        """
+        Write pending URLs to S3, merging with concurrent writers.
+
+        Raises:
+            ClientError: If S3 fails, or writers keep conflicting
+        """
+        if not self.pending:
+            return
+
+        for attempt in range(max_attempts):
+            if not self.loaded:
+                self._read()
+            if self.bloom is None:
+                # The job has no usable filter, nobody relies on one
+                self.pending.clear()
+                return
+            for url in self.pending:
+                self.bloom.add(url)
+
+            condition = {"IfMatch": self.etag} if self.etag else {"IfNoneMatch": "*"}
+            try:
+                response = self.s3_client.put_object(
+                    Bucket=self.bucket,
+                    Key=self.key,
+                    Body=self.bloom.to_bytes(),
+                    ContentType="application/octet-stream",
+                    **condition,
+                )
+            except ClientError as e:
+                if e.response.get("Error", {}).get("Code") not in _CONDITION_FAILED:
+                    raise
+                if attempt == max_attempts - 1:
+                    raise
+                # Another invocation saved first: re-read and re-add our URLs
+                logger.info(f"Visited filter changed concurrently, merging: {self.key}")
+                self.loaded = False
+                continue
+
+            self.etag = response.get("ETag")
+            self.pending.clear()
+            return
+
+    def stats(self) -> dict[str, int]:
+        """Return lookup counters (negatives are DynamoDB reads avoided)."""
+        return {"negatives": self.negatives, "positives": self.positives}
@@ -41,6 +41,13 @@ class ScrapeScope(str, Enum):
     DOMAIN = "domain"  # Any URL on the same domain (includes subdomains)
 
 
+class DiscoveryMode(str, Enum):
+    """How a scrape job finds its URLs."""
+
+    CRAWL = "crawl"  # Recursively fetch pages and follow links
+    SITEMAP = "sitemap"  # Read robots.txt / sitemap.xml, crawl only if none found
+
+
 @dataclass
 class ScrapeConfig:
     """
@@ -55,6 +62,8 @@ class ScrapeConfig:
         exclude_patterns: Glob patterns for URLs to exclude
         cookies: Optional cookies for authenticated sites
         headers: Optional custom headers
+        force_rescrape: Re-process pages even when content is unchanged
+        discovery_mode: URL discovery strategy (link crawl or sitemaps)
     """
 
     max_pages: int = 1000
@@ -66,6 +75,7 @@ class ScrapeConfig:
     cookies: dict[str, str] = field(default_factory=dict)
     headers: dict[str, str] = field(default_factory=dict)
     force_rescrape: bool = False
+    discovery_mode: DiscoveryMode = DiscoveryMode.CRAWL
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for DynamoDB storage."""
@@ -79,6 +89,7 @@ class ScrapeConfig:
             "cookies": self.cookies,
             "headers": self.headers,
             "force_rescrape": self.force_rescrape,
+            "discovery_mode": self.discovery_mode.value,
         }
 
     @classmethod
@@ -89,6 +100,10 @@ class ScrapeConfig:
             scope = ScrapeScope(data.get("scope", "subpages"))
         except ValueError:
             scope = ScrapeScope.SUBPAGES
+        try:
+            discovery_mode = DiscoveryMode(data.get("discovery_mode", "crawl"))
+        except ValueError:
+            discovery_mode = DiscoveryMode.CRAWL
         return cls(
             max_pages=int(data.get("max_pages", 1000)),
             max_depth=int(data.get("max_depth", 3)),
@@ -99,6 +114,7 @@ class ScrapeConfig:
             cookies=data.get("cookies", {}),
             headers=data.get("headers", {}),
             force_rescrape=bool(data.get("force_rescrape", False)),
+            discovery_mode=discovery_mode,
         )
 
 
@@ -0,0 +1,89 @@
+"""
+Per-host politeness scheduling for concurrent crawls.
+
+HostScheduler replaces blanket sleeps between pages with a budget per host:
+requests to one host start at least delay_ms apart and at most
+max_per_host run at once, while requests to different hosts proceed in
+parallel up to max_concurrency.
+
+Usage:
+    scheduler = HostScheduler(delay_ms=500, max_per_host=2, max_concurrency=10)
+
+    async with scheduler.slot(url):
+        result = await asyncio.to_thread(fetcher.fetch, url)
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+
+class HostScheduler:
+    """
+    Asyncio scheduler enforcing per-host rate and concurrency limits.
+
+    Instances belong to one event loop (one crawl batch); they are not
+    thread-safe.
+    """
+
+    def __init__(self, delay_ms: int = 500, max_per_host: int = 2, max_concurrency: int = 10):
+        """
+        Initialize scheduler.
+
+        Args:
+            delay_ms: Minimum spacing between request starts to the same host
+            max_per_host: Maximum in-flight requests per host
+            max_concurrency: Maximum in-flight requests across all hosts
+        """
+        self.delay = max(delay_ms, 0) / 1000.0
+        self.max_per_host = max(max_per_host, 1)
+        self._global = asyncio.Semaphore(max(max_concurrency, 1))
+        self._host_slots: dict[str, asyncio.Semaphore] = {}
+        self._next_start: dict[str, float] = {}
+        self._stats = {"requests": 0, "throttled": 0, "wait_seconds": 0.0}
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        """
+        Wait until a request to URL's host is allowed, and hold the slot.
+
+        Args:
+            url: URL about to be requested
+        """
+        host = urlsplit(url).netloc.lower()
+        host_slots = self._host_slots.setdefault(host, asyncio.Semaphore(self.max_per_host))
+
+        async with host_slots, self._global:
+            # Reserve the next start time before awaiting so concurrent
+            # waiters for the same host queue up delay apart
+            now = time.monotonic()
+            start = max(now, self._next_start.get(host, 0.0))
+            self._next_start[host] = start + self.delay
+
+            wait = start - now
+            self._stats["requests"] += 1
+            if wait > 0:
+                self._stats["throttled"] += 1
+                self._stats["wait_seconds"] += wait
+                await asyncio.sleep(wait)
+            yield
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Return scheduling counters.
+
+        Returns:
+            Dict with request and throttle counts, total wait time and host count
+        """
+        return {
+            "requests": self._stats["requests"],
+            "throttled": self._stats["throttled"],
+            "wait_seconds": round(self._stats["wait_seconds"], 3),
+            "hosts": len(self._host_slots),
+        }
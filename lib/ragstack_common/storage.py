@@ -6,12 +6,16 @@ Provides simple, consistent interface for reading/writing data.
 
 import json
 import logging
+import time
 import uuid
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import boto3
 from botocore.exceptions import ClientError
 
+from ragstack_common.exceptions import S3BulkWriteError
 from ragstack_common.metadata_normalizer import normalize_metadata_for_s3
 
 logger = logging.getLogger(__name__)
@@ -20,6 +24,18 @@ logger = logging.getLogger(__name__)
 _s3_client = None
 _dynamodb = None
 
+# Bulk S3 writes (write_s3_objects)
+S3_WRITE_MAX_WORKERS = 8
+S3_WRITE_MAX_ATTEMPTS = 3
+S3_WRITE_BACKOFF_SECONDS = 0.5
+_RETRYABLE_S3_ERRORS = {
+    "SlowDown",
+    "InternalError",
+    "ServiceUnavailable",
+    "RequestTimeout",
+    "RequestTimeTooSkewed",
+}
+
 
 def get_s3_client() -> Any:
     """Get or create S3 client."""
@@ -195,6 +211,30 @@ def write_s3_text(s3_uri: str, content: str, encoding: str = "utf-8") -> str:
         raise
 
 
+def write_s3_binary(
+    s3_uri: str, content: bytes, content_type: str = "application/octet-stream"
+) -> str:
+    """
+    Write binary content to S3.
+
+    Args:
+        s3_uri: Destination S3 URI
+        content: Bytes to write
+        content_type: MIME type stored with the object
+
+    Returns:
+        The S3 URI that was written to
+    """
+    bucket, key = parse_s3_uri(s3_uri)
+    try:
+        get_s3_client().put_object(Bucket=bucket, Key=key, Body=content, ContentType=content_type)
+        logger.info(f"Wrote {len(content)} bytes to {s3_uri}")
+        return s3_uri
+    except ClientError:
+        logger.exception(f"Failed to write S3 binary to {s3_uri}")
+        raise
+
+
 def delete_s3_object(s3_uri: str) -> None:
     """
     Delete an object from S3.
@@ -242,48 +282,140 @@ def generate_presigned_url(
         return None
 
 
-def write_metadata_to_s3(s3_uri: str, metadata: dict[str, Any]) -> str:
+def write_s3_objects(
+    objects: Sequence[dict[str, Any]],
+    max_workers: int = S3_WRITE_MAX_WORKERS,
+    max_attempts: int = S3_WRITE_MAX_ATTEMPTS,
+    s3_client: Any = None,
+) -> list[str]:
     """
-    Write metadata to S3 as a .metadata.json file alongside the content file.
+    Write many S3 objects concurrently.
 
-    For S3 Vectors knowledge bases, metadata must be stored in S3 rather than
-    provided inline. The metadata file must be in the same location as the
-    content file with .metadata.json suffix.
+    For stages that fan out many small objects (segments, metadata sidecars),
+    where serial put_object round trips dominate. Throttling and 5xx errors
+    are retried with exponential backoff on top of botocore's own retries.
 
     Args:
-        s3_uri: S3 URI of the content file (e.g., s3://bucket/path/file.txt)
-        metadata: Dictionary of metadata key-value pairs
+        objects: put_object keyword arguments per object (Bucket, Key, Body, ...)
+        max_workers: Maximum concurrent writes
+        max_attempts: Attempts per object for retryable errors
+        s3_client: S3 client to use (default: shared client)
 
     Returns:
-        S3 URI of the metadata file
+        S3 URIs of the written objects, in input order
+
+    Raises:
+        S3BulkWriteError: If any object still fails; every other object has
+            been attempted, and failures are listed in input order
     """
+    if not objects:
+        return []
+
+    client = s3_client or get_s3_client()
+    uris = [f"s3://{obj['Bucket']}/{obj['Key']}" for obj in objects]
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(objects)))) as executor:
+        futures = [executor.submit(_put_s3_object, client, obj, max_attempts) for obj in objects]
+
+    failures: list[tuple[str, Exception]] = []
+    for uri, future in zip(uris, futures, strict=True):
+        error = future.exception()
+        if error is None:
+            continue
+        if not isinstance(error, Exception):
+            # SystemExit / KeyboardInterrupt are not write failures
+            raise error
+        logger.error(f"Failed to write {uri}: {error}")
+        failures.append((uri, error))
+
+    if failures:
+        raise S3BulkWriteError(failures, total=len(objects))
+
+    logger.info(f"Wrote {len(objects)} objects to S3")
+    return uris
+
+
+def _put_s3_object(client: Any, params: dict[str, Any], max_attempts: int) -> None:
+    """put_object with backoff for throttling and transient errors."""
+    for attempt in range(max_attempts):
+        try:
+            client.put_object(**params)
+            return
+        except ClientError as e:
+            code = e.response.get("Error", {}).get("Code", "")
+            if code not in _RETRYABLE_S3_ERRORS or attempt == max_attempts - 1:
+                raise
+            time.sleep(S3_WRITE_BACKOFF_SECONDS * (2**attempt))
+
+
+def _metadata_object(s3_uri: str, metadata: dict[str, Any]) -> dict[str, Any]:
+    """Build put_object arguments for a content file's .metadata.json sidecar."""
     bucket, key = parse_s3_uri(s3_uri)
 
     if not key:
         raise ValueError(f"Invalid S3 URI: missing object key in {s3_uri}")
 
-    # Create metadata file key (same location with .metadata.json suffix)
-    metadata_key = f"{key}.metadata.json"
-    metadata_uri = f"s3://{bucket}/{metadata_key}"
-
     # Normalize metadata for S3 Vectors (convert multi-value fields to arrays)
     normalized_metadata = normalize_metadata_for_s3(metadata)
 
     # Build metadata JSON in Bedrock KB format
     metadata_content = {"metadataAttributes": normalized_metadata}
 
+    # Same location as the content file with .metadata.json suffix
+    return {
+        "Bucket": bucket,
+        "Key": f"{key}.metadata.json",
+        "Body": json.dumps(metadata_content),
+        "ContentType": "application/json",
+    }
+
+
+def write_metadata_to_s3(s3_uri: str, metadata: dict[str, Any]) -> str:
+    """
+    Write metadata to S3 as a .metadata.json file alongside the content file.
+
+    For S3 Vectors knowledge bases, metadata must be stored in S3 rather than
+    provided inline. The metadata file must be in the same location as the
+    content file with .metadata.json suffix.
+
+    Args:
+        s3_uri: S3 URI of the content file (e.g., s3://bucket/path/file.txt)
+        metadata: Dictionary of metadata key-value pairs
+
+    Returns:
+        S3 URI of the metadata file
+    """
+    params = _metadata_object(s3_uri, metadata)
+    metadata_uri = f"s3://{params['Bucket']}/{params['Key']}"
+
     # Write to S3
-    get_s3_client().put_object(
-        Bucket=bucket,
-        Key=metadata_key,
-        Body=json.dumps(metadata_content),
-        ContentType="application/json",
-    )
+    get_s3_client().put_object(**params)
 
     logger.info(f"Wrote metadata to {metadata_uri}")
     return metadata_uri
 
 
+def write_metadata_to_s3_bulk(
+    items: Sequence[tuple[str, dict[str, Any]]],
+    max_workers: int = S3_WRITE_MAX_WORKERS,
+) -> list[str]:
+    """
+    Write .metadata.json sidecars for many content files concurrently.
+
+    Args:
+        items: (content S3 URI, metadata) pairs
+        max_workers: Maximum concurrent writes
+
+    Returns:
+        S3 URIs of the metadata files, in input order
+
+    Raises:
+        S3BulkWriteError: If any sidecar still fails after retries
+    """
+    objects = [_metadata_object(s3_uri, metadata) for s3_uri, metadata in items]
+    return write_s3_objects(objects, max_workers=max_workers)
+
+
 # ============================================================================
 # Validation Utilities
 # ============================================================================
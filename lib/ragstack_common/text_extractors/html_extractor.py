@@ -8,6 +8,7 @@ from ..scraper.extractor import (
     extract_title,
     find_main_content,
     html_to_markdown,
+    parse_html,
     sanitize_html,
 )
 from .base import BaseExtractor, ExtractionResult
@@ -34,20 +35,23 @@ class HtmlExtractor(BaseExtractor):
         html = self._decode_content(content)
         original_size = len(content)
 
+        # Parse once; every step below shares the tree
+        soup = parse_html(html)
+
         # Extract title (must happen before sanitization as title is in <head>)
-        title = extract_title(html)
+        title = extract_title(soup)
         if not title:
             title = self._extract_title_from_filename(filename)
 
         # Sanitize HTML (remove scripts, styles, nav, footer, etc.)
-        soup = sanitize_html(html)
+        sanitize_html(soup)
 
         # Find main content area
         main_content = find_main_content(soup)
         has_main_element = main_content.name == "main" if main_content else False
 
         # Convert to markdown
-        markdown_body = html_to_markdown(str(main_content))
+        markdown_body = html_to_markdown(main_content)
 
         # Count words
         word_count = self._count_words(markdown_body)
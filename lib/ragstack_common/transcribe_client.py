@@ -5,17 +5,36 @@ Provides async job management and transcript parsing with timestamps.
 """
 
 import logging
+import math
 import time
 import uuid
-from typing import Any
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, NamedTuple
 
 import boto3
+import ijson
 
 from ragstack_common.exceptions import TranscriptionError
 
 logger = logging.getLogger(__name__)
 
 
+class TranscriptWord(NamedTuple):
+    """One transcript item from TranscribeClient.iter_transcript_words.
+
+    A tuple rather than a dict so long transcripts stay cheap per word.
+    Timing and speaker are only set for pronunciation items.
+    """
+
+    word: str
+    type: str
+    confidence: float
+    start_time: float | None = None
+    end_time: float | None = None
+    speaker: str | None = None
+
+
 class TranscribeClient:
     """AWS Transcribe client wrapper for batch transcription jobs.
 
@@ -54,6 +73,7 @@ class TranscribeClient:
         enable_speaker_diarization: bool = False,
         max_speakers: int = 2,
         output_key_prefix: str = "transcripts/",
+        tags: dict[str, str] | None = None,
     ) -> str:
         """Start a transcription job for audio/video content.
 
@@ -65,6 +85,8 @@ class TranscribeClient:
             enable_speaker_diarization: Enable speaker labels (default: False).
             max_speakers: Maximum number of speakers to identify (default: 2).
             output_key_prefix: S3 key prefix for output (default: transcripts/).
+            tags: Tags to attach to the job, e.g. to map its completion
+                event back to a document (default: none).
 
         Returns:
             Transcription job name.
@@ -96,6 +118,9 @@ class TranscribeClient:
                 "MaxSpeakerLabels": max_speakers,
             }
 
+        if tags:
+            job_params["Tags"] = [{"Key": k, "Value": v} for k, v in tags.items()]
+
         try:
             response = self._client.start_transcription_job(**job_params)
             created_job_name: str = response["TranscriptionJob"]["TranscriptionJobName"]
@@ -123,6 +148,33 @@ class TranscribeClient:
             logger.exception(f"Failed to get job status: {e}")
             raise TranscriptionError(f"Failed to get job status: {e}") from e
 
+    def describe_job(self, job_name: str) -> dict[str, Any]:
+        """Get the status, transcript URI and tags of a transcription job.
+
+        Used to resume processing from a Transcribe job state change event,
+        which carries only the job name and status.
+
+        Args:
+            job_name: Transcription job name.
+
+        Returns:
+            Dict with status, transcript_uri (None until COMPLETED),
+            failure_reason (None unless FAILED) and tags.
+        """
+        try:
+            response = self._client.get_transcription_job(TranscriptionJobName=job_name)
+        except Exception as e:
+            logger.exception(f"Failed to describe transcription job: {e}")
+            raise TranscriptionError(f"Failed to describe transcription job: {e}") from e
+
+        job = response["TranscriptionJob"]
+        return {
+            "status": job["TranscriptionJobStatus"],
+            "transcript_uri": job.get("Transcript", {}).get("TranscriptFileUri"),
+            "failure_reason": job.get("FailureReason"),
+            "tags": {tag["Key"]: tag["Value"] for tag in job.get("Tags", [])},
+        }
+
     def get_transcript_result(self, job_name: str) -> str | None:
         """Get the transcript result URI for a completed job.
 
@@ -250,3 +302,81 @@ class TranscribeClient:
 
         logger.info(f"Parsed {len(words)} items from transcript")
         return words
+
+    def get_full_transcript(self, transcript_path: str | Path) -> str:
+        """Read the full transcript text from a Transcribe output file.
+
+        Streams the file, stopping after the transcript text (which precedes
+        the per-word items in Transcribe output).
+
+        Args:
+            transcript_path: Local path of the Transcribe output JSON.
+
+        Returns:
+            Full transcript text, or "" if absent.
+        """
+        with Path(transcript_path).open("rb") as transcript_file:
+            texts = ijson.items(transcript_file, "results.transcripts.item.transcript")
+            transcript: str = next(texts, "")
+            return transcript
+
+    def iter_transcript_words(self, transcript_path: str | Path) -> Iterator[TranscriptWord]:
+        """Stream words with timestamps from a Transcribe output file.
+
+        Incremental equivalent of parse_transcript_with_timestamps: items are
+        parsed one at a time and speaker labels are matched by walking the
+        speaker_labels segments alongside them (both are in time order), so
+        memory stays flat regardless of recording length.
+
+        Args:
+            transcript_path: Local path of the Transcribe output JSON.
+
+        Yields:
+            TranscriptWord for each item with at least one alternative.
+        """
+        path = Path(transcript_path)
+        count = 0
+        with path.open("rb") as items_file, path.open("rb") as labels_file:
+            labels = ijson.items(labels_file, "results.speaker_labels.segments.item.items.item")
+            label = None
+            label_start = -math.inf
+
+            for item in ijson.items(items_file, "results.items.item"):
+                alternatives = item.get("alternatives", [])
+                if not alternatives:
+                    continue
+
+                best_alt = alternatives[0]
+                item_type = item.get("type", "")
+                start_time = end_time = speaker = None
+
+                # Add timing and speaker for pronunciation items
+                if item_type == "pronunciation":
+                    start_value = item.get("start_time")
+                    end_value = item.get("end_time")
+                    start_time = float(start_value) if start_value is not None else None
+                    end_time = float(end_value) if end_value is not None else None
+
+                    # Newer output labels items directly; otherwise merge-walk the segments
+                    speaker = item.get("speaker_label")
+                    if speaker is None and start_time is not None:
+                        while label_start < start_time:
+                            label = next(labels, None)
+                            if label is None:
+                                label_start = math.inf
+                            elif label.get("start_time"):
+                                label_start = float(label["start_time"])
+                        if label is not None and label_start == start_time:
+                            speaker = label.get("speaker_label", "")
+
+                count += 1
+                yield TranscriptWord(
+                    word=best_alt.get("content", ""),
+                    type=item_type,
+                    confidence=float(best_alt.get("confidence", 0)),
+                    start_time=start_time,
+                    end_time=end_time,
+                    speaker=speaker,
+                )
+
+        logger.info(f"Parsed {count} items from transcript")
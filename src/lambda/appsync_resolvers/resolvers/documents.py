@@ -22,6 +22,7 @@ from ragstack_common.demo_mode import (
 from ragstack_common.ingestion import ingest_documents_with_retry
 from ragstack_common.key_library import KeyLibrary
 from ragstack_common.metadata_extractor import MetadataExtractor
+from ragstack_common.query_cache import bump_kb_content_version
 from ragstack_common.storage import is_valid_uuid, parse_s3_uri, read_s3_text, write_metadata_to_s3
 from resolvers.shared import (
     DATA_BUCKET,
@@ -29,6 +30,7 @@ from resolvers.shared import (
     MAX_FILENAME_LENGTH,
     METADATA_KEY_LIBRARY_TABLE,
     PROCESS_IMAGE_FUNCTION_ARN,
+    QUERY_CACHE_TABLE,
     SCRAPE_JOBS_TABLE,
     SCRAPE_URLS_TABLE,
     STATE_MACHINE_ARN,
@@ -250,6 +252,8 @@ def delete_documents(args: dict[str, Any]) -> dict[str, Any]:
                     logger.info(f"KB delete queued: {detail}")
                 elif str(status_val) != "DELETED":
                     logger.warning(f"KB delete issue: {detail}")
+            # Deleted content must not be served from cached query results
+            bump_kb_content_version(QUERY_CACHE_TABLE)
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code", "")
             logger.error(f"Failed to delete from KB: {error_code} - {e}")
@@ -531,6 +535,7 @@ def _delete_from_kb_for_reprocess(item: dict) -> None:
             documentIdentifiers=doc_identifiers,
         )
         logger.info(f"Successfully queued KB deletion for {len(kb_uris)} documents")
+        bump_kb_content_version(QUERY_CACHE_TABLE)
     except ClientError as e:
         # Log but don't fail - the document might not exist in KB yet
         error_code = e.response.get("Error", {}).get("Code", "")
@@ -919,6 +924,7 @@ def _reindex_scraped_content(document_id: str, text_uris: list[str], kb_id: str,
                 documents=documents,
             )
             logger.info(f"Ingested {len(documents)} scraped pages: {ingest_response}")
+            bump_kb_content_version(QUERY_CACHE_TABLE)
         except ClientError as e:
             logger.error(f"Failed to ingest scraped pages: {e}")
             raise  # Propagate to caller so job is marked FAILED, not INDEXED
@@ -998,6 +1004,7 @@ def reindex_document(args: dict[str, Any]) -> dict[str, Any]:
             dataSourceId=ds_id,
             documentIdentifiers=doc_identifiers,
         )
+        bump_kb_content_version(QUERY_CACHE_TABLE)
     except ValueError:
         logger.warning("KB config not available, skipping KB deletion before reindex")
     except ClientError as e:
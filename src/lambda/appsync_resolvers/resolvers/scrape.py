@@ -211,6 +211,7 @@ def start_scrape(args: dict[str, Any]) -> dict[str, Any]:
                 "include_patterns": input_data.get("includePatterns", []),
                 "exclude_patterns": input_data.get("excludePatterns", []),
                 "force_rescrape": input_data.get("forceRescrape", False),
+                "discovery_mode": input_data.get("discoveryMode", "crawl").lower(),
             },
         }
 
@@ -356,6 +357,7 @@ def format_scrape_job(item: dict[str, Any]) -> dict[str, Any]:
                 config.get("scrape_mode", "auto").upper() if config.get("scrape_mode") else None
             ),
             "cookies": json.dumps(config.get("cookies")) if config.get("cookies") else None,
+            "discoveryMode": config.get("discovery_mode", "crawl").upper(),
         },
         "totalUrls": int(item.get("total_urls", 0)),
         "processedCount": int(item.get("processed_count", 0)),
@@ -68,10 +68,15 @@ def _process_batch(
     output_s3_prefix: str,
     page_start: int,
     page_end: int,
+    batch_s3_uri: str | None = None,
 ) -> Document:
     """
     Process a single batch of pages and return the processed document.
 
+    When batch_s3_uri is set it points at a sub-PDF holding only this batch's
+    pages (staged by EnqueueBatches); it is read instead of the full document
+    and page numbers stay in original-document numbering via page_offset.
+
     Returns Document with pages_succeeded and pages_failed set.
     """
     # Read configuration
@@ -99,11 +104,12 @@ def _process_batch(
     document = Document(
         document_id=document_id,
         filename=filename,
-        input_s3_uri=input_s3_uri,
+        input_s3_uri=batch_s3_uri or input_s3_uri,
         output_s3_uri=output_s3_prefix,
         status=Status.PROCESSING,
         page_start=page_start,
         page_end=page_end,
+        page_offset=page_start - 1 if batch_s3_uri else 0,
     )
 
     # Create OCR service and process document
@@ -111,6 +117,7 @@ def _process_batch(
         region=os.environ.get("AWS_REGION"),
         backend=ocr_backend,
         bedrock_model_id=bedrock_model_id,
+        max_workers=int(os.environ.get("OCR_MAX_WORKERS", "4")),
     )
 
     # Process the page range
@@ -285,6 +292,7 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, list[dict[s
                     output_s3_prefix=output_s3_prefix,
                     page_start=page_start,
                     page_end=page_end,
+                    batch_s3_uri=message.get("batch_s3_uri"),
                 )
                 pages_succeeded = processed_doc.pages_succeeded
                 pages_failed = processed_doc.pages_failed
@@ -7,6 +7,10 @@ For OCR files (PDF/images), also counts pages and determines batching strategy.
 This Lambda combines file type detection with page info extraction for OCR files,
 eliminating the need for a separate GetPageInfo Lambda invocation.
 
+Large PDFs are inspected with S3 range reads (trailer, xref and the first pages'
+objects only); the whole file is downloaded only when the range read is not
+possible (encrypted, damaged or otherwise unusual files).
+
 Input event:
 {
     "document_id": "abc123",
@@ -38,6 +42,7 @@ from typing import Any
 import boto3
 import fitz  # PyMuPDF - for PDF page counting
 
+from ragstack_common.pdf_range import PdfRangeReadError, open_pdf_head
 from ragstack_common.storage import extract_filename_from_s3_uri, parse_s3_uri, read_s3_binary
 from ragstack_common.text_extractors import ContentSniffer
 
@@ -63,6 +68,10 @@ SNIFF_BYTES = 4096
 BATCH_SIZE = 10  # Pages per batch
 BATCH_THRESHOLD = 20  # Documents with more pages than this use batching
 MIN_EXTRACTABLE_CHARS_PER_PAGE = 50  # Threshold for text-native detection
+TEXT_NATIVE_SAMPLE_PAGES = 3  # Leading pages checked for extractable text
+
+# PDFs at least this large are inspected with range reads instead of downloaded
+RANGE_READ_MIN_BYTES = 8 * 1024 * 1024
 
 
 def _get_sniffer() -> ContentSniffer:
@@ -156,7 +165,7 @@ def _is_pdf_or_image(filename: str, content_first_bytes: bytes) -> bool:
     )
 
 
-def _is_text_native_pdf(pdf_bytes: bytes) -> bool:
+def _is_text_native_pdf(pdf_doc: "fitz.Document") -> bool:
     """
     Check if PDF has extractable text (text-native vs scanned).
 
@@ -164,8 +173,7 @@ def _is_text_native_pdf(pdf_bytes: bytes) -> bool:
     Text-native PDFs don't need OCR batching since text extraction is fast.
     """
     try:
-        pdf_doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-        pages_to_check = min(3, len(pdf_doc))
+        pages_to_check = min(TEXT_NATIVE_SAMPLE_PAGES, len(pdf_doc))
 
         total_chars = 0
         for i in range(pages_to_check):
@@ -173,8 +181,6 @@ def _is_text_native_pdf(pdf_bytes: bytes) -> bool:
             text = page.get_text()
             total_chars += len(text.strip())
 
-        pdf_doc.close()
-
         avg_chars = total_chars / pages_to_check if pages_to_check > 0 else 0
         is_text_native = avg_chars >= MIN_EXTRACTABLE_CHARS_PER_PAGE
 
@@ -190,23 +196,44 @@ def _is_text_native_pdf(pdf_bytes: bytes) -> bool:
         return False
 
 
-def _get_pdf_page_info(input_s3_uri: str, filename: str) -> dict:
+def _inspect_pdf_range(input_s3_uri: str) -> tuple[int, bool] | None:
+    """
+    Count pages and check text-native from S3 range reads.
+
+    Returns:
+        (total_pages, is_text_native), or None if the PDF must be downloaded
+    """
+    bucket, key = parse_s3_uri(input_s3_uri)
+    try:
+        with open_pdf_head(s3_client, bucket, key, max_pages=TEXT_NATIVE_SAMPLE_PAGES) as head:
+            result = (head.total_pages, _is_text_native_pdf(head.document))
+    except PdfRangeReadError as e:
+        logger.info(f"Range read not possible, downloading whole PDF: {e}")
+        return None
+    return result
+
+
+def _get_pdf_page_info(input_s3_uri: str, filename: str, file_size: int | None = None) -> dict:
     """
     Get page info for PDF files: count pages, check text-native, determine batching.
 
+    PDFs of RANGE_READ_MIN_BYTES or more are inspected with range reads
+    first; smaller ones (or of unknown size) are downloaded in one request.
+
     Returns dict with total_pages, needs_batching, is_text_native, and batches array.
     """
-    logger.info(f"Downloading PDF to count pages: {input_s3_uri}")
-    pdf_bytes = read_s3_binary(input_s3_uri, max_size_bytes=500 * 1024 * 1024)
+    inspected = None
+    if file_size is not None and file_size >= RANGE_READ_MIN_BYTES:
+        inspected = _inspect_pdf_range(input_s3_uri)
 
-    # Count pages
-    pdf_doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-    total_pages = len(pdf_doc)
-    pdf_doc.close()
-    logger.info(f"PDF has {total_pages} pages")
+    if inspected is None:
+        logger.info(f"Downloading PDF to count pages: {input_s3_uri}")
+        pdf_bytes = read_s3_binary(input_s3_uri, max_size_bytes=500 * 1024 * 1024)
+        with fitz.open(stream=pdf_bytes, filetype="pdf") as pdf_doc:
+            inspected = (len(pdf_doc), _is_text_native_pdf(pdf_doc))
 
-    # Check if text-native
-    is_text_native = _is_text_native_pdf(pdf_bytes)
+    total_pages, is_text_native = inspected
+    logger.info(f"PDF has {total_pages} pages")
 
     # Determine if batching is needed
     # Text-native PDFs don't need batching (text extraction is fast)
@@ -330,6 +357,9 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
             Range=f"bytes=0-{SNIFF_BYTES - 1}",
         )
         content = response["Body"].read()
+        # "bytes 0-4095/<total>"; sizes the PDF without a HEAD request
+        content_range = response.get("ContentRange", "")
+        file_size = int(content_range.rsplit("/", 1)[1]) if "/" in content_range else None
     except s3_client.exceptions.NoSuchKey:
         logger.error(f"File not found: {input_s3_uri}")
         raise
@@ -350,7 +380,7 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
         # For PDFs: get page count and determine batching strategy
         # For images: single page, no batching
         if detected_type == "pdf":
-            page_info = _get_pdf_page_info(input_s3_uri, filename)
+            page_info = _get_pdf_page_info(input_s3_uri, filename, file_size)
         else:
             # Images are single-page, no batching needed
             page_info = {
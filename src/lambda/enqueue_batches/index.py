@@ -4,6 +4,12 @@ Enqueue Batches Lambda
 Sends individual batch processing jobs to SQS queue and initializes DynamoDB tracking.
 Called by Step Functions when a document needs batched processing.
 
+Before enqueueing, the source PDF is downloaded once and split into per-batch
+sub-PDFs under working/batches/{document_id}/. Each SQS message carries the
+slice URI (batch_s3_uri) so batch processors fetch only their own pages instead
+of every batch downloading the full document. If slicing fails, messages are
+sent without batch_s3_uri and processors fall back to the full document.
+
 Input event (from GetPageInfo):
 {
     "document_id": "abc123",
@@ -30,14 +36,68 @@ Output:
 import json
 import logging
 import os
+import tempfile
 from datetime import UTC, datetime
 from typing import Any
 
 import boto3
+import fitz  # PyMuPDF
+
+from ragstack_common.ocr import copy_pdf_pages
+from ragstack_common.storage import parse_s3_uri
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# Per-batch sub-PDFs live under working/ (expired by the bucket lifecycle rule)
+BATCH_SLICE_PREFIX = "working/batches"
+
+
+def stage_batch_slices(
+    s3_client: Any,
+    document_id: str,
+    input_s3_uri: str,
+    batches: list[dict[str, int]],
+) -> list[str]:
+    """
+    Split the source PDF into one sub-PDF per batch and upload each slice.
+
+    The source is streamed to /tmp and opened from disk, so memory holds the
+    parsed document plus a single slice at a time rather than the raw bytes.
+
+    Args:
+        s3_client: boto3 S3 client
+        document_id: Document identifier (used in slice keys)
+        input_s3_uri: S3 URI of the original PDF
+        batches: Page ranges with page_start/page_end (1-indexed, inclusive)
+
+    Returns:
+        Slice S3 URIs, one per batch, in batch order
+    """
+    bucket, key = parse_s3_uri(input_s3_uri)
+    slice_uris: list[str] = []
+
+    with tempfile.NamedTemporaryFile(suffix=".pdf") as tmp:
+        s3_client.download_file(bucket, key, tmp.name)
+
+        with fitz.open(tmp.name) as source:
+            for batch in batches:
+                page_start = batch["page_start"]
+                page_end = batch["page_end"]
+                slice_key = (
+                    f"{BATCH_SLICE_PREFIX}/{document_id}/pages_{page_start:03d}-{page_end:03d}.pdf"
+                )
+                s3_client.put_object(
+                    Bucket=bucket,
+                    Key=slice_key,
+                    Body=copy_pdf_pages(source, page_start, page_end),
+                    ContentType="application/pdf",
+                )
+                slice_uris.append(f"s3://{bucket}/{slice_key}")
+
+    logger.info(f"Staged {len(slice_uris)} batch slices for {document_id}")
+    return slice_uris
+
 
 def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     """
@@ -71,8 +131,16 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     # Initialize clients
     dynamodb = boto3.resource("dynamodb")
     sqs = boto3.client("sqs")
+    s3 = boto3.client("s3")
     table = dynamodb.Table(tracking_table)
 
+    # Pre-slice the PDF once so each batch reads only its own pages
+    slice_uris: list[str] | None = None
+    try:
+        slice_uris = stage_batch_slices(s3, document_id, input_s3_uri, batches)
+    except Exception as e:
+        logger.warning(f"Failed to pre-slice {document_id}, batches will read full PDF: {e}")
+
     # Send batch messages to SQS first, verify all succeed,
     # then write DynamoDB. This prevents stale counters if Lambda retries
     # after a partial SQS failure.
@@ -89,6 +157,8 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
             "total_batches": total_batches,
             "total_pages": total_pages,
         }
+        if slice_uris:
+            message_body["batch_s3_uri"] = slice_uris[i]
         entries.append(
             {
                 "Id": str(i),
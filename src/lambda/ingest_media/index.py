@@ -55,7 +55,13 @@ from ragstack_common.ingestion import (
 )
 from ragstack_common.metadata_extractor import MetadataExtractor
 from ragstack_common.metadata_normalizer import reduce_metadata
-from ragstack_common.storage import parse_s3_uri, read_s3_text, write_metadata_to_s3
+from ragstack_common.query_cache import bump_kb_content_version
+from ragstack_common.storage import (
+    parse_s3_uri,
+    read_s3_text,
+    write_metadata_to_s3,
+    write_metadata_to_s3_bulk,
+)
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -305,28 +311,30 @@ def _batch_ingest_segments(
     """
     Batch ingest segments (25 per API call).
 
-    Writes metadata files and calls IngestKnowledgeBaseDocuments in batches.
+    Writes all metadata files concurrently, then calls
+    IngestKnowledgeBaseDocuments in batches.
     """
+    metadata_uris = write_metadata_to_s3_bulk(
+        [(item["segment_uri"], item["segment_metadata"]) for item in segment_data]
+    )
+
     for i in range(0, len(segment_data), INGEST_BATCH_SIZE):
         batch = segment_data[i : i + INGEST_BATCH_SIZE]
-        documents = []
-
-        for item in batch:
-            # Write metadata file for this segment
-            metadata_uri = write_metadata_to_s3(item["segment_uri"], item["segment_metadata"])
-
-            documents.append(
-                {
-                    "content": {
-                        "dataSourceType": "S3",
-                        "s3": {"s3Location": {"uri": item["segment_uri"]}},
-                    },
-                    "metadata": {
-                        "type": "S3_LOCATION",
-                        "s3Location": {"uri": metadata_uri},
-                    },
-                }
+        documents = [
+            {
+                "content": {
+                    "dataSourceType": "S3",
+                    "s3": {"s3Location": {"uri": item["segment_uri"]}},
+                },
+                "metadata": {
+                    "type": "S3_LOCATION",
+                    "s3Location": {"uri": metadata_uri},
+                },
+            }
+            for item, metadata_uri in zip(
+                batch, metadata_uris[i : i + INGEST_BATCH_SIZE], strict=True
             )
+        ]
 
         # Ingest batch via direct API with retry for conflicts
         try:
@@ -547,6 +555,10 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
             ds_id=ds_id,
         )
 
+        # New transcript content is searchable: invalidate cached query results
+        if text_indexed or segments_indexed:
+            bump_kb_content_version(os.environ.get("QUERY_CACHE_TABLE"))
+
         # Park at SYNC_QUEUED — text transcripts are ingested inline, but visual frames
         # are still pending the StartIngestionJob queued below. sync_status_checker
         # (EventBridge rate(1m)) promotes to INDEXED once Bedrock confirms the visual
@@ -41,6 +41,7 @@ from ragstack_common.ingestion import check_document_status, ingest_documents_wi
 from ragstack_common.key_library import KeyLibrary
 from ragstack_common.metadata_extractor import MetadataExtractor
 from ragstack_common.metadata_normalizer import normalize_metadata_for_s3, reduce_metadata
+from ragstack_common.query_cache import bump_kb_content_version
 from ragstack_common.storage import (
     read_s3_text,
     write_metadata_to_s3,
@@ -389,6 +390,9 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
             # Log the error but don't fail the ingestion
             # The document was successfully ingested
 
+        # New content is searchable: invalidate cached query results
+        bump_kb_content_version(os.environ.get("QUERY_CACHE_TABLE"))
+
         return {
             "document_id": document_id,
             "status": "INDEXED",
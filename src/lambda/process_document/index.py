@@ -274,6 +274,7 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
             region=os.environ.get("AWS_REGION"),
             backend=ocr_backend,
             bedrock_model_id=bedrock_model_id,
+            max_workers=int(os.environ.get("OCR_MAX_WORKERS", "4")),
         )
 
         # Process document - returns updated Document object
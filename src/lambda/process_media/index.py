@@ -7,6 +7,18 @@ Outputs timestamped transcript segments for embedding.
 Media files are uploaded directly to content/{docId}/ folder and processed
 via EventBridge trigger. No Step Functions involved for media.
 
+Processing runs in two stages so no Lambda sits idle while Transcribe works:
+
+1. Start: update tracking, start the Transcribe job (tagged with the
+   document_id) and store the job context on the tracking record.
+2. Completion: resumed by the Transcribe "Job State Change" EventBridge
+   event. Downloads the transcript, writes segments, then hands off to
+   IngestMedia (EventBridge uploads) or returns the result to Step Functions
+   via SendTaskSuccess (the ProcessMedia state waits on a task token).
+
+Set TRANSCRIBE_COMPLETION_MODE=poll to run both stages in one invocation,
+polling Transcribe in between (for local runs with a stubbed client).
+
 Input event (EventBridge S3):
 {
     "detail": {
@@ -15,7 +27,23 @@ Input event (EventBridge S3):
     }
 }
 
-Output:
+Input event (EventBridge Transcribe):
+{
+    "source": "aws.transcribe",
+    "detail": {
+        "TranscriptionJobName": "ragstack-abc123-1a2b3c4d",
+        "TranscriptionJobStatus": "COMPLETED"
+    }
+}
+
+Start stage output (event mode):
+{
+    "document_id": "abc123",
+    "status": "transcribing",
+    "transcribe_job_id": "ragstack-abc123-1a2b3c4d"
+}
+
+Completion output:
 {
     "document_id": "abc123",
     "status": "transcribed",
@@ -29,8 +57,10 @@ Output:
 import json
 import logging
 import os
+import shutil
+import tempfile
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, cast
 
 import boto3
 
@@ -38,7 +68,11 @@ from ragstack_common.appsync import publish_document_update
 from ragstack_common.config import ConfigurationManager
 from ragstack_common.exceptions import TranscriptionError
 from ragstack_common.media_segmenter import MediaSegmenter
-from ragstack_common.storage import extract_filename_from_s3_uri, parse_s3_uri
+from ragstack_common.storage import (
+    extract_filename_from_s3_uri,
+    parse_s3_uri,
+    write_s3_objects,
+)
 from ragstack_common.transcribe_client import TranscribeClient
 
 logger = logging.getLogger()
@@ -48,6 +82,7 @@ logger.setLevel(logging.INFO)
 s3_client = boto3.client("s3")
 dynamodb = boto3.resource("dynamodb")
 lambda_client = boto3.client("lambda")
+sfn_client = boto3.client("stepfunctions")
 
 
 # Media file extensions
@@ -55,6 +90,12 @@ MEDIA_EXTENSIONS = {".mp4", ".webm", ".mp3", ".wav", ".m4a", ".ogg"}
 VIDEO_EXTENSIONS = {".mp4", ".webm"}
 AUDIO_EXTENSIONS = {".mp3", ".wav", ".m4a", ".ogg"}
 
+# Transcribe job tag used to map completion events back to a document
+DOCUMENT_ID_TAG = "ragstack_document_id"
+
+# Chunk size for spooling Transcribe output to /tmp
+TRANSCRIPT_CHUNK_SIZE = 1024 * 1024
+
 
 def _is_eventbridge_event(event: dict) -> bool:
     """Check if this is an EventBridge S3 event (vs Step Functions)."""
@@ -66,6 +107,13 @@ def _is_eventbridge_event(event: dict) -> bool:
     return bool(bucket_info.get("name") and object_info.get("key"))
 
 
+def _is_transcribe_event(event: dict) -> bool:
+    """Check if this is a Transcribe job state change event."""
+    return event.get("source") == "aws.transcribe" and bool(
+        event.get("detail", {}).get("TranscriptionJobName")
+    )
+
+
 def _parse_eventbridge_event(event: dict) -> dict | None:
     """
     Parse EventBridge S3 event to extract media processing parameters.
@@ -142,10 +190,9 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     """
     Main Lambda handler for media file processing.
 
-    Orchestrates transcription through AWS Transcribe and outputs
-    timestamped transcript segments.
-
-    Handles both EventBridge S3 events and Step Functions events.
+    Starts transcription for EventBridge S3 and Step Functions events, and
+    completes it (segments, tracking, hand-off) for Transcribe job state
+    change events.
     """
     tracking_table = os.environ.get("TRACKING_TABLE")
     if not tracking_table:
@@ -155,8 +202,10 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
 
     logger.info(f"ProcessMedia: Received event: {json.dumps(event)[:500]}")
 
-    document_id = None
-    filename = None
+    if _is_transcribe_event(event):
+        return _handle_transcription_event(event, tracking_table, graphql_endpoint)
+
+    job: dict[str, Any] = {}
 
     try:
         # Check if this is an EventBridge S3 event (vs Step Functions)
@@ -190,84 +239,29 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
                 output_s3_prefix = f"{bucket_and_prefix}/content/{document_id}/"
                 logger.info(f"Fixed output_s3_prefix to: {output_s3_prefix}")
 
-        filename = extract_filename_from_s3_uri(input_s3_uri, default="media")
-        logger.info(f"Processing media file: {filename} (type: {detected_type})")
-
-        # Get configuration
-        config_manager = ConfigurationManager()
-        language_code = config_manager.get_parameter("transcribe_language_code", "en-US")
-        enable_diarization = config_manager.get_parameter("speaker_diarization_enabled", True)
-        segment_duration = config_manager.get_parameter("media_segment_duration_seconds", 30)
+        job = {
+            "document_id": document_id,
+            "input_s3_uri": input_s3_uri,
+            "output_s3_prefix": output_s3_prefix,
+            "detected_type": detected_type,
+            "filename": extract_filename_from_s3_uri(input_s3_uri, default="media"),
+            "trigger": "eventbridge" if is_eventbridge else "step_functions",
+        }
+        if event.get("task_token"):
+            job["task_token"] = event["task_token"]
+        logger.info(f"Processing media file: {job['filename']} (type: {detected_type})")
 
-        # Update status to transcribing
         table = dynamodb.Table(tracking_table)
-        now = datetime.now(UTC).isoformat()
-
-        table.update_item(
-            Key={"document_id": document_id},
-            UpdateExpression=(
-                "SET #status = :status, "
-                "#type = :type, "
-                "media_type = :media_type, "
-                "file_type = :file_type, "
-                "updated_at = :updated_at, "
-                "created_at = if_not_exists(created_at, :created_at), "
-                "filename = if_not_exists(filename, :filename), "
-                "input_s3_uri = if_not_exists(input_s3_uri, :input_s3_uri)"
-            ),
-            ExpressionAttributeNames={"#status": "status", "#type": "type"},
-            ExpressionAttributeValues={
-                ":status": "transcribing",
-                ":type": "media",
-                ":media_type": detected_type,
-                ":file_type": detected_type,  # video or audio
-                ":updated_at": now,
-                ":created_at": now,
-                ":filename": filename,
-                ":input_s3_uri": input_s3_uri,
-            },
-        )
-
-        # Publish real-time update
-        publish_document_update(graphql_endpoint, document_id, filename, "PROCESSING")
-
-        # Get file metadata for duration estimation
-        input_bucket, input_key = parse_s3_uri(input_s3_uri)
-        head_response = s3_client.head_object(Bucket=input_bucket, Key=input_key)
-        content_length = head_response.get("ContentLength", 0)
-        estimated_duration = _get_media_duration_estimate(content_length, detected_type)
-
-        logger.info(
-            f"Media file: {content_length} bytes, estimated duration: {estimated_duration}s"
-        )
-
-        # Start transcription job. Output goes to the data bucket — the same place
-        # we read transcripts back from below. VECTOR_BUCKET points at an S3 Vectors
-        # bucket which Transcribe rejects.
-        output_bucket, _ = parse_s3_uri(output_s3_prefix)
         transcribe_client = TranscribeClient()
-
-        job_name = transcribe_client.start_transcription_job(
-            document_id=document_id,
-            input_s3_uri=input_s3_uri,
-            output_bucket=output_bucket,
-            language_code=language_code,
-            enable_speaker_diarization=enable_diarization,
-            max_speakers=4,
-            output_key_prefix=f"transcripts/{document_id}/",
-        )
-
-        logger.info(f"Started transcription job: {job_name}")
-
-        # Update status with job info
-        table.update_item(
-            Key={"document_id": document_id},
-            UpdateExpression="SET transcribe_job_id = :job_id, updated_at = :updated_at",
-            ExpressionAttributeValues={
-                ":job_id": job_name,
-                ":updated_at": datetime.now(UTC).isoformat(),
-            },
-        )
+        job_name = _start_transcription(table, job, transcribe_client, graphql_endpoint)
+
+        if os.environ.get("TRANSCRIBE_COMPLETION_MODE", "poll") != "poll":
+            # Completion stage is resumed by the Transcribe job state change event
+            return {
+                "document_id": document_id,
+                "status": "transcribing",
+                "transcribe_job_id": job_name,
+            }
 
         # Wait for transcription to complete
         result = transcribe_client.wait_for_completion(
@@ -279,168 +273,390 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
         if result["status"] != "COMPLETED":
             raise TranscriptionError(f"Transcription did not complete: {result}")
 
-        transcript_uri = result["transcript_uri"]
-        logger.info(f"Transcription completed: {transcript_uri}")
+        return _complete_transcription(
+            table, job, result["transcript_uri"], transcribe_client, graphql_endpoint
+        )
+
+    except Exception as e:
+        logger.error(f"Media processing failed: {e}", exc_info=True)
+        _mark_failed(tracking_table, job, e, graphql_endpoint)
+        raise
 
-        # Download and parse transcript
-        transcript_bucket, transcript_key = parse_s3_uri(transcript_uri)
-        transcript_response = s3_client.get_object(Bucket=transcript_bucket, Key=transcript_key)
-        transcript_json = json.loads(transcript_response["Body"].read().decode("utf-8"))
 
-        # Parse words with timestamps
-        words = transcribe_client.parse_transcript_with_timestamps(transcript_json)
-        logger.info(f"Parsed {len(words)} words from transcript")
+def _handle_transcription_event(
+    event: dict[str, Any], tracking_table: str, graphql_endpoint: str | None
+) -> dict[str, Any]:
+    """
+    Resume a media job from its Transcribe job state change event.
 
-        # Get actual duration from transcript if available
-        if words:
-            actual_duration = max(w.get("end_time", 0) for w in words if w.get("end_time"))
-            if actual_duration > 0:
-                estimated_duration = actual_duration
+    Events for jobs this stack did not start, superseded jobs and
+    already-completed documents are skipped, so duplicate deliveries are
+    harmless.
+    """
+    job_name = event["detail"]["TranscriptionJobName"]
+    transcribe_client = TranscribeClient()
+    job_info = transcribe_client.describe_job(job_name)
+
+    document_id = job_info["tags"].get(DOCUMENT_ID_TAG)
+    if not document_id:
+        logger.info(f"Transcription job {job_name} has no document tag, skipping")
+        return {"status": "skipped", "reason": "not a media job"}
+
+    table = dynamodb.Table(tracking_table)
+    item = table.get_item(Key={"document_id": document_id}, ConsistentRead=True).get("Item")
+    if (
+        not item
+        or item.get("transcribe_job_id") != job_name
+        or item.get("status") != "transcribing"
+        or "transcribe_context" not in item
+    ):
+        logger.info(f"No pending media job for {job_name} in this stack, skipping")
+        return {"status": "skipped", "reason": "no pending media job"}
+
+    context = cast(dict[str, Any], item["transcribe_context"])
+    job = {
+        "document_id": document_id,
+        "input_s3_uri": context["input_s3_uri"],
+        "output_s3_prefix": context["output_s3_prefix"],
+        "detected_type": context["detected_type"],
+        "filename": context["filename"],
+        "trigger": context["trigger"],
+        "language_code": context["language_code"],
+        "segment_duration": int(context["segment_duration"]),
+        "estimated_duration": float(context["estimated_duration"]),
+    }
+    if context.get("task_token"):
+        job["task_token"] = context["task_token"]
 
-        # Segment transcript
-        segmenter = MediaSegmenter(segment_duration=segment_duration)
-        segments = segmenter.segment_transcript(words, total_duration=estimated_duration)
-        logger.info(f"Created {len(segments)} segments")
+    try:
+        if job_info["status"] != "COMPLETED":
+            reason = job_info.get("failure_reason") or "Unknown error"
+            raise TranscriptionError(f"Transcription failed: {reason}")
 
-        # Write full transcript to S3
-        full_transcript = (
-            transcript_json.get("results", {}).get("transcripts", [{}])[0].get("transcript", "")
+        logger.info(f"Transcription completed for {document_id}: {job_name}")
+        return _complete_transcription(
+            table, job, job_info["transcript_uri"], transcribe_client, graphql_endpoint
         )
-        output_bucket, output_prefix = parse_s3_uri(output_s3_prefix)
-        transcript_key = f"{output_prefix}transcript_full.txt".replace("//", "/")
-
-        s3_client.put_object(
-            Bucket=output_bucket,
-            Key=transcript_key,
-            Body=full_transcript.encode("utf-8"),
-            ContentType="text/plain",
+
+    except Exception as e:
+        logger.error(f"Media processing failed: {e}", exc_info=True)
+        _mark_failed(tracking_table, job, e, graphql_endpoint)
+        if job.get("task_token"):
+            try:
+                sfn_client.send_task_failure(
+                    taskToken=job["task_token"],
+                    error=type(e).__name__,
+                    cause=str(e)[:32768],
+                )
+            except Exception as sfn_error:
+                logger.error(f"Failed to report failure to Step Functions: {sfn_error}")
+        raise
+
+
+def _start_transcription(
+    table: Any,
+    job: dict[str, Any],
+    transcribe_client: TranscribeClient,
+    graphql_endpoint: str | None,
+) -> str:
+    """
+    Start stage: mark the document transcribing and start its Transcribe job.
+
+    Fills in the job's configuration and duration estimate, and stores the
+    job context on the tracking record for the completion stage.
+
+    Returns:
+        Transcription job name
+    """
+    document_id = job["document_id"]
+    input_s3_uri = job["input_s3_uri"]
+    detected_type = job["detected_type"]
+
+    # Get configuration
+    config_manager = ConfigurationManager()
+    language_code = config_manager.get_parameter("transcribe_language_code", "en-US")
+    enable_diarization = config_manager.get_parameter("speaker_diarization_enabled", True)
+    segment_duration = config_manager.get_parameter("media_segment_duration_seconds", 30)
+    job["language_code"] = language_code
+    job["segment_duration"] = int(segment_duration)
+
+    # Update status to transcribing
+    now = datetime.now(UTC).isoformat()
+
+    table.update_item(
+        Key={"document_id": document_id},
+        UpdateExpression=(
+            "SET #status = :status, "
+            "#type = :type, "
+            "media_type = :media_type, "
+            "file_type = :file_type, "
+            "updated_at = :updated_at, "
+            "created_at = if_not_exists(created_at, :created_at), "
+            "filename = if_not_exists(filename, :filename), "
+            "input_s3_uri = if_not_exists(input_s3_uri, :input_s3_uri)"
+        ),
+        ExpressionAttributeNames={"#status": "status", "#type": "type"},
+        ExpressionAttributeValues={
+            ":status": "transcribing",
+            ":type": "media",
+            ":media_type": detected_type,
+            ":file_type": detected_type,  # video or audio
+            ":updated_at": now,
+            ":created_at": now,
+            ":filename": job["filename"],
+            ":input_s3_uri": input_s3_uri,
+        },
+    )
+
+    # Publish real-time update
+    publish_document_update(graphql_endpoint, document_id, job["filename"], "PROCESSING")
+
+    # Get file metadata for duration estimation
+    input_bucket, input_key = parse_s3_uri(input_s3_uri)
+    head_response = s3_client.head_object(Bucket=input_bucket, Key=input_key)
+    content_length = head_response.get("ContentLength", 0)
+    job["estimated_duration"] = _get_media_duration_estimate(content_length, detected_type)
+
+    logger.info(
+        f"Media file: {content_length} bytes, estimated duration: {job['estimated_duration']}s"
+    )
+
+    # Start transcription job. Output goes to the data bucket — the same place
+    # we read transcripts back from below. VECTOR_BUCKET points at an S3 Vectors
+    # bucket which Transcribe rejects.
+    output_bucket, _ = parse_s3_uri(job["output_s3_prefix"])
+
+    job_name = transcribe_client.start_transcription_job(
+        document_id=document_id,
+        input_s3_uri=input_s3_uri,
+        output_bucket=output_bucket,
+        language_code=language_code,
+        enable_speaker_diarization=enable_diarization,
+        max_speakers=4,
+        output_key_prefix=f"transcripts/{document_id}/",
+        tags={DOCUMENT_ID_TAG: document_id},
+    )
+
+    logger.info(f"Started transcription job: {job_name}")
+
+    # Update status with job info and the context the completion stage needs
+    transcribe_context: dict[str, Any] = {
+        key: job[key]
+        for key in (
+            "input_s3_uri",
+            "output_s3_prefix",
+            "detected_type",
+            "filename",
+            "trigger",
+            "language_code",
+            "segment_duration",
+            "task_token",
+        )
+        if key in job
+    }
+    # DynamoDB rejects floats; the estimate is only a fallback for segmenting
+    transcribe_context["estimated_duration"] = int(job["estimated_duration"])
+
+    table.update_item(
+        Key={"document_id": document_id},
+        UpdateExpression=(
+            "SET transcribe_job_id = :job_id, transcribe_context = :context, "
+            "updated_at = :updated_at"
+        ),
+        ExpressionAttributeValues={
+            ":job_id": job_name,
+            ":context": transcribe_context,
+            ":updated_at": datetime.now(UTC).isoformat(),
+        },
+    )
+
+    return job_name
+
+
+def _complete_transcription(
+    table: Any,
+    job: dict[str, Any],
+    transcript_uri: str,
+    transcribe_client: TranscribeClient,
+    graphql_endpoint: str | None,
+) -> dict[str, Any]:
+    """
+    Completion stage: segment the transcript, write it to S3 and hand off.
+
+    The result goes to Step Functions when the job carries a task token, or
+    to IngestMedia for EventBridge uploads.
+    """
+    document_id = job["document_id"]
+    logger.info(f"Transcription completed: {transcript_uri}")
+
+    # Spool the transcript to /tmp and stream it: multi-hour recordings have
+    # hundreds of thousands of items, which are never held in memory at once
+    transcript_bucket, transcript_key = parse_s3_uri(transcript_uri)
+    transcript_response = s3_client.get_object(Bucket=transcript_bucket, Key=transcript_key)
+    with tempfile.NamedTemporaryFile(suffix=".json") as transcript_file:
+        shutil.copyfileobj(transcript_response["Body"], transcript_file, TRANSCRIPT_CHUNK_SIZE)
+        transcript_file.flush()
+
+        # Segment words as they are parsed; duration comes from the last word's
+        # end time, falling back to the file-size estimate
+        segmenter = MediaSegmenter(segment_duration=job["segment_duration"])
+        segments, estimated_duration = segmenter.segment_stream(
+            transcribe_client.iter_transcript_words(transcript_file.name),
+            fallback_duration=job["estimated_duration"],
         )
+        logger.info(f"Created {len(segments)} segments")
+
+        full_transcript = transcribe_client.get_full_transcript(transcript_file.name)
+
+    # Write full transcript to S3
+    output_bucket, output_prefix = parse_s3_uri(job["output_s3_prefix"])
+    transcript_key = f"{output_prefix}transcript_full.txt".replace("//", "/")
 
-        full_transcript_uri = f"s3://{output_bucket}/{transcript_key}"
-        logger.info(f"Wrote full transcript to: {full_transcript_uri}")
+    s3_client.put_object(
+        Bucket=output_bucket,
+        Key=transcript_key,
+        Body=full_transcript.encode("utf-8"),
+        ContentType="text/plain",
+    )
 
-        # Video stays in content/ - uploaded directly there, KB syncs from there
-        video_uri = input_s3_uri
+    full_transcript_uri = f"s3://{output_bucket}/{transcript_key}"
+    logger.info(f"Wrote full transcript to: {full_transcript_uri}")
 
-        # Write segment files to S3 (flat structure, no /segments/ subfolder)
-        for segment in segments:
-            seg_name = f"segment-{segment['segment_index']:03d}.txt"
-            segment_key = f"{output_prefix}{seg_name}".replace("//", "/")
-            segment_content = segment["text"]
+    # Video stays in content/ - uploaded directly there, KB syncs from there
+    video_uri = job["input_s3_uri"]
 
-            s3_client.put_object(
-                Bucket=output_bucket,
-                Key=segment_key,
-                Body=segment_content.encode("utf-8"),
-                ContentType="text/plain",
-                Metadata={
+    # Write segment files to S3 (flat structure, no /segments/ subfolder)
+    write_s3_objects(
+        [
+            {
+                "Bucket": output_bucket,
+                "Key": f"{output_prefix}segment-{segment['segment_index']:03d}.txt".replace(
+                    "//", "/"
+                ),
+                "Body": segment["text"].encode("utf-8"),
+                "ContentType": "text/plain",
+                "Metadata": {
                     "timestamp_start": str(segment["timestamp_start"]),
                     "timestamp_end": str(segment["timestamp_end"]),
                     "word_count": str(segment["word_count"]),
                     "segment_index": str(segment["segment_index"]),
                 },
-            )
+            }
+            for segment in segments
+        ],
+        s3_client=s3_client,
+    )
+
+    # Update DynamoDB tracking
+    table.update_item(
+        Key={"document_id": document_id},
+        UpdateExpression=(
+            "SET #status = :status, "
+            "duration_seconds = :duration, "
+            "total_segments = :segments, "
+            "output_s3_uri = :output_uri, "
+            "language_code = :language, "
+            "updated_at = :updated_at "
+            "REMOVE transcribe_context"
+        ),
+        ExpressionAttributeNames={"#status": "status"},
+        ExpressionAttributeValues={
+            ":status": "transcribed",
+            ":duration": int(estimated_duration),
+            ":segments": len(segments),
+            ":output_uri": full_transcript_uri,
+            ":language": job["language_code"],
+            ":updated_at": datetime.now(UTC).isoformat(),
+        },
+    )
+
+    # Publish completion update
+    publish_document_update(
+        graphql_endpoint,
+        document_id,
+        job["filename"],
+        "OCR_COMPLETE",
+        total_pages=len(segments),
+    )
+
+    # Build transcript segment list for output
+    transcript_segments = [
+        {
+            "segment_index": s["segment_index"],
+            "timestamp_start": s["timestamp_start"],
+            "timestamp_end": s["timestamp_end"],
+            "text": s["text"],
+            "word_count": s["word_count"],
+            "speaker": s.get("speaker"),
+        }
+        for s in segments
+    ]
+
+    # Build result
+    result = {
+        "document_id": document_id,
+        "status": "transcribed",
+        "output_s3_uri": full_transcript_uri,
+        "video_s3_uri": video_uri,
+        "total_segments": len(segments),
+        "duration_seconds": int(estimated_duration),
+        "media_type": job["detected_type"],
+        "transcript_segments": transcript_segments,
+    }
 
-        # Update DynamoDB tracking
+    if job.get("task_token"):
+        # Step Functions is waiting on the ProcessMedia state; it runs IngestMedia next
+        sfn_client.send_task_success(taskToken=job["task_token"], output=json.dumps(result))
+        return result
+
+    # If triggered via EventBridge (not Step Functions), invoke IngestMedia directly
+    ingest_media_arn = os.environ.get("INGEST_MEDIA_FUNCTION_ARN")
+    if job["trigger"] == "eventbridge" and ingest_media_arn:
+        logger.info(f"EventBridge trigger: invoking IngestMedia for {document_id}")
+        try:
+            lambda_client.invoke(
+                FunctionName=ingest_media_arn,
+                InvocationType="Event",  # Async invocation
+                Payload=json.dumps(result),
+            )
+        except Exception as invoke_err:
+            # Log but don't fail - transcription succeeded, ingest can be retried
+            logger.error(f"Failed to invoke IngestMedia for {document_id}: {invoke_err}")
+
+    return result
+
+
+def _mark_failed(
+    tracking_table: str,
+    job: dict[str, Any],
+    error: Exception,
+    graphql_endpoint: str | None,
+) -> None:
+    """Set the document's tracking status to failed and publish the failure."""
+    document_id = job.get("document_id")
+    if not document_id:
+        return
+    try:
+        table = dynamodb.Table(tracking_table)
         table.update_item(
             Key={"document_id": document_id},
             UpdateExpression=(
-                "SET #status = :status, "
-                "duration_seconds = :duration, "
-                "total_segments = :segments, "
-                "output_s3_uri = :output_uri, "
-                "language_code = :language, "
-                "updated_at = :updated_at"
+                "SET #status = :status, error_message = :error, updated_at = :updated_at"
             ),
             ExpressionAttributeNames={"#status": "status"},
             ExpressionAttributeValues={
-                ":status": "transcribed",
-                ":duration": int(estimated_duration),
-                ":segments": len(segments),
-                ":output_uri": full_transcript_uri,
-                ":language": language_code,
+                ":status": "failed",
+                ":error": str(error),
                 ":updated_at": datetime.now(UTC).isoformat(),
             },
         )
-
-        # Publish completion update
+        # Publish failure update
         publish_document_update(
             graphql_endpoint,
             document_id,
-            filename,
-            "OCR_COMPLETE",
-            total_pages=len(segments),
+            job.get("filename") or "unknown",
+            "FAILED",
+            error_message=str(error),
         )
-
-        # Build transcript segment list for output
-        transcript_segments = [
-            {
-                "segment_index": s["segment_index"],
-                "timestamp_start": s["timestamp_start"],
-                "timestamp_end": s["timestamp_end"],
-                "text": s["text"],
-                "word_count": s["word_count"],
-                "speaker": s.get("speaker"),
-            }
-            for s in segments
-        ]
-
-        # Build result
-        result = {
-            "document_id": document_id,
-            "status": "transcribed",
-            "output_s3_uri": full_transcript_uri,
-            "video_s3_uri": video_uri,
-            "total_segments": len(segments),
-            "duration_seconds": int(estimated_duration),
-            "media_type": detected_type,
-            "transcript_segments": transcript_segments,
-        }
-
-        # If triggered via EventBridge (not Step Functions), invoke IngestMedia directly
-        ingest_media_arn = os.environ.get("INGEST_MEDIA_FUNCTION_ARN")
-        if is_eventbridge and ingest_media_arn:
-            logger.info(f"EventBridge trigger: invoking IngestMedia for {document_id}")
-            try:
-                lambda_client.invoke(
-                    FunctionName=ingest_media_arn,
-                    InvocationType="Event",  # Async invocation
-                    Payload=json.dumps(result),
-                )
-            except Exception as invoke_err:
-                # Log but don't fail - transcription succeeded, ingest can be retried
-                logger.error(f"Failed to invoke IngestMedia for {document_id}: {invoke_err}")
-
-        return result
-
-    except Exception as e:
-        logger.error(f"Media processing failed: {e}", exc_info=True)
-
-        # Update status to failed
-        try:
-            if tracking_table and document_id:
-                table = dynamodb.Table(tracking_table)
-                table.update_item(
-                    Key={"document_id": document_id},
-                    UpdateExpression=(
-                        "SET #status = :status, error_message = :error, updated_at = :updated_at"
-                    ),
-                    ExpressionAttributeNames={"#status": "status"},
-                    ExpressionAttributeValues={
-                        ":status": "failed",
-                        ":error": str(e),
-                        ":updated_at": datetime.now(UTC).isoformat(),
-                    },
-                )
-                # Publish failure update
-                publish_document_update(
-                    graphql_endpoint,
-                    document_id,
-                    filename or "unknown",
-                    "FAILED",
-                    error_message=str(e),
-                )
-        except Exception as update_error:
-            logger.error(f"Failed to update DynamoDB: {update_error}")
-
-        raise
+    except Exception as update_error:
+        logger.error(f"Failed to update DynamoDB: {update_error}")
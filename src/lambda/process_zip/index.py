@@ -4,6 +4,11 @@ Process ZIP Lambda
 Processes ZIP archives containing images and an optional captions.json manifest.
 Extracts images, applies captions, and creates tracking records for each image.
 
+The archive is streamed to a /tmp spool file rather than held in memory. Images
+are read, captioned and uploaded by a bounded worker pool (ZIP_MAX_WORKERS);
+tracking records are written with BatchWriteItem in archive order, and each
+image's update is published once its record is written.
+
 Input event (from S3 trigger via EventBridge):
 {
     "bucket": "my-bucket",
@@ -25,12 +30,14 @@ Output:
 }
 """
 
-import io
 import json
 import logging
 import os
+import shutil
+import tempfile
 import uuid
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -57,6 +64,12 @@ MAX_CAPTION_LENGTH = 2000
 MAX_ZIP_SIZE = 500 * 1024 * 1024  # 500 MB max ZIP file
 MAX_IMAGE_SIZE = 50 * 1024 * 1024  # 50 MB max per image
 
+# Tracking records per BatchWriteItem (DynamoDB limit)
+TRACKING_BATCH_SIZE = 25
+
+# Chunk size for streaming the archive to /tmp
+SPOOL_CHUNK_SIZE = 8 * 1024 * 1024
+
 
 def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     """Process ZIP archive and extract images with captions."""
@@ -122,103 +135,21 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
                 f"(max {MAX_ZIP_SIZE / (1024 * 1024):.0f} MB)"
             )
 
-        # Download ZIP file from S3
+        # Stream ZIP file from S3 to /tmp
         zip_response = s3.get_object(Bucket=bucket, Key=key)
-        zip_bytes = zip_response["Body"].read()
-        zip_buffer = io.BytesIO(zip_bytes)
-
-        with zipfile.ZipFile(zip_buffer, "r") as zip_file:
-            # Parse captions.json if present
-            captions = {}
-            if "captions.json" in zip_file.namelist():
-                try:
-                    captions_data = zip_file.read("captions.json")
-                    captions = json.loads(captions_data.decode("utf-8"))
-                    logger.info(f"Loaded captions for {len(captions)} files")
-                except (json.JSONDecodeError, UnicodeDecodeError) as e:
-                    logger.warning(f"Failed to parse captions.json: {e}")
-                    result["errors"].append(f"Failed to parse captions.json: {str(e)}")
-
-            # Find image files (with path traversal protection)
-            image_files = [
-                name
-                for name in zip_file.namelist()
-                if is_supported_image(name)
-                and not name.startswith("__MACOSX")
-                and ".." not in name  # Path traversal protection
-                and not name.startswith("/")  # Absolute path protection
-            ]
-            result["total_images"] = len(image_files)
-            logger.info(f"Found {len(image_files)} images in ZIP")
-
-            # Process each image
-            for filename in image_files:
-                try:
-                    # Check individual image size before reading
-                    info = zip_file.getinfo(filename)
-                    if info.file_size > MAX_IMAGE_SIZE:
-                        logger.warning(
-                            f"Skipping oversized image: {filename} "
-                            f"({info.file_size / (1024 * 1024):.1f} MB)"
-                        )
-                        result["failed_images"] += 1
-                        max_mb = MAX_IMAGE_SIZE / (1024 * 1024)
-                        result["errors"].append(
-                            f"Image too large: {filename} "
-                            f"({info.file_size / (1024 * 1024):.1f} MB, max {max_mb:.0f} MB)"
-                        )
-                        continue
-
-                    image_data = zip_file.read(filename)
-                    base_filename = Path(filename).name
-
-                    # Get caption from manifest
-                    user_caption = captions.get(filename) or captions.get(base_filename)
-
-                    # Generate AI caption if requested and no user caption
-                    ai_caption = None
-                    if generate_captions:
-                        try:
-                            ai_caption = generate_image_caption(image_data, base_filename)
-                        except Exception as e:
-                            logger.warning(f"Failed to generate caption for {filename}: {e}")
-
-                    # Combine captions
-                    final_caption = combine_captions(user_caption, ai_caption)
-
-                    # Create image record
-                    image_id = create_image_record(
-                        tracking_table=tracking_table,
-                        data_bucket=data_bucket,
-                        image_data=image_data,
-                        filename=base_filename,
-                        caption=final_caption,
-                        user_caption=user_caption,
-                        ai_caption=ai_caption,
-                        upload_id=upload_id,
-                    )
-
-                    # Publish real-time update
-                    if graphql_endpoint:
-                        try:
-                            publish_image_update(
-                                graphql_endpoint,
-                                image_id,
-                                base_filename,
-                                ImageStatus.PENDING.value,
-                                caption=final_caption,
-                            )
-                        except Exception as e:
-                            logger.warning(f"Failed to publish image update: {e}")
-
-                    result["processed_images"] += 1
-                    logger.info(f"Processed image: {filename} -> {image_id}")
-
-                except Exception as e:
-                    result["failed_images"] += 1
-                    error_msg = f"Failed to process {filename}: {str(e)}"
-                    result["errors"].append(error_msg)
-                    logger.error(error_msg, exc_info=True)
+        with tempfile.TemporaryFile() as spool:
+            shutil.copyfileobj(zip_response["Body"], spool, SPOOL_CHUNK_SIZE)
+            spool.seek(0)
+            with zipfile.ZipFile(spool, "r") as zip_file:
+                _process_archive(
+                    zip_file,
+                    result,
+                    tracking_table=tracking_table,
+                    data_bucket=data_bucket,
+                    graphql_endpoint=graphql_endpoint,
+                    upload_id=upload_id,
+                    generate_captions=generate_captions,
+                )
 
         result["status"] = "COMPLETED" if result["failed_images"] == 0 else "COMPLETED_WITH_ERRORS"
 
@@ -242,6 +173,182 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     return result
 
 
+def _process_archive(
+    zip_file: zipfile.ZipFile,
+    result: dict[str, Any],
+    tracking_table: Any,
+    data_bucket: str,
+    graphql_endpoint: str | None,
+    upload_id: str,
+    generate_captions: bool,
+) -> None:
+    """
+    Extract, caption and record every image in an open archive.
+
+    Images are handled by a worker pool; records are written and updates
+    published on this thread in archive order. Counts and per-image errors
+    are added to result.
+    """
+    # Parse captions.json if present
+    captions = {}
+    if "captions.json" in zip_file.namelist():
+        try:
+            captions_data = zip_file.read("captions.json")
+            captions = json.loads(captions_data.decode("utf-8"))
+            logger.info(f"Loaded captions for {len(captions)} files")
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            logger.warning(f"Failed to parse captions.json: {e}")
+            result["errors"].append(f"Failed to parse captions.json: {str(e)}")
+
+    # Find image files (with path traversal protection)
+    image_files = [
+        name
+        for name in zip_file.namelist()
+        if is_supported_image(name)
+        and not name.startswith("__MACOSX")
+        and ".." not in name  # Path traversal protection
+        and not name.startswith("/")  # Absolute path protection
+    ]
+    result["total_images"] = len(image_files)
+    logger.info(f"Found {len(image_files)} images in ZIP")
+
+    # Skip oversized images before reading them
+    accepted = []
+    for filename in image_files:
+        info = zip_file.getinfo(filename)
+        if info.file_size > MAX_IMAGE_SIZE:
+            logger.warning(
+                f"Skipping oversized image: {filename} ({info.file_size / (1024 * 1024):.1f} MB)"
+            )
+            result["failed_images"] += 1
+            max_mb = MAX_IMAGE_SIZE / (1024 * 1024)
+            result["errors"].append(
+                f"Image too large: {filename} "
+                f"({info.file_size / (1024 * 1024):.1f} MB, max {max_mb:.0f} MB)"
+            )
+            continue
+        accepted.append(filename)
+
+    if not accepted:
+        return
+
+    max_workers = max(1, min(int(os.environ.get("ZIP_MAX_WORKERS", "4")), len(accepted)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                prepare_image,
+                zip_file,
+                filename,
+                captions,
+                generate_captions,
+                data_bucket,
+                upload_id,
+            )
+            for filename in accepted
+        ]
+
+        # Collect in archive order so records and error messages stay deterministic
+        pending: list[tuple[str, dict[str, Any]]] = []
+        for filename, future in zip(accepted, futures, strict=True):
+            try:
+                pending.append((filename, future.result()))
+            except Exception as e:
+                _record_failure(result, filename, e)
+            if len(pending) == TRACKING_BATCH_SIZE:
+                _write_image_records(tracking_table, pending, result, graphql_endpoint)
+                pending = []
+        _write_image_records(tracking_table, pending, result, graphql_endpoint)
+
+
+def _record_failure(result: dict[str, Any], filename: str, error: Exception) -> None:
+    """Count a failed image and report it in result["errors"]."""
+    result["failed_images"] += 1
+    error_msg = f"Failed to process {filename}: {str(error)}"
+    result["errors"].append(error_msg)
+    logger.error(error_msg, exc_info=error)
+
+
+def _write_image_records(
+    tracking_table: Any,
+    images: list[tuple[str, dict[str, Any]]],
+    result: dict[str, Any],
+    graphql_endpoint: str | None,
+) -> None:
+    """Write tracking records with BatchWriteItem, then publish each image's update."""
+    if not images:
+        return
+    try:
+        with tracking_table.batch_writer() as batch:
+            for _, item in images:
+                batch.put_item(Item=item)
+    except Exception as e:
+        for filename, _ in images:
+            _record_failure(result, filename, e)
+        return
+
+    for filename, item in images:
+        image_id = item["document_id"]
+        logger.info(f"Created image record: {image_id}")
+
+        # Publish real-time update
+        if graphql_endpoint:
+            try:
+                publish_image_update(
+                    graphql_endpoint,
+                    image_id,
+                    item["filename"],
+                    ImageStatus.PENDING.value,
+                    caption=item["caption"],
+                )
+            except Exception as e:
+                logger.warning(f"Failed to publish image update: {e}")
+
+        result["processed_images"] += 1
+        logger.info(f"Processed image: {filename} -> {image_id}")
+
+
+def prepare_image(
+    zip_file: zipfile.ZipFile,
+    filename: str,
+    captions: dict[str, str],
+    generate_captions: bool,
+    data_bucket: str,
+    upload_id: str,
+) -> dict[str, Any]:
+    """
+    Read, caption and upload one image (runs on a worker thread).
+
+    Returns:
+        Tracking record for the image (not yet written)
+    """
+    image_data = zip_file.read(filename)
+    base_filename = Path(filename).name
+
+    # Get caption from manifest
+    user_caption = captions.get(filename) or captions.get(base_filename)
+
+    # Generate AI caption if requested and no user caption
+    ai_caption = None
+    if generate_captions:
+        try:
+            ai_caption = generate_image_caption(image_data, base_filename)
+        except Exception as e:
+            logger.warning(f"Failed to generate caption for {filename}: {e}")
+
+    # Combine captions
+    final_caption = combine_captions(user_caption, ai_caption)
+
+    return upload_image(
+        data_bucket=data_bucket,
+        image_data=image_data,
+        filename=base_filename,
+        caption=final_caption,
+        user_caption=user_caption,
+        ai_caption=ai_caption,
+        upload_id=upload_id,
+    )
+
+
 def is_supported_image(filename: str) -> bool:
     """Check if filename has a supported image extension."""
     ext = Path(filename.lower()).suffix
@@ -331,8 +438,7 @@ def combine_captions(user_caption: str | None, ai_caption: str | None) -> str:
     return ". ".join(parts) if parts else ""
 
 
-def create_image_record(
-    tracking_table: Any,
+def upload_image(
     data_bucket: str,
     image_data: bytes,
     filename: str,
@@ -340,8 +446,8 @@ def create_image_record(
     user_caption: str | None,
     ai_caption: str | None,
     upload_id: str,
-) -> str:
-    """Create tracking record and upload image to S3."""
+) -> dict[str, Any]:
+    """Upload image to S3 and build its tracking record (written by the caller)."""
     image_id = str(uuid.uuid4())
     timestamp = datetime.now(UTC).isoformat()
 
@@ -368,8 +474,8 @@ def create_image_record(
     # Note: metadata.json no longer written to S3 - all data stored in DynamoDB
     # This prevents KB from incorrectly indexing the metadata file
 
-    # Create tracking record
-    tracking_item = {
+    # Tracking record
+    return {
         "document_id": image_id,
         "type": "image",
         "filename": filename,
@@ -384,7 +490,3 @@ def create_image_record(
         "created_at": timestamp,
         "updated_at": timestamp,
     }
-    tracking_table.put_item(Item=tracking_item)
-
-    logger.info(f"Created image record: {image_id}")
-    return image_id
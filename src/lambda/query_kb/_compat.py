@@ -46,6 +46,7 @@ try:
         _get_filter_components,
         _get_filter_examples,
         get_config_manager,
+        get_query_cache,
     )
     from .media import (
         IMAGE_FORMAT_MAP,
@@ -62,7 +63,7 @@ try:
         build_conversation_messages,
         build_retrieval_query,
     )
-    from .sources import extract_sources
+    from .sources import document_id_from_kb_uri, extract_sources, prefetch_tracking_items
 except ImportError:
     from conversation import (  # type: ignore[import-not-found,no-redef]
         MAX_MESSAGE_LENGTH,
@@ -74,6 +75,7 @@ except ImportError:
         _get_filter_components,
         _get_filter_examples,
         get_config_manager,
+        get_query_cache,
     )
     from media import (  # type: ignore[import-not-found,no-redef]
         IMAGE_FORMAT_MAP,
@@ -90,7 +92,11 @@ except ImportError:
         build_conversation_messages,
         build_retrieval_query,
     )
-    from sources import extract_sources  # type: ignore[import-not-found,no-redef]
+    from sources import (  # type: ignore[import-not-found,no-redef]
+        document_id_from_kb_uri,
+        extract_sources,
+        prefetch_tracking_items,
+    )
 
 __all__ = [
     # _clients
@@ -108,6 +114,7 @@ __all__ = [
     "_get_filter_components",
     "_get_filter_examples",
     "get_config_manager",
+    "get_query_cache",
     # media
     "IMAGE_FORMAT_MAP",
     "MAX_IMAGE_SIZE_BYTES",
@@ -122,5 +129,7 @@ __all__ = [
     "build_conversation_messages",
     "build_retrieval_query",
     # sources
+    "document_id_from_kb_uri",
     "extract_sources",
+    "prefetch_tracking_items",
 ]
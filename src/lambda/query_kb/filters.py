@@ -17,6 +17,7 @@ from ragstack_common.config import ConfigurationManager
 from ragstack_common.filter_generator import FilterGenerator
 from ragstack_common.key_library import KeyLibrary
 from ragstack_common.multislice_retriever import MultiSliceRetriever
+from ragstack_common.query_cache import QueryResultCache
 
 logger = logging.getLogger()
 
@@ -30,13 +31,27 @@ def get_config_manager() -> ConfigurationManager:
     global _config_manager
     if _config_manager is None:
         table_name = os.environ.get("CONFIGURATION_TABLE_NAME")
-        if table_name:
-            _config_manager = ConfigurationManager(table_name=table_name)
-        else:
-            _config_manager = ConfigurationManager()
+        # Warm-container config cache: edits propagate within this many seconds
+        ttl = float(os.environ.get("CONFIG_CACHE_TTL_SECONDS", "0"))
+        _config_manager = ConfigurationManager(table_name=table_name, max_staleness_seconds=ttl)
     return _config_manager
 
 
+_query_cache: QueryResultCache | None = None
+
+
+def get_query_cache() -> QueryResultCache | None:
+    """Lazy-load the query-result cache; None when disabled or unconfigured."""
+    global _query_cache
+    if _query_cache is None:
+        table_name = os.environ.get("QUERY_CACHE_TABLE")
+        ttl = int(os.environ.get("QUERY_CACHE_TTL_SECONDS", "0"))
+        if not table_name or ttl <= 0:
+            return None
+        _query_cache = QueryResultCache(table_name=table_name, ttl_seconds=ttl)
+    return _query_cache
+
+
 # Filter generation components (lazy-loaded to avoid init overhead if disabled)
 _key_library: KeyLibrary | None = None
 _filter_generator: FilterGenerator | None = None
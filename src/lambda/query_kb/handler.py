@@ -9,6 +9,7 @@ import contextlib
 import json
 import logging
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import UTC, datetime
 from decimal import Decimal
 from typing import Any
@@ -25,6 +26,7 @@ try:
         bedrock_runtime,
         build_conversation_messages,
         build_retrieval_query,
+        document_id_from_kb_uri,
         dynamodb,
         dynamodb_client,
         extract_sources,
@@ -32,6 +34,8 @@ try:
         format_timestamp,
         get_config_manager,
         get_conversation_history,
+        get_query_cache,
+        prefetch_tracking_items,
         s3_client,
         store_conversation_turn,
         update_conversation_turn,
@@ -45,6 +49,7 @@ except ImportError:
         bedrock_runtime,
         build_conversation_messages,
         build_retrieval_query,
+        document_id_from_kb_uri,
         dynamodb,
         dynamodb_client,
         extract_sources,
@@ -52,6 +57,8 @@ except ImportError:
         format_timestamp,
         get_config_manager,
         get_conversation_history,
+        get_query_cache,
+        prefetch_tracking_items,
         s3_client,
         store_conversation_turn,
         update_conversation_turn,
@@ -70,6 +77,46 @@ logger.setLevel(logging.INFO)
 # Quota settings
 QUOTA_TTL_DAYS = 2  # Quota counters expire after 2 days
 
+# Results per KB retrieve (per slice for multi-slice retrieval)
+RETRIEVAL_NUM_RESULTS = 25
+
+# Shared pool for the concurrent pre-retrieval stages (reused across warm invocations)
+PIPELINE_WORKERS = 4
+_pipeline_executor: ThreadPoolExecutor | None = None
+
+
+def _get_pipeline_executor() -> ThreadPoolExecutor:
+    """Get or create the pre-retrieval stage executor (lazy initialization)."""
+    global _pipeline_executor
+    if _pipeline_executor is None:
+        _pipeline_executor = ThreadPoolExecutor(
+            max_workers=PIPELINE_WORKERS, thread_name_prefix="query-kb"
+        )
+    return _pipeline_executor
+
+
+def _retrieve_unfiltered(
+    knowledge_base_id: str, retrieval_query: str, num_results: int
+) -> list[dict[str, Any]]:
+    """
+    Run an unfiltered KB retrieve.
+
+    Args:
+        knowledge_base_id: Bedrock Knowledge Base ID
+        retrieval_query: Query text for vector search
+        num_results: Number of results to return
+
+    Returns:
+        Retrieval results
+    """
+    logger.info(f"[RETRIEVE REQUEST] kb={knowledge_base_id} (unfiltered)")
+    retrieve_response = bedrock_agent.retrieve(
+        knowledgeBaseId=knowledge_base_id,
+        retrievalQuery={"text": retrieval_query},
+        retrievalConfiguration={"vectorSearchConfiguration": {"numberOfResults": num_results}},
+    )
+    return list(retrieve_response.get("retrievalResults", []))  # type: ignore[arg-type]
+
 
 def atomic_quota_check_and_increment(tracking_id: str, is_authenticated: bool, region: str) -> str:
     """
@@ -206,7 +253,7 @@ def lambda_handler(event: dict[str, Any], context: Any) -> ChatResponse:
     Returns:
         dict: ChatResponse with answer, conversationId, sources, and optional error
     """
-    # Clear config cache at handler entry to ensure fresh reads per invocation
+    # Clear config cache at handler entry (kept while within CONFIG_CACHE_TTL_SECONDS)
     get_config_manager().clear_cache()
 
     # Detect async invocation from AppSync resolver
@@ -308,9 +355,19 @@ def lambda_handler(event: dict[str, Any], context: Any) -> ChatResponse:
                 "error": "Query exceeds maximum length of 10000 characters",
             }
 
+        # Pre-retrieval stages run as a small dependency graph:
+        #   quota check                      (independent, joined before generation)
+        #   history -> query rewrite -> filter generation
+        #                            \-> speculative unfiltered retrieve
+        # With multi-slice enabled, the unfiltered retrieve is what the
+        # no-filter path needs anyway and doubles as the unfiltered slice when a
+        # filter is generated. Without multi-slice it would be wasted whenever a
+        # filter is generated, so it is not started.
+        executor = _get_pipeline_executor()
+
         # Check quotas and select model (primary or fallback) — after validation
-        chat_model_id = atomic_quota_check_and_increment(
-            tracking_id or "", is_authenticated, region
+        quota_future = executor.submit(
+            atomic_quota_check_and_increment, tracking_id or "", is_authenticated, region
         )
 
         # Log safe summary (not full event payload to avoid PII/user data leakage)
@@ -323,7 +380,6 @@ def lambda_handler(event: dict[str, Any], context: Any) -> ChatResponse:
             else knowledge_base_id,
         }
         logger.info(f"Querying Knowledge Base: {json.dumps(safe_summary)}")
-        logger.info(f"Using chat model: {chat_model_id}")
 
         # Retrieve conversation history for multi-turn context
         history = []
@@ -331,8 +387,6 @@ def lambda_handler(event: dict[str, Any], context: Any) -> ChatResponse:
             history = get_conversation_history(conversation_id)
             logger.info(f"Retrieved {len(history)} turns for conversation {conversation_id[:8]}...")
 
-        logger.info(f"Using model: {chat_model_id} in region {region}")
-
         # STEP 1: Retrieve relevant documents from KB
         # Use a focused query with minimal context for effective retrieval
         retrieval_query = build_retrieval_query(query, history)
@@ -342,22 +396,55 @@ def lambda_handler(event: dict[str, Any], context: Any) -> ChatResponse:
         generated_filter = None
 
         # Check if filter generation is enabled
-        filter_enabled = get_config_manager().get_parameter(
-            "filter_generation_enabled", default=True
+        cfg = get_config_manager()
+        filter_enabled = cfg.get_parameter("filter_generation_enabled", default=True)
+        multislice_enabled = cfg.get_parameter("multislice_enabled", default=True)
+        filtered_score_boost = float(cfg.get_parameter("multislice_filtered_boost", default=1.25))
+        manual_keys = cfg.get_parameter("metadata_manual_keys", default=None)
+        extraction_mode = cfg.get_parameter("metadata_extraction_mode", default="auto")
+
+        # Query-result cache: a filter hit skips filter generation, a results hit
+        # skips every KB retrieve. Keys include the KB content version.
+        query_cache = get_query_cache()
+        filter_variant = json.dumps(
+            [extraction_mode, manual_keys if extraction_mode == "manual" else None], default=str
         )
-        multislice_enabled = get_config_manager().get_parameter("multislice_enabled", default=True)
-        filtered_score_boost = float(
-            get_config_manager().get_parameter("multislice_filtered_boost", default=1.25)
+        results_variant = (
+            f"chat:multislice={multislice_enabled}:boost={filtered_score_boost}"
+            f":n={RETRIEVAL_NUM_RESULTS}"
         )
+        filter_cached = False
+        cached_results = None
+        # Read the content version once so lookups and writes share one key,
+        # even if an ingestion bumps the version mid-request
+        cache_version = query_cache.content_version() if query_cache else None
+        if cache_version is None:
+            query_cache = None
+        if query_cache:
+            if filter_enabled:
+                filter_cached, generated_filter = query_cache.get_filter(
+                    knowledge_base_id, retrieval_query, filter_variant, version=cache_version
+                )
+            if filter_cached or not filter_enabled:
+                cached_results = query_cache.get_results(
+                    knowledge_base_id,
+                    retrieval_query,
+                    generated_filter,
+                    results_variant,
+                    version=cache_version,
+                )
+
+        speculative_future: Future[list[dict[str, Any]]] | None = None
+        if cached_results is None and multislice_enabled:
+            speculative_future = executor.submit(
+                _retrieve_unfiltered, knowledge_base_id, retrieval_query, RETRIEVAL_NUM_RESULTS
+            )
 
         # Generate metadata filter if enabled (includes content_type filtering)
-        if filter_enabled:
+        if filter_enabled and not filter_cached:
             try:
                 _, filter_generator, _ = _get_filter_components(filtered_score_boost)
                 filter_examples = _get_filter_examples()
-                cfg = get_config_manager()
-                manual_keys = cfg.get_parameter("metadata_manual_keys", default=None)
-                extraction_mode = cfg.get_parameter("metadata_extraction_mode", default="auto")
                 generated_filter = filter_generator.generate_filter(
                     retrieval_query,
                     filter_examples=filter_examples,
@@ -367,12 +454,33 @@ def lambda_handler(event: dict[str, Any], context: Any) -> ChatResponse:
                     logger.info(f"Generated filter: {json.dumps(generated_filter)}")
                 else:
                     logger.info("No filter intent detected in query")
+                if query_cache:
+                    query_cache.put_filter(
+                        knowledge_base_id,
+                        retrieval_query,
+                        filter_variant,
+                        generated_filter,
+                        version=cache_version,
+                    )
             except (ClientError, ValueError, KeyError, TypeError) as e:
                 logger.warning(f"Filter generation failed, proceeding without filter: {e}")
 
+        chat_model_id = quota_future.result()
+        logger.info(f"Using model: {chat_model_id} in region {region}")
+
         # Single unified query with optional metadata filter
-        if multislice_enabled and generated_filter:
-            # Use multi-slice retrieval with filter
+        if cached_results is not None:
+            retrieval_results = cached_results
+            logger.info(f"[QUERY CACHE] Reusing {len(retrieval_results)} cached results")
+        elif multislice_enabled and generated_filter:
+            # Use multi-slice retrieval with filter, reusing the speculative
+            # unfiltered results as the unfiltered slice
+            precomputed: dict[str, list[dict[str, Any]]] = {}
+            if speculative_future is not None:
+                try:
+                    precomputed["unfiltered"] = speculative_future.result()
+                except ClientError as e:
+                    logger.warning(f"Speculative unfiltered retrieve failed, re-running: {e}")
             _, _, multislice_retriever = _get_filter_components(filtered_score_boost)
             logger.info(
                 f"[MULTISLICE REQUEST] kb_id={knowledge_base_id}, filter={generated_filter}"
@@ -382,23 +490,22 @@ def lambda_handler(event: dict[str, Any], context: Any) -> ChatResponse:
                 knowledge_base_id=knowledge_base_id,
                 data_source_id=None,  # No data source filtering with unified content/
                 metadata_filter=generated_filter,
-                num_results=25,
+                num_results=RETRIEVAL_NUM_RESULTS,
+                precomputed_slices=precomputed,
             )
             logger.info(f"[MULTISLICE] Retrieved {len(retrieval_results)} results")
             for i, r in enumerate(retrieval_results):
                 uri = r.get("location", {}).get("s3Location", {}).get("uri", "N/A")
                 score = r.get("score", "N/A")
                 logger.debug(f"[MULTISLICE] Result {i}: score={score}, uri={uri}")
-        else:
-            # Standard single-query retrieval
+        elif generated_filter:
+            # Multi-slice disabled: single filtered query
             retrieval_config: dict[str, Any] = {
                 "vectorSearchConfiguration": {
-                    "numberOfResults": 25,
+                    "numberOfResults": RETRIEVAL_NUM_RESULTS,
+                    "filter": generated_filter,
                 }
             }
-            # Apply generated filter if available
-            if generated_filter:
-                retrieval_config["vectorSearchConfiguration"]["filter"] = generated_filter
 
             # Log exactly what we're sending to the KB
             logger.info(f"[RETRIEVE REQUEST] kb={knowledge_base_id}")
@@ -409,6 +516,24 @@ def lambda_handler(event: dict[str, Any], context: Any) -> ChatResponse:
                 retrievalConfiguration=retrieval_config,  # type: ignore[arg-type]
             )
             retrieval_results = list(retrieve_response.get("retrievalResults", []))
+        else:
+            # No filter: the speculative unfiltered retrieve (if started) is the result
+            if speculative_future is not None:
+                retrieval_results = speculative_future.result()
+            else:
+                retrieval_results = _retrieve_unfiltered(
+                    knowledge_base_id, retrieval_query, RETRIEVAL_NUM_RESULTS
+                )
+
+        if query_cache and cached_results is None:
+            query_cache.put_results(
+                knowledge_base_id,
+                retrieval_query,
+                generated_filter,
+                results_variant,
+                list(retrieval_results),
+                version=cache_version,
+            )
         logger.info(f"Retrieved {len(retrieval_results)} results")
 
         # Log each result's URI and score for debugging
@@ -425,6 +550,18 @@ def lambda_handler(event: dict[str, Any], context: Any) -> ChatResponse:
             retrieval_query, retrieval_results, tracking_table
         )
 
+        # Prefetch tracking records for every referenced document in one
+        # BatchGetItem; shared by visual context building and source extraction
+        tracking_items = prefetch_tracking_items(
+            (
+                document_id_from_kb_uri(
+                    (r.get("location") or {}).get("s3Location", {}).get("uri", "")
+                )
+                for r in retrieval_results
+            ),
+            tracking_table,
+        )
+
         # Build context from retrieved documents
         retrieved_chunks = []
         citations = []  # Build citations in the format expected by extract_sources
@@ -520,9 +657,12 @@ def lambda_handler(event: dict[str, Any], context: Any) -> ChatResponse:
 
                 if doc_id and tracking_table:
                     try:
-                        table = dynamodb.Table(tracking_table)
-                        response = table.get_item(Key={"document_id": doc_id})
-                        item = response.get("Item", {})
+                        if doc_id in tracking_items:
+                            item = tracking_items[doc_id] or {}
+                        else:
+                            table = dynamodb.Table(tracking_table)
+                            response = table.get_item(Key={"document_id": doc_id})
+                            item = response.get("Item", {})
                         tracked_type = str(item.get("type", ""))
 
                         if tracked_type == "image":
@@ -621,7 +761,7 @@ def lambda_handler(event: dict[str, Any], context: Any) -> ChatResponse:
             retrieved_context = "No relevant information found in the knowledge base."
 
         # Parse sources from citations (limited to top 5)
-        sources = extract_sources(citations[:MAX_SOURCES])
+        sources = extract_sources(citations[:MAX_SOURCES], tracking_items=tracking_items)
 
         # STEP 2: Generate response using Converse API with conversation history
         # Build messages with conversation history and retrieved context
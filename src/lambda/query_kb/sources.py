@@ -8,6 +8,8 @@ import contextlib
 import json
 import logging
 import os
+import time
+from collections.abc import Iterable
 from typing import Any
 from urllib.parse import unquote
 
@@ -42,13 +44,113 @@ from ragstack_common.types import SourceInfo
 
 logger = logging.getLogger()
 
+# BatchGetItem accepts at most 100 keys per request
+BATCH_GET_MAX_KEYS = 100
+# Attempts per chunk while DynamoDB returns UnprocessedKeys (throttling)
+BATCH_GET_MAX_ATTEMPTS = 4
+BATCH_GET_BASE_DELAY = 0.05  # seconds, doubled per retry
 
-def extract_sources(citations: list[Any]) -> list[SourceInfo]:
+
+def document_id_from_kb_uri(uri: str) -> str | None:
+    """
+    Derive the tracking-table document_id from a KB result URI.
+
+    Mirrors the path rules used by extract_sources: content/{docId}/...,
+    input/{docId}/{filename}, or {docId}/... as a generic fallback.
+
+    Args:
+        uri: S3 URI from a KB retrieval result
+
+    Returns:
+        Document ID, or None if the URI does not identify a document
+    """
+    try:
+        _, s3_key = parse_s3_uri(uri)
+    except ValueError:
+        return None
+
+    parts = s3_key.split("/")
+    if len(parts) < 2:
+        return None
+    if parts[0] == "content" or (len(parts) > 2 and parts[0] == "input"):
+        document_id = unquote(parts[1])
+    else:
+        document_id = unquote(parts[0])
+    return document_id if len(document_id) >= 5 else None
+
+
+def prefetch_tracking_items(
+    document_ids: Iterable[str | None],
+    tracking_table_name: str | None,
+) -> dict[str, dict[str, Any] | None]:
+    """
+    Fetch tracking records for all referenced documents with BatchGetItem.
+
+    Replaces one get_item per retrieval result with one request per 100 IDs.
+    UnprocessedKeys are retried with exponential backoff.
+
+    Args:
+        document_ids: Document IDs to fetch (None and duplicates are ignored)
+        tracking_table_name: Tracking table name
+
+    Returns:
+        Mapping of document_id to its tracking item, or None when no item
+        exists. IDs that could not be fetched (unprocessed after all retries,
+        or a failed request) are omitted so callers fall back to get_item.
+    """
+    unique_ids = list(dict.fromkeys(doc_id for doc_id in document_ids if doc_id))
+    items: dict[str, dict[str, Any] | None] = {}
+    if not unique_ids or not tracking_table_name:
+        return items
+
+    for start in range(0, len(unique_ids), BATCH_GET_MAX_KEYS):
+        chunk = unique_ids[start : start + BATCH_GET_MAX_KEYS]
+        request: dict[str, Any] = {
+            tracking_table_name: {"Keys": [{"document_id": doc_id} for doc_id in chunk]}
+        }
+        unresolved: set[str] = set()
+
+        for attempt in range(BATCH_GET_MAX_ATTEMPTS):
+            try:
+                response = dynamodb.batch_get_item(RequestItems=request)
+            except ClientError as e:
+                logger.warning(f"[SOURCE] Tracking batch lookup failed: {e}")
+                unresolved = {doc_id for doc_id in chunk if doc_id not in items}
+                break
+
+            for item in response.get("Responses", {}).get(tracking_table_name, []):
+                items[str(item["document_id"])] = item
+
+            request = dict(response.get("UnprocessedKeys") or {})
+            pending = request.get(tracking_table_name) or {}
+            unresolved = {str(key["document_id"]) for key in pending.get("Keys", [])}
+            if not unresolved:
+                break
+            if attempt < BATCH_GET_MAX_ATTEMPTS - 1:
+                time.sleep(BATCH_GET_BASE_DELAY * (2**attempt))
+
+        if unresolved:
+            logger.warning(f"[SOURCE] {len(unresolved)} tracking keys unprocessed after retries")
+
+        for doc_id in chunk:
+            if doc_id not in items and doc_id not in unresolved:
+                items[doc_id] = None
+
+    logger.info(f"[SOURCE] Prefetched {len(items)}/{len(unique_ids)} tracking records")
+    return items
+
+
+def extract_sources(
+    citations: list[Any],
+    tracking_items: dict[str, dict[str, Any] | None] | None = None,
+) -> list[SourceInfo]:
     """
     Parse Bedrock citations into structured sources.
 
     Args:
         citations (list): Bedrock citation objects from retrieve_and_generate
+        tracking_items (dict, optional): Tracking records from prefetch_tracking_items.
+            Documents missing from it are looked up individually.
 
     Returns:
         list[dict]: Parsed sources with documentId, pageNumber, s3Uri, snippet
@@ -191,9 +293,12 @@ def extract_sources(citations: list[Any]) -> list[SourceInfo]:
                 logger.debug(f"[SOURCE] Tracking table: {tracking_table_name}")
                 if tracking_table_name:
                     try:
-                        tracking_table = dynamodb.Table(tracking_table_name)
-                        response = tracking_table.get_item(Key={"document_id": document_id})
-                        tracking_item = response.get("Item")
+                        if tracking_items is not None and document_id in tracking_items:
+                            tracking_item = tracking_items[document_id]
+                        else:
+                            tracking_table = dynamodb.Table(tracking_table_name)
+                            response = tracking_table.get_item(Key={"document_id": document_id})
+                            tracking_item = response.get("Item")
                         if tracking_item:
                             tracking_input_uri = str(tracking_item.get("input_s3_uri", "")) or None
                             tracking_source_url = str(tracking_item.get("source_url", "")) or None
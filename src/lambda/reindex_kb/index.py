@@ -14,9 +14,10 @@ Content Types:
 - Scraped (type="scraped"): Web content stored at output_s3_uri
 """
 
+import json
 import logging
 import os
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from typing import Any
 
@@ -27,7 +28,13 @@ from ragstack_common.appsync import publish_reindex_update
 from ragstack_common.config import ConfigurationManager
 from ragstack_common.key_library import KeyLibrary
 from ragstack_common.metadata_extractor import MetadataExtractor
-from ragstack_common.storage import read_s3_text, write_metadata_to_s3
+from ragstack_common.query_cache import bump_kb_content_version
+from ragstack_common.rate_limiter import TokenBucket
+from ragstack_common.storage import (
+    read_s3_text,
+    write_metadata_to_s3,
+    write_metadata_to_s3_bulk,
+)
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -42,6 +49,7 @@ lambda_client = boto3.client("lambda")
 _key_library: KeyLibrary | None = None
 _metadata_extractor: MetadataExtractor | None = None
 _config_manager: ConfigurationManager | None = None
+_rate_limiter: TokenBucket | None = None
 
 # Cache for job metadata (persists within a single Lambda invocation/batch)
 # Key: job_id, Value: dict of extracted metadata from seed document
@@ -50,6 +58,27 @@ _job_metadata_cache: dict[str, dict[str, Any]] = {}
 # Reindex lock key in configuration table
 REINDEX_LOCK_KEY = "reindex_lock"
 
+# Content manifest written once by init and paged through by process_batch.
+# Stored under working/ so the bucket lifecycle rule expires it (7-day TTL).
+MANIFEST_PREFIX = "working/reindex"
+
+# Tracking record fields needed by the process_*_item functions
+MANIFEST_FIELDS = (
+    "document_id",
+    "type",
+    "filename",
+    "input_s3_uri",
+    "output_s3_uri",
+    "caption_s3_uri",
+    "source_url",
+    "media_type",
+    "user_caption",
+    "ai_caption",
+)
+
+# Initial byte range fetched per batch (extended if a record straddles the end)
+MANIFEST_READ_CHUNK_BYTES = 64 * 1024
+
 
 def acquire_reindex_lock(execution_arn: str) -> bool:
     """
@@ -270,6 +299,7 @@ def handle_init(event: dict) -> dict:
     4. Return initial state for processing loop
     """
     tracking_table_name = os.environ.get("TRACKING_TABLE")
+    data_bucket = os.environ.get("DATA_BUCKET")
     old_kb_id = os.environ.get("KNOWLEDGE_BASE_ID")
     graphql_endpoint = os.environ.get("GRAPHQL_ENDPOINT")
 
@@ -297,9 +327,15 @@ def handle_init(event: dict) -> dict:
     # Count all content to reindex (documents, images, scraped pages)
     if not tracking_table_name:
         raise ValueError("TRACKING_TABLE environment variable is required")
+    if not data_bucket:
+        raise ValueError("DATA_BUCKET environment variable is required")
     tracking_table = dynamodb.Table(tracking_table_name)
     all_content = list_all_content(tracking_table)
 
+    # Write the sorted manifest once; process_batch pages through it by byte offset
+    manifest_key = f"{MANIFEST_PREFIX}/{execution_id}/manifest.jsonl"
+    manifest_size = write_content_manifest(all_content, data_bucket, manifest_key)
+
     # Count by type for logging
     doc_count = sum(1 for item in all_content if not item.get("type"))
     image_count = sum(1 for item in all_content if item.get("type") == "image")
@@ -322,6 +358,9 @@ def handle_init(event: dict) -> dict:
         "error_messages": [],
         "batch_size": 10,
         "current_batch_index": 0,
+        "manifest_key": manifest_key,
+        "manifest_size": manifest_size,
+        "manifest_offset": 0,
     }
 
 
@@ -445,83 +484,68 @@ def handle_process_batch(event: dict) -> dict:
     batch_size = event.get("batch_size", 10)
     current_batch_index = event.get("current_batch_index", 0)
 
-    # Get all content for this batch
-    tracking_table = dynamodb.Table(tracking_table_name)
-    all_content = list_all_content(tracking_table)
-
-    batch_start = current_batch_index * batch_size
-    batch_end = min(batch_start + batch_size, len(all_content))
-    batch_items = all_content[batch_start:batch_end]
+    manifest_key = event.get("manifest_key")
+    all_content: list[dict[str, Any]] | None = None
 
-    logger.info(f"Processing batch {current_batch_index}: items {batch_start}-{batch_end}")
-
-    # Process each item in the batch
-    for item in batch_items:
-        doc_id = item.get("document_id")
-        filename = item.get("filename", "unknown")
-        item_type = item.get("type", "")  # "", "image", or "scraped"
-
-        # Publish progress
-        publish_reindex_update(
-            graphql_endpoint,
-            status="PROCESSING",
-            total_documents=total_documents,
-            processed_count=processed_count,
-            current_document=filename,
-            error_count=error_count,
-            error_messages=error_messages[-5:] if error_messages else None,
+    if manifest_key:
+        # Read only this batch's page of the manifest written by init
+        manifest_size = event["manifest_size"]
+        manifest_offset = event.get("manifest_offset", 0)
+        batch_items, next_offset = read_manifest_page(
+            data_bucket, manifest_key, manifest_offset, batch_size, manifest_size
         )
+        has_more = next_offset < manifest_size
+        logger.info(
+            f"Processing batch {current_batch_index}: {len(batch_items)} items "
+            f"(manifest bytes {manifest_offset}-{next_offset})"
+        )
+    else:
+        # Executions started before manifests existed: fall back to a full scan
+        tracking_table = dynamodb.Table(tracking_table_name)
+        all_content = list_all_content(tracking_table)
+
+        batch_start = current_batch_index * batch_size
+        batch_end = min(batch_start + batch_size, len(all_content))
+        batch_items = all_content[batch_start:batch_end]
+        has_more = batch_end < len(all_content)
+        next_offset = 0
+
+        logger.info(f"Processing batch {current_batch_index}: items {batch_start}-{batch_end}")
+
+    # Old-format scraped pages need the full listing to locate their seed document
+    if all_content is None and any(_is_legacy_scraped_item(item) for item in batch_items):
+        all_content = read_manifest(data_bucket, str(manifest_key))
+
+    # Process items concurrently; the shared token bucket paces Bedrock calls
+    limiter = get_rate_limiter()
+    max_workers = max(1, min(int(os.environ.get("REINDEX_MAX_WORKERS", "4")), len(batch_items)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(reindex_item, item, data_bucket, all_content or [], limiter)
+            for item in batch_items
+        ]
+
+        # Collect in batch order so counts and error messages stay deterministic
+        for item, future in zip(batch_items, futures, strict=True):
+            item_processed, item_errors, item_messages = future.result()
+            processed_count += item_processed
+            error_count += item_errors
+            error_messages.extend(item_messages)
 
-        try:
-            if item_type == "media":
-                processed_count, error_count, error_messages = process_media_item(
-                    item,
-                    data_bucket,
-                    processed_count,
-                    error_count,
-                    error_messages,
-                )
-            elif item_type == "image":
-                processed_count, error_count, error_messages = process_image_item(
-                    item,
-                    data_bucket,
-                    processed_count,
-                    error_count,
-                    error_messages,
-                )
-            elif item_type == "scraped":
-                processed_count, error_count, error_messages = process_scraped_item(
-                    item,
-                    data_bucket,
-                    all_content,
-                    processed_count,
-                    error_count,
-                    error_messages,
-                )
-            else:
-                processed_count, error_count, error_messages = process_text_item(
-                    item,
-                    data_bucket,
-                    "document",
-                    processed_count,
-                    error_count,
-                    error_messages,
-                )
-
-            # Small delay to avoid rate limiting
-            time.sleep(0.5)
-
-        except Exception as e:
-            error_count += 1
-            error_msg = f"{filename}: {str(e)[:100]}"
-            error_messages.append(error_msg)
-            logger.error(f"Failed to reindex {doc_id}: {e}")
-            processed_count += 1  # Count as processed even if failed
+            publish_reindex_update(
+                graphql_endpoint,
+                status="PROCESSING",
+                total_documents=total_documents,
+                processed_count=processed_count,
+                current_document=item.get("filename", "unknown"),
+                error_count=error_count,
+                error_messages=error_messages[-5:] if error_messages else None,
+            )
 
     # Check if more batches to process
-    if batch_end < len(all_content):
+    if has_more:
         # More items to process
-        return {
+        next_state = {
             **event,
             "action": "process_batch",
             "processed_count": processed_count,
@@ -529,6 +553,9 @@ def handle_process_batch(event: dict) -> dict:
             "error_messages": error_messages,
             "current_batch_index": current_batch_index + 1,
         }
+        if manifest_key:
+            next_state["manifest_offset"] = next_offset
+        return next_state
     # All items processed, move to KB creation and sync
     return {
         **event,
@@ -539,6 +566,56 @@ def handle_process_batch(event: dict) -> dict:
     }
 
 
+def get_rate_limiter() -> TokenBucket:
+    """Get or create the token bucket shared by all reindex workers in this container."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        rate = float(os.environ.get("REINDEX_REQUESTS_PER_SECOND", "2"))
+        _rate_limiter = TokenBucket(rate=rate)
+    return _rate_limiter
+
+
+def reindex_item(
+    item: dict,
+    data_bucket: str,
+    all_content: list[dict],
+    limiter: TokenBucket,
+) -> tuple[int, int, list]:
+    """
+    Reindex a single content item, dispatching on its type.
+
+    Runs on a worker thread. Failures are caught here and reported in the
+    returned counts so one bad item never fails the whole batch.
+
+    Args:
+        item: Tracking record (or manifest projection of one)
+        data_bucket: S3 bucket name
+        all_content: Full content listing, only needed for old-format scraped pages
+        limiter: Shared rate limiter, acquired once per item
+
+    Returns:
+        Tuple of (processed delta, error delta, new error messages)
+    """
+    doc_id = item.get("document_id")
+    filename = item.get("filename", "unknown")
+    item_type = item.get("type", "")  # "", "image", "scraped", or "media"
+
+    limiter.acquire()
+
+    try:
+        if item_type == "media":
+            return process_media_item(item, data_bucket, 0, 0, [])
+        if item_type == "image":
+            return process_image_item(item, data_bucket, 0, 0, [])
+        if item_type == "scraped":
+            return process_scraped_item(item, data_bucket, all_content, 0, 0, [])
+        return process_text_item(item, data_bucket, "document", 0, 0, [])
+    except Exception as e:
+        logger.error(f"Failed to reindex {doc_id}: {e}")
+        # Count as processed even if failed
+        return 1, 1, [f"{filename}: {str(e)[:100]}"]
+
+
 VISUAL_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp", ".bmp", ".tiff", ".tif"}
 MEDIA_EXTENSIONS = {".mp4", ".mov", ".avi", ".mkv", ".webm", ".mp3", ".wav", ".m4a", ".flac"}
 SKIP_EXTENSIONS = VISUAL_EXTENSIONS | MEDIA_EXTENSIONS
@@ -879,7 +956,7 @@ def process_media_item(
                 Prefix=f"{content_dir}/segment-",
             )
 
-            segment_count = 0
+            segment_sidecars = []
             for obj in response.get("Contents", []):
                 segment_key = obj["Key"]
                 # Extract segment index from filename (segment-000.txt -> 0)
@@ -900,12 +977,11 @@ def process_media_item(
                     "timestamp_end": timestamp_end,
                 }
 
-                segment_uri = f"s3://{bucket}/{segment_key}"
-                write_metadata_to_s3(segment_uri, segment_metadata)
-                segment_count += 1
+                segment_sidecars.append((f"s3://{bucket}/{segment_key}", segment_metadata))
 
-            if segment_count > 0:
-                logger.info(f"Wrote {segment_count} segment sidecars for {doc_id}")
+            if segment_sidecars:
+                write_metadata_to_s3_bulk(segment_sidecars)
+                logger.info(f"Wrote {len(segment_sidecars)} segment sidecars for {doc_id}")
 
         except Exception as e:
             logger.warning(f"Failed to write segment sidecars for {doc_id}: {e}")
@@ -1180,6 +1256,9 @@ def handle_finalize(event: dict) -> dict:
     except Exception as e:
         logger.warning(f"Failed to deactivate zero-count keys: {e}")
 
+    # The KB was rebuilt: invalidate cached query results
+    bump_kb_content_version(os.environ.get("QUERY_CACHE_TABLE"))
+
     # Release the global reindex lock
     release_reindex_lock()
 
@@ -1473,6 +1552,115 @@ def list_all_content(tracking_table: Any) -> list[dict[str, Any]]:
     return sorted(items, key=sort_key)
 
 
+def _is_legacy_scraped_item(item: dict[str, Any]) -> bool:
+    """Check whether a scraped item uses the old per-page tracking format."""
+    output_s3_uri = item.get("output_s3_uri") or ""
+    return item.get("type") == "scraped" and bool(output_s3_uri) and not output_s3_uri.endswith("/")
+
+
+def write_content_manifest(all_content: list[dict[str, Any]], bucket: str, key: str) -> int:
+    """
+    Write the sorted content listing to S3 as a JSON Lines manifest.
+
+    Each line holds the tracking fields the process_*_item functions need,
+    in the order produced by list_all_content. process_batch reads it back
+    page by page using byte offsets, so the tracking table is scanned once
+    per reindex instead of once per batch.
+
+    Args:
+        all_content: Sorted content items from list_all_content
+        bucket: S3 bucket name
+        key: S3 key for the manifest
+
+    Returns:
+        Size of the manifest in bytes
+    """
+    lines = []
+    for item in all_content:
+        record = {field: item[field] for field in MANIFEST_FIELDS if item.get(field)}
+        lines.append(json.dumps(record, default=str))
+
+    body = ("\n".join(lines) + "\n").encode("utf-8") if lines else b""
+    s3_client.put_object(
+        Bucket=bucket,
+        Key=key,
+        Body=body,
+        ContentType="application/x-ndjson",
+    )
+    logger.info(
+        f"Wrote reindex manifest s3://{bucket}/{key}: {len(lines)} items, {len(body)} bytes"
+    )
+    return len(body)
+
+
+def read_manifest_page(
+    bucket: str,
+    key: str,
+    offset: int,
+    count: int,
+    manifest_size: int,
+) -> tuple[list[dict[str, Any]], int]:
+    """
+    Read up to ``count`` manifest records starting at byte ``offset``.
+
+    Uses S3 range reads, growing the range only when the last record in the
+    buffer is incomplete, so each batch costs one GET in the common case.
+
+    Args:
+        bucket: S3 bucket name
+        key: S3 key of the manifest
+        offset: Byte offset of the first record to read
+        count: Maximum number of records to return
+        manifest_size: Total manifest size in bytes
+
+    Returns:
+        Tuple of (records, offset of the next unread record)
+    """
+    if offset >= manifest_size or count <= 0:
+        return [], offset
+
+    buffer = b""
+    read_end = offset
+    while True:
+        range_end = min(read_end + MANIFEST_READ_CHUNK_BYTES, manifest_size) - 1
+        response = s3_client.get_object(
+            Bucket=bucket, Key=key, Range=f"bytes={read_end}-{range_end}"
+        )
+        buffer += response["Body"].read()
+        read_end = range_end + 1
+
+        if buffer.count(b"\n") >= count or read_end >= manifest_size:
+            break
+
+    records = []
+    consumed = 0
+    for line in buffer.split(b"\n")[:-1][:count]:
+        consumed += len(line) + 1
+        if line:
+            records.append(json.loads(line))
+
+    return records, offset + consumed
+
+
+def read_manifest(bucket: str, key: str) -> list[dict[str, Any]]:
+    """
+    Read every record from a reindex manifest.
+
+    Only needed for old-format scraped pages, whose job metadata is
+    extracted from a seed document found elsewhere in the listing.
+
+    Args:
+        bucket: S3 bucket name
+        key: S3 key of the manifest
+
+    Returns:
+        All manifest records in order
+    """
+    response = s3_client.get_object(Bucket=bucket, Key=key)
+    body = response["Body"].read().decode("utf-8")
+    return [json.loads(line) for line in body.splitlines() if line]
+
+
 def extract_document_metadata(output_s3_uri: str, document_id: str) -> dict[str, Any]:
     """
     Extract metadata from document text using LLM.
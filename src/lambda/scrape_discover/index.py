@@ -4,6 +4,20 @@ Scrape Discover Lambda
 Processes URLs from the discovery queue, extracts links, and adds
 new discovered URLs back to the queue (recursive discovery).
 
+With DISCOVERY_CRAWL_MODE=async the whole SQS batch is crawled concurrently:
+a HostScheduler spaces requests to each host REQUEST_DELAY_MS apart and caps
+in-flight requests per host and overall, instead of sleeping after every page.
+
+With DATA_BUCKET set, each job keeps a Bloom filter of the URLs it has
+claimed in S3; URLs the filter has never seen are claimed without a
+ScrapeUrls read, so only possible duplicates cost a DynamoDB lookup.
+
+Jobs with discovery_mode "sitemap" read robots.txt and the site's sitemaps
+when their seed URL arrives and queue every in-scope page for processing in
+that one pass; link crawling is only used when the site has no sitemap.
+Sitemap reading for a batch shares DISCOVERY_SITEMAP_BUDGET_SECONDS, so a
+large sitemap cannot use up the time the batch's other records need.
+
 Input event (SQS triggered):
 {
     "Records": [{
@@ -19,6 +33,7 @@ Output:
 }
 """
 
+import asyncio
 import json
 import logging
 import os
@@ -30,22 +45,46 @@ import boto3
 from botocore.exceptions import ClientError
 
 from ragstack_common.appsync import publish_scrape_update
-from ragstack_common.scraper import ScrapePage, ScrapeStatus, UrlStatus
+from ragstack_common.scraper import DiscoveryMode, ScrapePage, ScrapeStatus, UrlStatus
+from ragstack_common.scraper.dedup import DeduplicationService
 from ragstack_common.scraper.discovery import (
+    SitemapDiscovery,
+    UrlFilter,
+    discover_sitemap_urls,
     extract_links,
-    filter_discovered_urls,
+    get_url_depth,
     normalize_url,
 )
-from ragstack_common.scraper.fetcher import HttpFetcher
+from ragstack_common.scraper.fetcher import (
+    FetchResult,
+    HttpFetcher,
+    fetched_page_key,
+    get_connection_pool,
+    store_fetch_result,
+)
+from ragstack_common.scraper.frontier import VisitedFilter
 from ragstack_common.scraper.models import ScrapeConfig
+from ragstack_common.scraper.scheduler import HostScheduler
 
 logger = logging.getLogger()
 logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
 
+# Maximum entries per SQS send_message_batch call
+SQS_BATCH_SIZE = 10
+
+# Smallest visited filter (URLs); filters are sized at twice max_pages
+MIN_VISITED_CAPACITY = 1000
+
 
 def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     """
     Main Lambda handler - processes discovery queue messages.
+
+    The batch is handled in phases so AWS calls scale with the number of
+    batches rather than with link count: URLs are claimed with one job read
+    per job and a BatchWriteItem of page records, pages are fetched, then
+    queue messages go out through send_message_batch and job counters and
+    progress are updated once per job.
     """
     # Get environment variables
     jobs_table = os.environ.get("SCRAPE_JOBS_TABLE")
@@ -53,6 +92,11 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     discovery_queue_url = os.environ.get("SCRAPE_DISCOVERY_QUEUE_URL")
     processing_queue_url = os.environ.get("SCRAPE_PROCESSING_QUEUE_URL")
     request_delay_ms = int(os.environ.get("REQUEST_DELAY_MS", "500"))
+    # Fetched pages are handed to scrape_process through this bucket (optional)
+    data_bucket = os.environ.get("DATA_BUCKET")
+    # "serial" (one record at a time) or "async" (whole batch concurrently)
+    crawl_mode = os.environ.get("DISCOVERY_CRAWL_MODE", "serial")
+    sitemap_budget = float(os.environ.get("DISCOVERY_SITEMAP_BUDGET_SECONDS", "60"))
 
     if not jobs_table:
         raise ValueError("SCRAPE_JOBS_TABLE environment variable required")
@@ -67,193 +111,623 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     jobs_tbl = dynamodb.Table(jobs_table)
     urls_tbl = dynamodb.Table(urls_table)
     sqs = boto3.client("sqs")
+    s3 = boto3.client("s3") if data_bucket else None
+    dedup = DeduplicationService(urls_table)
 
-    processed = 0
-    discovered = 0
+    records: list[dict[str, Any]] = event.get("Records", [])
+    failed: set[int] = set()
     skipped = 0
-    batch_item_failures = []
 
-    # Process SQS records
-    for record in event.get("Records", []):
+    # Claim URLs: one job read per job, page records in a single batch write
+    jobs: dict[str, dict[str, Any] | None] = {}
+    job_state: dict[str, dict[str, Any]] = {}
+    claimed: set[tuple[str, str]] = set()
+    tasks: dict[int, dict[str, Any]] = {}
+    for i, record in enumerate(records):
+        try:
+            task = _prepare_record(
+                record,
+                jobs_tbl,
+                urls_tbl,
+                jobs,
+                job_state,
+                claimed,
+                s3=s3,
+                data_bucket=data_bucket,
+            )
+        except Exception as e:
+            _log_record_error(e)
+            failed.add(i)
+            continue
+        if task is None:
+            skipped += 1
+        else:
+            tasks[i] = task
+
+    # Record claimed URLs in each job's visited filter before writing them,
+    # so no invocation can read a filter that misses a claimed URL
+    for job_id in _save_visited_filters(job_state):
+        for i in [i for i, task in tasks.items() if task["job_id"] == job_id]:
+            failed.add(i)
+            del tasks[i]
+
+    try:
+        _write_page_records(urls_tbl, list(tasks.values()))
+    except Exception as e:
+        _log_record_error(e)
+        failed.update(tasks)
+        tasks = {}
+
+    # Sitemap mode: the seed page's job is discovered from its sitemaps.
+    # All seeds in the batch share one deadline; URLs read before it are kept.
+    sitemap_deadline = time.monotonic() + sitemap_budget
+    sitemaps = {
+        i: _discover_sitemaps(task, sitemap_deadline)
+        for i, task in tasks.items()
+        if task["depth"] == 0 and task["config"].discovery_mode == DiscoveryMode.SITEMAP
+    }
+
+    # Read revalidation validators here: DynamoDB stays on the handler thread
+    validators: dict[int, tuple[str | None, str | None]] = {}
+    for i, task in list(tasks.items()):
+        try:
+            validators[i] = _get_validators(task, dedup)
+        except Exception as e:
+            _log_record_error(e)
+            failed.add(i)
+            del tasks[i]
+
+    # Fetch pages
+    if crawl_mode == "async":
+        fetched = asyncio.run(
+            _fetch_concurrently(
+                tasks,
+                validators,
+                request_delay_ms=request_delay_ms,
+                max_per_host=int(os.environ.get("DISCOVERY_MAX_PER_HOST", "2")),
+                max_concurrency=int(os.environ.get("DISCOVERY_MAX_CONCURRENCY", "10")),
+            )
+        )
+    else:
+        fetched = _fetch_serially(tasks, validators, request_delay_ms)
+
+    # Build queue messages and per-job counter deltas
+    progress: dict[str, dict[str, int]] = {}
+    processing_messages: list[tuple[int, dict[str, Any]]] = []
+    discovery_messages: list[tuple[int, dict[str, Any]]] = []
+    for i, task in tasks.items():
+        fetch_outcome = fetched.get(i)
+        if fetch_outcome is None:
+            failed.add(i)
+            continue
+        job_progress = progress.setdefault(
+            task["job_id"], {"queued": 0, "enqueued": 0, "failed_count": 0}
+        )
+        try:
+            _finish_record(
+                i,
+                task,
+                fetch_outcome,
+                job_progress,
+                processing_messages,
+                discovery_messages,
+                urls_tbl=urls_tbl,
+                s3=s3,
+                data_bucket=data_bucket,
+                sitemap=sitemaps.get(i),
+            )
+        except Exception as e:
+            _log_record_error(e)
+            failed.add(i)
+
+    # Send queue messages first, then update counters for what was enqueued
+    processing_failed = _send_messages(sqs, processing_queue_url, processing_messages)
+    discovery_failed = _send_messages(sqs, discovery_queue_url, discovery_messages)
+    failed.update(processing_failed, discovery_failed)
+
+    for i, message in processing_messages:
+        if i not in processing_failed:
+            progress[message["job_id"]]["enqueued"] += 1
+    for job_id, job_progress in progress.items():
+        job_item = jobs[job_id]
+        if job_item is not None:
+            _update_job_progress(jobs_tbl, job_id, job_item, job_progress)
+
+    logger.info(f"HTTP connection pool: {get_connection_pool().stats()}")
+
+    return {
+        "processed": sum(1 for i in tasks if i not in failed),
+        "discovered": sum(1 for i, _ in discovery_messages if i not in discovery_failed),
+        "skipped": skipped,
+        "batchItemFailures": [{"itemIdentifier": records[i]["messageId"]} for i in sorted(failed)],
+    }
+
+
+def _log_record_error(e: Exception) -> None:
+    """Log a failed record (AWS errors with their error code)."""
+    if isinstance(e, ClientError):
+        error_code = e.response.get("Error", {}).get("Code", "")
+        logger.error(f"AWS error processing record: {error_code} - {e}")
+    else:
+        logger.error(f"Error processing record: {e}", exc_info=True)
+
+
+def _prepare_record(
+    record: dict[str, Any],
+    jobs_tbl: Any,
+    urls_tbl: Any,
+    jobs: dict[str, dict[str, Any] | None],
+    job_state: dict[str, dict[str, Any]],
+    claimed: set[tuple[str, str]],
+    s3: Any = None,
+    data_bucket: str | None = None,
+) -> dict[str, Any] | None:
+    """
+    Parse a discovery message and check that its URL still needs crawling.
+
+    Args:
+        record: SQS record
+        jobs_tbl: ScrapeJobs table
+        urls_tbl: ScrapeUrls table
+        jobs: Job items already read in this batch, by job ID (updated)
+        job_state: Parsed config, compiled URL filter and visited filter,
+            by job ID (updated)
+        claimed: (job_id, url) pairs already claimed in this batch (updated)
+        s3: S3 client for visited filters (None disables them)
+        data_bucket: Bucket holding visited filters
+
+    Returns:
+        Task dict for fetching, or None if the record should be skipped
+        (job missing or finished, URL already visited)
+    """
+    message = json.loads(record["body"])
+    job_id = message["job_id"]
+    url = message["url"]
+    depth = message.get("depth", 0)
+
+    logger.info(f"Processing discovery: job={job_id}, url={url}, depth={depth}")
+
+    # Check if job is still active (read once per job per batch)
+    if job_id not in jobs:
+        jobs[job_id] = jobs_tbl.get_item(Key={"job_id": job_id}).get("Item")
+    job_item = jobs[job_id]
+
+    if not job_item:
+        logger.warning(f"Job not found: {job_id}")
+        return None
+
+    job_status = str(job_item.get("status", ""))
+    if job_status in [
+        ScrapeStatus.CANCELLED.value,
+        ScrapeStatus.FAILED.value,
+        ScrapeStatus.COMPLETED.value,
+    ]:
+        logger.info(f"Job {job_id} is {job_status}, skipping")
+        return None
+
+    # Get job config; filters are compiled / loaded once per job per batch
+    config_data: dict[str, Any] = job_item.get("config", {})
+    if job_id not in job_state:
+        job_state[job_id] = _load_job_state(job_id, job_item, url, depth, s3, data_bucket)
+    state = job_state[job_id]
+    config: ScrapeConfig = state["config"]
+    url_filter: UrlFilter = state["url_filter"]
+    visited: VisitedFilter | None = state["visited"]
+
+    # Normalize URL for deduplication
+    normalized_url = normalize_url(url)
+
+    # Check if URL already visited (in an earlier invocation or this batch).
+    # The visited filter answers "never claimed" without reading DynamoDB.
+    if (job_id, normalized_url) in claimed:
+        logger.info(f"URL already visited: {normalized_url}")
+        return None
+    if visited is None or visited.might_contain(normalized_url):
+        existing = urls_tbl.get_item(Key={"job_id": job_id, "url": normalized_url})
+        if existing.get("Item"):
+            logger.info(f"URL already visited: {normalized_url}")
+            return None
+    claimed.add((job_id, normalized_url))
+    if visited is not None:
+        visited.add(normalized_url)
+
+    return {
+        "job_id": job_id,
+        "original_url": url,
+        "url": normalized_url,
+        "depth": depth,
+        "job_item": job_item,
+        "config_data": config_data,
+        "config": config,
+        "url_filter": url_filter,
+    }
+
+
+def _load_job_state(
+    job_id: str,
+    job_item: dict[str, Any],
+    url: str,
+    depth: int,
+    s3: Any,
+    data_bucket: str | None,
+) -> dict[str, Any]:
+    """Parse a job's config and compile its URL filter; load its visited filter."""
+    config = ScrapeConfig.from_dict(job_item.get("config", {}))
+    base_url = str(job_item.get("base_url", url))
+
+    visited = None
+    if s3 is not None and data_bucket:
+        visited = VisitedFilter(
+            s3, data_bucket, job_id, capacity=max(2 * config.max_pages, MIN_VISITED_CAPACITY)
+        )
+        # Only the seed batch creates the filter, so an existing filter has
+        # seen every URL the job claimed
+        is_seed = depth == 0 and int(job_item.get("total_urls", 0)) == 0
+        visited.load(create=is_seed)
+
+    return {"config": config, "url_filter": UrlFilter(base_url, config), "visited": visited}
+
+
+def _save_visited_filters(job_state: dict[str, dict[str, Any]]) -> set[str]:
+    """
+    Save newly claimed URLs to each job's visited filter.
+
+    Returns:
+        IDs of jobs whose filter could not be saved (their records must not
+        be claimed in this invocation)
+    """
+    failed_jobs: set[str] = set()
+    for job_id, state in job_state.items():
+        visited: VisitedFilter | None = state["visited"]
+        if visited is None:
+            continue
         try:
-            message = json.loads(record["body"])
-            job_id = message["job_id"]
-            url = message["url"]
-            depth = message.get("depth", 0)
-
-            logger.info(f"Processing discovery: job={job_id}, url={url}, depth={depth}")
-
-            # Check if job is still active
-            job_response = jobs_tbl.get_item(Key={"job_id": job_id})
-            job_item = job_response.get("Item")
-
-            if not job_item:
-                logger.warning(f"Job not found: {job_id}")
-                continue
-
-            job_status = str(job_item.get("status", ""))
-            if job_status in [
-                ScrapeStatus.CANCELLED.value,
-                ScrapeStatus.FAILED.value,
-                ScrapeStatus.COMPLETED.value,
-            ]:
-                logger.info(f"Job {job_id} is {job_status}, skipping")
-                skipped += 1
-                continue
-
-            # Normalize URL for deduplication
-            normalized_url = normalize_url(url)
-
-            # Check if URL already visited
-            existing = urls_tbl.get_item(Key={"job_id": job_id, "url": normalized_url})
-            if existing.get("Item"):
-                logger.info(f"URL already visited: {normalized_url}")
-                skipped += 1
-                continue
-
-            # Create page record (mark as discovered)
+            visited.save()
+        except Exception as e:
+            logger.error(f"Could not save visited filter for job {job_id}: {e}")
+            failed_jobs.add(job_id)
+            continue
+        logger.info(f"Visited filter for job {job_id}: {visited.stats()}")
+    return failed_jobs
+
+
+def _discover_sitemaps(task: dict[str, Any], deadline: float) -> SitemapDiscovery:
+    """Read a seed URL's robots.txt and sitemaps until deadline (empty result on failure)."""
+    base_url = str(task["job_item"].get("base_url", task["original_url"]))
+    try:
+        sitemap = discover_sitemap_urls(base_url, task["config"], deadline=deadline)
+    except Exception as e:
+        logger.warning(f"Sitemap discovery failed, falling back to crawling: {e}")
+        return SitemapDiscovery()
+    logger.info(
+        f"Sitemap discovery for job {task['job_id']}: {len(sitemap.urls)} URLs "
+        f"from {len(sitemap.sitemaps_read)} sitemaps, crawl delay {sitemap.crawl_delay_ms} ms"
+    )
+    return sitemap
+
+
+def _write_page_records(urls_tbl: Any, tasks: list[dict[str, Any]]) -> None:
+    """Create page records (mark as discovered) with BatchWriteItem."""
+    if not tasks:
+        return
+    with urls_tbl.batch_writer(overwrite_by_pkeys=["job_id", "url"]) as batch:
+        for task in tasks:
             page = ScrapePage(
-                job_id=job_id,
-                url=normalized_url,
+                job_id=task["job_id"],
+                url=task["url"],
                 status=UrlStatus.PENDING,
-                depth=depth,
+                depth=task["depth"],
             )
+            batch.put_item(Item=page.to_dict())
 
-            page_data = page.to_dict()
-            urls_tbl.put_item(Item=page_data)
 
-            # Get job config
-            config_data: dict[str, Any] = job_item.get("config", {})  # type: ignore[assignment]
-            config = ScrapeConfig.from_dict(config_data)
-            base_url = str(job_item.get("base_url", url))
+def _fetch_serially(
+    tasks: dict[int, dict[str, Any]],
+    validators: dict[int, tuple[str | None, str | None]],
+    request_delay_ms: int,
+) -> dict[int, tuple[FetchResult, bool] | None]:
+    """Fetch pages one at a time, sleeping request_delay_ms between pages."""
+    fetched: dict[int, tuple[FetchResult, bool] | None] = {}
+    for i, task in tasks.items():
+        try:
+            fetched[i] = _fetch_page(task, validators[i], delay_ms=request_delay_ms)
+        except Exception as e:
+            _log_record_error(e)
+            fetched[i] = None
 
-            # Fetch the page to extract links
-            fetcher = HttpFetcher(
-                delay_ms=request_delay_ms,
-                cookies=config.cookies,
-                headers=config.headers,
-            )
-            result = fetcher.fetch(normalized_url)
-
-            if result.error:
-                logger.warning(f"Fetch failed during discovery: {normalized_url} - {result.error}")
-                # Mark URL as failed but continue - processing will retry
-                urls_tbl.update_item(
-                    Key={"job_id": job_id, "url": normalized_url},
-                    UpdateExpression="SET #status = :status, #error = :err",
-                    ExpressionAttributeNames={"#status": "status", "#error": "error"},
-                    ExpressionAttributeValues={
-                        ":status": UrlStatus.FAILED.value,
-                        ":err": result.error,
-                    },
-                )
-                # Update job failed count
-                jobs_tbl.update_item(
-                    Key={"job_id": job_id},
-                    UpdateExpression="SET failed_count = failed_count + :inc, updated_at = :ts",
-                    ExpressionAttributeValues={
-                        ":inc": 1,
-                        ":ts": datetime.now(UTC).isoformat(),
-                    },
-                )
-                continue
-
-            # Send URL to processing queue
-            sqs.send_message(
-                QueueUrl=processing_queue_url,
-                MessageBody=json.dumps(
-                    {
-                        "job_id": job_id,
-                        "url": normalized_url,
-                        "depth": depth,
-                    }
-                ),
-            )
+        # Respect rate limit between pages
+        time.sleep(request_delay_ms / 1000.0)
+    return fetched
 
-            # Update job total URLs count
-            jobs_tbl.update_item(
-                Key={"job_id": job_id},
-                UpdateExpression="SET total_urls = total_urls + :inc, updated_at = :ts",
-                ExpressionAttributeValues={
-                    ":inc": 1,
-                    ":ts": datetime.now(UTC).isoformat(),
-                },
-            )
 
-            # Publish discovery progress update to subscribers
-            graphql_endpoint = os.environ.get("GRAPHQL_ENDPOINT")
-            current_total = int(job_item.get("total_urls", 0)) + 1  # type: ignore[arg-type]
-            publish_scrape_update(
-                graphql_endpoint=graphql_endpoint,
-                job_id=job_id,
-                base_url=str(job_item.get("base_url", url)),
-                title=str(job_item.get("title") or job_item.get("base_url", url)),
-                status=str(job_item.get("status", ScrapeStatus.DISCOVERING.value)),
-                total_urls=current_total,
-                processed_count=int(job_item.get("processed_count", 0)),  # type: ignore[arg-type]
-                failed_count=int(job_item.get("failed_count", 0)),  # type: ignore[arg-type]
-            )
+async def _fetch_concurrently(
+    tasks: dict[int, dict[str, Any]],
+    validators: dict[int, tuple[str | None, str | None]],
+    request_delay_ms: int,
+    max_per_host: int,
+    max_concurrency: int,
+) -> dict[int, tuple[FetchResult, bool] | None]:
+    """
+    Fetch all pages concurrently under a per-host politeness budget.
 
-            # Extract and filter links if within depth limit
-            max_depth = config.max_depth
-            max_pages = config.max_pages
+    Fetches run in worker threads gated by the HostScheduler; DynamoDB and
+    SQS calls (including the validator reads) stay on the handler thread
+    (boto3 resources are not thread-safe).
+    """
+    scheduler = HostScheduler(
+        delay_ms=request_delay_ms,
+        max_per_host=max_per_host,
+        max_concurrency=max_concurrency,
+    )
 
-            if depth < max_depth and result.is_html:
-                links = extract_links(result.content, normalized_url)
+    async def fetch(i: int, task: dict[str, Any]) -> tuple[FetchResult, bool] | None:
+        try:
+            async with scheduler.slot(task["url"]):
+                return await asyncio.to_thread(_fetch_page, task, validators[i], 0)
+        except Exception as e:
+            _log_record_error(e)
+            return None
 
-                # Track URLs we've already seen (including current URL)
-                # DynamoDB provides cross-invocation dedup; this handles within-batch
-                visited = {normalized_url}
+    results = await asyncio.gather(*(fetch(i, task) for i, task in tasks.items()))
+    logger.info(f"Discovery scheduler: {scheduler.stats()}")
+    return dict(zip(tasks, results, strict=True))
 
-                filtered = filter_discovered_urls(
-                    urls=links,
-                    base_url=base_url,
-                    config=config,
-                    visited=visited,
-                )
 
-                logger.info(f"Discovered {len(filtered)} new URLs from {normalized_url}")
+def _get_validators(
+    task: dict[str, Any], dedup: DeduplicationService
+) -> tuple[str | None, str | None]:
+    """
+    Get the (etag, last_modified) validators to revalidate a task's page with.
 
-                # Check max pages limit
-                job_refresh = jobs_tbl.get_item(Key={"job_id": job_id})
-                total_discovered = int(job_refresh.get("Item", {}).get("total_urls", 0))  # type: ignore[arg-type]
-                remaining = max_pages - total_discovered
+    Leaf pages are fetched only to hand off to processing, so they are
+    revalidated with the validators stored by the previous scrape of the URL.
+    Pages whose links are followed are always fetched unconditionally.
+    """
+    config: ScrapeConfig = task["config"]
+    scrape_mode = str(task["config_data"].get("scrape_mode", "auto"))
+    if task["depth"] >= config.max_depth and not config.force_rescrape and scrape_mode != "full":
+        return dedup.get_validators(task["url"])
+    return None, None
 
-                # Queue new URLs for discovery
-                urls_to_queue = filtered[:remaining] if remaining > 0 else []
 
-                for link in urls_to_queue:
-                    sqs.send_message(
-                        QueueUrl=discovery_queue_url,
-                        MessageBody=json.dumps(
-                            {
-                                "job_id": job_id,
-                                "url": link,
-                                "depth": depth + 1,
-                            }
-                        ),
-                    )
-                    discovered += 1
+def _fetch_page(
+    task: dict[str, Any], validators: tuple[str | None, str | None], delay_ms: int
+) -> tuple[FetchResult, bool]:
+    """
+    Fetch a task's page (keep-alive pool shared across records).
 
-                if remaining <= 0:
-                    logger.info(f"Max pages limit ({max_pages}) reached for job {job_id}")
+    Makes no DynamoDB calls, so it is safe to run in a worker thread.
 
-            processed += 1
+    Args:
+        task: Prepared discovery task
+        validators: (etag, last_modified) from _get_validators
+        delay_ms: Delay before the request in milliseconds
 
-            # Respect rate limit between pages
-            time.sleep(request_delay_ms / 1000.0)
+    Returns:
+        Tuple of (result, conditional) where conditional is True when the
+        request carried validators from a previous scrape
+    """
+    config: ScrapeConfig = task["config"]
+
+    fetcher = HttpFetcher(
+        delay_ms=delay_ms,
+        cookies=config.cookies,
+        headers=config.headers,
+        pooled=True,
+        http2=True,
+    )
+
+    etag, last_modified = validators
+    result = fetcher.fetch(task["url"], etag=etag, last_modified=last_modified)
+    return result, bool(etag or last_modified)
+
+
+def _finish_record(
+    index: int,
+    task: dict[str, Any],
+    fetched: tuple[FetchResult, bool],
+    job_progress: dict[str, int],
+    processing_messages: list[tuple[int, dict[str, Any]]],
+    discovery_messages: list[tuple[int, dict[str, Any]]],
+    urls_tbl: Any,
+    s3: Any,
+    data_bucket: str | None,
+    sitemap: SitemapDiscovery | None = None,
+) -> None:
+    """
+    Queue a fetched page for processing and queue its links for discovery.
 
-        except ClientError as e:
-            error_code = e.response.get("Error", {}).get("Code", "")
-            logger.error(f"AWS error processing record: {error_code} - {e}")
-            batch_item_failures.append({"itemIdentifier": record["messageId"]})
+    Messages are appended to processing_messages / discovery_messages (tagged
+    with the record index) and counted in job_progress; nothing is sent here.
+    When a sitemap discovery found URLs for the job, they are queued for
+    processing instead of the page's links.
+    """
+    result, conditional = fetched
+    job_id: str = task["job_id"]
+    normalized_url: str = task["url"]
+    depth: int = task["depth"]
+    job_item: dict[str, Any] = task["job_item"]
+    config: ScrapeConfig = task["config"]
+    scrape_mode = str(task["config_data"].get("scrape_mode", "auto"))
+
+    if result.error:
+        logger.warning(f"Fetch failed during discovery: {normalized_url} - {result.error}")
+        # Mark URL as failed but continue - processing will retry
+        urls_tbl.update_item(
+            Key={"job_id": job_id, "url": normalized_url},
+            UpdateExpression="SET #status = :status, #error = :err",
+            ExpressionAttributeNames={"#status": "status", "#error": "error"},
+            ExpressionAttributeValues={
+                ":status": UrlStatus.FAILED.value,
+                ":err": result.error,
+            },
+        )
+        job_progress["failed_count"] += 1
+        if sitemap and sitemap.urls:
+            # Sitemap URLs do not depend on the seed page
+            _queue_sitemap_urls(index, task, sitemap, job_progress, processing_messages, urls_tbl)
+        return
+
+    # Hand the fetched page to processing so it is not downloaded twice.
+    # Full mode renders with Playwright, so the HTTP body is not reusable.
+    processing_message: dict[str, Any] = {
+        "job_id": job_id,
+        "url": normalized_url,
+        "depth": depth,
+    }
+    if sitemap and sitemap.crawl_delay_ms:
+        processing_message["crawl_delay_ms"] = sitemap.crawl_delay_ms
+    if conditional and result.not_modified:
+        # 304: processing can mark the page skipped without fetching it
+        processing_message["not_modified"] = True
+    elif s3 and data_bucket and result.is_html and scrape_mode != "full":
+        try:
+            processing_message["fetched_s3_uri"] = store_fetch_result(
+                s3, data_bucket, fetched_page_key(job_id, normalized_url), result
+            )
         except Exception as e:
-            logger.error(f"Error processing record: {e}", exc_info=True)
-            batch_item_failures.append({"itemIdentifier": record["messageId"]})
+            logger.warning(f"Could not stage fetched page, processing will re-fetch: {e}")
 
-    return {
-        "processed": processed,
-        "discovered": discovered,
-        "skipped": skipped,
-        "batchItemFailures": batch_item_failures,
-    }
+    processing_messages.append((index, processing_message))
+    job_progress["queued"] += 1
+
+    if sitemap and sitemap.urls:
+        _queue_sitemap_urls(index, task, sitemap, job_progress, processing_messages, urls_tbl)
+        return
+
+    # Extract and filter links if within depth limit
+    max_depth = config.max_depth
+    max_pages = config.max_pages
+
+    if depth < max_depth and result.is_html:
+        links = extract_links(result.content, normalized_url)
+
+        # Track URLs we've already seen (including current URL)
+        # DynamoDB provides cross-invocation dedup; this handles within-batch
+        visited = {normalized_url}
+
+        url_filter: UrlFilter = task["url_filter"]
+        filtered = url_filter.filter(links, visited)
+
+        logger.info(f"Discovered {len(filtered)} new URLs from {normalized_url}")
+
+        # Check max pages limit (job total as read this batch plus pages queued since)
+        total_discovered = int(job_item.get("total_urls", 0)) + job_progress["queued"]
+        remaining = max_pages - total_discovered
+
+        # Queue new URLs for discovery
+        urls_to_queue = filtered[:remaining] if remaining > 0 else []
+
+        for link in urls_to_queue:
+            discovery_messages.append((index, {"job_id": job_id, "url": link, "depth": depth + 1}))
+
+        if remaining <= 0:
+            logger.info(f"Max pages limit ({max_pages}) reached for job {job_id}")
+
+
+def _queue_sitemap_urls(
+    index: int,
+    task: dict[str, Any],
+    sitemap: SitemapDiscovery,
+    job_progress: dict[str, int],
+    processing_messages: list[tuple[int, dict[str, Any]]],
+    urls_tbl: Any,
+) -> None:
+    """
+    Queue a job's sitemap URLs straight to processing.
+
+    Page records are written before the messages are queued, as for crawled
+    URLs; the job's max_pages limit applies to the combined total.
+    """
+    job_id: str = task["job_id"]
+    job_item: dict[str, Any] = task["job_item"]
+    base_url = str(job_item.get("base_url", task["original_url"]))
+
+    total_discovered = int(job_item.get("total_urls", 0)) + job_progress["queued"]
+    remaining = task["config"].max_pages - total_discovered
+    urls = [url for url in sitemap.urls if url != task["url"]][: max(remaining, 0)]
+
+    pages = [{"job_id": job_id, "url": url, "depth": get_url_depth(url, base_url)} for url in urls]
+    _write_page_records(urls_tbl, pages)
+
+    for page in pages:
+        message: dict[str, Any] = dict(page)
+        if sitemap.crawl_delay_ms:
+            message["crawl_delay_ms"] = sitemap.crawl_delay_ms
+        processing_messages.append((index, message))
+    job_progress["queued"] += len(pages)
+
+    logger.info(f"Queued {len(pages)} sitemap URLs for processing: job={job_id}")
+    if remaining <= len(pages):
+        logger.info(f"Max pages limit ({task['config'].max_pages}) reached for job {job_id}")
+
+
+def _send_messages(
+    sqs: Any, queue_url: str, messages: list[tuple[int, dict[str, Any]]]
+) -> set[int]:
+    """
+    Send messages with send_message_batch in chunks of 10.
+
+    Args:
+        sqs: SQS client
+        queue_url: Target queue URL
+        messages: (record index, message body) pairs
+
+    Returns:
+        Record indexes with at least one message that failed to send
+    """
+    failed: set[int] = set()
+    for start in range(0, len(messages), SQS_BATCH_SIZE):
+        chunk = messages[start : start + SQS_BATCH_SIZE]
+        entries = [
+            {"Id": str(n), "MessageBody": json.dumps(body)} for n, (_, body) in enumerate(chunk)
+        ]
+        try:
+            resp = sqs.send_message_batch(QueueUrl=queue_url, Entries=entries)
+        except ClientError as e:
+            _log_record_error(e)
+            failed.update(index for index, _ in chunk)
+            continue
+        for f in resp.get("Failed", []):
+            logger.error(f"SQS batch send failed: {f.get('Id')} - {f.get('Message')}")
+            failed.add(chunk[int(f["Id"])][0])
+    return failed
+
+
+def _update_job_progress(
+    jobs_tbl: Any, job_id: str, job_item: dict[str, Any], job_progress: dict[str, int]
+) -> None:
+    """Apply this batch's counter increments to the job and publish progress once."""
+    enqueued = job_progress["enqueued"]
+    failed_count = job_progress["failed_count"]
+    if not enqueued and not failed_count:
+        return
+
+    # Update job total URLs and failed counts in one write
+    update_parts = ["updated_at = :ts"]
+    values: dict[str, Any] = {":ts": datetime.now(UTC).isoformat()}
+    if enqueued:
+        update_parts.append("total_urls = total_urls + :inc")
+        values[":inc"] = enqueued
+    if failed_count:
+        update_parts.append("failed_count = failed_count + :failed")
+        values[":failed"] = failed_count
+    jobs_tbl.update_item(
+        Key={"job_id": job_id},
+        UpdateExpression="SET " + ", ".join(update_parts),
+        ExpressionAttributeValues=values,
+    )
+
+    # Publish discovery progress update to subscribers
+    graphql_endpoint = os.environ.get("GRAPHQL_ENDPOINT")
+    base_url = str(job_item.get("base_url", ""))
+    publish_scrape_update(
+        graphql_endpoint=graphql_endpoint,
+        job_id=job_id,
+        base_url=base_url,
+        title=str(job_item.get("title") or base_url),
+        status=str(job_item.get("status", ScrapeStatus.DISCOVERING.value)),
+        total_urls=int(job_item.get("total_urls", 0)) + enqueued,
+        processed_count=int(job_item.get("processed_count", 0)),
+        failed_count=int(job_item.get("failed_count", 0)) + failed_count,
+    )
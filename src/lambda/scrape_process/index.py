@@ -35,7 +35,12 @@ from ragstack_common.appsync import publish_scrape_update
 from ragstack_common.scraper import ScrapeStatus, UrlStatus
 from ragstack_common.scraper.dedup import DeduplicationService
 from ragstack_common.scraper.extractor import extract_content
-from ragstack_common.scraper.fetcher import fetch_auto
+from ragstack_common.scraper.fetcher import (
+    fetch_auto,
+    get_browser_pool,
+    get_connection_pool,
+    load_fetch_result,
+)
 from ragstack_common.scraper.models import ScrapeConfig
 
 # Metadata JSON file for Bedrock KB ingestion
@@ -232,43 +237,72 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, int]:
             scrape_mode = str(config_data.get("scrape_mode", "auto"))
             force_playwright = scrape_mode == "full"
 
-            result = fetch_auto(
-                url,
-                cookies=config.cookies,
-                headers=config.headers,
-                force_playwright=force_playwright,
-                delay_ms=request_delay_ms,
-            )
+            # Conditional GET: validators from the last scrape let the server
+            # answer 304 so unchanged pages skip download and parsing entirely
+            not_modified = False
+            etag = last_modified = None
+            if not config.force_rescrape and not force_playwright:
+                if message.get("not_modified"):
+                    # scrape_discover already got a 304 for this URL
+                    not_modified = True
+                else:
+                    etag, last_modified = dedup.get_validators(url)
+
+            if not_modified:
+                result = None
+            else:
+                # Reuse the page scrape_discover already fetched, if it staged one
+                prefetched = None
+                fetched_s3_uri = message.get("fetched_s3_uri")
+                if fetched_s3_uri and not force_playwright:
+                    prefetched = load_fetch_result(s3, fetched_s3_uri)
+
+                result = fetch_auto(
+                    url,
+                    cookies=config.cookies,
+                    headers=config.headers,
+                    force_playwright=force_playwright,
+                    # Crawl-delay from robots.txt (sitemap discovery) overrides
+                    delay_ms=max(request_delay_ms, int(message.get("crawl_delay_ms", 0))),
+                    prefetched=prefetched,
+                    pooled=True,
+                    etag=etag,
+                    last_modified=last_modified,
+                    # One browser context per job in the warm container's browser
+                    context_key=job_id,
+                )
+
+                if result.error:
+                    raise Exception(f"Fetch failed: {result.error}")
 
-            if result.error:
-                raise Exception(f"Fetch failed: {result.error}")
+                not_modified = bool(etag or last_modified) and result.not_modified
+
+            if not_modified or result is None:
+                logger.info(f"Not modified since last scrape, skipping: {url}")
+                _mark_skipped(jobs_tbl, urls_tbl, job_id, url)
+                skipped += 1
+                continue
 
             if not result.is_html:
                 raise Exception(f"Not HTML content: {result.content_type}")
 
             # Extract content and convert to markdown
-            extracted = extract_content(result.content, url)
+            extracted = extract_content(result.parsed(), url)
 
             # Check for content changes (deduplication) - skip if force_rescrape enabled
             if not config.force_rescrape and not dedup.is_content_changed(url, extracted.markdown):
                 logger.info(f"Content unchanged, skipping: {url}")
-                urls_tbl.update_item(
-                    Key={"job_id": job_id, "url": url},
-                    UpdateExpression="SET #status = :status",
-                    ExpressionAttributeNames={"#status": "status"},
-                    ExpressionAttributeValues={":status": UrlStatus.SKIPPED.value},
-                )
-                # Still count as processed for job completion
-                jobs_tbl.update_item(
-                    Key={"job_id": job_id},
-                    UpdateExpression=(
-                        "SET processed_count = processed_count + :one, updated_at = :ts"
-                    ),
-                    ExpressionAttributeValues={
-                        ":one": 1,
-                        ":ts": datetime.now(UTC).isoformat(),
-                    },
+                # Keep this response's validators (pages scraped before they
+                # were stored, or whose ETag rotates) so the next job can
+                # revalidate with a conditional GET
+                dedup.store_hash(
+                    job_id,
+                    url,
+                    extracted.markdown,
+                    etag=result.etag,
+                    last_modified=result.last_modified,
                 )
+                _mark_skipped(jobs_tbl, urls_tbl, job_id, url)
                 skipped += 1
                 continue
 
@@ -302,8 +336,14 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, int]:
             )
             write_metadata_file(s3, data_bucket, s3_key, scrape_metadata)
 
-            # Store hash for future deduplication
-            dedup.store_hash(job_id, url, extracted.markdown)
+            # Store hash and HTTP validators for future deduplication
+            dedup.store_hash(
+                job_id,
+                url,
+                extracted.markdown,
+                etag=result.etag,
+                last_modified=result.last_modified,
+            )
 
             # Update URL record with S3 key info
             urls_tbl.update_item(
@@ -363,6 +403,9 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, int]:
             failed += 1
             raise
 
+    logger.info(f"HTTP connection pool: {get_connection_pool().stats()}")
+    logger.info(f"Browser pool: {get_browser_pool().stats()}")
+
     return {
         "processed": processed,
         "failed": failed,
@@ -370,6 +413,25 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, int]:
     }
 
 
+def _mark_skipped(jobs_tbl: Any, urls_tbl: Any, job_id: str, url: str) -> None:
+    """Mark URL as skipped (unchanged) and count it as processed for the job."""
+    urls_tbl.update_item(
+        Key={"job_id": job_id, "url": url},
+        UpdateExpression="SET #status = :status",
+        ExpressionAttributeNames={"#status": "status"},
+        ExpressionAttributeValues={":status": UrlStatus.SKIPPED.value},
+    )
+    # Still count as processed for job completion
+    jobs_tbl.update_item(
+        Key={"job_id": job_id},
+        UpdateExpression="SET processed_count = processed_count + :one, updated_at = :ts",
+        ExpressionAttributeValues={
+            ":one": 1,
+            ":ts": datetime.now(UTC).isoformat(),
+        },
+    )
+
+
 def _mark_failed(
     jobs_tbl: Any,
     urls_tbl: Any,
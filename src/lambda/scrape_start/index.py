@@ -137,7 +137,7 @@ def extract_job_metadata(url: str, config: ScrapeConfig) -> dict:
             return {}
 
         # Extract content and convert to markdown
-        extracted = extract_content(result.content, url)
+        extracted = extract_content(result.parsed(), url)
         if not extracted.markdown:
             logger.warning("No content extracted from seed URL")
             return {}
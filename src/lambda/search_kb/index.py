@@ -42,6 +42,7 @@ from ragstack_common.filter_generator import FilterGenerator
 from ragstack_common.kb_filters import extract_kb_scalar
 from ragstack_common.key_library import KeyLibrary
 from ragstack_common.multislice_retriever import MultiSliceRetriever
+from ragstack_common.query_cache import QueryResultCache
 from ragstack_common.storage import generate_presigned_url, parse_s3_uri
 
 logger = logging.getLogger()
@@ -63,13 +64,27 @@ def get_config_manager() -> ConfigurationManager:
     global _config_manager
     if _config_manager is None:
         table_name = os.environ.get("CONFIGURATION_TABLE_NAME")
-        if table_name:
-            _config_manager = ConfigurationManager(table_name=table_name)
-        else:
-            _config_manager = ConfigurationManager()
+        # Warm-container config cache: edits propagate within this many seconds
+        ttl = float(os.environ.get("CONFIG_CACHE_TTL_SECONDS", "0"))
+        _config_manager = ConfigurationManager(table_name=table_name, max_staleness_seconds=ttl)
     return _config_manager
 
 
+_query_cache: QueryResultCache | None = None
+
+
+def get_query_cache() -> QueryResultCache | None:
+    """Get or create the query-result cache; None when disabled or unconfigured."""
+    global _query_cache
+    if _query_cache is None:
+        table_name = os.environ.get("QUERY_CACHE_TABLE")
+        ttl = int(os.environ.get("QUERY_CACHE_TTL_SECONDS", "0"))
+        if not table_name or ttl <= 0:
+            return None
+        _query_cache = QueryResultCache(table_name=table_name, ttl_seconds=ttl)
+    return _query_cache
+
+
 # Filter generation components (lazy-loaded to avoid init overhead if disabled)
 _key_library: KeyLibrary | None = None
 _filter_generator: FilterGenerator | None = None
@@ -177,7 +192,7 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     Returns:
         dict: KBQueryResult with query, results, total, and optional error
     """
-    # Clear config cache at handler entry to ensure fresh reads per invocation
+    # Clear config cache at handler entry (kept while within CONFIG_CACHE_TTL_SECONDS)
     get_config_manager().clear_cache()
 
     # Check public access control
@@ -259,15 +274,44 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
             config_manager.get_parameter("multislice_filtered_boost", default=1.25)
         )
 
+        manual_keys = config_manager.get_parameter("metadata_manual_keys", default=None)
+        extraction_mode = config_manager.get_parameter("metadata_extraction_mode", default="auto")
+
+        # Query-result cache: a filter hit skips filter generation, a results hit
+        # skips the KB retrieve. Keys include the KB content version.
+        query_cache = get_query_cache()
+        filter_variant = json.dumps(
+            [extraction_mode, manual_keys if extraction_mode == "manual" else None], default=str
+        )
+        results_variant = (
+            f"search:multislice={multislice_enabled}:boost={filtered_score_boost}:n={max_results}"
+        )
+        filter_cached = False
+        cached_results = None
+        # Read the content version once so lookups and writes share one key,
+        # even if an ingestion bumps the version mid-request
+        cache_version = query_cache.content_version() if query_cache else None
+        if cache_version is None:
+            query_cache = None
+        if query_cache:
+            if filter_enabled:
+                filter_cached, generated_filter = query_cache.get_filter(
+                    knowledge_base_id, query, filter_variant, version=cache_version
+                )
+            if filter_cached or not filter_enabled:
+                cached_results = query_cache.get_results(
+                    knowledge_base_id,
+                    query,
+                    generated_filter,
+                    results_variant,
+                    version=cache_version,
+                )
+
         # Generate metadata filter if enabled
-        if filter_enabled:
+        if filter_enabled and not filter_cached:
             try:
                 _, filter_generator, _ = _get_filter_components(filtered_score_boost)
                 filter_examples = _get_filter_examples()
-                manual_keys = config_manager.get_parameter("metadata_manual_keys", default=None)
-                extraction_mode = config_manager.get_parameter(
-                    "metadata_extraction_mode", default="auto"
-                )
                 generated_filter = filter_generator.generate_filter(
                     query,
                     filter_examples=filter_examples,
@@ -277,12 +321,23 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
                     logger.info(f"Generated filter: {json.dumps(generated_filter)}")
                 else:
                     logger.info("No filter intent detected in query")
+                if query_cache:
+                    query_cache.put_filter(
+                        knowledge_base_id,
+                        query,
+                        filter_variant,
+                        generated_filter,
+                        version=cache_version,
+                    )
             except Exception as e:
                 logger.warning(f"Filter generation failed, proceeding without filter: {e}")
 
         # Single unified query with optional metadata filter
         try:
-            if multislice_enabled and generated_filter:
+            if cached_results is not None:
+                retrieval_results = cached_results
+                logger.info(f"[QUERY CACHE] Reusing {len(retrieval_results)} cached results")
+            elif multislice_enabled and generated_filter:
                 # Use multi-slice retrieval with filter
                 _, _, multislice_retriever = _get_filter_components(filtered_score_boost)
                 retrieval_results = multislice_retriever.retrieve(
@@ -315,6 +370,15 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
                 uri = r.get("location", {}).get("s3Location", {}).get("uri", "N/A")
                 score = r.get("score", "N/A")
                 logger.info(f"[SEARCH RESULT] {i}: score={score}, uri={uri}")
+            if query_cache and cached_results is None:
+                query_cache.put_results(
+                    knowledge_base_id,
+                    query,
+                    generated_filter,
+                    results_variant,
+                    retrieval_results,
+                    version=cache_version,
+                )
         except Exception as e:
             logger.warning(f"Search failed: {e}")
 
@@ -27,6 +27,7 @@ from botocore.exceptions import ClientError
 from ragstack_common.appsync import publish_image_update
 from ragstack_common.config import get_config_manager_or_none, get_knowledge_base_config
 from ragstack_common.ingestion import batch_check_document_statuses
+from ragstack_common.query_cache import bump_kb_content_version
 
 logger = logging.getLogger()
 logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
@@ -223,6 +224,10 @@ def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, int]:
             # Still processing (STARTING, IN_PROGRESS) or UNKNOWN
             logger.debug(f"Document {document_id} status: {kb_status}, leaving as SYNC_QUEUED")
 
+    # Newly indexed content is searchable: invalidate cached query results
+    if indexed_count:
+        bump_kb_content_version(os.environ.get("QUERY_CACHE_TABLE"))
+
     logger.info(
         f"Status check complete: {len(documents)} checked, "
         f"{updated_count} updated ({indexed_count} indexed, {failed_count} failed)"
@@ -215,6 +215,7 @@ def start_scrape_job(
     scrape_mode: str = "AUTO",
     cookies: str | None = None,
     force_rescrape: bool = False,
+    discovery_mode: str = "CRAWL",
 ) -> str:
     """
     Start a web scraping job to add website content to the knowledge base.
@@ -240,6 +241,10 @@ def start_scrape_job(
             Format: "name1=value1; name2=value2" (e.g., "session=abc123; auth=xyz")
         force_rescrape: If True, re-scrape all pages even if content hasn't changed.
             Useful when you want to refresh all content (default: False).
+        discovery_mode: How to find pages:
+            - "CRAWL" - Follow links from the starting URL up to max_depth (default)
+            - "SITEMAP" - Read robots.txt and sitemap.xml in one pass, crawling
+              only if the site has no sitemap (fastest for documentation sites)
 
     Returns:
         Multiline string with:
@@ -291,6 +296,7 @@ def start_scrape_job(
         "scope": scope,
         "scrapeMode": scrape_mode,
         "forceRescrape": force_rescrape,
+        "discoveryMode": discovery_mode,
     }
     if include_patterns:
         input_data["includePatterns"] = include_patterns
@@ -321,3 +321,36 @@ class TestLambdaHandler:
         result = module.lambda_handler(event, None)
         assert len(result["batchItemFailures"]) == 1
         assert result["batchItemFailures"][0]["itemIdentifier"] == "msg-bad"
+
+
+class TestProcessBatch:
+    """Tests for _process_batch."""
+
+    @patch("boto3.client")
+    @patch("boto3.resource")
+    def test_presliced_batch_reads_slice_with_page_offset(self, mock_resource, mock_client):
+        mock_resource.return_value = MagicMock()
+        mock_client.return_value = MagicMock()
+        mock_config = MagicMock()
+        mock_config.get_parameter.side_effect = lambda _key, default=None: default
+
+        module = load_batch_processor_module()
+        with (
+            patch.object(module, "_config_manager", mock_config),
+            patch.object(module, "OcrService") as mock_ocr_class,
+        ):
+            mock_ocr_class.return_value.process_document.side_effect = lambda doc: doc
+            document = module._process_batch(
+                document_id="doc-123",
+                batch_index=2,
+                input_s3_uri="s3://bucket/input/doc-123/report.pdf",
+                output_s3_prefix="s3://bucket/content/doc-123/",
+                page_start=21,
+                page_end=30,
+                batch_s3_uri="s3://bucket/working/batches/doc-123/pages_021-030.pdf",
+            )
+
+        assert document.input_s3_uri == "s3://bucket/working/batches/doc-123/pages_021-030.pdf"
+        assert document.filename == "report.pdf"
+        assert document.page_offset == 20
+        assert (document.page_start, document.page_end) == (21, 30)
@@ -409,6 +409,51 @@ def test_clear_cache_forces_refresh(config_manager, sample_default_config):
     assert calls_after_clear > calls_after_first
 
 
+@pytest.fixture
+def ttl_config_manager(mock_dynamodb_resource):
+    """Create a ConfigurationManager in warm-container TTL mode."""
+    with patch("boto3.resource", return_value=mock_dynamodb_resource):
+        return ConfigurationManager(table_name="test-configuration-table", max_staleness_seconds=30)
+
+
+def test_ttl_mode_keeps_cache_across_clear(ttl_config_manager, sample_default_config):
+    """In TTL mode clear_cache() keeps a fresh cache, so warm invocations skip reads."""
+    ttl_config_manager.table.get_item.return_value = {"Item": sample_default_config}
+
+    with patch("ragstack_common.config.time.monotonic", return_value=100.0):
+        ttl_config_manager.get_effective_config()
+    with patch("ragstack_common.config.time.monotonic", return_value=129.0):
+        ttl_config_manager.clear_cache()
+        ttl_config_manager.get_effective_config()
+
+    assert ttl_config_manager.table.get_item.call_count == 2
+
+
+def test_ttl_mode_reloads_after_staleness_window(ttl_config_manager, sample_default_config):
+    """Config edits propagate once the cached copy is older than the TTL."""
+    ttl_config_manager.table.get_item.return_value = {"Item": sample_default_config}
+
+    with patch("ragstack_common.config.time.monotonic", return_value=100.0):
+        ttl_config_manager.get_effective_config()
+    with patch("ragstack_common.config.time.monotonic", return_value=131.0):
+        ttl_config_manager.get_effective_config()
+
+    assert ttl_config_manager.table.get_item.call_count == 4
+
+
+def test_ttl_mode_force_clear_and_update_drop_cache(ttl_config_manager, sample_default_config):
+    """force=True and local config updates bypass the TTL."""
+    ttl_config_manager.table.get_item.return_value = {"Item": sample_default_config}
+
+    ttl_config_manager.get_effective_config()
+    ttl_config_manager.clear_cache(force=True)
+    ttl_config_manager.get_effective_config()
+    ttl_config_manager.update_custom_config({"ocr_backend": "bedrock"})
+    ttl_config_manager.get_effective_config()
+
+    assert ttl_config_manager.table.get_item.call_count == 6
+
+
 def test_get_parameter_uses_cache(config_manager, sample_default_config):
     """Test that get_parameter benefits from caching via get_effective_config."""
     config_manager.table.get_item.return_value = {"Item": sample_default_config}
@@ -420,6 +420,71 @@ This is the email body."""
             module.lambda_handler(base_event, lambda_context)
 
 
+class TestPdfRangeRead:
+    """Test range-read PDF inspection in the handler."""
+
+    def _put_pdf(self, num_pages: int, text: str = "", trailing: bytes = b"") -> None:
+        import fitz
+
+        pdf_doc = fitz.open()
+        for i in range(num_pages):
+            pdf_doc.new_page().insert_text((72, 72), f"{text} {i}")
+        pdf_bytes = pdf_doc.tobytes()
+        pdf_doc.close()
+
+        s3 = boto3.client("s3", region_name="us-east-1")
+        s3.create_bucket(Bucket="test-bucket")
+        s3.put_object(
+            Bucket="test-bucket",
+            Key="input/test-pdf-123/document.pdf",
+            Body=pdf_bytes + trailing,
+        )
+
+    def _event(self):
+        return {
+            "document_id": "test-pdf-123",
+            "input_s3_uri": "s3://test-bucket/input/test-pdf-123/document.pdf",
+            "output_s3_prefix": "s3://test-bucket/output/test-pdf-123/",
+        }
+
+    @mock_aws
+    @patch("boto3.resource")
+    def test_large_pdf_is_range_read(self, mock_boto_resource, lambda_context):
+        """Large PDFs are counted without downloading the whole file."""
+        self._put_pdf(45)
+        module = _load_detect_file_type_module()
+
+        with (
+            patch.object(module, "RANGE_READ_MIN_BYTES", 0),
+            patch.object(module, "read_s3_binary") as mock_read_binary,
+        ):
+            result = module.lambda_handler(self._event(), lambda_context)
+
+        mock_read_binary.assert_not_called()
+        assert result["pageInfo"]["total_pages"] == 45
+        assert result["pageInfo"]["is_text_native"] is False
+        assert len(result["pageInfo"]["batches"]) == 5
+
+    @mock_aws
+    @patch("boto3.resource")
+    def test_unreadable_trailer_falls_back_to_download(self, mock_boto_resource, lambda_context):
+        """PDFs the range reader cannot parse are downloaded whole."""
+        # Junk after %%EOF hides startxref from the range reader; PyMuPDF repairs it
+        text = "Text-native content long enough to pass the threshold " * 2
+        self._put_pdf(3, text=text, trailing=b"\n" + b"x" * 70000)
+        module = _load_detect_file_type_module()
+
+        # Keep the shared storage client created under moto out of other tests
+        with (
+            patch.object(module, "RANGE_READ_MIN_BYTES", 0),
+            patch("ragstack_common.storage._s3_client", None),
+        ):
+            result = module.lambda_handler(self._event(), lambda_context)
+
+        assert result["pageInfo"]["total_pages"] == 3
+        assert result["pageInfo"]["is_text_native"] is True
+
+
 class TestPageInfoFunctions:
     """Test page info extraction functions for OCR files."""
 
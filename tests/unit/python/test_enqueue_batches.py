@@ -1,11 +1,13 @@
 """Unit tests for enqueue_batches Lambda."""
 
 import importlib.util
+import json
 import os
 import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import fitz  # PyMuPDF
 import pytest
 
 
@@ -207,3 +209,63 @@ class TestLambdaHandler:
             # Should not raise even if publish fails
             result = module.lambda_handler(_make_event(1), None)
             assert result["status"] == "batches_enqueued"
+
+
+def _write_pdf(path, num_pages):
+    pdf_doc = fitz.open()
+    for i in range(num_pages):
+        pdf_doc.new_page().insert_text((100, 100), f"Page {i + 1}")
+    pdf_doc.save(path)
+    pdf_doc.close()
+
+
+class TestBatchSlicing:
+    """Tests for per-batch sub-PDF staging."""
+
+    @patch("boto3.client")
+    @patch("boto3.resource")
+    def test_messages_carry_batch_slice_uri(self, mock_resource, mock_client):
+        mock_dynamodb = MagicMock()
+        mock_resource.return_value = mock_dynamodb
+
+        mock_s3 = MagicMock()
+        mock_s3.download_file.side_effect = lambda _b, _k, path: _write_pdf(path, 30)
+        mock_sqs = MagicMock()
+        mock_client.side_effect = lambda service, **_k: mock_s3 if service == "s3" else mock_sqs
+
+        module = load_enqueue_batches_module()
+        module.lambda_handler(_make_event(3), None)
+
+        mock_s3.download_file.assert_called_once_with(
+            "bucket", "input/doc-123/report.pdf", mock_s3.download_file.call_args.args[2]
+        )
+        puts = mock_s3.put_object.call_args_list
+        assert [c.kwargs["Key"] for c in puts] == [
+            "working/batches/doc-123/pages_001-010.pdf",
+            "working/batches/doc-123/pages_011-020.pdf",
+            "working/batches/doc-123/pages_021-030.pdf",
+        ]
+        with fitz.open(stream=puts[1].kwargs["Body"], filetype="pdf") as subset:
+            assert len(subset) == 10
+            assert "Page 11" in subset[0].get_text()
+
+        entries = mock_sqs.send_message_batch.call_args.kwargs["Entries"]
+        bodies = [json.loads(e["MessageBody"]) for e in entries]
+        assert bodies[2]["batch_s3_uri"] == "s3://bucket/working/batches/doc-123/pages_021-030.pdf"
+        assert bodies[2]["input_s3_uri"] == "s3://bucket/input/doc-123/report.pdf"
+
+    @patch("boto3.client")
+    @patch("boto3.resource")
+    def test_slicing_failure_falls_back_to_full_document(self, mock_resource, mock_client):
+        mock_resource.return_value = MagicMock()
+        mock_s3 = MagicMock()
+        mock_s3.download_file.side_effect = Exception("AccessDenied")
+        mock_sqs = MagicMock()
+        mock_client.side_effect = lambda service, **_k: mock_s3 if service == "s3" else mock_sqs
+
+        module = load_enqueue_batches_module()
+        result = module.lambda_handler(_make_event(2), None)
+
+        assert result["status"] == "batches_enqueued"
+        entries = mock_sqs.send_message_batch.call_args.kwargs["Entries"]
+        assert all("batch_s3_uri" not in json.loads(e["MessageBody"]) for e in entries)
@@ -81,7 +81,10 @@ def sample_media_event():
 class TestIngestMediaLambda:
     """Tests for the IngestMedia Lambda handler."""
 
+    @patch.dict(os.environ, {"QUERY_CACHE_TABLE": "test-query-cache"})
+    @patch("ragstack_common.query_cache.bump_kb_content_version")
     @patch("ragstack_common.appsync.publish_document_update")
+    @patch("ragstack_common.ingestion.check_document_status", return_value="INDEXED")
     @patch("ragstack_common.ingestion.ingest_documents_with_retry")
     @patch("ragstack_common.storage.read_s3_text")
     @patch("boto3.resource")
@@ -92,7 +95,9 @@ class TestIngestMediaLambda:
         mock_boto_resource,
         mock_read_s3,
         mock_ingest,
+        mock_check_status,
         mock_publish,
+        mock_bump,
         sample_media_event,
     ):
         """Test that handler ingests text content to knowledge base."""
@@ -132,8 +137,11 @@ class TestIngestMediaLambda:
 
         assert result["status"] == "SYNC_QUEUED"
         assert result["document_id"] == "media-123"
+        # Ingested transcript invalidates cached query results
+        mock_bump.assert_called_once_with("test-query-cache")
 
     @patch("ragstack_common.appsync.publish_document_update")
+    @patch("ragstack_common.storage.write_metadata_to_s3_bulk")
     @patch("ragstack_common.storage.write_metadata_to_s3")
     @patch("ragstack_common.storage.read_s3_text")
     @patch("boto3.resource")
@@ -144,12 +152,16 @@ class TestIngestMediaLambda:
         mock_boto_resource,
         mock_read_s3,
         mock_write_metadata,
+        mock_write_metadata_bulk,
         mock_publish,
         sample_media_event,
     ):
         """Test that handler writes metadata files and triggers KB sync."""
         mock_read_s3.return_value = "Test content"
         mock_write_metadata.return_value = "s3://test-bucket/metadata.json"
+        mock_write_metadata_bulk.side_effect = lambda items: [
+            f"{uri}.metadata.json" for uri, _ in items
+        ]
 
         mock_bedrock_agent = MagicMock()
 
@@ -168,8 +180,10 @@ class TestIngestMediaLambda:
         result = module.lambda_handler(sample_media_event, None)
 
         assert "segments_indexed" in result
-        # Metadata files written via shared module (transcript + segments)
-        assert mock_write_metadata.call_count >= 2
+        # Metadata files written via shared module (transcript, then segments in bulk)
+        assert mock_write_metadata.call_count >= 1
+        segment_items = mock_write_metadata_bulk.call_args[0][0]
+        assert len(segment_items) == len(sample_media_event["transcript_segments"])
 
     @patch("ragstack_common.appsync.publish_document_update")
     @patch("ragstack_common.storage.read_s3_text")
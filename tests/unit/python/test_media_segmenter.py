@@ -3,6 +3,7 @@
 import pytest
 
 from ragstack_common.media_segmenter import MediaSegmenter
+from ragstack_common.transcribe_client import TranscriptWord
 
 
 class TestMediaSegmenterInit:
@@ -280,3 +281,66 @@ class TestEdgeCases:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+class TestSegmentStream:
+    """Tests for segmenting a streamed word sequence."""
+
+    @staticmethod
+    def _stream(words):
+        return [
+            TranscriptWord(
+                word=w["word"],
+                type=w["type"],
+                confidence=1.0,
+                start_time=w.get("start_time"),
+                end_time=w.get("end_time"),
+                speaker=w.get("speaker"),
+            )
+            for w in words
+        ]
+
+    def test_matches_segment_transcript(self):
+        """Streamed segments match segment_transcript, including silent gaps."""
+        words = [
+            {"word": "One", "start_time": 0.0, "end_time": 0.5, "type": "pronunciation"},
+            {"word": ",", "type": "punctuation"},
+            {
+                "word": "two",
+                "start_time": 10.0,
+                "end_time": 10.5,
+                "speaker": "spk_1",
+                "type": "pronunciation",
+            },
+            {
+                "word": "three",
+                "start_time": 95.0,
+                "end_time": 95.5,
+                "speaker": "spk_0",
+                "type": "pronunciation",
+            },
+            {
+                "word": "four",
+                "start_time": 96.0,
+                "end_time": 121.0,
+                "speaker": "spk_0",
+                "type": "pronunciation",
+            },
+        ]
+
+        segmenter = MediaSegmenter(segment_duration=30)
+        segments, duration = segmenter.segment_stream(self._stream(words), fallback_duration=10)
+
+        assert duration == 121.0
+        assert segments == segmenter.segment_transcript(words, total_duration=121.0)
+        assert len(segments) == 5
+        assert segments[2]["text"] == ""
+        assert segments[3]["speaker"] == "spk_0"
+
+    def test_empty_stream_uses_fallback_duration(self):
+        """Without timed words, the fallback duration sets the segment count."""
+        segmenter = MediaSegmenter(segment_duration=30)
+        segments, duration = segmenter.segment_stream([], fallback_duration=75.0)
+
+        assert duration == 75.0
+        assert segments == segmenter.segment_transcript([], total_duration=75.0)
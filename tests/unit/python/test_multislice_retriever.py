@@ -4,6 +4,8 @@ Tests the MultiSliceRetriever class using mocked Bedrock Agent Runtime client.
 No actual AWS calls are made.
 """
 
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -13,9 +15,12 @@ from ragstack_common.multislice_retriever import (
     ADAPTIVE_BOOST_MARGIN,
     MultiSliceRetriever,
     SliceConfig,
+    SliceLatencyHistogram,
     compute_adaptive_boost,
     deduplicate_results,
+    get_slice_latency_histograms,
     merge_slices_with_guaranteed_minimum,
+    reset_slice_latency_histograms,
 )
 
 # Fixtures
@@ -267,6 +272,81 @@ def test_retrieve_handles_timeout(retriever, mock_bedrock_agent, sample_kb_resul
     assert isinstance(result, list)
 
 
+def test_retrieve_deadline_returns_finished_slices_without_joining(
+    mock_bedrock_agent, sample_kb_results, sample_filter
+):
+    """A slow filtered slice is abandoned; the unfiltered results still come back."""
+    release = threading.Event()
+
+    def retrieve(**kwargs):
+        if "filter" in kwargs["retrievalConfiguration"]["vectorSearchConfiguration"]:
+            release.wait(5)
+        return {"retrievalResults": sample_kb_results}
+
+    mock_bedrock_agent.retrieve.side_effect = retrieve
+    retriever = MultiSliceRetriever(bedrock_agent_client=mock_bedrock_agent, timeout_seconds=0.2)
+    reset_slice_latency_histograms()
+
+    try:
+        start = time.monotonic()
+        result = retriever.retrieve(
+            query="test query",
+            knowledge_base_id="kb-123",
+            data_source_id=None,
+            metadata_filter=sample_filter,
+            num_results=5,
+        )
+        elapsed = time.monotonic() - start
+    finally:
+        release.set()
+
+    assert elapsed < 2
+    assert [r["location"]["s3Location"]["uri"] for r in result] == [
+        r["location"]["s3Location"]["uri"] for r in sample_kb_results
+    ]
+    histograms = get_slice_latency_histograms()
+    assert histograms["filtered"]["timeout"] == 1
+    assert histograms["unfiltered"]["ok"] == 1
+
+
+def test_retrieve_skips_precomputed_slices(mock_bedrock_agent, sample_kb_results, sample_filter):
+    """Slices passed in precomputed_slices are merged without being re-run."""
+    mock_bedrock_agent.retrieve.return_value = {"retrievalResults": sample_kb_results[:1]}
+    retriever = MultiSliceRetriever(bedrock_agent_client=mock_bedrock_agent)
+
+    result = retriever.retrieve(
+        query="test query",
+        knowledge_base_id="kb-123",
+        data_source_id=None,
+        metadata_filter=sample_filter,
+        num_results=5,
+        precomputed_slices={"unfiltered": sample_kb_results[1:]},
+    )
+
+    mock_bedrock_agent.retrieve.assert_called_once()
+    vector_config = mock_bedrock_agent.retrieve.call_args.kwargs["retrievalConfiguration"]
+    assert "filter" in vector_config["vectorSearchConfiguration"]
+    assert len(result) == 3
+
+
+def test_slice_latency_histogram_buckets():
+    """Latencies land in the first bucket whose bound covers them."""
+    histogram = SliceLatencyHistogram(buckets_ms=(100, 1000))
+    histogram.record("unfiltered", 40)
+    histogram.record("unfiltered", 100)
+    histogram.record("unfiltered", 500, ok=False)
+    histogram.record("unfiltered", 5000)
+    histogram.record_timeout("filtered")
+
+    snapshot = histogram.snapshot()
+    assert snapshot["unfiltered"]["counts"] == [2, 1, 1]
+    assert snapshot["unfiltered"]["ok"] == 3
+    assert snapshot["unfiltered"]["error"] == 1
+    assert snapshot["unfiltered"]["max_ms"] == 5000
+    assert snapshot["unfiltered"]["mean_ms"] == pytest.approx(1410)
+    assert snapshot["filtered"]["timeout"] == 1
+
+
 # Test: Slice configurations
 
 
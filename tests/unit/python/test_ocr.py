@@ -1,6 +1,20 @@
+import time
+from unittest.mock import MagicMock, patch
+
 import fitz  # PyMuPDF
 
-from ragstack_common.ocr import OcrService
+from ragstack_common.models import Document, Status
+from ragstack_common.ocr import OcrService, extract_pdf_page_range
+
+
+def _make_pdf(num_pages: int) -> bytes:
+    pdf_doc = fitz.open()
+    for i in range(num_pages):
+        page = pdf_doc.new_page()
+        page.insert_text((100, 100), f"Page {i + 1}")
+    pdf_bytes = pdf_doc.tobytes()
+    pdf_doc.close()
+    return pdf_bytes
 
 
 def test_is_text_native_pdf():
@@ -38,6 +52,184 @@ def test_ocr_service_initialization():
     print("✓ OCR service initialization works")
 
 
+def test_extract_pdf_page_range_copies_requested_pages():
+    """Sub-PDF contains exactly the requested 1-indexed inclusive range."""
+    sub_pdf = extract_pdf_page_range(_make_pdf(10), 4, 6)
+
+    with fitz.open(stream=sub_pdf, filetype="pdf") as subset:
+        assert len(subset) == 3
+        assert "Page 4" in subset[0].get_text()
+        assert "Page 6" in subset[2].get_text()
+
+
+def test_extract_pdf_page_range_full_range_returns_none():
+    """No sub-PDF is built when the range already spans the whole document."""
+    assert extract_pdf_page_range(_make_pdf(3), 1, 3) is None
+
+
+def test_textract_batch_mode_sends_only_page_range():
+    """Batch mode runs Textract on a staged sub-PDF and maps pages back."""
+    ocr_service = OcrService(region="us-east-1", backend="textract")
+    textract = MagicMock()
+    textract.start_document_text_detection.return_value = {"JobId": "job-1"}
+    textract.get_document_text_detection.return_value = {
+        "JobStatus": "SUCCEEDED",
+        "Blocks": [
+            {"BlockType": "LINE", "Page": 1, "Text": "first", "Confidence": 90},
+            {"BlockType": "LINE", "Page": 2, "Text": "second", "Confidence": 80},
+        ],
+    }
+    ocr_service._textract_client = textract
+
+    document = Document(
+        document_id="doc-1",
+        filename="scan.pdf",
+        input_s3_uri="s3://bucket/input/doc-1/scan.pdf",
+        output_s3_uri="s3://bucket/content/doc-1/",
+        page_start=11,
+        page_end=13,
+    )
+
+    with (
+        patch("ragstack_common.ocr.write_s3_binary", side_effect=lambda uri, *_a, **_k: uri) as w,
+        patch("ragstack_common.ocr.delete_s3_object") as mock_delete,
+        patch("ragstack_common.ocr.write_s3_text"),
+    ):
+        result = ocr_service._process_with_textract(document, _make_pdf(20))
+
+    staged_uri = w.call_args.args[0]
+    assert staged_uri == "s3://bucket/working/ocr/doc-1/pages_011-013.pdf"
+    with fitz.open(stream=w.call_args.args[1], filetype="pdf") as subset:
+        assert len(subset) == 3
+
+    location = textract.start_document_text_detection.call_args.kwargs["DocumentLocation"]
+    assert location["S3Object"]["Name"] == "working/ocr/doc-1/pages_011-013.pdf"
+    mock_delete.assert_called_once_with(staged_uri)
+
+    assert result.status == Status.OCR_COMPLETE
+    assert [page.page_number for page in result.pages] == [11, 12, 13]
+    assert result.pages[0].text == "first"
+    assert result.pages[2].text == ""
+    assert result.pages_succeeded == 3
+
+
+def test_native_extraction_of_presliced_batch_keeps_original_numbering():
+    """A pre-sliced batch PDF is read through page_offset, not re-sliced."""
+    ocr_service = OcrService(region="us-east-1", backend="textract")
+    batch_pdf = extract_pdf_page_range(_make_pdf(30), 21, 30)
+
+    document = Document(
+        document_id="doc-1",
+        filename="report.pdf",
+        input_s3_uri="s3://bucket/working/batches/doc-1/pages_021-030.pdf",
+        output_s3_uri="s3://bucket/content/doc-1/",
+        page_start=21,
+        page_end=30,
+        page_offset=20,
+    )
+
+    with patch("ragstack_common.ocr.write_s3_text") as mock_write:
+        result = ocr_service._extract_text_native_pdf(document, batch_pdf)
+
+    assert [page.page_number for page in result.pages] == list(range(21, 31))
+    assert "Page 21" in result.pages[0].text
+    assert "Page 30" in result.pages[-1].text
+    assert result.pages_succeeded == 10
+    assert mock_write.call_args.args[0] == "s3://bucket/content/doc-1/pages_021-030.txt"
+
+
+def test_textract_presliced_batch_skips_staging():
+    """Textract reads a pre-sliced batch directly and maps pages by page_offset."""
+    ocr_service = OcrService(region="us-east-1", backend="textract")
+    textract = MagicMock()
+    textract.start_document_text_detection.return_value = {"JobId": "job-1"}
+    textract.get_document_text_detection.return_value = {
+        "JobStatus": "SUCCEEDED",
+        "Blocks": [{"BlockType": "LINE", "Page": 2, "Text": "second", "Confidence": 80}],
+    }
+    ocr_service._textract_client = textract
+
+    document = Document(
+        document_id="doc-1",
+        filename="scan.pdf",
+        input_s3_uri="s3://bucket/working/batches/doc-1/pages_011-013.pdf",
+        output_s3_uri="s3://bucket/content/doc-1/",
+        page_start=11,
+        page_end=13,
+        page_offset=10,
+    )
+
+    with (
+        patch("ragstack_common.ocr.write_s3_binary") as mock_stage,
+        patch("ragstack_common.ocr.write_s3_text"),
+    ):
+        result = ocr_service._process_with_textract(document, _make_pdf(3))
+
+    mock_stage.assert_not_called()
+    location = textract.start_document_text_detection.call_args.kwargs["DocumentLocation"]
+    assert location["S3Object"]["Name"] == "working/batches/doc-1/pages_011-013.pdf"
+    assert [page.page_number for page in result.pages] == [11, 12, 13]
+    assert result.pages[1].text == "second"
+
+
+def _fake_bedrock(fail_pages=()):
+    """Bedrock client whose responses finish out of order and fail on request."""
+    bedrock = MagicMock()
+
+    def invoke_model(content, **_kwargs):
+        page = int(content[0]["marker"])
+        time.sleep(0.01 * (5 - page % 5))
+        if page in fail_pages:
+            raise RuntimeError("boom")
+        return {"text": f"text {page}"}
+
+    bedrock.invoke_model.side_effect = invoke_model
+    bedrock.extract_text_from_response.side_effect = lambda response: response["text"]
+    return bedrock
+
+
+def _process_with_fake_bedrock(ocr_service, bedrock, pdf_bytes, **kwargs):
+    """Run Bedrock PDF OCR with each rendered "image" tagged by its page number."""
+    ocr_service._bedrock_client = bedrock
+    with (
+        patch.object(
+            ocr_service, "_render_page_to_image", side_effect=lambda pdf_page: pdf_page.number + 1
+        ),
+        patch(
+            "ragstack_common.ocr.prepare_bedrock_image_attachment",
+            side_effect=lambda img: {"marker": str(img)},
+        ),
+    ):
+        return ocr_service._process_pdf_with_bedrock(pdf_bytes, **kwargs)
+
+
+def test_bedrock_concurrent_pages_reassembled_in_order():
+    """Concurrent Bedrock OCR returns pages and text parts in page order."""
+    ocr_service = OcrService(region="us-east-1", backend="bedrock", max_workers=4)
+    pages, text_parts, succeeded, failed = _process_with_fake_bedrock(
+        ocr_service, _fake_bedrock(), _make_pdf(10), page_start=3, page_end=8
+    )
+
+    assert [page.page_number for page in pages] == [3, 4, 5, 6, 7, 8]
+    assert [page.text for page in pages] == [f"text {n}" for n in range(3, 9)]
+    assert text_parts[0] == "--- Page 3 ---\ntext 3"
+    assert (succeeded, failed) == (6, 0)
+
+
+def test_bedrock_concurrent_failures_keep_placeholders():
+    """Failed pages keep their placeholder and are counted, in any worker mode."""
+    for workers in (1, 4):
+        ocr_service = OcrService(region="us-east-1", backend="bedrock", max_workers=workers)
+        pages, _, succeeded, failed = _process_with_fake_bedrock(
+            ocr_service, _fake_bedrock(fail_pages={2, 4}), _make_pdf(5)
+        )
+
+        assert [page.page_number for page in pages] == [1, 2, 3, 4, 5]
+        assert pages[1].text == "[Page 2 could not be extracted: RuntimeError]"
+        assert pages[2].text == "text 3"
+        assert (succeeded, failed) == (3, 2)
+
+
 if __name__ == "__main__":
     test_is_text_native_pdf()
     test_ocr_service_initialization()
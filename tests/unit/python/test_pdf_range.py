@@ -0,0 +1,129 @@
+"""Unit tests for range-read PDF inspection."""
+
+import io
+import os
+
+import fitz  # PyMuPDF
+import pytest
+
+from ragstack_common import pdf_range
+from ragstack_common.pdf_range import PdfRangeReadError, open_pdf_head
+
+
+class FakeS3:
+    """S3 client serving one object, recording the ranges requested."""
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self.ranges: list[tuple[int, int]] = []
+
+    def head_object(self, Bucket, Key):
+        return {"ContentLength": len(self.data)}
+
+    def get_object(self, Bucket, Key, Range):
+        start, end = (int(n) for n in Range.removeprefix("bytes=").split("-"))
+        self.ranges.append((start, end))
+        return {"Body": io.BytesIO(self.data[start : end + 1])}
+
+    @property
+    def bytes_read(self) -> int:
+        return sum(end + 1 - start for start, end in self.ranges)
+
+
+@pytest.fixture(autouse=True)
+def small_blocks(monkeypatch):
+    """Use small range blocks so test PDFs are not fetched whole."""
+    monkeypatch.setattr(pdf_range, "RANGE_BLOCK_SIZE", 2048)
+
+
+def _text_pdf(num_pages: int, **save_options) -> bytes:
+    pdf_doc = fitz.open()
+    for i in range(num_pages):
+        page = pdf_doc.new_page()
+        page.insert_text((72, 72), f"Page {i + 1} " + "lorem ipsum dolor sit amet " * 5)
+    pdf_doc.set_toc([[1, f"Chapter {i + 1}", i + 1] for i in range(min(num_pages, 3))])
+    pdf_bytes = pdf_doc.tobytes(**save_options)
+    pdf_doc.close()
+    return pdf_bytes
+
+
+def _scanned_pdf(num_pages: int) -> bytes:
+    pdf_doc = fitz.open()
+    for _ in range(num_pages):
+        page = pdf_doc.new_page()
+        scan = fitz.Pixmap(fitz.csGRAY, 300, 400, os.urandom(300 * 400), False)
+        page.insert_image(page.rect, pixmap=scan)
+    pdf_bytes = pdf_doc.tobytes()
+    pdf_doc.close()
+    return pdf_bytes
+
+
+@pytest.mark.parametrize(
+    "save_options",
+    [{}, {"garbage": 4, "deflate": True}, {"garbage": 3, "deflate": True, "use_objstms": 1}],
+    ids=["xref-table", "compressed", "object-streams"],
+)
+def test_counts_pages_and_reads_first_pages(save_options):
+    data = _text_pdf(120, **save_options)
+    s3 = FakeS3(data)
+
+    with open_pdf_head(s3, "bucket", "doc.pdf", max_pages=3) as head:
+        assert head.total_pages == 120
+        assert len(head.document) == 3
+        texts = [head.document[i].get_text() for i in range(3)]
+
+    assert [t.split()[:2] for t in texts] == [["Page", "1"], ["Page", "2"], ["Page", "3"]]
+    assert s3.bytes_read < len(data)
+
+
+def test_skips_image_data():
+    data = _scanned_pdf(20)
+    s3 = FakeS3(data)
+
+    with open_pdf_head(s3, "bucket", "scan.pdf") as head:
+        assert head.total_pages == 20
+        assert all(not head.document[i].get_text().strip() for i in range(3))
+
+    assert s3.bytes_read < len(data) // 10
+
+
+def test_short_document_has_fewer_pages():
+    s3 = FakeS3(_text_pdf(2))
+
+    with open_pdf_head(s3, "bucket", "doc.pdf", max_pages=3) as head:
+        assert head.total_pages == 2
+        assert len(head.document) == 2
+
+
+def test_incremental_update_uses_latest_objects(tmp_path):
+    path = tmp_path / "doc.pdf"
+    path.write_bytes(_text_pdf(30))
+    with fitz.open(path) as pdf_doc:
+        pdf_doc[0].insert_text((72, 300), "Revised")
+        pdf_doc.saveIncr()
+
+    with open_pdf_head(FakeS3(path.read_bytes()), "bucket", "doc.pdf") as head:
+        assert head.total_pages == 30
+        assert "Revised" in head.document[0].get_text()
+
+
+def test_missing_trailer_raises():
+    data = _text_pdf(5)
+    with pytest.raises(PdfRangeReadError), open_pdf_head(FakeS3(data[:-400]), "b", "doc.pdf"):
+        pass
+
+
+def test_range_budget_raises(monkeypatch):
+    monkeypatch.setattr(pdf_range, "MAX_RANGE_READ_BYTES", 4096)
+    with pytest.raises(PdfRangeReadError), open_pdf_head(FakeS3(_text_pdf(50)), "b", "doc.pdf"):
+        pass
+
+
+def test_encrypted_pdf_raises():
+    pdf_doc = fitz.open()
+    pdf_doc.new_page().insert_text((72, 72), "secret")
+    data = pdf_doc.tobytes(encryption=fitz.PDF_ENCRYPT_AES_256, owner_pw="o", user_pw="u")
+    pdf_doc.close()
+
+    with pytest.raises(PdfRangeReadError), open_pdf_head(FakeS3(data), "b", "doc.pdf"):
+        pass
@@ -1,6 +1,7 @@
 """Unit tests for ProcessMedia Lambda."""
 
 import importlib.util
+import io
 import json
 import os
 import sys
@@ -156,29 +157,29 @@ class TestProcessMediaFlow:
             "status": "COMPLETED",
             "transcript_uri": "s3://bucket/transcripts/job-123.json",
         }
-        mock_transcribe.parse_transcript_with_timestamps.return_value = [
-            {"word": "Hello", "start_time": 0.0, "end_time": 0.5, "type": "pronunciation"},
-            {"word": "world", "start_time": 0.5, "end_time": 1.0, "type": "pronunciation"},
-        ]
+        mock_transcribe.get_full_transcript.return_value = "Hello world"
         mock_transcribe_class.return_value = mock_transcribe
 
         mock_segmenter = MagicMock()
-        mock_segmenter.segment_transcript.return_value = [
-            {
-                "segment_index": 0,
-                "timestamp_start": 0,
-                "timestamp_end": 30,
-                "text": "Hello world",
-                "word_count": 2,
-            }
-        ]
+        mock_segmenter.segment_stream.return_value = (
+            [
+                {
+                    "segment_index": 0,
+                    "timestamp_start": 0,
+                    "timestamp_end": 30,
+                    "text": "Hello world",
+                    "word_count": 2,
+                }
+            ],
+            1.0,
+        )
         mock_segmenter_class.return_value = mock_segmenter
 
         # Mock S3 client
         mock_s3 = MagicMock()
         mock_s3.head_object.return_value = {"ContentLength": 1000000}
         mock_s3.get_object.return_value = {
-            "Body": MagicMock(read=lambda: json.dumps(sample_transcript_json).encode())
+            "Body": io.BytesIO(json.dumps(sample_transcript_json).encode())
         }
         mock_boto3_client.return_value = mock_s3
 
@@ -273,5 +274,187 @@ class TestProcessMediaErrorHandling:
         mock_table.update_item.assert_called()
 
 
+@pytest.fixture
+def staged_module(sample_transcript_json):
+    """ProcessMedia module with mocked clients, in event completion mode."""
+    with patch("boto3.client"), patch("boto3.resource"):
+        module = load_process_media_module()
+        parser = module.TranscribeClient()
+
+    mock_config = MagicMock()
+    mock_config.get_parameter.side_effect = lambda key, default=None: {
+        "transcribe_language_code": "en-US",
+        "speaker_diarization_enabled": True,
+        "media_segment_duration_seconds": 30,
+    }.get(key, default)
+
+    mock_transcribe = MagicMock()
+    mock_transcribe.start_transcription_job.return_value = "ragstack-doc-123-abcd1234"
+    mock_transcribe.iter_transcript_words.side_effect = parser.iter_transcript_words
+    mock_transcribe.get_full_transcript.side_effect = parser.get_full_transcript
+
+    mock_s3 = MagicMock()
+    mock_s3.head_object.return_value = {"ContentLength": 1000000}
+    mock_s3.get_object.return_value = {
+        "Body": io.BytesIO(json.dumps(sample_transcript_json).encode())
+    }
+    mock_table = MagicMock()
+    mock_dynamodb = MagicMock()
+    mock_dynamodb.Table.return_value = mock_table
+
+    with (
+        patch.dict(os.environ, {"TRANSCRIBE_COMPLETION_MODE": "event"}),
+        patch.object(module, "s3_client", mock_s3),
+        patch.object(module, "dynamodb", mock_dynamodb),
+        patch.object(module, "sfn_client", MagicMock()) as mock_sfn,
+        patch.object(module, "lambda_client", MagicMock()) as mock_lambda,
+        patch.object(module, "TranscribeClient", return_value=mock_transcribe),
+        patch.object(module, "ConfigurationManager", return_value=mock_config),
+        patch.object(module, "publish_document_update"),
+    ):
+        yield {
+            "module": module,
+            "transcribe": mock_transcribe,
+            "s3": mock_s3,
+            "table": mock_table,
+            "sfn": mock_sfn,
+            "lambda": mock_lambda,
+        }
+
+
+def _transcribe_event(job_name="ragstack-doc-123-abcd1234", status="COMPLETED"):
+    return {
+        "source": "aws.transcribe",
+        "detail-type": "Transcribe Job State Change",
+        "detail": {"TranscriptionJobName": job_name, "TranscriptionJobStatus": status},
+    }
+
+
+class TestProcessMediaStages:
+    """Tests for the event-driven start and completion stages."""
+
+    def test_start_stage_returns_without_waiting(self, staged_module, sample_event):
+        """Start stage tags the job and stores its context instead of polling."""
+        event = {**sample_event, "task_token": "token-1"}
+
+        result = staged_module["module"].lambda_handler(event, None)
+
+        assert result == {
+            "document_id": "doc-123",
+            "status": "transcribing",
+            "transcribe_job_id": "ragstack-doc-123-abcd1234",
+        }
+        transcribe = staged_module["transcribe"]
+        transcribe.wait_for_completion.assert_not_called()
+        assert transcribe.start_transcription_job.call_args[1]["tags"] == {
+            "ragstack_document_id": "doc-123"
+        }
+        values = staged_module["table"].update_item.call_args[1]["ExpressionAttributeValues"]
+        assert values[":job_id"] == "ragstack-doc-123-abcd1234"
+        assert values[":context"]["task_token"] == "token-1"
+        assert values[":context"]["trigger"] == "step_functions"
+
+    def _pending_item(self, **context):
+        return {
+            "Item": {
+                "document_id": "doc-123",
+                "status": "transcribing",
+                "transcribe_job_id": "ragstack-doc-123-abcd1234",
+                "transcribe_context": {
+                    "input_s3_uri": "s3://input-bucket/uploads/video.mp4",
+                    "output_s3_prefix": "s3://output-bucket/content/doc-123/",
+                    "detected_type": "video",
+                    "filename": "video.mp4",
+                    "language_code": "en-US",
+                    "segment_duration": 30,
+                    "estimated_duration": 30,
+                    **context,
+                },
+            }
+        }
+
+    def test_completion_event_sends_task_success(self, staged_module):
+        """Completion stage writes segments and returns the result to Step Functions."""
+        staged_module["transcribe"].describe_job.return_value = {
+            "status": "COMPLETED",
+            "transcript_uri": "s3://output-bucket/transcripts/doc-123/job.json",
+            "failure_reason": None,
+            "tags": {"ragstack_document_id": "doc-123"},
+        }
+        staged_module["table"].get_item.return_value = self._pending_item(
+            trigger="step_functions", task_token="token-1"
+        )
+
+        result = staged_module["module"].lambda_handler(_transcribe_event(), None)
+
+        assert result["status"] == "transcribed"
+        assert result["total_segments"] == 1
+        assert result["transcript_segments"][0]["text"] == "Hello world this is a test"
+        assert result["duration_seconds"] == 2
+        full_transcript = staged_module["s3"].put_object.call_args_list[0][1]
+        assert full_transcript["Body"] == b"Hello world this is a test"
+        staged_module["sfn"].send_task_success.assert_called_once()
+        sent = staged_module["sfn"].send_task_success.call_args[1]
+        assert sent["taskToken"] == "token-1"
+        assert json.loads(sent["output"]) == result
+        staged_module["lambda"].invoke.assert_not_called()
+
+    def test_completion_event_invokes_ingest_for_eventbridge_uploads(self, staged_module):
+        """Direct uploads hand off to IngestMedia when transcription completes."""
+        staged_module["transcribe"].describe_job.return_value = {
+            "status": "COMPLETED",
+            "transcript_uri": "s3://output-bucket/transcripts/doc-123/job.json",
+            "failure_reason": None,
+            "tags": {"ragstack_document_id": "doc-123"},
+        }
+        staged_module["table"].get_item.return_value = self._pending_item(trigger="eventbridge")
+
+        with patch.dict(os.environ, {"INGEST_MEDIA_FUNCTION_ARN": "arn:ingest"}):
+            staged_module["module"].lambda_handler(_transcribe_event(), None)
+
+        staged_module["lambda"].invoke.assert_called_once()
+        staged_module["sfn"].send_task_success.assert_not_called()
+
+    def test_completion_event_for_superseded_job_is_skipped(self, staged_module):
+        """Events for a job that is no longer the document's current job are ignored."""
+        staged_module["transcribe"].describe_job.return_value = {
+            "status": "COMPLETED",
+            "transcript_uri": "s3://output-bucket/transcripts/doc-123/old.json",
+            "failure_reason": None,
+            "tags": {"ragstack_document_id": "doc-123"},
+        }
+        staged_module["table"].get_item.return_value = self._pending_item(trigger="eventbridge")
+
+        result = staged_module["module"].lambda_handler(
+            _transcribe_event(job_name="ragstack-doc-123-00000000"), None
+        )
+
+        assert result["status"] == "skipped"
+        staged_module["s3"].get_object.assert_not_called()
+
+    def test_failed_job_sends_task_failure(self, staged_module):
+        """A failed transcription marks the document failed and fails the waiting task."""
+        from ragstack_common.exceptions import TranscriptionError
+
+        staged_module["transcribe"].describe_job.return_value = {
+            "status": "FAILED",
+            "transcript_uri": None,
+            "failure_reason": "Unsupported media format",
+            "tags": {"ragstack_document_id": "doc-123"},
+        }
+        staged_module["table"].get_item.return_value = self._pending_item(
+            trigger="step_functions", task_token="token-1"
+        )
+
+        with pytest.raises(TranscriptionError, match="Unsupported media format"):
+            staged_module["module"].lambda_handler(_transcribe_event(status="FAILED"), None)
+
+        failure = staged_module["sfn"].send_task_failure.call_args[1]
+        assert failure["taskToken"] == "token-1"
+        assert failure["error"] == "TranscriptionError"
+        values = staged_module["table"].update_item.call_args[1]["ExpressionAttributeValues"]
+        assert values[":status"] == "failed"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
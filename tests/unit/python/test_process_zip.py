@@ -49,6 +49,8 @@ def mock_boto3():
         mock_dynamodb = MagicMock()
         mock_table = MagicMock()
         mock_dynamodb.Table.return_value = mock_table
+        # Route batch_writer() puts to the table mock
+        mock_table.batch_writer.return_value.__enter__.return_value = mock_table
 
         def client_factory(service_name, *args, **kwargs):
             if service_name == "s3":
@@ -245,6 +247,67 @@ class TestProcessZip:
         assert item["user_caption"] == "User provided caption"
         assert item["ai_caption"] == "AI description"
 
+    def test_process_zip_reports_failures_in_archive_order(
+        self, mock_env, mock_boto3, mock_publish, monkeypatch
+    ):
+        """Per-image upload failures are reported in archive order with the pool enabled."""
+        monkeypatch.setenv("ZIP_MAX_WORKERS", "4")
+        module = _load_process_zip_module()
+
+        names = [f"img{i:02d}.png" for i in range(8)]
+        zip_content = create_test_zip({name: b"\x89PNG" + name.encode() for name in names})
+        mock_boto3["s3"].get_object.return_value = {"Body": io.BytesIO(zip_content)}
+
+        def put_object(**kwargs):
+            if kwargs["Key"].endswith(("img02.png", "img05.png")):
+                raise RuntimeError("upload failed")
+
+        mock_boto3["s3"].put_object.side_effect = put_object
+
+        result = module.lambda_handler({"upload_id": "u", "bucket": "b", "key": "k"}, None)
+
+        assert result["status"] == "COMPLETED_WITH_ERRORS"
+        assert result["processed_images"] == 6
+        assert result["failed_images"] == 2
+        assert result["errors"] == [
+            "Failed to process img02.png: upload failed",
+            "Failed to process img05.png: upload failed",
+        ]
+        written = [c[1]["Item"]["filename"] for c in mock_boto3["table"].put_item.call_args_list]
+        assert written == [n for n in names if n not in ("img02.png", "img05.png")]
+
+    def test_process_zip_batches_tracking_writes(self, mock_env, mock_boto3, mock_publish):
+        """Tracking records are written in BatchWriteItem-sized chunks."""
+        module = _load_process_zip_module()
+
+        zip_content = create_test_zip({f"img{i:02d}.png": b"\x89PNG" for i in range(30)})
+        mock_boto3["s3"].get_object.return_value = {"Body": io.BytesIO(zip_content)}
+
+        result = module.lambda_handler({"upload_id": "u", "bucket": "b", "key": "k"}, None)
+
+        assert result["processed_images"] == 30
+        assert mock_boto3["table"].batch_writer.call_count == 2
+        assert mock_boto3["table"].put_item.call_count == 30
+
+    def test_process_zip_batch_write_failure_fails_chunk(self, mock_env, mock_boto3, mock_publish):
+        """A failed tracking batch marks each of its images as failed."""
+        module = _load_process_zip_module()
+
+        zip_content = create_test_zip({"a.png": b"\x89PNG", "b.png": b"\x89PNG"})
+        mock_boto3["s3"].get_object.return_value = {"Body": io.BytesIO(zip_content)}
+        mock_boto3["table"].batch_writer.return_value.__exit__.side_effect = RuntimeError(
+            "throttled"
+        )
+
+        result = module.lambda_handler({"upload_id": "u", "bucket": "b", "key": "k"}, None)
+
+        assert result["status"] == "COMPLETED_WITH_ERRORS"
+        assert result["processed_images"] == 0
+        assert result["errors"] == [
+            "Failed to process a.png: throttled",
+            "Failed to process b.png: throttled",
+        ]
+
     def test_process_zip_skips_non_image_files(self, mock_env, mock_boto3, mock_publish):
         """Test that non-image files are skipped."""
         module = _load_process_zip_module()
@@ -0,0 +1,196 @@
+"""Unit tests for the query-result cache.
+
+Uses a mocked boto3 DynamoDB resource backed by an in-memory dict.
+No actual AWS calls are made.
+"""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from ragstack_common import query_cache as query_cache_module
+from ragstack_common.query_cache import (
+    CONTENT_VERSION_KEY,
+    QueryResultCache,
+    bump_kb_content_version,
+    normalize_query,
+)
+
+
+class FakeTable:
+    """Minimal in-memory stand-in for a DynamoDB Table resource."""
+
+    def __init__(self):
+        self.items = {}
+
+    def get_item(self, Key, **kwargs):
+        item = self.items.get(Key["cache_key"])
+        return {"Item": dict(item)} if item else {}
+
+    def put_item(self, Item):
+        self.items[Item["cache_key"]] = dict(Item)
+
+    def update_item(self, Key, **kwargs):
+        item = self.items.setdefault(Key["cache_key"], {"cache_key": Key["cache_key"]})
+        item["content_version"] = item.get("content_version", 0) + 1
+
+
+@pytest.fixture
+def table():
+    return FakeTable()
+
+
+@pytest.fixture
+def mock_dynamodb(table):
+    resource = MagicMock()
+    resource.Table.return_value = table
+    with patch.object(query_cache_module, "_dynamodb", resource):
+        yield resource
+
+
+@pytest.fixture
+def cache(mock_dynamodb):
+    return QueryResultCache(table_name="query-cache", ttl_seconds=3600, version_ttl_seconds=0)
+
+
+class TestNormalizeQuery:
+    def test_collapses_case_whitespace_and_trailing_punctuation(self):
+        assert normalize_query("  What   is\tRAGStack?? ") == "what is ragstack"
+
+    def test_keeps_inner_punctuation(self):
+        assert normalize_query("U.S. history.") == "u.s. history"
+
+
+class TestFilterCache:
+    def test_miss_then_hit(self, cache):
+        assert cache.get_filter("kb-1", "genealogy records", "auto") == (False, None)
+
+        cache.put_filter("kb-1", "genealogy records", "auto", {"topic": {"$eq": "genealogy"}})
+
+        assert cache.get_filter("kb-1", "Genealogy  records?", "auto") == (
+            True,
+            {"topic": {"$eq": "genealogy"}},
+        )
+
+    def test_no_filter_is_cached_as_hit(self, cache):
+        cache.put_filter("kb-1", "hello", "auto", None)
+
+        assert cache.get_filter("kb-1", "hello", "auto") == (True, None)
+
+    def test_keys_are_scoped_by_kb_and_variant(self, cache):
+        cache.put_filter("kb-1", "hello", "auto", {"a": 1})
+
+        assert cache.get_filter("kb-2", "hello", "auto") == (False, None)
+        assert cache.get_filter("kb-1", "hello", "manual") == (False, None)
+
+
+class TestResultsCache:
+    def test_roundtrip_keyed_on_filter(self, cache, table):
+        results = [{"content": {"text": "x" * 1000}, "score": 0.5}]
+        cache.put_results("kb-1", "q", {"a": 1}, "n=5", results)
+
+        assert cache.get_results("kb-1", "q", {"a": 1}, "n=5") == results
+        assert cache.get_results("kb-1", "q", {"a": 2}, "n=5") is None
+        assert cache.get_results("kb-1", "q", {"a": 1}, "n=10") is None
+        # Stored compressed
+        (item,) = table.items.values()
+        assert len(item["payload"]) < 1000
+
+    def test_empty_results_not_cached(self, cache, table):
+        cache.put_results("kb-1", "q", None, "", [])
+
+        assert table.items == {}
+
+    def test_oversized_payload_skipped(self, cache, table):
+        results = [{"content": {"text": str(i) * 10}} for i in range(1000)]
+        with patch.object(query_cache_module, "MAX_PAYLOAD_BYTES", 100):
+            cache.put_results("kb-1", "q", None, "", results)
+
+        assert table.items == {}
+
+    def test_expired_entry_is_miss(self, cache, table):
+        cache.put_results("kb-1", "q", None, "", [{"a": 1}])
+        for item in table.items.values():
+            item["ttl"] = int(time.time()) - 1
+
+        assert cache.get_results("kb-1", "q", None, "") is None
+
+
+class TestInvalidation:
+    def test_version_bump_invalidates_entries(self, cache, mock_dynamodb):
+        cache.put_results("kb-1", "q", None, "", [{"a": 1}])
+        assert cache.get_results("kb-1", "q", None, "") == [{"a": 1}]
+
+        bump_kb_content_version("query-cache")
+
+        assert cache.get_results("kb-1", "q", None, "") is None
+
+    def test_bump_between_get_and_put_does_not_serve_stale_results(self, cache):
+        version = cache.content_version()
+        assert cache.get_results("kb-1", "q", None, "", version=version) is None
+
+        # Ingestion lands while the retrieve for the miss is running
+        bump_kb_content_version("query-cache")
+        cache.put_results("kb-1", "q", None, "", [{"stale": True}], version=version)
+
+        assert cache.get_results("kb-1", "q", None, "", version=cache.content_version()) is None
+        assert cache.get_results("kb-1", "q", None, "", version=version) == [{"stale": True}]
+
+    def test_content_version_read_failure_returns_none(self, cache, table):
+        table.get_item = MagicMock(
+            side_effect=ClientError({"Error": {"Code": "ThrottlingException"}}, "GetItem")
+        )
+
+        assert cache.content_version() is None
+
+    def test_version_reused_within_ttl(self, mock_dynamodb, table):
+        cache = QueryResultCache(table_name="query-cache", ttl_seconds=60, version_ttl_seconds=60)
+        table.get_item = MagicMock(wraps=table.get_item)
+
+        cache.get_filter("kb-1", "a")
+        cache.get_filter("kb-1", "b")
+
+        version_reads = [
+            c
+            for c in table.get_item.call_args_list
+            if c.kwargs["Key"]["cache_key"] == CONTENT_VERSION_KEY
+        ]
+        assert len(version_reads) == 1
+
+    def test_bump_without_table_is_noop(self, mock_dynamodb):
+        bump_kb_content_version(None)
+
+        mock_dynamodb.Table.assert_not_called()
+
+    def test_bump_swallows_client_errors(self, mock_dynamodb):
+        mock_dynamodb.Table.return_value.update_item = MagicMock(
+            side_effect=ClientError({"Error": {"Code": "ResourceNotFoundException"}}, "UpdateItem")
+        )
+
+        bump_kb_content_version("query-cache")
+
+
+class TestStats:
+    def test_hit_rate(self, cache):
+        cache.put_filter("kb-1", "q", "", None)
+        cache.get_filter("kb-1", "q")
+        cache.get_filter("kb-1", "other")
+        cache.get_results("kb-1", "q", None)
+
+        stats = cache.get_stats()
+
+        assert stats["filter_hits"] == 1
+        assert stats["filter_misses"] == 1
+        assert stats["filter_hit_rate"] == 0.5
+        assert stats["result_misses"] == 1
+        assert stats["result_hit_rate"] == 0.0
+
+    def test_client_error_counts_as_miss(self, cache, table):
+        table.get_item = MagicMock(
+            side_effect=ClientError({"Error": {"Code": "ThrottlingException"}}, "GetItem")
+        )
+
+        assert cache.get_filter("kb-1", "q") == (False, None)
+        assert cache.get_stats()["filter_misses"] == 1
@@ -506,5 +506,275 @@ class TestKBRetrievalErrorHandling:
             assert result["answer"] == ""
 
 
+class TestPreRetrievalPipeline:
+    """Tests for the concurrent pre-retrieval stages in lambda_handler."""
+
+    @pytest.fixture(autouse=True)
+    def _mock_boto3(self):
+        """Mock boto3 clients to avoid AWS initialization."""
+        mock_boto3 = MagicMock()
+        mock_dynamodb = MagicMock()
+        mock_conditions = MagicMock()
+        mock_boto3.dynamodb = mock_dynamodb
+        mock_boto3.dynamodb.conditions = mock_conditions
+
+        with patch.dict(
+            "sys.modules",
+            {
+                "boto3": mock_boto3,
+                "boto3.dynamodb": mock_dynamodb,
+                "boto3.dynamodb.conditions": mock_conditions,
+            },
+        ):
+            mock_config = MagicMock()
+            mock_config.get_parameter.return_value = False
+            with patch("ragstack_common.config.ConfigurationManager", return_value=mock_config):
+                yield
+
+    def _run_until_retrieval(self, config, generated_filter, query_cache=None):
+        """Run lambda_handler and capture the results handed on after retrieval."""
+        import importlib
+
+        import handler
+
+        importlib.reload(handler)
+
+        captured = {}
+
+        def stop_after_retrieval(_query, results, _table):
+            captured["results"] = results
+            raise RuntimeError("stop")
+
+        unfiltered = [{"location": {"s3Location": {"uri": "s3://b/content/doc-1/a.txt"}}}]
+        filter_generator = MagicMock()
+        filter_generator.generate_filter.return_value = generated_filter
+        retriever = MagicMock()
+        retriever.retrieve.return_value = [{"merged": True}]
+
+        with (
+            patch.object(handler, "check_public_access", return_value=(True, None)),
+            patch.object(handler, "get_knowledge_base_config", return_value=("kb-123", "ds-456")),
+            patch.object(handler, "get_config_manager") as mock_cfg,
+            patch.object(handler, "atomic_quota_check_and_increment", return_value="model-id"),
+            patch.object(handler, "build_retrieval_query", return_value="test query"),
+            patch.object(
+                handler, "_get_filter_components", return_value=(None, filter_generator, retriever)
+            ),
+            patch.object(handler, "_get_filter_examples", return_value=[]),
+            patch.object(handler, "_augment_with_id_lookup", side_effect=stop_after_retrieval),
+            patch.object(handler, "bedrock_agent") as mock_bedrock_agent,
+            patch.object(handler, "get_query_cache", return_value=query_cache),
+        ):
+            mock_cfg.return_value.get_parameter.side_effect = lambda key, default=None: config.get(
+                key, default
+            )
+            mock_bedrock_agent.retrieve.return_value = {"retrievalResults": unfiltered}
+
+            handler.lambda_handler({"arguments": {"query": "test question"}}, MagicMock())
+
+        return captured["results"], unfiltered, mock_bedrock_agent, retriever, filter_generator
+
+    def test_no_filter_uses_speculative_unfiltered_retrieve(self):
+        config = {"filter_generation_enabled": True, "multislice_enabled": True}
+        results, unfiltered, agent, retriever, _ = self._run_until_retrieval(config, None)
+
+        assert results == unfiltered
+        agent.retrieve.assert_called_once()
+        vector_config = agent.retrieve.call_args.kwargs["retrievalConfiguration"]
+        assert "filter" not in vector_config["vectorSearchConfiguration"]
+        retriever.retrieve.assert_not_called()
+
+    def test_filter_merges_speculative_slice_via_multislice(self):
+        config = {"filter_generation_enabled": True, "multislice_enabled": True}
+        generated_filter = {"topic": {"$eq": "genealogy"}}
+        results, unfiltered, agent, retriever, _ = self._run_until_retrieval(
+            config, generated_filter
+        )
+
+        assert results == [{"merged": True}]
+        agent.retrieve.assert_called_once()
+        kwargs = retriever.retrieve.call_args.kwargs
+        assert kwargs["metadata_filter"] == generated_filter
+        assert kwargs["precomputed_slices"] == {"unfiltered": unfiltered}
+
+    def test_multislice_disabled_skips_speculative_retrieve(self):
+        config = {"filter_generation_enabled": True, "multislice_enabled": False}
+        generated_filter = {"topic": {"$eq": "genealogy"}}
+        _, _, agent, retriever, _ = self._run_until_retrieval(config, generated_filter)
+
+        agent.retrieve.assert_called_once()
+        vector_config = agent.retrieve.call_args.kwargs["retrievalConfiguration"]
+        assert vector_config["vectorSearchConfiguration"]["filter"] == generated_filter
+        retriever.retrieve.assert_not_called()
+
+    def test_multislice_disabled_no_filter_retrieves_unfiltered(self):
+        config = {"filter_generation_enabled": True, "multislice_enabled": False}
+        results, unfiltered, agent, _, _ = self._run_until_retrieval(config, None)
+
+        assert results == unfiltered
+        agent.retrieve.assert_called_once()
+        vector_config = agent.retrieve.call_args.kwargs["retrievalConfiguration"]
+        assert "filter" not in vector_config["vectorSearchConfiguration"]
+
+    def test_query_cache_hit_skips_filter_generation_and_retrieval(self):
+        config = {"filter_generation_enabled": True, "multislice_enabled": True}
+        cached_filter = {"topic": {"$eq": "genealogy"}}
+        query_cache = MagicMock()
+        query_cache.get_filter.return_value = (True, cached_filter)
+        query_cache.get_results.return_value = [{"cached": True}]
+
+        results, _, agent, retriever, filter_generator = self._run_until_retrieval(
+            config, None, query_cache=query_cache
+        )
+
+        assert results == [{"cached": True}]
+        filter_generator.generate_filter.assert_not_called()
+        agent.retrieve.assert_not_called()
+        retriever.retrieve.assert_not_called()
+        assert query_cache.get_results.call_args.args[2] == cached_filter
+        query_cache.put_results.assert_not_called()
+
+    def test_query_cache_miss_stores_filter_and_results(self):
+        config = {"filter_generation_enabled": True, "multislice_enabled": True}
+        generated_filter = {"topic": {"$eq": "genealogy"}}
+        query_cache = MagicMock()
+        query_cache.get_filter.return_value = (False, None)
+        query_cache.content_version.return_value = 7
+
+        results, _, _, _, _ = self._run_until_retrieval(
+            config, generated_filter, query_cache=query_cache
+        )
+
+        query_cache.get_results.assert_not_called()
+        assert query_cache.put_filter.call_args.args[3] == generated_filter
+        put_args = query_cache.put_results.call_args.args
+        assert put_args[2] == generated_filter
+        assert put_args[4] == results
+        # Writes use the version read before the lookup, never a re-read
+        query_cache.content_version.assert_called_once()
+        assert query_cache.get_filter.call_args.kwargs["version"] == 7
+        assert query_cache.put_filter.call_args.kwargs["version"] == 7
+        assert query_cache.put_results.call_args.kwargs["version"] == 7
+
+
+class TestTrackingPrefetch:
+    """Tests for BatchGetItem prefetch of tracking records."""
+
+    @pytest.fixture(autouse=True)
+    def _mock_boto3(self, monkeypatch):
+        """Mock boto3 clients to avoid AWS initialization."""
+        monkeypatch.setenv("TRACKING_TABLE", "tracking")
+        mock_boto3 = MagicMock()
+        mock_dynamodb = MagicMock()
+        mock_conditions = MagicMock()
+        mock_boto3.dynamodb = mock_dynamodb
+        mock_boto3.dynamodb.conditions = mock_conditions
+
+        with patch.dict(
+            "sys.modules",
+            {
+                "boto3": mock_boto3,
+                "boto3.dynamodb": mock_dynamodb,
+                "boto3.dynamodb.conditions": mock_conditions,
+            },
+        ):
+            mock_config = MagicMock()
+            mock_config.get_parameter.return_value = False
+            with patch("ragstack_common.config.ConfigurationManager", return_value=mock_config):
+                yield
+
+    def _load_sources(self):
+        import importlib
+
+        import index
+
+        importlib.reload(index)
+        import sources
+
+        return sources
+
+    def test_document_id_from_kb_uri(self):
+        sources = self._load_sources()
+
+        assert sources.document_id_from_kb_uri("s3://b/content/doc-12345/text.txt") == "doc-12345"
+        assert sources.document_id_from_kb_uri("s3://b/input/doc%2012345/a.pdf") == "doc 12345"
+        assert sources.document_id_from_kb_uri("s3://b/doc-12345/a.pdf") == "doc-12345"
+        assert sources.document_id_from_kb_uri("s3://b/content/abc/x.txt") is None
+        assert sources.document_id_from_kb_uri("not-a-uri") is None
+
+    def test_prefetch_retries_unprocessed_keys(self):
+        sources = self._load_sources()
+        ddb = MagicMock()
+        ddb.batch_get_item.side_effect = [
+            {
+                "Responses": {"tracking": [{"document_id": "doc-00001", "type": "image"}]},
+                "UnprocessedKeys": {"tracking": {"Keys": [{"document_id": "doc-00002"}]}},
+            },
+            {"Responses": {"tracking": [{"document_id": "doc-00002", "type": "media"}]}},
+        ]
+
+        with (
+            patch.object(sources, "dynamodb", ddb),
+            patch.object(sources.time, "sleep") as mock_sleep,
+        ):
+            items = sources.prefetch_tracking_items(
+                ["doc-00001", "doc-00002", "doc-00001", None, "doc-00003"], "tracking"
+            )
+
+        assert ddb.batch_get_item.call_count == 2
+        first_keys = ddb.batch_get_item.call_args_list[0].kwargs["RequestItems"]["tracking"]
+        assert len(first_keys["Keys"]) == 3
+        mock_sleep.assert_called_once()
+        assert items["doc-00001"]["type"] == "image"
+        assert items["doc-00002"]["type"] == "media"
+        assert items["doc-00003"] is None
+
+    def test_prefetch_omits_keys_still_unprocessed(self):
+        sources = self._load_sources()
+        ddb = MagicMock()
+        ddb.batch_get_item.return_value = {
+            "Responses": {"tracking": []},
+            "UnprocessedKeys": {"tracking": {"Keys": [{"document_id": "doc-00001"}]}},
+        }
+
+        with patch.object(sources, "dynamodb", ddb), patch.object(sources.time, "sleep"):
+            items = sources.prefetch_tracking_items(["doc-00001"], "tracking")
+
+        assert ddb.batch_get_item.call_count == sources.BATCH_GET_MAX_ATTEMPTS
+        assert "doc-00001" not in items
+
+    def test_extract_sources_uses_prefetched_items(self):
+        sources = self._load_sources()
+        ddb = MagicMock()
+        citations = [
+            {
+                "retrievedReferences": [
+                    {
+                        "content": {"text": "chunk"},
+                        "location": {
+                            "s3Location": {"uri": "s3://bucket/content/doc-00001/text.txt"}
+                        },
+                        "metadata": {},
+                    }
+                ]
+            }
+        ]
+        tracking_items = {
+            "doc-00001": {
+                "document_id": "doc-00001",
+                "filename": "report.pdf",
+                "input_s3_uri": "s3://bucket/input/doc-00001/report.pdf",
+                "type": "document",
+            }
+        }
+
+        with patch.object(sources, "dynamodb", ddb):
+            result = sources.extract_sources(citations, tracking_items=tracking_items)
+
+        ddb.Table.return_value.get_item.assert_not_called()
+        assert result[0]["documentId"] == "doc-00001"
+        assert result[0]["s3Uri"] == "s3://bucket/input/doc-00001/report.pdf"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,81 @@
+"""Unit tests for the token-bucket rate limiter."""
+
+import threading
+
+from ragstack_common.rate_limiter import TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+
+
+class TestTokenBucket:
+    def test_burst_within_capacity_does_not_wait(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, capacity=2, clock=clock, sleep=clock.sleep)
+
+        assert bucket.acquire() == 0.0
+        assert bucket.acquire() == 0.0
+        assert clock.sleeps == []
+
+    def test_deficit_waits_proportionally(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, capacity=1, clock=clock, sleep=clock.sleep)
+
+        bucket.acquire()
+        # Second and third callers queue behind each other at 0.5s spacing
+        assert bucket.acquire() == 0.5
+        assert bucket.acquire() == 1.0
+        assert clock.sleeps == [0.5, 1.0]
+
+    def test_refills_over_time(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1, capacity=1, clock=clock, sleep=clock.sleep)
+
+        bucket.acquire()
+        clock.now = 1.0
+        assert bucket.acquire() == 0.0
+
+    def test_refill_capped_at_capacity(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1, capacity=2, clock=clock, sleep=clock.sleep)
+
+        clock.now = 100.0
+        bucket.acquire()
+        bucket.acquire()
+        assert bucket.acquire() == 1.0
+
+    def test_zero_rate_disables_limiting(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=0, clock=clock, sleep=clock.sleep)
+
+        for _ in range(100):
+            assert bucket.acquire() == 0.0
+        assert clock.sleeps == []
+
+    def test_concurrent_acquires_reserve_distinct_slots(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10, capacity=1, clock=clock, sleep=clock.sleep)
+        waits = []
+        lock = threading.Lock()
+
+        def worker():
+            wait = bucket.acquire()
+            with lock:
+                waits.append(round(wait, 6))
+
+        threads = [threading.Thread(target=worker) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(waits) == [0.0, 0.1, 0.2, 0.3, 0.4]
@@ -272,3 +272,189 @@ class TestListAllContent:
             assert result[1]["document_id"] == "img1"
             assert result[2]["document_id"] == "img2"
             assert result[3]["document_id"] == "scrape1"
+
+
+class FakeManifestS3:
+    """Minimal in-memory S3 supporting put_object and ranged get_object."""
+
+    def __init__(self):
+        self.objects = {}
+        self.get_calls = []
+
+    def put_object(self, Bucket, Key, Body, **kwargs):
+        self.objects[(Bucket, Key)] = Body
+
+    def get_object(self, Bucket, Key, Range=None):
+        self.get_calls.append(Range)
+        data = self.objects[(Bucket, Key)]
+        if Range:
+            start, end = Range.removeprefix("bytes=").split("-")
+            data = data[int(start) : int(end) + 1]
+        body = MagicMock()
+        body.read.return_value = data
+        return {"Body": body}
+
+
+class TestReindexManifest:
+    """Tests for the cursor-based reindex content manifest."""
+
+    def _load(self):
+        with (
+            patch("boto3.client"),
+            patch("boto3.resource"),
+            patch("boto3.Session"),
+        ):
+            module = load_reindex_module()
+        module.s3_client = FakeManifestS3()
+        return module
+
+    def test_pages_preserve_order_and_cover_all_items(self, set_env_vars):
+        """Reading the manifest page by page yields every item once, in order."""
+        module = self._load()
+        items = [{"document_id": f"doc{i:03d}", "filename": f"f{i}.pdf"} for i in range(23)]
+
+        size = module.write_content_manifest(items, "bucket", "working/reindex/x/manifest.jsonl")
+
+        seen = []
+        offset = 0
+        while offset < size:
+            page, offset = module.read_manifest_page(
+                "bucket", "working/reindex/x/manifest.jsonl", offset, 10, size
+            )
+            assert len(page) <= 10
+            seen.extend(page)
+
+        assert [item["document_id"] for item in seen] == [item["document_id"] for item in items]
+        assert offset == size
+
+    def test_small_chunk_extends_range_for_partial_record(self, set_env_vars):
+        """A record straddling the first range is completed with a follow-up read."""
+        module = self._load()
+        items = [
+            {"document_id": f"doc{i}", "source_url": "https://x.test/" + "a" * 40} for i in range(3)
+        ]
+        size = module.write_content_manifest(items, "bucket", "m.jsonl")
+
+        with patch.object(module, "MANIFEST_READ_CHUNK_BYTES", 16):
+            page, offset = module.read_manifest_page("bucket", "m.jsonl", 0, 2, size)
+
+        assert [item["document_id"] for item in page] == ["doc0", "doc1"]
+        assert offset < size
+        assert len(module.s3_client.get_calls) > 1
+
+    def test_manifest_projects_only_needed_fields(self, set_env_vars):
+        """Unrelated tracking attributes are not copied into the manifest."""
+        module = self._load()
+        items = [{"document_id": "img1", "type": "image", "extracted_metadata": {"a": "b"}}]
+        module.write_content_manifest(items, "bucket", "m.jsonl")
+
+        assert module.read_manifest("bucket", "m.jsonl") == [
+            {"document_id": "img1", "type": "image"}
+        ]
+
+    def test_process_batch_reads_manifest_without_scanning(self, set_env_vars):
+        """process_batch uses the manifest cursor and never scans the tracking table."""
+        module = self._load()
+        items = [{"document_id": f"doc{i}", "output_s3_uri": f"s3://b/{i}.txt"} for i in range(3)]
+        size = module.write_content_manifest(items, "test-data-bucket", "m.jsonl")
+        event = {
+            "total_documents": 3,
+            "processed_count": 0,
+            "error_count": 0,
+            "batch_size": 2,
+            "current_batch_index": 0,
+            "manifest_key": "m.jsonl",
+            "manifest_size": size,
+            "manifest_offset": 0,
+        }
+
+        with (
+            patch.object(module, "list_all_content") as mock_list,
+            patch.object(module, "process_text_item") as mock_process,
+            patch.object(module, "publish_reindex_update"),
+        ):
+            mock_process.side_effect = lambda _item, *args: (args[2] + 1, args[3], args[4])
+            first = module.handle_process_batch(event)
+            second = module.handle_process_batch(first)
+
+        mock_list.assert_not_called()
+        assert first["action"] == "process_batch"
+        assert first["manifest_offset"] > 0
+        assert second["action"] == "create_kb"
+        assert second["processed_count"] == 3
+        processed_ids = [call.args[0]["document_id"] for call in mock_process.call_args_list]
+        assert processed_ids == ["doc0", "doc1", "doc2"]
+
+
+class TestConcurrentBatchProcessing:
+    """Tests for worker-pool item processing inside a reindex batch."""
+
+    def _load(self):
+        with (
+            patch("boto3.client"),
+            patch("boto3.resource"),
+            patch("boto3.Session"),
+        ):
+            module = load_reindex_module()
+        module.s3_client = FakeManifestS3()
+        module._rate_limiter = MagicMock()
+        return module
+
+    def test_reindex_item_dispatches_by_type(self, set_env_vars):
+        module = self._load()
+        limiter = MagicMock()
+
+        with (
+            patch.object(module, "process_image_item", return_value=(1, 0, [])) as mock_image,
+            patch.object(module, "process_media_item", return_value=(1, 0, [])) as mock_media,
+        ):
+            module.reindex_item({"document_id": "i", "type": "image"}, "bucket", [], limiter)
+            module.reindex_item({"document_id": "m", "type": "media"}, "bucket", [], limiter)
+
+        mock_image.assert_called_once()
+        mock_media.assert_called_once()
+        assert limiter.acquire.call_count == 2
+
+    def test_reindex_item_reports_failures(self, set_env_vars):
+        module = self._load()
+
+        with patch.object(module, "process_text_item", side_effect=RuntimeError("boom")):
+            result = module.reindex_item(
+                {"document_id": "d", "filename": "bad.pdf"}, "bucket", [], MagicMock()
+            )
+
+        assert result == (1, 1, ["bad.pdf: boom"])
+
+    def test_batch_aggregates_results_in_order(self, set_env_vars):
+        module = self._load()
+        items = [{"document_id": f"doc{i}", "filename": f"f{i}.pdf"} for i in range(5)]
+        size = module.write_content_manifest(items, "test-data-bucket", "m.jsonl")
+        event = {
+            "total_documents": 5,
+            "processed_count": 0,
+            "error_count": 0,
+            "error_messages": [],
+            "batch_size": 10,
+            "current_batch_index": 0,
+            "manifest_key": "m.jsonl",
+            "manifest_size": size,
+            "manifest_offset": 0,
+        }
+
+        def fake_reindex(item, *args):
+            if item["document_id"] in ("doc1", "doc3"):
+                return 1, 1, [f"{item['filename']}: failed"]
+            return 1, 0, []
+
+        with (
+            patch.dict(os.environ, {"REINDEX_MAX_WORKERS": "3"}),
+            patch.object(module, "reindex_item", side_effect=fake_reindex),
+            patch.object(module, "publish_reindex_update") as mock_publish,
+        ):
+            result = module.handle_process_batch(event)
+
+        assert result["action"] == "create_kb"
+        assert result["processed_count"] == 5
+        assert result["error_count"] == 2
+        assert result["error_messages"] == ["f1.pdf: failed", "f3.pdf: failed"]
+        assert mock_publish.call_count == 5
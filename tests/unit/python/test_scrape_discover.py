@@ -3,10 +3,13 @@
 import importlib.util
 import json
 import sys
+import threading
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+from botocore.exceptions import ClientError
 
 
 def _load_scrape_discover_module():
@@ -19,6 +22,16 @@ def _load_scrape_discover_module():
     return module
 
 
+def _sent_messages(mock_sqs, queue_suffix):
+    """Decode message bodies sent with send_message_batch to the queue ending in suffix."""
+    return [
+        json.loads(entry["MessageBody"])
+        for c in mock_sqs.send_message_batch.call_args_list
+        if c.kwargs["QueueUrl"].endswith(queue_suffix)
+        for entry in c.kwargs["Entries"]
+    ]
+
+
 @pytest.fixture
 def _mock_env(monkeypatch):
     """Set up environment variables for tests."""
@@ -121,7 +134,8 @@ class TestScrapeDiscoverHandler:
         result = module.lambda_handler(event, None)
 
         assert result["processed"] == 1
-        mock_aws["urls_table"].put_item.assert_called_once()
+        writer = mock_aws["urls_table"].batch_writer.return_value.__enter__.return_value
+        writer.put_item.assert_called_once()
 
     def test_duplicate_url_handling(self, mock_aws, _mock_fetcher):
         """Test that already-visited URLs are skipped."""
@@ -178,7 +192,7 @@ class TestScrapeDiscoverHandler:
         result = module.lambda_handler(event, None)
 
         assert result["skipped"] == 1
-        mock_aws["urls_table"].put_item.assert_not_called()
+        mock_aws["urls_table"].batch_writer.assert_not_called()
 
     def test_job_not_found(self, mock_aws, _mock_fetcher):
         """Test handling when job doesn't exist."""
@@ -295,7 +309,503 @@ class TestUrlDiscovery:
         # Should discover at least 2 new URLs
         assert result["discovered"] >= 2
         # Should send messages to discovery queue
-        mock_aws["sqs"].send_message.assert_called()
+        assert len(_sent_messages(mock_aws["sqs"], "/disc")) == result["discovered"]
+
+
+class TestFetchedPageHandoff:
+    """Tests for staging fetched pages for scrape_process."""
+
+    def _run(self, mock_aws, config):
+        mock_aws["jobs_table"].get_item.return_value = {
+            "Item": {"job_id": "test-job-123", "status": "running", "config": config}
+        }
+        mock_aws["urls_table"].get_item.return_value = {}
+        module = _load_scrape_discover_module()
+        event = {
+            "Records": [
+                {
+                    "messageId": "m1",
+                    "body": json.dumps(
+                        {"job_id": "test-job-123", "url": "https://example.com/a", "depth": 0}
+                    ),
+                }
+            ]
+        }
+        with patch.object(module, "store_fetch_result", return_value="s3://b/k") as mock_store:
+            module.lambda_handler(event, None)
+        return mock_store, _sent_messages(mock_aws["sqs"], "/proc")[0]
+
+    def test_stages_page_when_bucket_configured(self, mock_aws, _mock_fetcher, monkeypatch):
+        monkeypatch.setenv("DATA_BUCKET", "test-data-bucket")
+
+        mock_store, message = self._run(mock_aws, {"max_depth": 0})
+
+        mock_store.assert_called_once()
+        assert mock_store.call_args.args[1] == "test-data-bucket"
+        assert message["fetched_s3_uri"] == "s3://b/k"
+
+    def test_no_staging_without_bucket(self, mock_aws, _mock_fetcher):
+        mock_store, message = self._run(mock_aws, {"max_depth": 0})
+
+        mock_store.assert_not_called()
+        assert "fetched_s3_uri" not in message
+
+    def test_no_staging_in_full_mode(self, mock_aws, _mock_fetcher, monkeypatch):
+        monkeypatch.setenv("DATA_BUCKET", "test-data-bucket")
+
+        mock_store, message = self._run(mock_aws, {"max_depth": 0, "scrape_mode": "full"})
+
+        mock_store.assert_not_called()
+        assert "fetched_s3_uri" not in message
+
+
+class TestConditionalRevalidation:
+    """Tests for revalidating leaf pages with stored ETag / Last-Modified."""
+
+    def _run(self, mock_aws, config, previous=None):
+        mock_aws["jobs_table"].get_item.return_value = {
+            "Item": {"job_id": "test-job-123", "status": "running", "config": config}
+        }
+        mock_aws["urls_table"].get_item.return_value = {}
+        mock_aws["urls_table"].query.return_value = {"Items": [previous] if previous else []}
+        module = _load_scrape_discover_module()
+        event = {
+            "Records": [
+                {
+                    "messageId": "m1",
+                    "body": json.dumps(
+                        {"job_id": "test-job-123", "url": "https://example.com/a", "depth": 0}
+                    ),
+                }
+            ]
+        }
+        module.lambda_handler(event, None)
+        return _sent_messages(mock_aws["sqs"], "/proc")[0]
+
+    def test_leaf_page_sends_validators(self, mock_aws, _mock_fetcher):
+        self._run(mock_aws, {"max_depth": 0}, previous={"etag": '"v1"'})
+
+        kwargs = _mock_fetcher.fetch.call_args.kwargs
+        assert kwargs["etag"] == '"v1"'
+        assert kwargs["last_modified"] is None
+
+    def test_not_modified_is_forwarded(self, mock_aws, _mock_fetcher):
+        _mock_fetcher.fetch.return_value = MagicMock(error=None, is_html=False, not_modified=True)
+
+        message = self._run(mock_aws, {"max_depth": 0}, previous={"etag": '"v1"'})
+
+        assert message["not_modified"] is True
+
+    def test_pages_with_links_to_follow_fetch_unconditionally(self, mock_aws, _mock_fetcher):
+        message = self._run(mock_aws, {"max_depth": 2}, previous={"etag": '"v1"'})
+
+        assert _mock_fetcher.fetch.call_args.kwargs["etag"] is None
+        assert "not_modified" not in message
+
+    def test_force_rescrape_fetches_unconditionally(self, mock_aws, _mock_fetcher):
+        self._run(mock_aws, {"max_depth": 0, "force_rescrape": True}, previous={"etag": '"v1"'})
+
+        assert _mock_fetcher.fetch.call_args.kwargs["etag"] is None
+
+
+class TestAsyncCrawlMode:
+    """Tests for crawling the SQS batch concurrently (DISCOVERY_CRAWL_MODE=async)."""
+
+    def _event(self, urls):
+        return {
+            "Records": [
+                {
+                    "messageId": f"m{i}",
+                    "body": json.dumps({"job_id": "test-job-123", "url": url, "depth": 0}),
+                }
+                for i, url in enumerate(urls)
+            ]
+        }
+
+    def _job(self, mock_aws):
+        mock_aws["jobs_table"].get_item.return_value = {
+            "Item": {"job_id": "test-job-123", "status": "running", "config": {"max_depth": 0}}
+        }
+        mock_aws["urls_table"].get_item.return_value = {}
+
+    def test_processes_batch_concurrently(self, mock_aws, _mock_fetcher, monkeypatch):
+        monkeypatch.setenv("DISCOVERY_CRAWL_MODE", "async")
+        self._job(mock_aws)
+        module = _load_scrape_discover_module()
+        urls = [f"https://host{i}.example.com/" for i in range(3)]
+
+        with patch.object(module.time, "sleep") as mock_sleep:
+            result = module.lambda_handler(self._event(urls), None)
+
+        assert result["processed"] == 3
+        assert result["batchItemFailures"] == []
+        fetched = {c.args[0] for c in _mock_fetcher.fetch.call_args_list}
+        assert fetched == set(urls)
+        # Politeness comes from the scheduler, not blanket sleeps
+        mock_sleep.assert_not_called()
+
+    def test_failed_record_reported(self, mock_aws, _mock_fetcher, monkeypatch):
+        monkeypatch.setenv("DISCOVERY_CRAWL_MODE", "async")
+        self._job(mock_aws)
+        module = _load_scrape_discover_module()
+        event = self._event(["https://a.example.com/", "https://b.example.com/"])
+        event["Records"][1]["body"] = "not json"
+
+        result = module.lambda_handler(event, None)
+
+        assert result["processed"] == 1
+        assert result["batchItemFailures"] == [{"itemIdentifier": "m1"}]
+
+    def test_skips_visited_urls(self, mock_aws, _mock_fetcher, monkeypatch):
+        monkeypatch.setenv("DISCOVERY_CRAWL_MODE", "async")
+        self._job(mock_aws)
+        mock_aws["urls_table"].get_item.return_value = {"Item": {"url": "x"}}
+        module = _load_scrape_discover_module()
+
+        result = module.lambda_handler(self._event(["https://a.example.com/"]), None)
+
+        assert result["skipped"] == 1
+        _mock_fetcher.fetch.assert_not_called()
+
+    def test_validators_read_on_handler_thread(self, mock_aws, _mock_fetcher, monkeypatch):
+        monkeypatch.setenv("DISCOVERY_CRAWL_MODE", "async")
+        self._job(mock_aws)
+        query_threads = []
+
+        def query(**_kwargs):
+            query_threads.append(threading.current_thread())
+            return {"Items": [{"etag": '"v1"'}]}
+
+        mock_aws["urls_table"].query.side_effect = query
+        module = _load_scrape_discover_module()
+        urls = [f"https://host{i}.example.com/" for i in range(3)]
+
+        result = module.lambda_handler(self._event(urls), None)
+
+        assert result["processed"] == 3
+        assert query_threads == [threading.current_thread()] * 3
+        assert {c.kwargs["etag"] for c in _mock_fetcher.fetch.call_args_list} == {'"v1"'}
+
+
+class TestBatchedFanOut:
+    """Tests for batched SQS sends, page writes and counter updates."""
+
+    def _job(self, mock_aws, total_urls=0, max_pages=100):
+        mock_aws["jobs_table"].get_item.return_value = {
+            "Item": {
+                "job_id": "test-job-123",
+                "status": "running",
+                "base_url": "https://example.com",
+                "config": {"max_depth": 3, "max_pages": max_pages, "scope": "hostname"},
+                "total_urls": total_urls,
+            }
+        }
+        mock_aws["urls_table"].get_item.return_value = {}
+
+    def _links(self, _mock_fetcher, count):
+        anchors = "".join(f'<a href="/p{i}">{i}</a>' for i in range(count))
+        _mock_fetcher.fetch.return_value = MagicMock(
+            error=None, is_html=True, content=f"<html><body>{anchors}</body></html>"
+        )
+
+    def _event(self, urls):
+        return {
+            "Records": [
+                {
+                    "messageId": f"m{i}",
+                    "body": json.dumps({"job_id": "test-job-123", "url": url, "depth": 0}),
+                }
+                for i, url in enumerate(urls)
+            ]
+        }
+
+    def test_links_sent_in_chunks_of_ten(self, mock_aws, _mock_fetcher):
+        self._job(mock_aws)
+        self._links(_mock_fetcher, 25)
+        module = _load_scrape_discover_module()
+
+        result = module.lambda_handler(self._event(["https://example.com/"]), None)
+
+        disc_batches = [
+            len(c.kwargs["Entries"])
+            for c in mock_aws["sqs"].send_message_batch.call_args_list
+            if c.kwargs["QueueUrl"].endswith("/disc")
+        ]
+        assert disc_batches == [10, 10, 5]
+        assert result["discovered"] == 25
+        mock_aws["sqs"].send_message.assert_not_called()
+
+    def test_counters_and_progress_once_per_job(self, mock_aws, _mock_fetcher):
+        self._job(mock_aws)
+        module = _load_scrape_discover_module()
+        urls = ["https://example.com/a", "https://example.com/b", "https://example.com/c"]
+
+        with patch.object(module, "publish_scrape_update") as mock_publish:
+            result = module.lambda_handler(self._event(urls), None)
+
+        assert result["processed"] == 3
+        mock_aws["jobs_table"].get_item.assert_called_once()
+        mock_aws["jobs_table"].update_item.assert_called_once()
+        values = mock_aws["jobs_table"].update_item.call_args.kwargs["ExpressionAttributeValues"]
+        assert values[":inc"] == 3
+        mock_publish.assert_called_once()
+        assert mock_publish.call_args.kwargs["total_urls"] == 3
+        writer = mock_aws["urls_table"].batch_writer.return_value.__enter__.return_value
+        assert writer.put_item.call_count == 3
+
+    def test_duplicate_url_in_batch_skipped(self, mock_aws, _mock_fetcher):
+        self._job(mock_aws)
+        module = _load_scrape_discover_module()
+
+        result = module.lambda_handler(
+            self._event(["https://example.com/a", "https://example.com/a"]), None
+        )
+
+        assert result["processed"] == 1
+        assert result["skipped"] == 1
+
+    def test_failed_send_reports_record(self, mock_aws, _mock_fetcher):
+        self._job(mock_aws)
+        module = _load_scrape_discover_module()
+        mock_aws["sqs"].send_message_batch.side_effect = lambda QueueUrl, **_kw: {
+            "Failed": [{"Id": "1", "Message": "throttled"}] if QueueUrl.endswith("/proc") else []
+        }
+
+        result = module.lambda_handler(
+            self._event(["https://example.com/a", "https://example.com/b"]), None
+        )
+
+        assert result["batchItemFailures"] == [{"itemIdentifier": "m1"}]
+        values = mock_aws["jobs_table"].update_item.call_args.kwargs["ExpressionAttributeValues"]
+        assert values[":inc"] == 1
+
+    def test_max_pages_counts_pages_queued_in_batch(self, mock_aws, _mock_fetcher):
+        self._job(mock_aws, total_urls=95)
+        self._links(_mock_fetcher, 10)
+        module = _load_scrape_discover_module()
+
+        result = module.lambda_handler(self._event(["https://example.com/"]), None)
+
+        # 95 existing + this page leaves room for 4 more
+        assert result["discovered"] == 4
+
+
+class TestSitemapDiscoveryMode:
+    """Tests for jobs with discovery_mode sitemap."""
+
+    def _job(self, mock_aws, max_pages=100):
+        mock_aws["jobs_table"].get_item.return_value = {
+            "Item": {
+                "job_id": "test-job-123",
+                "status": "running",
+                "base_url": "https://example.com",
+                "config": {
+                    "max_depth": 3,
+                    "max_pages": max_pages,
+                    "scope": "hostname",
+                    "discovery_mode": "sitemap",
+                },
+                "total_urls": 0,
+            }
+        }
+        mock_aws["urls_table"].get_item.return_value = {}
+
+    def _event(self, depth=0):
+        body = {"job_id": "test-job-123", "url": "https://example.com", "depth": depth}
+        return {"Records": [{"messageId": "m0", "body": json.dumps(body)}]}
+
+    def _run(self, module, sitemap, depth=0):
+        with patch.object(module, "discover_sitemap_urls", return_value=sitemap) as mock_discover:
+            result = module.lambda_handler(self._event(depth), None)
+        return result, mock_discover
+
+    def test_sitemap_urls_queued_for_processing(self, mock_aws, _mock_fetcher):
+        self._job(mock_aws)
+        _mock_fetcher.fetch.return_value = MagicMock(
+            error=None, is_html=True, content='<html><body><a href="/linked">x</a></body></html>'
+        )
+        module = _load_scrape_discover_module()
+        sitemap = module.SitemapDiscovery(
+            urls=["https://example.com", "https://example.com/a", "https://example.com/b"],
+            crawl_delay_ms=2000,
+        )
+
+        result, _ = self._run(module, sitemap)
+
+        processing = _sent_messages(mock_aws["sqs"], "/proc")
+        assert [m["url"] for m in processing] == [
+            "https://example.com",
+            "https://example.com/a",
+            "https://example.com/b",
+        ]
+        assert all(m["crawl_delay_ms"] == 2000 for m in processing)
+        # Links on the seed page are not crawled
+        assert _sent_messages(mock_aws["sqs"], "/disc") == []
+        assert result["discovered"] == 0
+        values = mock_aws["jobs_table"].update_item.call_args.kwargs["ExpressionAttributeValues"]
+        assert values[":inc"] == 3
+        writer = mock_aws["urls_table"].batch_writer.return_value.__enter__.return_value
+        assert writer.put_item.call_count == 3
+
+    def test_sitemap_respects_max_pages(self, mock_aws, _mock_fetcher):
+        self._job(mock_aws, max_pages=3)
+        module = _load_scrape_discover_module()
+        sitemap = module.SitemapDiscovery(urls=[f"https://example.com/p{i}" for i in range(10)])
+
+        self._run(module, sitemap)
+
+        assert len(_sent_messages(mock_aws["sqs"], "/proc")) == 3
+
+    def test_sitemap_urls_queued_when_seed_fetch_fails(self, mock_aws, _mock_fetcher):
+        self._job(mock_aws)
+        _mock_fetcher.fetch.return_value = MagicMock(error="HTTP 500", is_html=False)
+        module = _load_scrape_discover_module()
+        sitemap = module.SitemapDiscovery(urls=["https://example.com/a"])
+
+        self._run(module, sitemap)
+
+        assert [m["url"] for m in _sent_messages(mock_aws["sqs"], "/proc")] == [
+            "https://example.com/a"
+        ]
+
+    def test_no_sitemap_falls_back_to_crawling(self, mock_aws, _mock_fetcher):
+        self._job(mock_aws)
+        _mock_fetcher.fetch.return_value = MagicMock(
+            error=None, is_html=True, content='<html><body><a href="/linked">x</a></body></html>'
+        )
+        module = _load_scrape_discover_module()
+
+        result, _ = self._run(module, module.SitemapDiscovery())
+
+        assert [m["url"] for m in _sent_messages(mock_aws["sqs"], "/disc")] == [
+            "https://example.com/linked"
+        ]
+        assert result["discovered"] == 1
+
+    def test_sitemap_read_only_for_seed(self, mock_aws, _mock_fetcher):
+        self._job(mock_aws)
+        module = _load_scrape_discover_module()
+
+        _, mock_discover = self._run(module, module.SitemapDiscovery(), depth=1)
+
+        mock_discover.assert_not_called()
+
+    def test_sitemap_reading_gets_batch_deadline(self, mock_aws, _mock_fetcher, monkeypatch):
+        self._job(mock_aws)
+        monkeypatch.setenv("DISCOVERY_SITEMAP_BUDGET_SECONDS", "5")
+        module = _load_scrape_discover_module()
+
+        before = time.monotonic()
+        _, mock_discover = self._run(module, module.SitemapDiscovery())
+
+        deadline = mock_discover.call_args.kwargs["deadline"]
+        assert before + 5 <= deadline <= time.monotonic() + 5
+
+
+class TestVisitedFilter:
+    """Tests for the per-job visited filter fast path."""
+
+    def _job(self, mock_aws, total_urls=5):
+        mock_aws["jobs_table"].get_item.return_value = {
+            "Item": {
+                "job_id": "test-job-123",
+                "status": "running",
+                "base_url": "https://example.com",
+                "config": {"max_depth": 0, "max_pages": 100},
+                "total_urls": total_urls,
+            }
+        }
+        mock_aws["urls_table"].get_item.return_value = {}
+
+    def _stored_filter(self, mock_aws, urls=()):
+        from ragstack_common.scraper.frontier import BloomFilter
+
+        bloom = BloomFilter.for_capacity(1000)
+        for url in urls:
+            bloom.add(url)
+        mock_aws["sqs"].get_object.return_value = {
+            "Body": MagicMock(read=MagicMock(return_value=bloom.to_bytes())),
+            "ETag": '"v1"',
+        }
+
+    def _filter_writes(self, mock_aws):
+        return [
+            c.kwargs
+            for c in mock_aws["sqs"].put_object.call_args_list
+            if c.kwargs["Key"].endswith("visited.bloom")
+        ]
+
+    def _event(self, url, depth=1):
+        body = {"job_id": "test-job-123", "url": url, "depth": depth}
+        return {"Records": [{"messageId": "m0", "body": json.dumps(body)}]}
+
+    def test_negative_lookup_skips_dynamodb_read(self, mock_aws, _mock_fetcher, monkeypatch):
+        monkeypatch.setenv("DATA_BUCKET", "test-data-bucket")
+        self._job(mock_aws)
+        self._stored_filter(mock_aws, ["https://example.com/other"])
+        module = _load_scrape_discover_module()
+
+        result = module.lambda_handler(self._event("https://example.com/new"), None)
+
+        assert result["processed"] == 1
+        mock_aws["urls_table"].get_item.assert_not_called()
+        (write,) = self._filter_writes(mock_aws)
+        assert write["IfMatch"] == '"v1"'
+
+    def test_possible_duplicate_checks_dynamodb(self, mock_aws, _mock_fetcher, monkeypatch):
+        monkeypatch.setenv("DATA_BUCKET", "test-data-bucket")
+        self._job(mock_aws)
+        self._stored_filter(mock_aws, ["https://example.com/seen"])
+        mock_aws["urls_table"].get_item.return_value = {"Item": {"url": "https://example.com/seen"}}
+        module = _load_scrape_discover_module()
+
+        result = module.lambda_handler(self._event("https://example.com/seen"), None)
+
+        assert result["skipped"] == 1
+        mock_aws["urls_table"].get_item.assert_called_once()
+        assert self._filter_writes(mock_aws) == []
+
+    def test_seed_creates_filter(self, mock_aws, _mock_fetcher, monkeypatch):
+        monkeypatch.setenv("DATA_BUCKET", "test-data-bucket")
+        self._job(mock_aws, total_urls=0)
+        mock_aws["sqs"].get_object.side_effect = ClientError(
+            {"Error": {"Code": "NoSuchKey", "Message": "missing"}}, "GetObject"
+        )
+        module = _load_scrape_discover_module()
+
+        module.lambda_handler(self._event("https://example.com", depth=0), None)
+
+        mock_aws["urls_table"].get_item.assert_not_called()
+        (write,) = self._filter_writes(mock_aws)
+        assert write["IfNoneMatch"] == "*"
+
+    def test_job_without_filter_reads_dynamodb(self, mock_aws, _mock_fetcher, monkeypatch):
+        monkeypatch.setenv("DATA_BUCKET", "test-data-bucket")
+        self._job(mock_aws)
+        mock_aws["sqs"].get_object.side_effect = ClientError(
+            {"Error": {"Code": "NoSuchKey", "Message": "missing"}}, "GetObject"
+        )
+        module = _load_scrape_discover_module()
+
+        result = module.lambda_handler(self._event("https://example.com/new"), None)
+
+        assert result["processed"] == 1
+        mock_aws["urls_table"].get_item.assert_called_once()
+        assert self._filter_writes(mock_aws) == []
+
+    def test_failed_filter_save_fails_records(self, mock_aws, _mock_fetcher, monkeypatch):
+        monkeypatch.setenv("DATA_BUCKET", "test-data-bucket")
+        self._job(mock_aws)
+        self._stored_filter(mock_aws)
+        mock_aws["sqs"].put_object.side_effect = ClientError(
+            {"Error": {"Code": "InternalError", "Message": "boom"}}, "PutObject"
+        )
+        module = _load_scrape_discover_module()
+
+        result = module.lambda_handler(self._event("https://example.com/new"), None)
+
+        assert result["batchItemFailures"] == [{"itemIdentifier": "m0"}]
+        mock_aws["urls_table"].batch_writer.assert_not_called()
 
 
 if __name__ == "__main__":
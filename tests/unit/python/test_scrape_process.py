@@ -8,6 +8,8 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from ragstack_common.scraper.fetcher import FetchResult
+
 
 def _load_scrape_process_module():
     """Load scrape_process module using importlib (avoids 'lambda' keyword issue)."""
@@ -63,11 +65,12 @@ def _mock_fetcher():
             "<html><head><title>Test Page</title></head>"
             "<body><h1>Test</h1><p>Content here</p></body></html>"
         )
-        mock_fetch.return_value = MagicMock(
-            error=None,
-            is_html=True,
-            content=test_html,
+        mock_fetch.return_value = FetchResult(
+            url="https://example.com/page1",
             status_code=200,
+            content=test_html,
+            content_type="text/html",
+            is_html=True,
         )
         yield mock_fetch
 
@@ -79,6 +82,7 @@ def _mock_dedup():
         mock_service = MagicMock()
         mock_service.is_content_changed.return_value = True  # Content is new
         mock_service.get_content_hash.return_value = "abc123"
+        mock_service.get_validators.return_value = (None, None)
         mock_cls.return_value = mock_service
         yield mock_service
 
@@ -311,5 +315,144 @@ class TestDeduplication:
         mock_aws["s3"].put_object.assert_not_called()
 
 
+class TestFetchedPageReuse:
+    """Tests for reusing pages staged by scrape_discover."""
+
+    def _event(self, **extra):
+        body = {"job_id": "test-job-123", "url": "https://example.com/page1", "depth": 0}
+        body.update(extra)
+        return {"Records": [{"body": json.dumps(body)}]}
+
+    def _job(self, mock_aws, config):
+        mock_aws["jobs_table"].get_item.return_value = {
+            "Item": {"job_id": "test-job-123", "status": "running", "config": config}
+        }
+
+    def test_passes_staged_page_to_fetch_auto(self, mock_aws, _mock_fetcher, _mock_dedup):
+        self._job(mock_aws, {})
+        module = _load_scrape_process_module()
+        staged = MagicMock(error=None)
+
+        with patch.object(module, "load_fetch_result", return_value=staged) as mock_load:
+            result = module.lambda_handler(self._event(fetched_s3_uri="s3://b/k.json.gz"), None)
+
+        assert result["processed"] == 1
+        mock_load.assert_called_once_with(module.s3, "s3://b/k.json.gz")
+        assert _mock_fetcher.call_args.kwargs["prefetched"] is staged
+
+    def test_fetches_when_nothing_staged(self, mock_aws, _mock_fetcher, _mock_dedup):
+        self._job(mock_aws, {})
+        module = _load_scrape_process_module()
+
+        with patch.object(module, "load_fetch_result") as mock_load:
+            module.lambda_handler(self._event(), None)
+
+        mock_load.assert_not_called()
+        assert _mock_fetcher.call_args.kwargs["prefetched"] is None
+
+    def test_full_mode_ignores_staged_page(self, mock_aws, _mock_fetcher, _mock_dedup):
+        self._job(mock_aws, {"scrape_mode": "full"})
+        module = _load_scrape_process_module()
+
+        with patch.object(module, "load_fetch_result") as mock_load:
+            module.lambda_handler(self._event(fetched_s3_uri="s3://b/k.json.gz"), None)
+
+        mock_load.assert_not_called()
+
+
+class TestConditionalRevalidation:
+    """Tests for ETag / Last-Modified revalidation of re-scraped URLs."""
+
+    def _event(self, **extra):
+        body = {"job_id": "test-job-123", "url": "https://example.com/page1", "depth": 0}
+        body.update(extra)
+        return {"Records": [{"body": json.dumps(body)}]}
+
+    def _job(self, mock_aws, config):
+        mock_aws["jobs_table"].get_item.return_value = {
+            "Item": {"job_id": "test-job-123", "status": "running", "config": config}
+        }
+
+    def test_sends_stored_validators(self, mock_aws, _mock_fetcher, _mock_dedup):
+        self._job(mock_aws, {})
+        _mock_dedup.get_validators.return_value = ('"v1"', "Wed, 01 Jan 2025 00:00:00 GMT")
+        module = _load_scrape_process_module()
+
+        module.lambda_handler(self._event(), None)
+
+        kwargs = _mock_fetcher.call_args.kwargs
+        assert kwargs["etag"] == '"v1"'
+        assert kwargs["last_modified"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+
+    def test_not_modified_response_skips_page(self, mock_aws, _mock_fetcher, _mock_dedup):
+        self._job(mock_aws, {})
+        _mock_dedup.get_validators.return_value = ('"v1"', None)
+        _mock_fetcher.return_value = MagicMock(error=None, not_modified=True)
+        module = _load_scrape_process_module()
+
+        result = module.lambda_handler(self._event(), None)
+
+        assert result["skipped"] == 1
+        assert result["processed"] == 0
+        _mock_dedup.is_content_changed.assert_not_called()
+        mock_aws["s3"].put_object.assert_not_called()
+
+    def test_not_modified_from_discovery_skips_fetch(self, mock_aws, _mock_fetcher, _mock_dedup):
+        self._job(mock_aws, {})
+        module = _load_scrape_process_module()
+
+        result = module.lambda_handler(self._event(not_modified=True), None)
+
+        assert result["skipped"] == 1
+        _mock_fetcher.assert_not_called()
+
+    def test_force_rescrape_ignores_validators(self, mock_aws, _mock_fetcher, _mock_dedup):
+        self._job(mock_aws, {"force_rescrape": True})
+        module = _load_scrape_process_module()
+
+        result = module.lambda_handler(self._event(not_modified=True), None)
+
+        assert result["processed"] == 1
+        _mock_dedup.get_validators.assert_not_called()
+        assert _mock_fetcher.call_args.kwargs["etag"] is None
+
+    def test_stores_response_validators(self, mock_aws, _mock_fetcher, _mock_dedup):
+        self._job(mock_aws, {})
+        _mock_fetcher.return_value.etag = '"v2"'
+        module = _load_scrape_process_module()
+
+        module.lambda_handler(self._event(), None)
+
+        assert _mock_dedup.store_hash.call_args.kwargs["etag"] == '"v2"'
+
+    def test_unchanged_content_stores_validators_for_next_run(
+        self, mock_aws, _mock_fetcher, _mock_dedup
+    ):
+        self._job(mock_aws, {})
+        # First scrape predates validator storage: nothing stored for the URL
+        stored = {"etag": None, "last_modified": None}
+        _mock_dedup.get_validators.side_effect = lambda _url: (
+            stored["etag"],
+            stored["last_modified"],
+        )
+        _mock_dedup.store_hash.side_effect = lambda *_a, etag=None, last_modified=None: (
+            stored.update(etag=etag, last_modified=last_modified)
+        )
+        _mock_dedup.is_content_changed.return_value = False
+        _mock_fetcher.return_value.etag = '"v1"'
+        module = _load_scrape_process_module()
+
+        first = module.lambda_handler(self._event(), None)
+
+        assert first["skipped"] == 1
+        assert _mock_fetcher.call_args.kwargs["etag"] is None
+        mock_aws["s3"].put_object.assert_not_called()
+
+        module.lambda_handler(self._event(), None)
+
+        # The re-scrape now sends If-None-Match with the validator stored above
+        assert _mock_fetcher.call_args.kwargs["etag"] == '"v1"'
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
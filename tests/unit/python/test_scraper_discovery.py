@@ -1,13 +1,23 @@
 """Unit tests for URL discovery logic."""
 
+import gzip
+import itertools
+
+import httpx
 import pytest
+from bs4 import BeautifulSoup
 
 from ragstack_common.scraper.discovery import (
+    UrlFilter,
+    compile_patterns,
+    discover_sitemap_urls,
     extract_links,
     filter_discovered_urls,
     get_url_depth,
+    iter_sitemap_entries,
     matches_patterns,
     normalize_url,
+    parse_robots_txt,
     should_crawl,
 )
 from ragstack_common.scraper.models import ScrapeConfig, ScrapeScope
@@ -66,6 +76,11 @@ class TestExtractLinks:
         links = extract_links(html, "https://example.com/docs/")
         assert "https://example.com/docs/subpage" in links
 
+    def test_accepts_parsed_tree(self):
+        soup = BeautifulSoup('<a href="/page">Link</a>', "lxml")
+        links = extract_links(soup, "https://example.com/")
+        assert links == ["https://example.com/page"]
+
     def test_ignores_fragment_only_links(self):
         html = '<html><body><a href="#section">Link</a></body></html>'
         links = extract_links(html, "https://example.com/")
@@ -275,5 +290,291 @@ class TestFilterDiscoveredUrls:
         assert filtered == []
 
 
+SITEMAP_NS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+
+
+def _urlset(urls):
+    entries = "".join(f"<url><loc>{url}</loc></url>" for url in urls)
+    return f'<?xml version="1.0"?><urlset xmlns="{SITEMAP_NS}">{entries}</urlset>'.encode()
+
+
+def _sitemap_index(urls):
+    entries = "".join(f"<sitemap><loc>{url}</loc></sitemap>" for url in urls)
+    return (
+        f'<?xml version="1.0"?><sitemapindex xmlns="{SITEMAP_NS}">{entries}</sitemapindex>'.encode()
+    )
+
+
+def _client(routes):
+    """httpx client serving routes (path -> body bytes or str); other paths 404."""
+
+    def handler(request):
+        body = routes.get(request.url.path)
+        if body is None:
+            return httpx.Response(404)
+        return httpx.Response(200, content=body.encode() if isinstance(body, str) else body)
+
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+class TestParseRobotsTxt:
+    """Tests for parse_robots_txt function."""
+
+    def test_sitemaps_and_crawl_delay(self):
+        text = (
+            "User-agent: *\nCrawl-delay: 1.5\nDisallow: /private\n\n"
+            "Sitemap: https://example.com/sitemap.xml\n"
+            "Sitemap: https://example.com/docs/sitemap.xml.gz\n"
+        )
+        sitemaps, crawl_delay_ms = parse_robots_txt(text)
+        assert sitemaps == [
+            "https://example.com/sitemap.xml",
+            "https://example.com/docs/sitemap.xml.gz",
+        ]
+        assert crawl_delay_ms == 1500
+
+    def test_agent_group_overrides_wildcard(self):
+        text = (
+            "User-agent: Googlebot\nCrawl-delay: 10\n\n"
+            "User-agent: RAGStack-Scraper\nCrawl-delay: 0.5\n\n"
+            "User-agent: *\nCrawl-delay: 3\n"
+        )
+        assert parse_robots_txt(text) == ([], 500)
+
+    def test_empty(self):
+        assert parse_robots_txt("") == ([], None)
+
+
+class TestIterSitemapEntries:
+    """Tests for iter_sitemap_entries function."""
+
+    def test_urlset(self):
+        body = _urlset(["https://example.com/a", "https://example.com/b"])
+        assert list(iter_sitemap_entries([body])) == [
+            ("url", "https://example.com/a"),
+            ("url", "https://example.com/b"),
+        ]
+
+    def test_sitemap_index(self):
+        body = _sitemap_index(["https://example.com/s1.xml"])
+        assert list(iter_sitemap_entries([body])) == [("sitemap", "https://example.com/s1.xml")]
+
+    def test_gzipped_in_small_chunks(self):
+        body = gzip.compress(_urlset([f"https://example.com/p{i}" for i in range(100)]))
+        chunks = [body[i : i + 7] for i in range(0, len(body), 7)]
+        entries = list(iter_sitemap_entries(chunks))
+        assert len(entries) == 100
+        assert entries[-1] == ("url", "https://example.com/p99")
+
+    def test_malformed_keeps_entries_read(self):
+        body = _urlset(["https://example.com/a"])[: -len("</urlset>")] + b"<<garbage"
+        assert list(iter_sitemap_entries([body])) == [("url", "https://example.com/a")]
+
+    def test_size_limit(self):
+        body = _urlset([f"https://example.com/p{i}" for i in range(1000)])
+        entries = list(iter_sitemap_entries([body], max_bytes=len(body) // 2))
+        assert 0 < len(entries) < 1000
+
+
+class TestDiscoverSitemapUrls:
+    """Tests for discover_sitemap_urls function."""
+
+    def test_robots_sitemap_index_gzip(self):
+        client = _client(
+            {
+                "/robots.txt": "User-agent: *\nCrawl-delay: 2\nSitemap: https://example.com/index.xml\n",
+                "/index.xml": _sitemap_index(["https://example.com/docs.xml.gz"]),
+                "/docs.xml.gz": gzip.compress(
+                    _urlset(["https://example.com/docs/a", "https://example.com/docs/b/"])
+                ),
+            }
+        )
+        result = discover_sitemap_urls(
+            "https://example.com/docs", ScrapeConfig(max_pages=100), client=client
+        )
+        assert result.urls == ["https://example.com/docs/a", "https://example.com/docs/b"]
+        assert result.crawl_delay_ms == 2000
+        assert result.sitemaps_read == [
+            "https://example.com/index.xml",
+            "https://example.com/docs.xml.gz",
+        ]
+
+    def test_falls_back_to_sitemap_xml(self):
+        client = _client({"/sitemap.xml": _urlset(["https://example.com/a"])})
+        result = discover_sitemap_urls("https://example.com", ScrapeConfig(), client=client)
+        assert result.urls == ["https://example.com/a"]
+        assert result.crawl_delay_ms is None
+
+    def test_no_sitemap(self):
+        result = discover_sitemap_urls("https://example.com", ScrapeConfig(), client=_client({}))
+        assert result.urls == []
+
+    def test_scope_and_patterns(self):
+        client = _client(
+            {
+                "/sitemap.xml": _urlset(
+                    [
+                        "https://example.com/docs/a",
+                        "https://example.com/docs/changelog",
+                        "https://example.com/blog/b",
+                        "https://other.com/docs/c",
+                    ]
+                )
+            }
+        )
+        config = ScrapeConfig(scope=ScrapeScope.SUBPAGES, exclude_patterns=["*changelog*"])
+        result = discover_sitemap_urls("https://example.com/docs", config, client=client)
+        assert result.urls == ["https://example.com/docs/a"]
+
+    def test_stops_at_max_pages(self):
+        client = _client(
+            {
+                "/sitemap.xml": _sitemap_index(
+                    ["https://example.com/s1.xml", "https://example.com/s2.xml"]
+                ),
+                "/s1.xml": _urlset([f"https://example.com/p{i}" for i in range(5)]),
+                "/s2.xml": _urlset([f"https://example.com/q{i}" for i in range(5)]),
+            }
+        )
+        result = discover_sitemap_urls(
+            "https://example.com", ScrapeConfig(max_pages=3, scope=ScrapeScope.HOSTNAME), client
+        )
+        assert len(result.urls) == 3
+        assert "https://example.com/s2.xml" not in result.sitemaps_read
+
+    def test_off_domain_sitemaps_not_fetched(self):
+        client = _client(
+            {
+                "/robots.txt": "Sitemap: https://evil.internal/sitemap.xml\n",
+                "/sitemap.xml": _urlset(["https://example.com/a"]),
+            }
+        )
+        result = discover_sitemap_urls("https://example.com", ScrapeConfig(), client=client)
+        assert result.urls == []
+        assert result.sitemaps_read == []
+
+    def test_stops_at_deadline(self, monkeypatch):
+        now = [0.0]
+        routes = {
+            "/sitemap.xml": _sitemap_index(
+                ["https://example.com/s1.xml", "https://example.com/s2.xml"]
+            ),
+            "/s1.xml": _urlset([f"https://example.com/p{i}" for i in range(5)]),
+            "/s2.xml": _urlset([f"https://example.com/q{i}" for i in range(5)]),
+        }
+
+        def handler(request):
+            if request.url.path == "/s1.xml":
+                # Budget runs out while the first child sitemap is downloading
+                now[0] = 100.0
+            body = routes.get(request.url.path)
+            return httpx.Response(200, content=body) if body else httpx.Response(404)
+
+        monkeypatch.setattr("ragstack_common.scraper.discovery.time.monotonic", lambda: now[0])
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        result = discover_sitemap_urls(
+            "https://example.com",
+            ScrapeConfig(scope=ScrapeScope.HOSTNAME),
+            client,
+            deadline=10.0,
+        )
+        assert result.urls == []
+        assert result.sitemaps_read == [
+            "https://example.com/sitemap.xml",
+            "https://example.com/s1.xml",
+        ]
+
+
+class TestCompilePatterns:
+    """compile_patterns must accept exactly what matches_patterns accepts."""
+
+    PATTERNS = [
+        "*",
+        "**",
+        "*/docs/*",
+        "*/docs",
+        "https://example.com/*",
+        "*.pdf",
+        "*/a?c/*",
+        "*[0-9]*",
+        "*/x[!a]y/*",
+        "exact",
+        "*docs*",
+        "https://*.example.com/api/*",
+        "*/page[1-3]?*",
+        "*a*b*",
+    ]
+    URLS = [
+        "https://example.com/docs/a",
+        "https://example.com/docs",
+        "https://x.example.com/api/v1",
+        "https://example.com/file.pdf",
+        "https://example.com/abc/1",
+        "https://example.com/xby/",
+        "https://example.com/x-y/",
+        "https://example.com/page2x?q=1",
+        "https://e.com/ba",
+        "exact",
+        "",
+    ]
+
+    def test_equivalent_to_fnmatch(self):
+        for n in (1, 2, 3):
+            for combo in itertools.combinations(self.PATTERNS, n):
+                regex = compile_patterns(list(combo))
+                for url in self.URLS:
+                    expected = matches_patterns(url, list(combo))
+                    assert bool(regex.search(url)) == expected, (combo, url)
+
+    def test_no_patterns(self):
+        assert compile_patterns([]) is None
+
+
+class TestUrlFilter:
+    """UrlFilter must agree with should_crawl."""
+
+    URLS = [
+        "https://docs.example.com/guide",
+        "https://docs.example.com/guide/a",
+        "https://docs.example.com/guide;v=1",
+        "https://docs.example.com/guidebook",
+        "https://docs.example.com/blog/post",
+        "https://DOCS.example.com/guide/b",
+        "https://api.example.com/guide/c",
+        "https://other.com/guide/d",
+        "https://docs.example.com/guide/file.pdf",
+    ]
+
+    @pytest.mark.parametrize("scope", list(ScrapeScope))
+    @pytest.mark.parametrize(
+        "base_url", ["https://docs.example.com/guide/", "https://docs.example.com"]
+    )
+    def test_matches_should_crawl(self, scope, base_url):
+        config = ScrapeConfig(
+            scope=scope, include_patterns=["*example.com*"], exclude_patterns=["*.pdf"]
+        )
+        url_filter = UrlFilter(base_url, config)
+        for url in self.URLS:
+            assert url_filter.matches(url) == should_crawl(url, base_url, config), url
+
+    def test_filter_skips_visited(self):
+        url_filter = UrlFilter("https://example.com", ScrapeConfig(scope=ScrapeScope.HOSTNAME))
+        urls = ["https://example.com/a", "https://example.com/b", "https://other.com/c"]
+        assert url_filter.filter(urls, {"https://example.com/a"}) == ["https://example.com/b"]
+
+    def test_matches_should_crawl_on_10k_links_50_patterns(self):
+        """Compiled filter agrees with per-link should_crawl on 10k links x 50 patterns."""
+        base_url = "https://docs.example.com/guide"
+        links = [f"https://docs.example.com/guide/section{i % 40}/page{i}" for i in range(10_000)]
+        patterns = [f"*/section{i}/*" for i in range(50)]
+        config = ScrapeConfig(include_patterns=patterns[:25], exclude_patterns=patterns[25:])
+
+        expected = [url for url in links if should_crawl(url, base_url, config)]
+        actual = UrlFilter(base_url, config).filter(links, set())
+
+        assert actual == expected
+        assert len(actual) == 6250
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -9,6 +9,7 @@ from ragstack_common.scraper.extractor import (
     extract_title,
     find_main_content,
     html_to_markdown,
+    parse_html,
     sanitize_html,
 )
 
@@ -101,6 +102,20 @@ class TestSanitizeHtml:
         soup = sanitize_html(html)
         assert soup.find(attrs={"role": "navigation"}) is None
 
+    def test_removes_nested_matches_once(self):
+        html = (
+            '<nav class="menu" role="navigation"><button class="ads">x</button></nav>'
+            '<div class="card sidebar"><p>side</p></div><p>kept</p>'
+        )
+        result = sanitize_html(html)
+        assert "side" not in result.get_text()
+        assert result.get_text(strip=True) == "kept"
+
+    def test_sanitizes_parsed_tree_in_place(self):
+        soup = parse_html("<body><script>x</script><p>kept</p></body>")
+        assert sanitize_html(soup) is soup
+        assert soup.find("script") is None
+
     def test_removes_sidebar_class(self):
         html = '<html><body><div class="sidebar">Sidebar</div><p>Content</p></body></html>'
         soup = sanitize_html(html)
@@ -195,6 +210,11 @@ class TestHtmlToMarkdown:
         # Should not have more than 2 consecutive newlines
         assert "\n\n\n" not in md
 
+    def test_converts_parsed_element_like_string(self):
+        html = "<main><h2>Title</h2><ul><li>a</li></ul><pre><code>x = 1</code></pre></main>"
+        main = parse_html(html).find("main")
+        assert html_to_markdown(main) == html_to_markdown(html)
+
     def test_empty_html(self):
         md = html_to_markdown("")
         assert md == ""
@@ -286,6 +306,16 @@ class TestExtractContent:
         assert result.title == "Untitled"
         assert result.source_url == "https://example.com"
 
+    def test_parsed_tree_matches_string_input(self):
+        html = (
+            "<html><head><title>T</title></head><body><nav>Menu</nav>"
+            "<main><h1>Heading</h1><p>" + "word " * 20 + "</p></main></body></html>"
+        )
+        from_string = extract_content(html, "https://example.com")
+        from_tree = extract_content(parse_html(html), "https://example.com")
+        assert from_tree.title == from_string.title
+        assert from_tree.markdown.split("---")[-1] == from_string.markdown.split("---")[-1]
+
     def test_handles_malformed_html(self):
         html = "<p>Unclosed paragraph<div>Nested wrong</p></div>"
         result = extract_content(html, "https://example.com")
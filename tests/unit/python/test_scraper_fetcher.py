@@ -1,17 +1,25 @@
 """Unit tests for HTTP/Playwright fetcher."""
 
+import gzip
+import json
+from dataclasses import asdict
 from unittest.mock import MagicMock, patch
 
 import httpx
 import pytest
 
 from ragstack_common.scraper.fetcher import (
+    BrowserPool,
+    ConnectionPool,
     FetchError,
     FetchResult,
     HttpFetcher,
     fetch_auto,
     fetch_with_playwright,
+    fetched_page_key,
     is_spa,
+    load_fetch_result,
+    store_fetch_result,
 )
 
 
@@ -222,6 +230,165 @@ class TestHttpFetcher:
         assert "Authorization" in call_kwargs["headers"]
         assert call_kwargs["headers"]["Authorization"] == "Bearer token"
 
+    @patch("ragstack_common.scraper.fetcher.httpx.Client")
+    @patch("ragstack_common.scraper.fetcher.time.sleep")
+    def test_conditional_get_not_modified(self, _mock_sleep, mock_client_class):
+        """Test that validators are sent and a 304 is reported as not modified."""
+        mock_response = MagicMock()
+        mock_response.status_code = 304
+        mock_response.headers = {"etag": '"v1"'}
+        mock_response.url = "https://example.com"
+        mock_response.raise_for_status = MagicMock(side_effect=AssertionError("not called"))
+
+        mock_client = MagicMock()
+        mock_client.get.return_value = mock_response
+        mock_client.__enter__ = MagicMock(return_value=mock_client)
+        mock_client.__exit__ = MagicMock(return_value=False)
+        mock_client_class.return_value = mock_client
+
+        fetcher = HttpFetcher(delay_ms=0)
+        result = fetcher.fetch(
+            "https://example.com", etag='"v1"', last_modified="Wed, 01 Jan 2025 00:00:00 GMT"
+        )
+
+        sent = mock_client.get.call_args[1]["headers"]
+        assert sent["If-None-Match"] == '"v1"'
+        assert sent["If-Modified-Since"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+        assert result.not_modified
+        assert result.error is None
+        assert result.etag == '"v1"'
+
+    @patch("ragstack_common.scraper.fetcher.httpx.Client")
+    @patch("ragstack_common.scraper.fetcher.time.sleep")
+    def test_records_validators(self, _mock_sleep, mock_client_class):
+        """Test that ETag and Last-Modified are captured from a 200 response."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.text = "<html></html>"
+        mock_response.headers = {
+            "content-type": "text/html",
+            "etag": '"v2"',
+            "last-modified": "Thu, 02 Jan 2025 00:00:00 GMT",
+        }
+        mock_response.url = "https://example.com"
+        mock_response.raise_for_status = MagicMock()
+
+        mock_client = MagicMock()
+        mock_client.get.return_value = mock_response
+        mock_client.__enter__ = MagicMock(return_value=mock_client)
+        mock_client.__exit__ = MagicMock(return_value=False)
+        mock_client_class.return_value = mock_client
+
+        result = HttpFetcher(delay_ms=0).fetch("https://example.com")
+
+        assert "If-None-Match" not in mock_client.get.call_args[1]["headers"]
+        assert not result.not_modified
+        assert result.etag == '"v2"'
+        assert result.last_modified == "Thu, 02 Jan 2025 00:00:00 GMT"
+
+
+class TestConnectionPool:
+    """Tests for the shared keep-alive connection pool."""
+
+    @patch("ragstack_common.scraper.fetcher.httpx.Client")
+    def test_reuses_client_per_host(self, mock_client_class):
+        pool = ConnectionPool()
+
+        first = pool.get_client("https://example.com/a", 30.0, {})
+        second = pool.get_client("https://example.com/b", 30.0, {})
+        other = pool.get_client("https://other.com/", 30.0, {})
+
+        assert first is second
+        assert mock_client_class.call_count == 2
+        assert other is not None
+        assert pool.stats() == {"hits": 1, "misses": 2, "evictions": 0, "size": 2}
+
+    @patch("ragstack_common.scraper.fetcher.httpx.Client")
+    def test_cookies_are_part_of_key(self, mock_client_class):
+        pool = ConnectionPool()
+
+        pool.get_client("https://example.com/", 30.0, {"session": "a"})
+        pool.get_client("https://example.com/", 30.0, {"session": "b"})
+
+        assert pool.stats()["misses"] == 2
+
+    @patch("ragstack_common.scraper.fetcher.httpx.Client")
+    def test_bounded_size_evicts_least_recently_used(self, mock_client_class):
+        mock_client_class.side_effect = lambda **_kw: MagicMock()
+        pool = ConnectionPool(max_clients=2)
+
+        a = pool.get_client("https://a.com/", 30.0, {})
+        pool.get_client("https://b.com/", 30.0, {})
+        pool.get_client("https://a.com/", 30.0, {})  # a is now most recent
+        pool.get_client("https://c.com/", 30.0, {})
+
+        stats = pool.stats()
+        assert stats["size"] == 2
+        assert stats["evictions"] == 1
+        assert pool.get_client("https://a.com/", 30.0, {}) is a
+        a.close.assert_not_called()
+
+    @patch("ragstack_common.scraper.fetcher.time.monotonic")
+    @patch("ragstack_common.scraper.fetcher.httpx.Client")
+    def test_idle_clients_are_closed(self, mock_client_class, mock_monotonic):
+        mock_client_class.side_effect = lambda **_kw: MagicMock()
+        pool = ConnectionPool(idle_timeout=60.0)
+
+        mock_monotonic.return_value = 0.0
+        idle = pool.get_client("https://a.com/", 30.0, {})
+        mock_monotonic.return_value = 120.0
+        pool.get_client("https://b.com/", 30.0, {})
+
+        idle.close.assert_called_once()
+        assert pool.stats()["size"] == 1
+
+    @patch("ragstack_common.scraper.fetcher.get_connection_pool")
+    @patch("ragstack_common.scraper.fetcher.time.sleep")
+    def test_pooled_fetcher_uses_pool(self, _mock_sleep, mock_get_pool):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.text = "<html><body>Hello</body></html>"
+        mock_response.headers = {"content-type": "text/html"}
+        mock_response.url = "https://example.com"
+        mock_client = MagicMock()
+        mock_client.get.return_value = mock_response
+        mock_get_pool.return_value.get_client.return_value = mock_client
+
+        fetcher = HttpFetcher(delay_ms=0, cookies={"s": "1"}, pooled=True, http2=True)
+        result = fetcher.fetch("https://example.com")
+
+        assert result.content == "<html><body>Hello</body></html>"
+        mock_get_pool.return_value.get_client.assert_called_once_with(
+            "https://example.com", 30.0, {"s": "1"}, http2=True
+        )
+        mock_client.close.assert_not_called()
+
+    def test_pooled_client_ignores_response_cookies(self):
+        seen_cookies = []
+
+        def handler(request):
+            seen_cookies.append(request.headers.get("cookie"))
+            if request.url.path == "/login":
+                return httpx.Response(
+                    302, headers={"location": "/home", "set-cookie": "tracker=x; Path=/"}
+                )
+            return httpx.Response(200, headers={"set-cookie": "other=y; Path=/"}, text="ok")
+
+        real_client = httpx.Client
+
+        def client_with_transport(**kwargs):
+            return real_client(transport=httpx.MockTransport(handler), **kwargs)
+
+        pool = ConnectionPool()
+        with patch("ragstack_common.scraper.fetcher.httpx.Client", client_with_transport):
+            client = pool.get_client("https://example.com/", 30.0, {"session": "abc"})
+        client.get("https://example.com/login")
+        client.get("https://example.com/page")
+
+        # Configured cookie follows the redirect; Set-Cookie never leaks into later requests
+        assert seen_cookies == ["session=abc", "session=abc", "session=abc"]
+        assert dict(client.cookies) == {"session": "abc"}
+
 
 class TestIsSpa:
     """Tests for is_spa detection function."""
@@ -336,6 +503,60 @@ class TestIsSpa:
         assert not is_spa(html)
 
 
+class TestParsedTree:
+    """Tests for sharing one parse between SPA detection and extraction."""
+
+    def test_parsed_is_cached(self):
+        result = FetchResult(
+            url="https://example.com",
+            status_code=200,
+            content="<html><body><p>Hi</p></body></html>",
+            content_type="text/html",
+            is_html=True,
+        )
+        assert result.parsed() is result.parsed()
+
+    def test_is_spa_does_not_modify_tree(self):
+        html = "<html><body><script>app()</script><p>" + "text " * 200 + "</p></body></html>"
+        result = FetchResult(
+            url="https://example.com",
+            status_code=200,
+            content=html,
+            content_type="text/html",
+            is_html=True,
+        )
+
+        assert is_spa(html, result.parsed()) == is_spa(html)
+        assert result.parsed().find("script") is not None
+
+    def test_noscript_text_not_counted(self):
+        html = (
+            "<html><body><noscript>"
+            + "Enable JavaScript " * 50
+            + "</noscript>"
+            + "<script>1</script>" * 6
+            + "</body></html>"
+        )
+        assert is_spa(html)
+
+    def test_parsed_tree_not_stored(self):
+        stored = {}
+        s3 = MagicMock()
+        s3.put_object.side_effect = lambda **kw: stored.update(kw)
+        result = FetchResult(
+            url="https://example.com",
+            status_code=200,
+            content="<p>x</p>",
+            content_type="text/html",
+            is_html=True,
+        )
+        result.parsed()
+
+        store_fetch_result(s3, "bucket", "key.json.gz", result)
+
+        assert "_soup" not in json.loads(gzip.decompress(stored["Body"]))
+
+
 class TestFetchWithPlaywright:
     """Tests for fetch_with_playwright function."""
 
@@ -410,6 +631,107 @@ class TestFetchWithPlaywright:
             assert "Playwright" in result.error
 
 
+class TestBrowserPool:
+    """Tests for the persistent Playwright browser pool."""
+
+    @pytest.fixture
+    def playwright(self):
+        """Fake playwright.sync_api whose browser returns fresh mock contexts."""
+        mock_pw = MagicMock()
+        browser = mock_pw.chromium.launch.return_value
+        browser.is_connected.return_value = True
+
+        def new_context(**_kw):
+            context = MagicMock()
+            page = context.new_page.return_value
+            page.content.return_value = "<html><body>Rendered</body></html>"
+            page.goto.return_value.status = 200
+            return context
+
+        browser.new_context.side_effect = new_context
+        sync_api = MagicMock()
+        sync_api.sync_playwright.return_value.start.return_value = mock_pw
+        with patch.dict(
+            "sys.modules", {"playwright": MagicMock(), "playwright.sync_api": sync_api}
+        ):
+            yield mock_pw
+
+    def test_reuses_browser_and_context(self, playwright):
+        pool = BrowserPool()
+
+        for i in range(3):
+            result = pool.fetch(f"https://example.com/{i}", context_key="job-1")
+
+        assert result.content == "<html><body>Rendered</body></html>"
+        playwright.chromium.launch.assert_called_once()
+        browser = playwright.chromium.launch.return_value
+        browser.new_context.assert_called_once()
+        assert pool.stats() == {
+            "launches": 1,
+            "pages": 3,
+            "context_hits": 2,
+            "context_misses": 1,
+            "contexts": 1,
+        }
+
+    def test_context_per_key_with_lru_eviction(self, playwright):
+        pool = BrowserPool(max_contexts=2)
+
+        pool.fetch("https://example.com/", context_key="job-1")
+        first_context = pool._contexts[("job-1", ())]
+        pool.fetch("https://example.com/", context_key="job-2")
+        pool.fetch("https://example.com/", context_key="job-3")
+
+        first_context.close.assert_called_once()
+        assert pool.stats()["contexts"] == 2
+
+    def test_recycles_browser_after_page_cap(self, playwright):
+        pool = BrowserPool(max_pages_per_browser=2)
+
+        for i in range(3):
+            pool.fetch(f"https://example.com/{i}", context_key="job-1")
+
+        assert playwright.chromium.launch.call_count == 2
+        playwright.chromium.launch.return_value.close.assert_called_once()
+        playwright.stop.assert_called_once()
+
+    def test_pages_closed_on_navigation_error(self, playwright):
+        browser = playwright.chromium.launch.return_value
+        context = MagicMock()
+        context.new_page.return_value.goto.side_effect = RuntimeError("timeout")
+        browser.new_context.side_effect = None
+        browser.new_context.return_value = context
+        pool = BrowserPool()
+
+        with pytest.raises(RuntimeError):
+            pool.fetch("https://example.com/")
+
+        context.new_page.return_value.close.assert_called_once()
+
+    def test_blocks_heavy_resources(self):
+        pool = BrowserPool()
+        image, script = MagicMock(), MagicMock()
+        image.request.resource_type = "image"
+        script.request.resource_type = "script"
+
+        pool._route(image)
+        pool._route(script)
+
+        image.abort.assert_called_once()
+        script.continue_.assert_called_once()
+        script.abort.assert_not_called()
+
+    def test_pooled_fetch_error_resets_pool(self, playwright):
+        mock_pool = MagicMock()
+        mock_pool.fetch.side_effect = RuntimeError("browser crashed")
+
+        with patch("ragstack_common.scraper.fetcher.get_browser_pool", return_value=mock_pool):
+            result = fetch_with_playwright("https://example.com", pooled=True, context_key="job")
+
+        assert "browser crashed" in result.error
+        mock_pool.close.assert_called_once()
+
+
 class TestFetchAuto:
     """Tests for fetch_auto function."""
 
@@ -509,6 +831,132 @@ class TestFetchAuto:
         # Should fall back to HTTP result
         assert result.content == http_result.content
 
+    @patch("ragstack_common.scraper.fetcher.HttpFetcher")
+    def test_prefetched_result_skips_http(self, mock_fetcher_class):
+        """Test that a prefetched result is used instead of a new HTTP request."""
+        prefetched = FetchResult(
+            url="https://example.com",
+            status_code=200,
+            content="<html><body><h1>Title</h1><p>" + "static " * 100 + "</p></body></html>",
+            content_type="text/html",
+            is_html=True,
+        )
+
+        result = fetch_auto("https://example.com", prefetched=prefetched)
+
+        mock_fetcher_class.assert_not_called()
+        assert result is prefetched
+
+    @patch("ragstack_common.scraper.fetcher.fetch_with_playwright")
+    @patch("ragstack_common.scraper.fetcher.HttpFetcher")
+    def test_prefetched_spa_still_uses_playwright(self, mock_fetcher_class, mock_pw_fetch):
+        """Test that SPA detection still runs on a prefetched result."""
+        prefetched = FetchResult(
+            url="https://example.com",
+            status_code=200,
+            content='<html><div id="__next"></div><script>__NEXT_DATA__={}</script>'
+            + "<script>1</script>" * 6,
+            content_type="text/html",
+            is_html=True,
+        )
+        mock_pw_fetch.return_value = FetchResult(
+            url="https://example.com",
+            status_code=200,
+            content="<html><body><h1>Rendered SPA</h1></body></html>",
+            content_type="text/html",
+            is_html=True,
+        )
+
+        result = fetch_auto("https://example.com", prefetched=prefetched)
+
+        mock_fetcher_class.assert_not_called()
+        assert "Rendered SPA" in result.content
+
+    @patch("ragstack_common.scraper.fetcher.fetch_with_playwright")
+    def test_pooled_playwright_uses_context_key(self, mock_pw_fetch):
+        """Test that pooled fetches render in the shared browser with the job's context."""
+        fetch_auto("https://example.com", force_playwright=True, pooled=True, context_key="job")
+
+        mock_pw_fetch.assert_called_once_with(
+            "https://example.com", None, pooled=True, context_key="job"
+        )
+
+    @patch("ragstack_common.scraper.fetcher.HttpFetcher")
+    def test_prefetched_result_matching_etag_is_not_modified(self, mock_fetcher_class):
+        """Test that a prefetched page with an unchanged ETag short-circuits."""
+        prefetched = FetchResult(
+            url="https://example.com",
+            status_code=200,
+            content="<html><body>" + "static " * 100 + "</body></html>",
+            content_type="text/html",
+            is_html=True,
+            etag='"v1"',
+        )
+
+        result = fetch_auto("https://example.com", prefetched=prefetched, etag='"v1"')
+
+        mock_fetcher_class.assert_not_called()
+        assert result.not_modified
+
+    @patch("ragstack_common.scraper.fetcher.HttpFetcher")
+    def test_validators_passed_to_http_fetch(self, mock_fetcher_class):
+        """Test that fetch_auto forwards validators and returns a 304 untouched."""
+        mock_fetcher = MagicMock()
+        mock_fetcher.fetch.return_value = FetchResult(
+            url="https://example.com",
+            status_code=304,
+            content="",
+            content_type="",
+            is_html=False,
+            not_modified=True,
+        )
+        mock_fetcher_class.return_value = mock_fetcher
+
+        result = fetch_auto("https://example.com", etag='"v1"')
+
+        mock_fetcher.fetch.assert_called_once_with(
+            "https://example.com", etag='"v1"', last_modified=None
+        )
+        assert result.not_modified
+
+
+class TestFetchedPageStorage:
+    """Tests for staging fetched pages in S3 between discovery and processing."""
+
+    def test_key_is_stable_per_job_and_url(self):
+        key = fetched_page_key("job-1", "https://example.com/a")
+
+        assert key.startswith("working/scrape/job-1/")
+        assert key.endswith(".json.gz")
+        assert key == fetched_page_key("job-1", "https://example.com/a")
+        assert key != fetched_page_key("job-1", "https://example.com/b")
+
+    def test_store_and_load_roundtrip(self):
+        stored = {}
+        s3 = MagicMock()
+        s3.put_object.side_effect = lambda **kw: stored.update(kw)
+        s3.get_object.side_effect = lambda **_kw: {"Body": MagicMock(read=lambda: stored["Body"])}
+        original = FetchResult(
+            url="https://example.com/a",
+            status_code=200,
+            content="<html>" + "x" * 5000 + "</html>",
+            content_type="text/html",
+            is_html=True,
+        )
+
+        uri = store_fetch_result(s3, "bucket", "working/scrape/job-1/k.json.gz", original)
+
+        assert uri == "s3://bucket/working/scrape/job-1/k.json.gz"
+        assert len(stored["Body"]) < 1000  # gzipped
+        # Compare fields: other tests reload the fetcher module, replacing FetchResult
+        assert asdict(load_fetch_result(s3, uri)) == asdict(original)
+
+    def test_load_missing_returns_none(self):
+        s3 = MagicMock()
+        s3.get_object.side_effect = Exception("NoSuchKey")
+
+        assert load_fetch_result(s3, "s3://bucket/working/scrape/job-1/k.json.gz") is None
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
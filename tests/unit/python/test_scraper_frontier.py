@@ -0,0 +1,174 @@
+"""Unit tests for the per-job visited-URL Bloom filter."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from ragstack_common.scraper.frontier import BloomFilter, VisitedFilter, visited_filter_key
+
+
+def _client_error(code):
+    return ClientError({"Error": {"Code": code, "Message": code}}, "Op")
+
+
+def _s3_with(bloom=None, etag='"v1"'):
+    """Mock S3 client holding a serialized filter (or none)."""
+    s3 = MagicMock()
+    if bloom is None:
+        s3.get_object.side_effect = _client_error("NoSuchKey")
+    else:
+        s3.get_object.return_value = {
+            "Body": MagicMock(read=MagicMock(return_value=bloom.to_bytes())),
+            "ETag": etag,
+        }
+    s3.put_object.return_value = {"ETag": '"v2"'}
+    return s3
+
+
+def _saved_filter(s3):
+    return BloomFilter.from_bytes(s3.put_object.call_args.kwargs["Body"])
+
+
+class TestBloomFilter:
+    def test_no_false_negatives(self):
+        bloom = BloomFilter.for_capacity(1000)
+        urls = [f"https://example.com/page{i}" for i in range(1000)]
+        for url in urls:
+            bloom.add(url)
+        assert all(url in bloom for url in urls)
+
+    def test_false_positive_rate_at_capacity(self):
+        bloom = BloomFilter.for_capacity(2000, error_rate=0.01)
+        for i in range(2000):
+            bloom.add(f"https://example.com/seen{i}")
+        false_positives = sum(f"https://example.com/new{i}" in bloom for i in range(10_000))
+        assert false_positives < 300  # ~1% expected
+
+    def test_roundtrip(self):
+        bloom = BloomFilter.for_capacity(100)
+        bloom.add("https://example.com/a")
+        restored = BloomFilter.from_bytes(bloom.to_bytes())
+        assert "https://example.com/a" in restored
+        assert "https://example.com/b" not in restored
+        assert (restored.size_bits, restored.num_hashes) == (bloom.size_bits, bloom.num_hashes)
+
+    def test_size_is_capped(self):
+        bloom = BloomFilter.for_capacity(10_000_000, max_bits=8192)
+        assert bloom.size_bits == 8192
+        assert len(bloom.bits) == 1024
+
+    @pytest.mark.parametrize("data", [b"", b"garbage-data-here", b"RSBF\x01\x03\x00\x00\x01\x00"])
+    def test_from_bytes_rejects_invalid(self, data):
+        with pytest.raises(ValueError):
+            BloomFilter.from_bytes(data)
+
+
+class TestVisitedFilter:
+    def test_existing_filter_answers_negatives(self):
+        bloom = BloomFilter.for_capacity(100)
+        bloom.add("https://example.com/seen")
+        s3 = _s3_with(bloom)
+        visited = VisitedFilter(s3, "bucket", "job-1", capacity=100)
+        visited.load()
+
+        assert visited.might_contain("https://example.com/seen")
+        assert not visited.might_contain("https://example.com/new")
+        assert visited.stats() == {"negatives": 1, "positives": 1}
+        s3.get_object.assert_called_once_with(Bucket="bucket", Key=visited_filter_key("job-1"))
+
+    def test_missing_filter_without_create_is_maybe(self):
+        s3 = _s3_with(None)
+        visited = VisitedFilter(s3, "bucket", "job-1", capacity=100)
+        visited.load(create=False)
+
+        assert visited.might_contain("https://example.com/new")
+        visited.add("https://example.com/new")
+        visited.save()
+        s3.put_object.assert_not_called()
+
+    def test_seed_creates_filter(self):
+        s3 = _s3_with(None)
+        visited = VisitedFilter(s3, "bucket", "job-1", capacity=100)
+        visited.load(create=True)
+
+        assert not visited.might_contain("https://example.com")
+        visited.add("https://example.com")
+        visited.save()
+
+        kwargs = s3.put_object.call_args.kwargs
+        assert kwargs["IfNoneMatch"] == "*"
+        assert "https://example.com" in _saved_filter(s3)
+        assert visited.etag == '"v2"'
+
+    def test_save_is_conditional_on_etag(self):
+        s3 = _s3_with(BloomFilter.for_capacity(100))
+        visited = VisitedFilter(s3, "bucket", "job-1", capacity=100)
+        visited.load()
+        visited.add(["https://example.com/a", "https://example.com/b"])
+        visited.save()
+
+        assert s3.put_object.call_args.kwargs["IfMatch"] == '"v1"'
+        saved = _saved_filter(s3)
+        assert "https://example.com/a" in saved
+        assert "https://example.com/b" in saved
+
+    def test_conflict_merges_concurrent_writer(self):
+        ours = BloomFilter.for_capacity(100)
+        theirs = BloomFilter.for_capacity(100)
+        theirs.add("https://example.com/theirs")
+        s3 = _s3_with(ours)
+        s3.put_object.side_effect = [_client_error("PreconditionFailed"), {"ETag": '"v3"'}]
+
+        visited = VisitedFilter(s3, "bucket", "job-1", capacity=100)
+        visited.load()
+        visited.add("https://example.com/ours")
+        # The other invocation's write is what the retry reads back
+        s3.get_object.return_value = {
+            "Body": MagicMock(read=MagicMock(return_value=theirs.to_bytes())),
+            "ETag": '"v2"',
+        }
+        visited.save()
+
+        assert s3.put_object.call_count == 2
+        assert s3.put_object.call_args.kwargs["IfMatch"] == '"v2"'
+        saved = _saved_filter(s3)
+        assert "https://example.com/ours" in saved
+        assert "https://example.com/theirs" in saved
+
+    def test_load_error_rereads_on_save(self):
+        bloom = BloomFilter.for_capacity(100)
+        s3 = _s3_with(bloom)
+        s3.get_object.side_effect = [_client_error("InternalError"), s3.get_object.return_value]
+
+        visited = VisitedFilter(s3, "bucket", "job-1", capacity=100)
+        visited.load()
+        assert visited.might_contain("https://example.com/new")
+
+        visited.add("https://example.com/new")
+        visited.save()
+        assert "https://example.com/new" in _saved_filter(s3)
+
+    def test_save_error_raises(self):
+        s3 = _s3_with(BloomFilter.for_capacity(100))
+        s3.put_object.side_effect = _client_error("AccessDenied")
+        visited = VisitedFilter(s3, "bucket", "job-1", capacity=100)
+        visited.load()
+        visited.add("https://example.com/a")
+
+        with pytest.raises(ClientError):
+            visited.save()
+
+    def test_corrupt_filter_is_ignored(self):
+        s3 = MagicMock()
+        s3.get_object.return_value = {
+            "Body": MagicMock(read=MagicMock(return_value=b"not a filter")),
+            "ETag": '"v1"',
+        }
+        visited = VisitedFilter(s3, "bucket", "job-1", capacity=100)
+        visited.load(create=True)
+
+        assert visited.might_contain("https://example.com/a")
+        visited.add("https://example.com/a")
+        visited.save()
+        s3.put_object.assert_not_called()
@@ -3,6 +3,7 @@
 from datetime import UTC, datetime
 
 from ragstack_common.scraper import (
+    DiscoveryMode,
     ScrapeConfig,
     ScrapeJob,
     ScrapePage,
@@ -110,6 +111,12 @@ class TestScrapeConfig:
         assert config.request_delay_ms == 750
         assert config.headers == {"X-Custom": "value"}
 
+    def test_discovery_mode_roundtrip(self):
+        config = ScrapeConfig(discovery_mode=DiscoveryMode.SITEMAP)
+        assert ScrapeConfig.from_dict(config.to_dict()).discovery_mode == DiscoveryMode.SITEMAP
+        # Unknown values fall back to crawling
+        assert ScrapeConfig.from_dict({"discovery_mode": "x"}).discovery_mode == DiscoveryMode.CRAWL
+
     def test_from_dict_defaults(self):
         config = ScrapeConfig.from_dict({})
         assert config.max_pages == 1000
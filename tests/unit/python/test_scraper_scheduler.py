@@ -0,0 +1,72 @@
+"""Unit tests for the per-host crawl scheduler."""
+
+import asyncio
+import time
+
+from ragstack_common.scraper.scheduler import HostScheduler
+
+
+def _run_requests(scheduler, urls, hold=0.0):
+    """Run one scheduled request per URL concurrently; return start times and peak load."""
+    starts = []
+    in_flight = {"now": 0, "peak": 0}
+
+    async def request(url):
+        async with scheduler.slot(url):
+            starts.append((url, time.monotonic()))
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            await asyncio.sleep(hold)
+            in_flight["now"] -= 1
+
+    async def main():
+        await asyncio.gather(*(request(url) for url in urls))
+
+    asyncio.run(main())
+    return starts, in_flight["peak"]
+
+
+class TestHostScheduler:
+    def test_same_host_requests_are_spaced(self):
+        scheduler = HostScheduler(delay_ms=50, max_per_host=3, max_concurrency=10)
+
+        starts, _ = _run_requests(scheduler, ["https://a.example.com/1"] * 3)
+
+        times = sorted(t for _, t in starts)
+        assert times[1] - times[0] >= 0.045
+        assert times[2] - times[1] >= 0.045
+        assert scheduler.stats()["throttled"] == 2
+
+    def test_different_hosts_run_in_parallel(self):
+        scheduler = HostScheduler(delay_ms=500, max_per_host=1, max_concurrency=10)
+        urls = [f"https://host{i}.example.com/" for i in range(4)]
+
+        started = time.monotonic()
+        _, peak = _run_requests(scheduler, urls, hold=0.05)
+
+        assert time.monotonic() - started < 0.4
+        assert peak == 4
+        assert scheduler.stats()["hosts"] == 4
+        assert scheduler.stats()["throttled"] == 0
+
+    def test_per_host_concurrency_cap(self):
+        scheduler = HostScheduler(delay_ms=0, max_per_host=2, max_concurrency=10)
+
+        _, peak = _run_requests(scheduler, ["https://a.example.com/"] * 6, hold=0.02)
+
+        assert peak == 2
+
+    def test_global_concurrency_cap(self):
+        scheduler = HostScheduler(delay_ms=0, max_per_host=5, max_concurrency=3)
+        urls = [f"https://host{i}.example.com/" for i in range(8)]
+
+        _, peak = _run_requests(scheduler, urls, hold=0.02)
+
+        assert peak == 3
+
+    def test_host_matching_is_case_insensitive(self):
+        scheduler = HostScheduler(delay_ms=0)
+
+        _run_requests(scheduler, ["https://Docs.Example.com/a", "https://docs.example.com/b"])
+
+        assert scheduler.stats()["hosts"] == 1
@@ -5,8 +5,14 @@ from unittest.mock import MagicMock, patch
 import pytest
 from botocore.exceptions import ClientError
 
-from ragstack_common.exceptions import FileSizeLimitExceededError
-from ragstack_common.storage import parse_s3_uri, read_s3_binary, read_s3_text
+from ragstack_common.exceptions import FileSizeLimitExceededError, S3BulkWriteError
+from ragstack_common.storage import (
+    parse_s3_uri,
+    read_s3_binary,
+    read_s3_text,
+    write_metadata_to_s3_bulk,
+    write_s3_objects,
+)
 
 
 class TestParseS3Uri:
@@ -140,3 +146,78 @@ class TestReadS3Text:
 
         result = read_s3_text("s3://bucket/file.txt", max_size_bytes=50_000_000)
         assert result == "small file"
+
+
+def _client_error(code: str) -> ClientError:
+    return ClientError({"Error": {"Code": code, "Message": code}}, "PutObject")
+
+
+class TestWriteS3Objects:
+    def test_writes_all_objects_in_order(self):
+        """Every object is written and URIs come back in input order."""
+        client = MagicMock()
+        objects = [{"Bucket": "bucket", "Key": f"seg-{i:03d}.txt", "Body": b"x"} for i in range(20)]
+
+        uris = write_s3_objects(objects, max_workers=4, s3_client=client)
+
+        assert uris == [f"s3://bucket/seg-{i:03d}.txt" for i in range(20)]
+        written = sorted(c.kwargs["Key"] for c in client.put_object.call_args_list)
+        assert written == [f"seg-{i:03d}.txt" for i in range(20)]
+
+    @patch("ragstack_common.storage.time.sleep")
+    def test_retries_throttling(self, mock_sleep):
+        """SlowDown errors are retried with backoff."""
+        client = MagicMock()
+        client.put_object.side_effect = [_client_error("SlowDown"), None]
+
+        uris = write_s3_objects([{"Bucket": "b", "Key": "k"}], s3_client=client)
+
+        assert uris == ["s3://b/k"]
+        assert client.put_object.call_count == 2
+        mock_sleep.assert_called_once()
+
+    @patch("ragstack_common.storage.time.sleep")
+    def test_reports_failures_in_input_order(self, mock_sleep):
+        """Failures are collected in input order after all objects are attempted."""
+        client = MagicMock()
+
+        def put_object(**kwargs):
+            if kwargs["Key"] in ("k1", "k3"):
+                raise _client_error("AccessDenied")
+
+        client.put_object.side_effect = put_object
+        objects = [{"Bucket": "b", "Key": f"k{i}"} for i in range(5)]
+
+        with pytest.raises(S3BulkWriteError) as exc_info:
+            write_s3_objects(objects, s3_client=client)
+
+        assert [uri for uri, _ in exc_info.value.failures] == ["s3://b/k1", "s3://b/k3"]
+        assert exc_info.value.total == 5
+        assert client.put_object.call_count == 5
+        mock_sleep.assert_not_called()
+
+    def test_empty_input(self):
+        """No objects means no writes."""
+        assert write_s3_objects([], s3_client=MagicMock()) == []
+
+    @patch("ragstack_common.storage.get_s3_client")
+    def test_metadata_bulk_writes_sidecars(self, mock_get_client):
+        """Metadata sidecars are written next to each content file."""
+        client = MagicMock()
+        mock_get_client.return_value = client
+
+        uris = write_metadata_to_s3_bulk(
+            [
+                ("s3://b/doc/segment-000.txt", {"segment_index": 0}),
+                ("s3://b/doc/segment-001.txt", {"segment_index": 1}),
+            ]
+        )
+
+        assert uris == [
+            "s3://b/doc/segment-000.txt.metadata.json",
+            "s3://b/doc/segment-001.txt.metadata.json",
+        ]
+        assert client.put_object.call_count == 2
+        assert all(
+            c.kwargs["ContentType"] == "application/json" for c in client.put_object.call_args_list
+        )
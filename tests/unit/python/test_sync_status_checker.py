@@ -27,6 +27,7 @@ def mock_env(monkeypatch):
     monkeypatch.setenv("TRACKING_TABLE", "test-tracking-table")
     monkeypatch.setenv("GRAPHQL_ENDPOINT", "https://test.appsync.amazonaws.com/graphql")
     monkeypatch.setenv("LOG_LEVEL", "INFO")
+    monkeypatch.setenv("QUERY_CACHE_TABLE", "test-query-cache")
 
 
 @pytest.fixture
@@ -134,13 +135,17 @@ class TestLambdaHandler:
             module = import_sync_status_checker()
 
             # Also mock the publish function
-            with patch.object(module, "publish_image_update"):
+            with (
+                patch.object(module, "publish_image_update"),
+                patch.object(module, "bump_kb_content_version") as mock_bump,
+            ):
                 result = module.lambda_handler({}, None)
 
         assert result["checked"] == 1
         assert result["updated"] == 1
         assert result["indexed"] == 1
         assert result["failed"] == 0
+        mock_bump.assert_called_once_with("test-query-cache")
 
     def test_updates_failed_documents(self, mock_env, mock_dynamodb):
         """Updates status when KB reports FAILED."""
@@ -161,13 +166,17 @@ class TestLambdaHandler:
 
             module = import_sync_status_checker()
 
-            with patch.object(module, "publish_image_update"):
+            with (
+                patch.object(module, "publish_image_update"),
+                patch.object(module, "bump_kb_content_version") as mock_bump,
+            ):
                 result = module.lambda_handler({}, None)
 
         assert result["checked"] == 1
         assert result["updated"] == 1
         assert result["indexed"] == 0
         assert result["failed"] == 1
+        mock_bump.assert_not_called()
 
     def test_leaves_in_progress_documents(self, mock_env, mock_dynamodb):
         """Leaves status unchanged for documents still processing."""
@@ -1,5 +1,6 @@
 """Unit tests for TranscribeClient wrapper."""
 
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -123,6 +124,53 @@ class TestStartTranscriptionJob:
         job_name = call_args.kwargs["TranscriptionJobName"]
         assert "doc-123" in job_name or job_name.startswith("ragstack-")
 
+    @patch("boto3.client")
+    def test_start_transcription_job_with_tags(self, mock_boto3_client):
+        """Test that tags are passed to Transcribe as Key/Value pairs."""
+        mock_client = MagicMock()
+        mock_client.start_transcription_job.return_value = {
+            "TranscriptionJob": {"TranscriptionJobName": "test-job"}
+        }
+        mock_boto3_client.return_value = mock_client
+
+        client = TranscribeClient()
+        client.start_transcription_job(
+            document_id="doc-123",
+            input_s3_uri="s3://bucket/audio.mp3",
+            output_bucket="output-bucket",
+            tags={"ragstack_document_id": "doc-123"},
+        )
+
+        call_args = mock_client.start_transcription_job.call_args[1]
+        assert call_args["Tags"] == [{"Key": "ragstack_document_id", "Value": "doc-123"}]
+
+
+class TestDescribeJob:
+    """Tests for describing transcription jobs."""
+
+    @patch("boto3.client")
+    def test_describe_job_returns_status_uri_and_tags(self, mock_boto3_client):
+        """Test that describe_job flattens the job description."""
+        mock_client = MagicMock()
+        mock_client.get_transcription_job.return_value = {
+            "TranscriptionJob": {
+                "TranscriptionJobStatus": "COMPLETED",
+                "Transcript": {"TranscriptFileUri": "s3://bucket/transcript.json"},
+                "Tags": [{"Key": "ragstack_document_id", "Value": "doc-123"}],
+            }
+        }
+        mock_boto3_client.return_value = mock_client
+
+        client = TranscribeClient()
+        job = client.describe_job("test-job")
+
+        assert job == {
+            "status": "COMPLETED",
+            "transcript_uri": "s3://bucket/transcript.json",
+            "failure_reason": None,
+            "tags": {"ragstack_document_id": "doc-123"},
+        }
+
 
 class TestGetJobStatus:
     """Tests for getting job status."""
@@ -437,3 +485,88 @@ class TestWaitForCompletion:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+def _diarized_transcript(num_words: int) -> dict:
+    """Transcript alternating two speakers per word, with punctuation every 5 words."""
+    items = []
+    label_items = []
+    for i in range(num_words):
+        start, end = f"{i * 0.5:.2f}", f"{i * 0.5 + 0.4:.2f}"
+        items.append(
+            {
+                "type": "pronunciation",
+                "alternatives": [{"content": f"w{i}", "confidence": "0.9"}],
+                "start_time": start,
+                "end_time": end,
+            }
+        )
+        label_items.append({"speaker_label": f"spk_{i % 2}", "start_time": start, "end_time": end})
+        if i % 5 == 4:
+            items.append({"type": "punctuation", "alternatives": [{"content": "."}]})
+    return {
+        "results": {
+            "transcripts": [{"transcript": "full text"}],
+            "speaker_labels": {
+                "speakers": 2,
+                "segments": [
+                    {"speaker_label": "spk_0", "items": label_items[:20]},
+                    {"speaker_label": "spk_1", "items": label_items[20:]},
+                ],
+            },
+            "items": items,
+        }
+    }
+
+
+class TestIterTranscriptWords:
+    """Tests for streaming transcript parsing."""
+
+    def test_matches_parse_transcript_with_timestamps(self, tmp_path):
+        """Streamed words carry the same text, timing and speakers as the dict parser."""
+        transcript_json = _diarized_transcript(50)
+        path = tmp_path / "transcript.json"
+        path.write_text(json.dumps(transcript_json))
+
+        with patch("boto3.client"):
+            client = TranscribeClient()
+            expected = client.parse_transcript_with_timestamps(transcript_json)
+            words = list(client.iter_transcript_words(path))
+
+        assert [w._asdict() for w in words] == [
+            {
+                "start_time": None,
+                "end_time": None,
+                "speaker": None,
+                **w,
+            }
+            for w in expected
+        ]
+
+    def test_uses_item_speaker_labels(self, tmp_path):
+        """Speaker labels on items are used directly."""
+        item = {
+            "type": "pronunciation",
+            "alternatives": [{"content": "Hi", "confidence": "0.9"}],
+            "start_time": "0.0",
+            "end_time": "0.4",
+            "speaker_label": "spk_3",
+        }
+        path = tmp_path / "transcript.json"
+        path.write_text(json.dumps({"results": {"items": [item]}}))
+
+        with patch("boto3.client"):
+            words = list(TranscribeClient().iter_transcript_words(path))
+
+        assert words[0].speaker == "spk_3"
+
+    def test_get_full_transcript(self, tmp_path):
+        """Full transcript text is read from the output file."""
+        path = tmp_path / "transcript.json"
+        path.write_text(json.dumps(_diarized_transcript(3)))
+
+        with patch("boto3.client"):
+            client = TranscribeClient()
+            assert client.get_full_transcript(path) == "full text"
+            path.write_text(json.dumps({"results": {"items": []}}))
+            assert client.get_full_transcript(path) == ""